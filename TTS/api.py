@@ -6,8 +6,8 @@ from typing import Union
 import numpy as np
 from torch import nn
 
-from TTS.utils.audio.numpy_transforms import save_wav
 from TTS.utils.manage import ModelManager
+from TTS.utils.model_pool import ModelPool
 from TTS.utils.synthesizer import Synthesizer
 from TTS.config import load_config
 
@@ -24,6 +24,9 @@ class TTS(nn.Module):
         vocoder_config_path: str = None,
         progress_bar: bool = True,
         gpu=False,
+        quantize: str = None,
+        max_loaded_models: int = 1,
+        max_memory_mb: float = None,
     ):
         """🐸TTS python interface that allows to load and use the released models.
 
@@ -47,6 +50,14 @@ class TTS(nn.Module):
             >>> tts.tts_to_file("C'est le clonage de la voix.", speaker_wav="my/cloning/audio.wav", language="fr", file_path="thisisit.wav")
             >>> tts.tts_to_file("Isso é clonagem de voz.", speaker_wav="my/cloning/audio.wav", language="pt", file_path="thisisit.wav")
 
+        Example int8 quantized inference on CPU:
+            >>> tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2", quantize="int8")
+            >>> tts.tts_to_file("This is a test.", speaker_wav="my/cloning/audio.wav", language="en", file_path="output.wav")
+
+        Example serving several models, the 4 most recently used ones stay in memory:
+            >>> tts = TTS("tts_models/en/ljspeech/vits", max_loaded_models=4)
+            >>> wav = tts.tts("This is a test.", model_name="tts_models/de/thorsten/vits")
+
         Example Fairseq TTS models (uses ISO language codes in https://dl.fbaipublicfiles.com/mms/tts/all-tts-languages.html):
             >>> tts = TTS(model_name="tts_models/eng/fairseq/vits", progress_bar=False, gpu=True)
             >>> tts.tts_to_file("This is a test.", file_path="output.wav")
@@ -59,6 +70,12 @@ class TTS(nn.Module):
             vocoder_config_path (str, optional): Path to the vocoder config. Defaults to None.
             progress_bar (bool, optional): Whether to pring a progress bar while downloading a model. Defaults to True.
             gpu (bool, optional): Enable/disable GPU. Some models might be too slow on CPU. Defaults to False.
+            quantize (str, optional): Quantize the model for CPU inference, e.g. "int8". Only supported by `XTTS`,
+                `VITS` and the HiFiGAN vocoders. Defaults to None.
+            max_loaded_models (int, optional): Number of models loaded by name kept in memory. Switching back to one
+                of them is instant, the least recently used one is dropped beyond that. Defaults to 1.
+            max_memory_mb (float, optional): Memory budget in MB for the weights of the models kept in memory. The
+                least recently used models are dropped beyond that. Defaults to None, no limit.
         """
         super().__init__()
         self.manager = ModelManager(models_file=self.get_models_file_path(), progress_bar=progress_bar, verbose=False)
@@ -66,6 +83,13 @@ class TTS(nn.Module):
         self.synthesizer = None
         self.voice_converter = None
         self.model_name = ""
+        self.quantize = quantize
+        self.model_pool = ModelPool(
+            self._load_synthesizer_by_name,
+            max_models=max_loaded_models,
+            max_memory=max_memory_mb * 2**20 if max_memory_mb is not None else None,
+        )
+        self._gpu = gpu
         if gpu:
             warnings.warn("`gpu` will be deprecated. Please use `tts.to(device)` instead.")
 
@@ -159,6 +183,8 @@ class TTS(nn.Module):
     def load_tts_model_by_name(self, model_name: str, gpu: bool = False):
         """Load one of 🐸TTS models by name.
 
+        The model is taken from `self.model_pool` if it is still in memory.
+
         Args:
             model_name (str): Model name to load. You can list models by ```tts.models```.
             gpu (bool, optional): Enable/disable GPU. Some models might be too slow on CPU. Defaults to False.
@@ -167,14 +193,20 @@ class TTS(nn.Module):
         """
         self.synthesizer = None
         self.model_name = model_name
+        self.config = None
+        self._gpu = gpu
+        synthesizer = self.model_pool.get(model_name)
+        if synthesizer.use_cuda != gpu:
+            self.model_pool.evict(model_name)
+            synthesizer = self.model_pool.get(model_name)
+        self.synthesizer = synthesizer
 
-        model_path, config_path, vocoder_path, vocoder_config_path, model_dir = self.download_model_by_name(
-            model_name
-        )
+    def _load_synthesizer_by_name(self, model_name: str) -> Synthesizer:
+        model_path, config_path, vocoder_path, vocoder_config_path, model_dir = self.download_model_by_name(model_name)
 
         # init synthesizer
         # None values are fetch from the model
-        self.synthesizer = Synthesizer(
+        return Synthesizer(
             tts_checkpoint=model_path,
             tts_config_path=config_path,
             tts_speakers_file=None,
@@ -184,7 +216,8 @@ class TTS(nn.Module):
             encoder_checkpoint=None,
             encoder_config=None,
             model_dir=model_dir,
-            use_cuda=gpu,
+            use_cuda=self._gpu,
+            quantize=self.quantize,
         )
 
     def load_tts_model_by_path(
@@ -199,7 +232,7 @@ class TTS(nn.Module):
             vocoder_config (str, optional): Path to the vocoder config. Defaults to None.
             gpu (bool, optional): Enable/disable GPU. Some models might be too slow on CPU. Defaults to False.
         """
-
+        self._gpu = gpu
         self.synthesizer = Synthesizer(
             tts_checkpoint=model_path,
             tts_config_path=config_path,
@@ -210,6 +243,7 @@ class TTS(nn.Module):
             encoder_checkpoint=None,
             encoder_config=None,
             use_cuda=gpu,
+            quantize=self.quantize,
         )
 
     def _check_arguments(
@@ -243,6 +277,7 @@ class TTS(nn.Module):
         emotion: str = None,
         speed: float = None,
         split_sentences: bool = True,
+        model_name: str = None,
         **kwargs,
     ):
         """Convert text to speech.
@@ -267,9 +302,14 @@ class TTS(nn.Module):
                 Split text into sentences, synthesize them separately and concatenate the file audio.
                 Setting it False uses more VRAM and possibly hit model specific text length or VRAM limits. Only
                 applicable to the 🐸TTS models. Defaults to True.
+            model_name (str, optional):
+                Name of the model to use. It becomes the loaded model and is taken from `self.model_pool` if it is
+                still in memory. Defaults to None, the loaded model.
             kwargs (dict, optional):
                 Additional arguments for the model.
         """
+        if model_name is not None and model_name != self.model_name:
+            self.load_tts_model_by_name(model_name, self._gpu)
         self._check_arguments(
             speaker=speaker, language=language, speaker_wav=speaker_wav, emotion=emotion, speed=speed, **kwargs
         )
@@ -298,6 +338,7 @@ class TTS(nn.Module):
         pipe_out=None,
         file_path: str = "output.wav",
         split_sentences: bool = True,
+        model_name: str = None,
         **kwargs,
     ):
         """Convert text to speech.
@@ -326,9 +367,13 @@ class TTS(nn.Module):
                 Split text into sentences, synthesize them separately and concatenate the file audio.
                 Setting it False uses more VRAM and possibly hit model specific text length or VRAM limits. Only
                 applicable to the 🐸TTS models. Defaults to True.
+            model_name (str, optional):
+                Name of the model to use, see `tts()`. Defaults to None, the loaded model.
             kwargs (dict, optional):
                 Additional arguments for the model.
         """
+        if model_name is not None and model_name != self.model_name:
+            self.load_tts_model_by_name(model_name, self._gpu)
         self._check_arguments(speaker=speaker, language=language, speaker_wav=speaker_wav, **kwargs)
 
         wav = self.tts(
@@ -374,6 +419,8 @@ class TTS(nn.Module):
             file_path (str, optional):
                 Output file path. Defaults to "output.wav".
         """
+        from TTS.utils.audio.numpy_transforms import save_wav  # pylint: disable=import-outside-toplevel
+
         wav = self.voice_conversion(source_wav=source_wav, target_wav=target_wav)
         save_wav(wav=wav, path=file_path, sample_rate=self.voice_converter.vc_config.audio.output_sample_rate)
         return file_path
@@ -452,6 +499,8 @@ class TTS(nn.Module):
                 Setting it False uses more VRAM and possibly hit model specific text length or VRAM limits. Only
                 applicable to the 🐸TTS models. Defaults to True.
         """
+        from TTS.utils.audio.numpy_transforms import save_wav  # pylint: disable=import-outside-toplevel
+
         wav = self.tts_with_vc(
             text=text, language=language, speaker_wav=speaker_wav, speaker=speaker, split_sentences=split_sentences
         )
@@ -0,0 +1,127 @@
+"""Benchmark the accuracy, speed and memory of a quantized model against the full precision model on CPU."""
+
+import argparse
+import os
+import time
+from argparse import RawTextHelpFormatter
+
+import librosa
+import numpy as np
+import torch
+
+from TTS.api import TTS
+from TTS.utils.quantization import QUANTIZATION_MODES, model_size
+
+DEFAULT_SENTENCES = [
+    "It took me quite a long time to develop a voice, and now that I have it I'm not going to be silent.",
+    "Be a voice, not an echo.",
+    "I'm sorry Dave. I'm afraid I can't do that.",
+    "This cake is great. It's so delicious and moist.",
+    "Prior to November 22, 1963.",
+]
+
+
+def _rss() -> int:
+    """Resident memory of the process in bytes."""
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _log_mel(wav: np.ndarray, sample_rate: int) -> np.ndarray:
+    mel = librosa.feature.melspectrogram(y=wav, sr=sample_rate, n_fft=1024, hop_length=256, n_mels=80)
+    return np.log10(np.maximum(mel, 1e-5))
+
+
+def _load(args, quantize=None):
+    start_rss = _rss()
+    tts = TTS(
+        model_name=args.model_name,
+        model_path=args.model_path,
+        config_path=args.config_path,
+        vocoder_path=args.vocoder_path,
+        vocoder_config_path=args.vocoder_config_path,
+        progress_bar=False,
+        quantize=quantize,
+    )
+    synthesizer = tts.synthesizer
+    size = sum(model_size(m) for m in [synthesizer.tts_model, synthesizer.vocoder_model] if m is not None)
+    return tts, size, _rss() - start_rss
+
+
+def _synthesize(tts, sentence, args, seed):
+    torch.manual_seed(seed)
+    start_time = time.perf_counter()
+    wav = tts.synthesizer.tts(
+        sentence, speaker_name=args.speaker_idx, language_name=args.language_idx, speaker_wav=args.speaker_wav
+    )
+    return np.array(wav, dtype=np.float32), time.perf_counter() - start_time
+
+
+@torch.inference_mode()
+def benchmark(fp32_tts, quantized_tts, sentences, args):
+    """Synthesize each sentence with both models and the same seed and report the RTF and the output distance."""
+    sample_rate = fp32_tts.synthesizer.output_sample_rate
+    total_audio, total_fp32, total_quantized, distances = 0.0, 0.0, 0.0, []
+    for sentence in sentences:
+        for run in range(args.num_runs):
+            wav, fp32_time = _synthesize(fp32_tts, sentence, args, seed=run)
+            quantized_wav, quantized_time = _synthesize(quantized_tts, sentence, args, seed=run)
+            total_fp32 += fp32_time
+            total_quantized += quantized_time
+            total_audio += len(wav) / sample_rate
+        mel, quantized_mel = _log_mel(wav, sample_rate), _log_mel(quantized_wav, sample_rate)
+        num_frames = min(mel.shape[1], quantized_mel.shape[1])
+        distances.append(np.abs(mel[:, :num_frames] - quantized_mel[:, :num_frames]).mean())
+        print(f" > {sentence}")
+        print(f" | > fp32: {fp32_time:.3f}s | {args.quantize}: {quantized_time:.3f}s")
+        print(f" | > length: {len(wav) / sample_rate:.2f}s | {len(quantized_wav) / sample_rate:.2f}s")
+        print(f" | > log-mel L1 distance: {distances[-1]:.4f}")
+    print(f" > RTF fp32: {total_fp32 / total_audio:.3f}")
+    print(f" > RTF {args.quantize}: {total_quantized / total_audio:.3f}")
+    print(f" > Speed up: {total_fp32 / total_quantized:.2f}x")
+    print(f" > Mean log-mel L1 distance: {np.mean(distances):.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="""Benchmark a quantized model against the full precision model on CPU.\n\n"""
+        """It reports the size of the weights, the resident memory taken by each model, the real time factor and
+the log-mel distance between the outputs. Models that sample their outputs, like XTTS, can diverge from the full
+precision outputs with the same seed, compare their lengths and listen to them.\n\n"""
+        """
+        Example runs:
+        python TTS/bin/benchmark_quantization.py --model_name tts_models/en/ljspeech/vits
+        python TTS/bin/benchmark_quantization.py --model_name tts_models/multilingual/multi-dataset/xtts_v2 --speaker_wav speaker.wav --language_idx en
+        """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument("--model_name", type=str, default=None, help="Name of one of the released models.")
+    parser.add_argument("--model_path", type=str, default=None, help="Path to the model checkpoint.")
+    parser.add_argument("--config_path", type=str, default=None, help="Path to the model config.")
+    parser.add_argument("--vocoder_path", type=str, default=None, help="Path to the vocoder checkpoint.")
+    parser.add_argument("--vocoder_config_path", type=str, default=None, help="Path to the vocoder config.")
+    parser.add_argument("--speaker_idx", type=str, default=None, help="Speaker name of a multi-speaker model.")
+    parser.add_argument("--language_idx", type=str, default=None, help="Language of a multi-lingual model.")
+    parser.add_argument("--speaker_wav", type=str, default=None, help="Reference audio file for voice cloning.")
+    parser.add_argument("--sentences_file", type=str, default=None, help="Text file with one sentence per line.")
+    parser.add_argument("--num_runs", type=int, default=3, help="Number of runs per sentence.")
+    parser.add_argument("--quantize", type=str, default="int8", choices=QUANTIZATION_MODES, help="Quantization mode.")
+    args = parser.parse_args()
+
+    fp32_tts, fp32_size, fp32_rss = _load(args)
+    quantized_tts, quantized_size, quantized_rss = _load(args, quantize=args.quantize)
+    print(f" > Weights fp32: {fp32_size / 2**20:.1f}MB | {args.quantize}: {quantized_size / 2**20:.1f}MB")
+    print(f" > Resident memory fp32: {fp32_rss / 2**20:.1f}MB | {args.quantize}: {quantized_rss / 2**20:.1f}MB")
+
+    sentences = DEFAULT_SENTENCES
+    if args.sentences_file is not None:
+        with open(args.sentences_file, "r", encoding="utf-8") as f:
+            sentences = [line.strip() for line in f if line.strip()]
+    benchmark(fp32_tts, quantized_tts, sentences, args)
+
+
+if __name__ == "__main__":
+    main()
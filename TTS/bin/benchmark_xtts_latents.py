@@ -0,0 +1,110 @@
+"""Benchmark collecting the XTTS GPT latents during generation against recovering them with a second GPT pass."""
+
+import argparse
+import os
+import time
+from argparse import RawTextHelpFormatter
+
+import torch
+
+from TTS.config import load_config
+from TTS.tts.models.xtts import Xtts
+
+DEFAULT_SENTENCES = [
+    "It took me quite a long time to develop a voice, and now that I have it I'm not going to be silent.",
+    "Be a voice, not an echo.",
+    "I'm sorry Dave. I'm afraid I can't do that.",
+    "This cake is great. It's so delicious and moist.",
+    "Prior to November 22, 1963.",
+]
+
+
+def _time(fn, use_cuda):
+    if use_cuda:
+        torch.cuda.synchronize()
+    start_time = time.perf_counter()
+    outputs = fn()
+    if use_cuda:
+        torch.cuda.synchronize()
+    return outputs, time.perf_counter() - start_time
+
+
+@torch.inference_mode()
+def benchmark(model, sentences, speaker_wav, language, num_runs=3, use_cuda=False):
+    """Synthesize each sentence both ways with the same seed and report the timings and the output difference."""
+    gpt = model.gpt
+    gpt_cond_latent, speaker_embedding = model.get_conditioning_latents(speaker_wav)
+    generate_kwargs = {"do_sample": True, "top_k": 50, "top_p": 0.85, "temperature": 0.75, "repetition_penalty": 10.0}
+    total_second_pass, total_reuse = 0.0, 0.0
+    for sentence in sentences:
+        text_tokens = torch.IntTensor(model.tokenizer.encode(sentence.strip().lower(), lang=language))
+        text_tokens = text_tokens.unsqueeze(0).to(model.device)
+        for _ in range(num_runs):
+            torch.manual_seed(0)
+
+            def _second_pass():
+                codes = gpt.generate(gpt_cond_latent, text_tokens, **generate_kwargs)
+                return gpt(
+                    text_tokens,
+                    torch.tensor([text_tokens.shape[-1]], device=model.device),
+                    codes,
+                    torch.tensor([codes.shape[-1] * gpt.code_stride_len], device=model.device),
+                    cond_latents=gpt_cond_latent,
+                    return_latent=True,
+                )
+
+            target_latents, second_pass_time = _time(_second_pass, use_cuda)
+            torch.manual_seed(0)
+            (_, latents), reuse_time = _time(
+                lambda: gpt.generate(gpt_cond_latent, text_tokens, return_latents=True, **generate_kwargs), use_cuda
+            )
+            total_second_pass += second_pass_time
+            total_reuse += reuse_time
+
+        wav = model.hifigan_decoder(latents, g=speaker_embedding)
+        target_wav = model.hifigan_decoder(target_latents, g=speaker_embedding)
+        print(f" > {sentence}")
+        print(f" | > codes: {latents.shape[1]}")
+        print(f" | > second pass: {second_pass_time:.3f}s | reused latents: {reuse_time:.3f}s")
+        print(f" | > max latent diff: {(latents - target_latents).abs().max().item():.2e}")
+        print(f" | > max audio diff: {(wav - target_wav).abs().max().item():.2e}")
+    print(f" > Total second pass: {total_second_pass:.3f}s")
+    print(f" > Total reused latents: {total_reuse:.3f}s")
+    print(f" > Speed up: {total_second_pass / total_reuse:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="""Benchmark the XTTS inference with the GPT latents collected during generation against
+the latents recovered with a second GPT pass over the generated codes.\n\n"""
+        """
+        Example runs:
+        python TTS/bin/benchmark_xtts_latents.py --model_dir /path/to/xtts_v2/ --speaker_wav speaker.wav --language en
+        """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--model_dir", type=str, required=True, help="Folder with the XTTS `config.json` and checkpoint."
+    )
+    parser.add_argument("--speaker_wav", type=str, required=True, help="Reference audio file of the voice.")
+    parser.add_argument("--language", type=str, default="en", help="Language of the sentences.")
+    parser.add_argument("--sentences_file", type=str, default=None, help="Text file with one sentence per line.")
+    parser.add_argument("--num_runs", type=int, default=3, help="Number of runs per sentence.")
+    parser.add_argument("--use_cuda", action="store_true", help="Run on GPU.")
+    args = parser.parse_args()
+
+    config = load_config(os.path.join(args.model_dir, "config.json"))
+    model = Xtts.init_from_config(config)
+    model.load_checkpoint(config, checkpoint_dir=args.model_dir, eval=True)
+    if args.use_cuda:
+        model.cuda()
+
+    sentences = DEFAULT_SENTENCES
+    if args.sentences_file is not None:
+        with open(args.sentences_file, "r", encoding="utf-8") as f:
+            sentences = [line.strip() for line in f if line.strip()]
+    benchmark(model, sentences, args.speaker_wav, args.language, num_runs=args.num_runs, use_cuda=args.use_cuda)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Convert 🐸TTS checkpoints to safetensors files that are memory-mapped on load."""
+
+import argparse
+import os
+from argparse import RawTextHelpFormatter
+
+from TTS.utils.io import convert_to_safetensors
+from TTS.utils.manage import ModelManager
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="""Convert 🐸TTS checkpoints to safetensors files.\n\n"""
+        """The weights of a safetensors checkpoint are memory-mapped instead of being unpickled into the process memory.
+Processes loading the same file share its pages through the page cache. The optimizer state is dropped, the converted
+files are meant for inference.
+
+A converted released model is saved as `model.safetensors` in the model folder and used instead of `model.pth`.\n\n"""
+        """
+        Example runs:
+        python TTS/bin/convert_to_safetensors.py --model_name tts_models/multilingual/multi-dataset/xtts_v2
+        python TTS/bin/convert_to_safetensors.py --checkpoint_path /path/to/best_model.pth
+        """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument("--model_name", type=str, default=None, help="Name of one of the released models.")
+    parser.add_argument("--checkpoint_path", type=str, default=None, help="Path or url of the checkpoint.")
+    parser.add_argument(
+        "--output_path",
+        type=str,
+        default=None,
+        help="Output file path. Defaults to the checkpoint path with the `.safetensors` extension.",
+    )
+    args = parser.parse_args()
+
+    if (args.model_name is None) == (args.checkpoint_path is None):
+        parser.error("Set one of `--model_name` or `--checkpoint_path`.")
+
+    checkpoint_path = args.checkpoint_path
+    output_path = args.output_path
+    if args.model_name is not None:
+        manager = ModelManager(models_file=os.path.join(os.path.dirname(__file__), "../.models.json"))
+        model_path, _, _ = manager.download_model(args.model_name)
+        model_dir = model_path if os.path.isdir(model_path) else os.path.dirname(model_path)
+        checkpoint_path = next(
+            (
+                os.path.join(model_dir, file_name)
+                for file_name in ["model.pth", "model_file.pth", "model_file.pth.tar"]
+                if os.path.isfile(os.path.join(model_dir, file_name))
+            ),
+            None,
+        )
+        if checkpoint_path is None:
+            raise ValueError(f" [!] No `.pth` checkpoint found for `{args.model_name}` in {model_dir}.")
+        output_path = os.path.join(model_dir, "model.safetensors")
+
+    output_path = convert_to_safetensors(checkpoint_path, output_path)
+    print(f" > Saved {output_path} ({os.path.getsize(output_path) / 2**20:.1f}MB).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Pack the audio, token ids, pitch and energy of a dataset into a memory-mapped feature store."""
+
+import argparse
+import os
+import time
+from argparse import RawTextHelpFormatter
+
+from TTS.config import load_config
+from TTS.tts.datasets import load_tts_samples
+from TTS.tts.datasets.feature_store import pack_features
+from TTS.tts.utils.text.tokenizer import TTSTokenizer
+from TTS.utils.audio import AudioProcessor
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="""Pack the features of the datasets of a TTS config into a feature store.\n\n"""
+        """The audio, token ids, pitch and energy of all the samples are written into a few large memory-mapped shard
+files with an index, instead of an audio file and a few `.npy` cache files per sample. Set `feature_store_path` in the
+config to train from the store. Features already in the per-file caches of the config are reused.\n\n"""
+        """
+        Example run:
+        python TTS/bin/pack_features.py --config_path config.json --output_path /data/ljspeech_store
+        """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument("--config_path", type=str, required=True, help="Path to the training config file.")
+    parser.add_argument("--output_path", type=str, required=True, help="Path to the output feature store folder.")
+    parser.add_argument("--shard_size", type=int, default=1024, help="Size of the shards in MB. Defaults to 1024.")
+    parser.add_argument("--num_workers", type=int, default=0, help="Number of workers computing the features.")
+    args, overrides = parser.parse_known_args()
+
+    config = load_config(args.config_path)
+    config.parse_known_args(overrides, relaxed_parser=True)
+
+    ap = AudioProcessor.init_from_config(config)
+    tokenizer = None
+    if config.get("use_phonemes", False):
+        tokenizer, config = TTSTokenizer.init_from_config(config)
+    # pack all the samples, the train and eval split is made at training time
+    samples, _ = load_tts_samples(config.datasets, eval_split=False)
+    datasets_with_eval = [dataset for dataset in config.datasets if dataset["meta_file_val"]]
+    if datasets_with_eval:
+        samples += load_tts_samples(datasets_with_eval, eval_split=True)[1]
+    print(f" > Packing {len(samples)} samples into {args.output_path}")
+
+    start = time.time()
+    store = pack_features(
+        samples,
+        args.output_path,
+        ap,
+        tokenizer=tokenizer,
+        compute_f0=config.get("compute_f0", False),
+        compute_energy=config.get("compute_energy", False),
+        f0_cache_path=config.get("f0_cache_path", None),
+        energy_cache_path=config.get("energy_cache_path", None),
+        phoneme_cache_path=config.get("phoneme_cache_path", None),
+        shard_size=args.shard_size * 2**20,
+        num_workers=args.num_workers,
+    )
+    size = sum(os.path.getsize(os.path.join(args.output_path, f)) for f in os.listdir(args.output_path))
+    print(
+        f" > Packed {len(store)} samples with {', '.join(store.features)} ({size / 2**20:.1f}MB) in"
+        f" {time.time() - start:.1f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -202,6 +202,19 @@ def main():
     )
     parser.add_argument("--use_cuda", type=bool, help="Run model on CUDA.", default=False)
     parser.add_argument("--device", type=str, help="Device to run model on.", default="cpu")
+    parser.add_argument(
+        "--quantize",
+        type=str,
+        help="Quantize the model for CPU inference. Supported by XTTS, VITS and the HiFiGAN vocoders.",
+        choices=["int8"],
+        default=None,
+    )
+    parser.add_argument(
+        "--sentence_batch_size",
+        type=int,
+        help="Synthesize the sentences in batches of this size. Speeds up long texts with VITS and ForwardTTS models.",
+        default=1,
+    )
     parser.add_argument(
         "--vocoder_path",
         type=str,
@@ -433,6 +446,7 @@ def main():
             vc_config_path,
             model_dir,
             args.voice_dir,
+            quantize=args.quantize,
         ).to(device)
 
         # query speaker ids of a multi-speaker model.
@@ -474,6 +488,7 @@ def main():
                 style_wav=args.capacitron_style_wav,
                 style_text=args.capacitron_style_text,
                 reference_speaker_name=args.reference_speaker_idx,
+                sentence_batch_size=args.sentence_batch_size,
             )
         elif vc_path is not None:
             wav = synthesizer.voice_conversion(
@@ -4,6 +4,7 @@ import torch
 from torch.utils.data import Dataset
 
 from TTS.encoder.utils.generic_utils import AugmentWAV
+from TTS.utils.audio.manifest import get_audio_manifest
 
 
 class EncoderDataset(Dataset):
@@ -80,15 +81,21 @@ class EncoderDataset(Dataset):
         classes = list(class_to_utters.keys())
         classes.sort()
 
+        # the durations are read from the audio manifest instead of decoding every file. Trimming the silences only
+        # shortens the audio, so the files are only decoded to check their trimmed length if they are long enough.
+        durations = get_audio_manifest().durations([item["audio_file"] for item in self.items])
+
         new_items = []
-        for item in self.items:
+        for item, duration in zip(self.items, durations):
             path_ = item["audio_file"]
             class_name = item["emotion_name"] if self.config.model == "emotion_encoder" else item["speaker_name"]
             # ignore filtered classes
             if class_name not in classes:
                 continue
             # ignore small audios
-            if self.load_wav(path_).shape[0] - self.seq_len <= 0:
+            if int(duration * self.sample_rate) - self.seq_len <= 0:
+                continue
+            if self.ap.do_trim_silence and self.load_wav(path_).shape[0] - self.seq_len <= 0:
                 continue
 
             new_items.append({"wav_file_path": path_, "class_name": class_name})
@@ -6,7 +6,7 @@ from torch import nn
 
 from TTS.encoder.losses import AngleProtoLoss, GE2ELoss, SoftmaxAngleProtoLoss
 from TTS.utils.generic_utils import set_init_dict
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 
 
 class PreEmphasis(nn.Module):
@@ -117,7 +117,7 @@ class BaseEncoder(nn.Module):
     ):
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
         try:
-            self.load_state_dict(state["model"])
+            self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
             print(" > Model fully restored. ")
         except (KeyError, RuntimeError) as error:
             # If eval raise the error
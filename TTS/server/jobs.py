@@ -0,0 +1,281 @@
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing, contextmanager
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from TTS.server.pool import ServerBusyError, SynthesizerPool
+from TTS.utils.audio.numpy_transforms import save_wav
+
+
+class JobQueue:
+    """Persistent queue of document-to-audio jobs stored in a SQLite database.
+
+    A job goes through the `queued`, `running` and then `done` or `failed` states. The number of sentences already
+    synthesized is stored with the job, so a job interrupted by a crash resumes from its last checkpoint once
+    `recover()` queues it again.
+
+    The checkpoints of a job are removed once it is done or failed, and `expire()` deletes the finished jobs and
+    their wav files `retention` seconds after they finished.
+
+    Args:
+        jobs_dir (str): folder keeping the database, the checkpointed audio of the running jobs and the wav files of
+            the finished ones.
+        retention (float): seconds the done and failed jobs are kept. Defaults to 24 hours. None keeps them forever.
+
+    Example:
+        >>> jobs = JobQueue("/path/to/jobs")
+        >>> job_id = jobs.submit("A long text.", {"speaker_name": "p225"})
+        >>> jobs.get(job_id)["status"]
+        'queued'
+    """
+
+    def __init__(self, jobs_dir: str, retention: float = 24 * 3600):
+        self.jobs_dir = jobs_dir
+        self.retention = retention
+        os.makedirs(jobs_dir, exist_ok=True)
+        self.db_path = os.path.join(jobs_dir, "jobs.db")
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    tts_args TEXT NOT NULL,
+                    sentences TEXT,
+                    num_done INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def _connect(self):
+        # a connection per call, so the queue can be shared by threads and processes
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return closing(conn)
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock first, so no other connection writes between our reads and writes
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _update(self, job_id: str, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", [*fields.values(), job_id])
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        sentences = json.loads(row["sentences"]) if row["sentences"] is not None else None
+        num_sentences = len(sentences) if sentences is not None else None
+        return {
+            "job_id": row["id"],
+            "status": row["status"],
+            "text": row["text"],
+            "tts_args": json.loads(row["tts_args"]),
+            "sentences": sentences,
+            "num_sentences": num_sentences,
+            "num_done": row["num_done"],
+            "progress": row["num_done"] / num_sentences if num_sentences else 0.0,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    def submit(self, text: str, tts_args: Dict = None) -> str:
+        """Queue a new job and return its id.
+
+        Args:
+            text (str): text to synthesize.
+            tts_args (Dict): JSON serializable arguments passed to `Synthesizer.tts()` for each sentence.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, text, tts_args, created_at, updated_at) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, text, json.dumps(tts_args or {}), now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Dict:
+        """Return the job with its status and progress or None if it does not exist."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def claim(self) -> Dict:
+        """Mark the oldest queued job as running and return it, or None if the queue is empty."""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1").fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ?", (time.time(), row["id"]))
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        return self._to_dict(row)
+
+    def set_sentences(self, job_id: str, sentences: List[str]):
+        """Store the sentences of the job so it resumes with the same split."""
+        self._update(job_id, sentences=json.dumps(sentences))
+
+    def checkpoint(self, job_id: str, num_done: int):
+        """Record that the audio of the first `num_done` sentences is saved."""
+        self._update(job_id, num_done=num_done)
+
+    def finish(self, job_id: str):
+        self._update(job_id, status="done")
+
+    def fail(self, job_id: str, error: str):
+        self._update(job_id, status="failed", error=error)
+
+    def requeue(self, job_id: str):
+        self._update(job_id, status="queued")
+
+    def recover(self) -> int:
+        """Queue again the jobs left running by a stopped process and return their number.
+
+        Call it at startup, before any `JobWorker` of this queue runs.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', updated_at = ? WHERE status = 'running'", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def expire(self) -> int:
+        """Delete the done and failed jobs older than `retention` with their files and return their number."""
+        if self.retention is None:
+            return 0
+        # the done and failed states are final, so the jobs cannot change between the select and the delete
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - self.retention,),
+            ).fetchall()
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(row["id"],) for row in rows])
+        for row in rows:
+            self.remove_checkpoints(row["id"])
+            for path in [self.audio_path(row["id"]), self.audio_path(row["id"]) + ".tmp"]:
+                if os.path.isfile(path):
+                    os.remove(path)
+        return len(rows)
+
+    def remove_checkpoints(self, job_id: str):
+        shutil.rmtree(os.path.join(self.jobs_dir, job_id), ignore_errors=True)
+
+    def checkpoint_path(self, job_id: str, idx: int) -> str:
+        return os.path.join(self.jobs_dir, job_id, f"{idx:06d}.npy")
+
+    def audio_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.wav")
+
+
+class JobWorker(threading.Thread):
+    """Background thread running the jobs of a `JobQueue` on the workers of a `SynthesizerPool`.
+
+    The text of a job is split with `Synthesizer.split_into_sentences()` and each sentence is synthesized by
+    `Synthesizer.tts()` on the next free worker, so jobs share the replicas with the synchronous requests. The audio
+    of each sentence is checkpointed to disk and the job wav is written once all the sentences are done. It matches
+    the output of a single `Synthesizer.tts()` call on the whole text. The finished jobs past the retention of the
+    queue are expired whenever it is empty.
+
+    Args:
+        jobs (JobQueue): queue to take the jobs from.
+        pool (SynthesizerPool): workers running the synthesis.
+        poll_interval (float): seconds to wait before checking an empty queue again. Defaults to 1.0.
+        get_pool (Callable[[str], SynthesizerPool]): returns the workers of the model named by the `model_name`
+            argument of a job. Defaults to None, all the jobs run on `pool`.
+    """
+
+    def __init__(
+        self,
+        jobs: JobQueue,
+        pool: SynthesizerPool,
+        poll_interval: float = 1.0,
+        get_pool: Callable[[str], SynthesizerPool] = None,
+    ):
+        super().__init__(daemon=True)
+        self.jobs = jobs
+        self.pool = pool
+        self.poll_interval = poll_interval
+        self.get_pool = get_pool
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Stop after the current sentence. An unfinished job is queued again."""
+        self._stop_event.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            job = self.jobs.claim()
+            if job is None:
+                self.jobs.expire()
+                self._stop_event.wait(self.poll_interval)
+                continue
+            self.run_job(job)
+
+    @staticmethod
+    def _run_on_worker(pool: SynthesizerPool, fn: Callable[[Any], Any], exclusive: bool = False) -> Any:
+        """Run `fn(worker)` on the pool, waiting for room in its queue instead of failing."""
+        while True:
+            try:
+                outputs, _ = pool.run(fn, exclusive=exclusive)
+                return outputs
+            except ServerBusyError as e:
+                time.sleep(e.retry_after)
+
+    def run_job(self, job: Dict):
+        """Synthesize the sentences of a claimed job that are not checkpointed yet and write the job wav."""
+        job_id = job["job_id"]
+        try:
+            tts_args = dict(job["tts_args"])
+            model_name = tts_args.pop("model_name", None)
+            pool = self.get_pool(model_name) if self.get_pool is not None else self.pool
+            sentences = job["sentences"]
+            if sentences is None:
+                sentences = self._run_on_worker(pool, lambda worker: worker.split_into_sentences(job["text"]))
+                self.jobs.set_sentences(job_id, sentences)
+            os.makedirs(os.path.join(self.jobs.jobs_dir, job_id), exist_ok=True)
+            for idx in range(job["num_done"], len(sentences)):
+                if self._stop_event.is_set():
+                    self.jobs.requeue(job_id)
+                    return
+                wav = self._run_on_worker(
+                    # pylint: disable=cell-var-from-loop
+                    pool,
+                    lambda worker: worker.tts(sentences[idx], split_sentences=False, **tts_args),
+                    # style_wav requests bypass the batching and must not share their worker
+                    exclusive=tts_args.get("style_wav") is not None,
+                )
+                path = self.jobs.checkpoint_path(job_id, idx)
+                with open(path + ".tmp", "wb") as f:
+                    np.save(f, np.asarray(wav, dtype=np.float32))
+                os.replace(path + ".tmp", path)
+                self.jobs.checkpoint(job_id, idx + 1)
+            wav = np.concatenate([np.load(self.jobs.checkpoint_path(job_id, idx)) for idx in range(len(sentences))])
+            path = self.jobs.audio_path(job_id)
+            save_wav(wav=wav, path=path + ".tmp", sample_rate=pool.workers[0].output_sample_rate)
+            os.replace(path + ".tmp", path)
+            self.jobs.remove_checkpoints(job_id)
+            self.jobs.finish(job_id)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f" > Job {job_id} failed: {e}")
+            self.jobs.remove_checkpoints(job_id)
+            self.jobs.fail(job_id, str(e))
@@ -0,0 +1,177 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from TTS.utils.model_pool import close_model
+
+
+class ServerBusyError(Exception):
+    """Raised when the request queue of a `SynthesizerPool` is full.
+
+    Args:
+        retry_after (int): seconds the client should wait before retrying.
+    """
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__(f" [!] All workers are busy and the request queue is full. Retry after {retry_after}s.")
+        self.retry_after = retry_after
+
+
+@dataclass
+class RequestTiming:
+    """Timing of a single request served by a `SynthesizerPool`, in seconds."""
+
+    queue_time: float = 0.0
+    process_time: float = 0.0
+
+    def to_server_timing(self) -> str:
+        """Format the timing as a `Server-Timing` HTTP header value (durations in ms)."""
+        return f"queue;dur={self.queue_time * 1000:.1f}, synthesis;dur={self.process_time * 1000:.1f}"
+
+
+class SynthesizerPool:
+    """A fixed pool of model replicas that serves requests concurrently.
+
+    Each worker is an independent replica built by `worker_fn` (e.g. a `Synthesizer`) and is used by one request at
+    a time, so models that keep decoding state on `self` stay safe. Workers that are safe to share, like a
+    `Synthesizer` batching concurrent calls, are selected by `is_shareable` and serve `requests_per_worker` requests
+    at once. A request that must not share its worker, e.g. one that bypasses the batching, takes it with
+    `exclusive=True`. At most `capacity - max_queue_size` requests run at once and at most `max_queue_size` more
+    wait for a free worker. Any request beyond that is rejected with `ServerBusyError` so the caller can answer with
+    backpressure instead of piling up threads.
+
+    Args:
+        worker_fn (Callable[[], Any]): builds a new worker replica.
+        num_workers (int): number of replicas. Defaults to 1.
+        max_queue_size (int): number of requests allowed to wait for a free worker. A negative value means
+            unbounded. Defaults to 16.
+        retry_after (int): seconds reported to rejected clients. Defaults to 1.
+        requests_per_worker (int): number of requests a shareable worker serves at once. Defaults to 1.
+        is_shareable (Callable[[Any], bool]): returns True if a worker can serve `requests_per_worker` requests at
+            once. Defaults to None, all the workers are shareable.
+
+    Example:
+        >>> pool = SynthesizerPool(lambda: Synthesizer(...), num_workers=4)
+        >>> wav, timing = pool.run(lambda synthesizer: synthesizer.tts("Hello world!"))
+    """
+
+    def __init__(
+        self,
+        worker_fn: Callable[[], Any],
+        num_workers: int = 1,
+        max_queue_size: int = 16,
+        retry_after: int = 1,
+        requests_per_worker: int = 1,
+        is_shareable: Callable[[Any], bool] = None,
+    ):
+        if num_workers < 1 or requests_per_worker < 1:
+            raise ValueError(
+                " [!] `num_workers` and `requests_per_worker` must be at least 1, "
+                f"got {num_workers} and {requests_per_worker}."
+            )
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.retry_after = retry_after
+        self.requests_per_worker = requests_per_worker
+        self.workers: List[Any] = [worker_fn() for _ in range(num_workers)]
+        # number of requests each worker serves at once and is serving
+        self._limits = [
+            requests_per_worker if is_shareable is None or is_shareable(worker) else 1 for worker in self.workers
+        ]
+        self._num_active = [0] * num_workers
+        self._exclusive = set()
+        self._available = threading.Condition()
+        self._lock = threading.Lock()
+        self._num_pending = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of requests in flight, running or waiting. -1 when unbounded."""
+        if self.max_queue_size < 0:
+            return -1
+        return sum(self._limits) + self.max_queue_size
+
+    @property
+    def num_pending(self) -> int:
+        """Number of requests currently running or waiting for a worker."""
+        return self._num_pending
+
+    def _find_worker(self, exclusive: bool) -> Optional[int]:
+        # the least busy worker with room for the request
+        free = [
+            idx
+            for idx, num_active in enumerate(self._num_active)
+            if (num_active == 0 if exclusive else num_active < self._limits[idx])
+        ]
+        return min(free, key=lambda idx: self._num_active[idx]) if free else None
+
+    def acquire(self, exclusive: bool = False) -> Tuple[Any, RequestTiming]:
+        """Wait for a free worker. It must be given back with `release()`.
+
+        Args:
+            exclusive (bool): take a worker that serves no other request and keep the other requests off it until
+                it is released. Defaults to False.
+
+        Raises:
+            ServerBusyError: if all workers are busy and the queue is full.
+
+        Returns:
+            Tuple[Any, RequestTiming]: the worker and the timing of the request so far.
+        """
+        with self._lock:
+            if 0 <= self.capacity <= self._num_pending:
+                raise ServerBusyError(self.retry_after)
+            self._num_pending += 1
+        start_time = time.perf_counter()
+        with self._available:
+            idx = self._find_worker(exclusive)
+            while idx is None:
+                self._available.wait()
+                idx = self._find_worker(exclusive)
+            if exclusive:
+                self._num_active[idx] = self._limits[idx]
+                self._exclusive.add(idx)
+            else:
+                self._num_active[idx] += 1
+        return self.workers[idx], RequestTiming(queue_time=time.perf_counter() - start_time)
+
+    def release(self, worker: Any):
+        """Give back a worker taken with `acquire()`."""
+        with self._available:
+            idx = next(idx for idx, w in enumerate(self.workers) if w is worker and self._num_active[idx] > 0)
+            if idx in self._exclusive:
+                self._exclusive.remove(idx)
+                self._num_active[idx] = 0
+            else:
+                self._num_active[idx] -= 1
+            self._available.notify_all()
+        with self._lock:
+            self._num_pending -= 1
+
+    def close(self):
+        """Close the workers that have a `close()` method, e.g. to stop the batching thread of a `Synthesizer`."""
+        for worker in self.workers:
+            close_model(worker)
+
+    def run(self, fn: Callable[..., Any], *args, exclusive: bool = False, **kwargs) -> Tuple[Any, RequestTiming]:
+        """Run `fn(worker, *args, **kwargs)` on the next free worker.
+
+        Args:
+            fn (Callable[..., Any]): function to run with the worker.
+            exclusive (bool): do not share the worker with other requests, see `acquire()`. Defaults to False.
+
+        Raises:
+            ServerBusyError: if all workers are busy and the queue is full.
+
+        Returns:
+            Tuple[Any, RequestTiming]: the output of `fn` and the timing of the request.
+        """
+        worker, timing = self.acquire(exclusive=exclusive)
+        try:
+            start_time = time.perf_counter()
+            outputs = fn(worker, *args, **kwargs)
+            timing.process_time = time.perf_counter() - start_time
+        finally:
+            self.release(worker)
+        return outputs, timing
@@ -4,15 +4,22 @@ import io
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from threading import Lock
 from typing import Union
 from urllib.parse import parse_qs
 
-from flask import Flask, render_template, render_template_string, request, send_file
+import torch
+from flask import Flask, Response, render_template, render_template_string, request, send_file, stream_with_context
 
 from TTS.config import load_config
+from TTS.server.jobs import JobQueue, JobWorker
+from TTS.server.pool import ServerBusyError, SynthesizerPool
+from TTS.server.voices import resolve_speaker_wav
+from TTS.tts.layers.xtts.latent_cache import ConditioningLatentCache
+from TTS.utils.audio.numpy_transforms import wav_stream_header, wav_to_pcm16
 from TTS.utils.manage import ModelManager
+from TTS.utils.model_pool import ModelPool
 from TTS.utils.synthesizer import Synthesizer
 
 
@@ -57,6 +64,72 @@ def create_argparser():
     parser.add_argument("--use_cuda", type=convert_boolean, default=False, help="true to use CUDA.")
     parser.add_argument("--debug", type=convert_boolean, default=False, help="true to enable Flask debug mode.")
     parser.add_argument("--show_details", type=convert_boolean, default=False, help="Generate model detail page.")
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=1,
+        help="Number of model replicas serving requests concurrently. Each replica holds its own copy of the model.",
+    )
+    parser.add_argument(
+        "--max_queue_size",
+        type=int,
+        default=16,
+        help="Number of requests allowed to wait for a free worker. Beyond that the server answers 503. -1 for unbounded.",
+    )
+    parser.add_argument(
+        "--retry_after", type=int, default=1, help="Seconds sent in the `Retry-After` header of 503 responses."
+    )
+    parser.add_argument(
+        "--max_batch_size",
+        type=int,
+        default=1,
+        help="Maximum number of sentences from concurrent requests synthesized together by a worker. Only for VITS and ForwardTTS models.",
+    )
+    parser.add_argument(
+        "--max_wait_time", type=float, default=0.01, help="Seconds a worker waits for more sentences to fill a batch."
+    )
+    parser.add_argument(
+        "--latent_cache_size",
+        type=int,
+        default=32,
+        help="Number of XTTS speaker conditioning latents cached in memory and shared by the workers. 0 to disable.",
+    )
+    parser.add_argument(
+        "--speaker_wav_dir",
+        type=str,
+        default=None,
+        help="Folder of the reference wavs clients can name in `speaker_wav` for voice cloning. Disabled if not set.",
+    )
+    parser.add_argument(
+        "--latent_cache_dir", type=str, default=None, help="Folder to also store the XTTS conditioning latents on disk."
+    )
+    parser.add_argument(
+        "--max_loaded_models",
+        type=int,
+        default=1,
+        help="Number of released models requested by `model_name` kept in memory besides the default one. The least recently used one is dropped beyond that.",
+    )
+    parser.add_argument(
+        "--max_memory_mb",
+        type=float,
+        default=None,
+        help="Memory budget in MB for the weights of the models requested by `model_name`. The least recently used ones are dropped beyond that.",
+    )
+    parser.add_argument(
+        "--jobs_dir",
+        type=str,
+        default=None,
+        help="Folder of the job queue to enable the asynchronous `/api/jobs` API. Unfinished jobs resume at restart.",
+    )
+    parser.add_argument(
+        "--job_retention_hours",
+        type=float,
+        default=24,
+        help="Hours the done and failed jobs of the `/api/jobs` API and their audio are kept. 0 keeps them forever.",
+    )
+    parser.add_argument(
+        "--num_job_workers", type=int, default=1, help="Number of jobs synthesized at once by the `/api/jobs` API."
+    )
     return parser
 
 
@@ -100,19 +173,114 @@ if args.vocoder_path is not None:
     vocoder_path = args.vocoder_path
     vocoder_config_path = args.vocoder_config_path
 
+# share the CPU cores among the workers instead of letting each one spawn a thread per core
+if args.num_workers > 1 and not args.use_cuda:
+    torch.set_num_threads(max(1, torch.get_num_threads() // args.num_workers))
+
+# share the XTTS speaker conditioning latents among the replicas
+latent_cache = (
+    ConditioningLatentCache(args.latent_cache_size, args.latent_cache_dir) if args.latent_cache_size > 0 else None
+)
+
+
+def create_pool(
+    tts_checkpoint: str,
+    tts_config_path: str,
+    tts_speakers_file: str = None,
+    vocoder_checkpoint: str = None,
+    vocoder_config: str = None,
+    model_dir: str = None,
+) -> SynthesizerPool:
+    """Load the replicas of a model."""
+    model_pool = SynthesizerPool(
+        lambda: Synthesizer(
+            tts_checkpoint=tts_checkpoint,
+            tts_config_path=tts_config_path,
+            tts_speakers_file=tts_speakers_file,
+            tts_languages_file=None,
+            vocoder_checkpoint=vocoder_checkpoint,
+            vocoder_config=vocoder_config,
+            encoder_checkpoint="",
+            encoder_config="",
+            model_dir=model_dir,
+            use_cuda=args.use_cuda,
+            max_batch_size=args.max_batch_size,
+            max_wait_time=args.max_wait_time,
+        ),
+        num_workers=args.num_workers,
+        max_queue_size=args.max_queue_size,
+        retry_after=args.retry_after,
+        # a batching worker collects the sentences of several requests at once, the others serve one at a time
+        requests_per_worker=args.max_batch_size,
+        is_shareable=lambda worker: worker.batch_scheduler is not None,
+    )
+    for worker in model_pool.workers:
+        if hasattr(worker.tts_model, "latent_cache"):
+            worker.tts_model.latent_cache = latent_cache
+    return model_pool
+
+
+def create_pool_by_name(name: str) -> SynthesizerPool:
+    """Download a released model and its default vocoder and load their replicas."""
+    tts_checkpoint, tts_config_path, model_item = manager.download_model(name)
+    if isinstance(model_item.get("model_url"), list):
+        # models with several files load themselves from their folder
+        return create_pool(None, None, model_dir=tts_checkpoint)
+    vocoder_checkpoint, vocoder_config = None, None
+    if model_item.get("default_vocoder") is not None:
+        vocoder_checkpoint, vocoder_config, _ = manager.download_model(model_item["default_vocoder"])
+    return create_pool(tts_checkpoint, tts_config_path, None, vocoder_checkpoint, vocoder_config)
+
+
 # load models
-synthesizer = Synthesizer(
-    tts_checkpoint=model_path,
-    tts_config_path=config_path,
-    tts_speakers_file=speakers_file_path,
-    tts_languages_file=None,
-    vocoder_checkpoint=vocoder_path,
-    vocoder_config=vocoder_config_path,
-    encoder_checkpoint="",
-    encoder_config="",
-    use_cuda=args.use_cuda,
+pool = create_pool(model_path, config_path, speakers_file_path, vocoder_path, vocoder_config_path)
+# the other released models are loaded on their first request and the least recently used ones are dropped
+model_pools = ModelPool(
+    create_pool_by_name,
+    max_models=args.max_loaded_models,
+    max_memory=args.max_memory_mb * 2**20 if args.max_memory_mb is not None else None,
 )
 
+
+def check_model_name(name: str = None):
+    """Raise a `ValueError` if `name` is neither empty, for the default model, nor a released TTS model."""
+    if not name or name == args.model_name:
+        return
+    parts = name.split("/")
+    released_models = manager.models_dict["tts_models"]
+    if (
+        len(parts) != 4
+        or parts[0] != "tts_models"
+        or parts[3] not in released_models.get(parts[1], {}).get(parts[2], {})
+    ):
+        raise ValueError(f" [!] Unknown model `{name}`.")
+
+
+def get_pool(name: str = None) -> SynthesizerPool:
+    """Return the replicas of the released model `name` or of the default model when `name` is empty.
+
+    Raises:
+        ValueError: if `name` is not a released TTS model.
+    """
+    check_model_name(name)
+    if not name or name == args.model_name:
+        return pool
+    return model_pools.get(name)
+
+
+# run the long texts submitted to `/api/jobs` in the background
+jobs = None
+if args.jobs_dir is not None:
+    jobs = JobQueue(args.jobs_dir, retention=args.job_retention_hours * 3600 or None)
+    num_recovered = jobs.recover()
+    if num_recovered > 0:
+        print(f" > Resuming {num_recovered} unfinished jobs.")
+    for _ in range(args.num_job_workers):
+        JobWorker(jobs, pool, get_pool=get_pool).start()
+
+# all the replicas are identical, use the first one for the model details
+synthesizer = pool.workers[0]
+
 use_multi_speaker = hasattr(synthesizer.tts_model, "num_speakers") and (
     synthesizer.tts_model.num_speakers > 1 or synthesizer.tts_speakers_file is not None
 )
@@ -185,25 +353,151 @@ def details():
     )
 
 
-lock = Lock()
+def _synthesize_wav(worker: Synthesizer, text: str, **kwargs) -> io.BytesIO:
+    wavs = worker.tts(text, **kwargs)
+    out = io.BytesIO()
+    worker.save_wav(wavs, out)
+    return out
+
+
+def synthesize(text: str, model_name: str = "", **kwargs) -> Response:
+    """Synthesize `text` on the next free worker of the model `model_name` and return the wav response.
+
+    Answers 503 with a `Retry-After` header when all the workers are busy and the request queue is full.
+    """
+    try:
+        # style_wav requests bypass the batching and must not share their worker
+        exclusive = kwargs.get("style_wav") is not None
+        out, timing = get_pool(model_name).run(_synthesize_wav, text, exclusive=exclusive, **kwargs)
+    except ValueError as e:
+        return Response(str(e), status=400)
+    except ServerBusyError as e:
+        return Response(str(e), status=503, headers={"Retry-After": str(e.retry_after)})
+    print(f" > Queue time: {timing.queue_time}")
+    print(f" > Synthesis time: {timing.process_time}")
+    response = send_file(out, mimetype="audio/wav")
+    response.headers["Server-Timing"] = timing.to_server_timing()
+    return response
+
+
+def _get_tts_args() -> dict:
+    """Read the synthesis arguments of the request.
+
+    Raises:
+        ValueError: if the `speaker_wav` of the request is not a wav file of `--speaker_wav_dir`.
+    """
+    text = request.headers.get("text") or request.values.get("text", "")
+    speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
+    language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
+    style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
+    style_wav = style_wav_uri_to_dict(style_wav)
+    # speaker_wav is the name of a reference .wav file in `--speaker_wav_dir` for voice cloning
+    speaker_wav = request.headers.get("speaker-wav") or request.values.get("speaker_wav", "")
+    speaker_wav = resolve_speaker_wav(args.speaker_wav_dir, speaker_wav)
+    # released model to use instead of the default one
+    model_name = request.headers.get("model-name") or request.values.get("model_name", "")
+
+    print(f" > Model input: {text}")
+    print(f" > Speaker Idx: {speaker_idx}")
+    print(f" > Language Idx: {language_idx}")
+    return {
+        "text": text,
+        "speaker_name": speaker_idx,
+        "language_name": language_idx,
+        "style_wav": style_wav,
+        "speaker_wav": speaker_wav,
+        "model_name": model_name,
+    }
 
 
 @app.route("/api/tts", methods=["GET", "POST"])
 def tts():
-    with lock:
-        text = request.headers.get("text") or request.values.get("text", "")
-        speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
-        language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
-        style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
-        style_wav = style_wav_uri_to_dict(style_wav)
-
-        print(f" > Model input: {text}")
-        print(f" > Speaker Idx: {speaker_idx}")
-        print(f" > Language Idx: {language_idx}")
-        wavs = synthesizer.tts(text, speaker_name=speaker_idx, language_name=language_idx, style_wav=style_wav)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
-    return send_file(out, mimetype="audio/wav")
+    try:
+        tts_args = _get_tts_args()
+    except ValueError as e:
+        return Response(str(e), status=400)
+    return synthesize(**tts_args)
+
+
+@app.route("/api/tts/stream", methods=["GET", "POST"])
+def tts_stream():
+    """Stream the speech as a chunked wav response while it is synthesized.
+
+    XTTS streams chunks within each sentence, the other models stream sentence by sentence. The wav header has an
+    unknown length and the 16-bit PCM frames follow as soon as they are ready.
+    """
+    try:
+        tts_args = _get_tts_args()
+        model_pool = get_pool(tts_args.pop("model_name"))
+        # streaming runs sentence by sentence outside of the batching
+        worker, timing = model_pool.acquire(exclusive=True)
+    except ValueError as e:
+        return Response(str(e), status=400)
+    except ServerBusyError as e:
+        return Response(str(e), status=503, headers={"Retry-After": str(e.retry_after)})
+
+    def _generate():
+        start_time = time.perf_counter()
+        try:
+            yield wav_stream_header(sample_rate=worker.output_sample_rate)
+            for idx, chunk in enumerate(worker.tts_stream(**tts_args)):
+                if idx == 0:
+                    print(f" > Time to first audio: {time.perf_counter() - start_time}")
+                yield wav_to_pcm16(wav=chunk)
+        finally:
+            # also reached when the client disconnects
+            model_pool.release(worker)
+            print(f" > Streaming time: {time.perf_counter() - start_time}")
+
+    response = Response(stream_with_context(_generate()), mimetype="audio/wav")
+    response.headers["Server-Timing"] = f"queue;dur={timing.queue_time * 1000:.1f}"
+    return response
+
+
+def _job_response(job: dict, status: int = 200) -> Response:
+    outputs = {key: job[key] for key in ["job_id", "status", "num_sentences", "num_done", "progress", "error"]}
+    response = Response(json.dumps(outputs), status=status, mimetype="application/json")
+    response.headers["Location"] = f"/api/jobs/{job['job_id']}"
+    return response
+
+
+@app.route("/api/jobs", methods=["POST"])
+def submit_job():
+    """Queue a long text and answer its job id right away.
+
+    Takes the same parameters as `/api/tts`. Poll `/api/jobs/<job_id>` for the progress and fetch the wav from
+    `/api/jobs/<job_id>/audio` once the job is done.
+    """
+    if jobs is None:
+        return Response("The job API is disabled. Start the server with `--jobs_dir`.", status=404)
+    try:
+        tts_args = _get_tts_args()
+        check_model_name(tts_args["model_name"])
+    except ValueError as e:
+        return Response(str(e), status=400)
+    text = tts_args.pop("text")
+    if not text.strip():
+        return Response("Missing `text`.", status=400)
+    job_id = jobs.submit(text, tts_args)
+    return _job_response(jobs.get(job_id), status=202)
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def job_status(job_id: str):
+    job = jobs.get(job_id) if jobs is not None else None
+    if job is None:
+        return Response(f"Unknown job `{job_id}`.", status=404)
+    return _job_response(job)
+
+
+@app.route("/api/jobs/<job_id>/audio", methods=["GET"])
+def job_audio(job_id: str):
+    job = jobs.get(job_id) if jobs is not None else None
+    if job is None:
+        return Response(f"Unknown job `{job_id}`.", status=404)
+    if job["status"] != "done":
+        return Response(f"Job `{job_id}` is {job['status']}.", status=409)
+    return send_file(jobs.audio_path(job_id), mimetype="audio/wav")
 
 
 # Basic MaryTTS compatibility layer
@@ -236,22 +530,18 @@ def mary_tts_api_voices():
 @app.route("/process", methods=["GET", "POST"])
 def mary_tts_api_process():
     """MaryTTS-compatible /process endpoint"""
-    with lock:
-        if request.method == "POST":
-            data = parse_qs(request.get_data(as_text=True))
-            # NOTE: we ignore param. LOCALE and VOICE for now since we have only one active model
-            text = data.get("INPUT_TEXT", [""])[0]
-        else:
-            text = request.args.get("INPUT_TEXT", "")
-        print(f" > Model input: {text}")
-        wavs = synthesizer.tts(text)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
-    return send_file(out, mimetype="audio/wav")
+    if request.method == "POST":
+        data = parse_qs(request.get_data(as_text=True))
+        # NOTE: we ignore param. LOCALE and VOICE for now since we have only one active model
+        text = data.get("INPUT_TEXT", [""])[0]
+    else:
+        text = request.args.get("INPUT_TEXT", "")
+    print(f" > Model input: {text}")
+    return synthesize(text)
 
 
 def main():
-    app.run(debug=args.debug, host="::", port=args.port)
+    app.run(debug=args.debug, host="::", port=args.port, threaded=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import os
+
+
+def resolve_speaker_wav(speaker_wav_dir: str, name: str) -> str:
+    """Return the path of the reference wav `name` of a request, looked up in `speaker_wav_dir`.
+
+    Only the `.wav` files inside `speaker_wav_dir` can be used, so clients cannot make the server read any other file
+    or probe which paths exist. The same error is raised for missing files and for names outside of the folder.
+
+    Args:
+        speaker_wav_dir (str): folder of the reference wavs. None disables the requests with a speaker wav.
+        name (str): file name, relative to `speaker_wav_dir`, given by the client. Empty for no speaker wav.
+
+    Raises:
+        ValueError: if `name` is not a `.wav` file inside `speaker_wav_dir` or `speaker_wav_dir` is not set.
+
+    Returns:
+        str: path of the wav file or None if `name` is empty.
+    """
+    if not name:
+        return None
+    if speaker_wav_dir is None:
+        raise ValueError(" [!] `speaker_wav` is disabled. Start the server with `--speaker_wav_dir`.")
+    voices_dir = os.path.realpath(speaker_wav_dir)
+    path = os.path.realpath(os.path.join(voices_dir, name))
+    if not path.startswith(voices_dir + os.sep) or not path.endswith(".wav") or not os.path.isfile(path):
+        raise ValueError(f" [!] Unknown `speaker_wav` `{name}`.")
+    return path
@@ -172,6 +172,10 @@ class BaseTTSConfig(BaseTrainingConfig):
             Language code for the phonemizer. You can check the list of supported languages by running
             `python TTS/tts/utils/text/phonemizers/__init__.py`. Defaults to None.
 
+        phonemizer_persistent (bool):
+            Keep a long-lived espeak process to phonemize the texts instead of starting a new one for every text. Only
+            used by the `espeak` phonemizer. Defaults to True.
+
         compute_input_seq_cache (bool):
             enable / disable precomputation of the phoneme sequences. At the expense of some delay at the beginning of
             the training, It allows faster data loader time and precise limitation with `max_seq_len` and
@@ -189,6 +193,13 @@ class BaseTTSConfig(BaseTrainingConfig):
         phoneme_cache_path (str):
             Path to the output folder caching the computed phonemes for each sample.
 
+        tokenizer_cache_size (int):
+            Number of tokenized texts kept in an LRU cache by the tokenizer. Useful at inference to skip the cleaners
+            and the phonemizer for repeated texts. 0 disables the cache. Defaults to 0.
+
+        tokenizer_cache_path (str):
+            Path to a JSON file to persist the tokenizer cache across restarts. Defaults to None.
+
         characters (CharactersConfig):
             Instance of a CharactersConfig class.
 
@@ -197,6 +208,12 @@ class BaseTTSConfig(BaseTrainingConfig):
             length for a more efficient and stable training. If `batch_group_size > 1` then it performs bucketing to
             prevent using the same batches for each epoch.
 
+        batch_max_frames (int):
+            Maximum number of padded spectrogram frames in a training batch. If set, the training batches are made of
+            samples of similar length with as many samples as fit the budget, instead of `batch_size` samples. Short
+            samples are then batched in larger batches and long samples in smaller ones. The batches are deterministic
+            per epoch and can be combined with the weighted samplers and distributed training. Defaults to None.
+
         loss_masking (bool):
             enable / disable masking loss values against padded segments of samples in a batch.
 
@@ -223,9 +240,19 @@ class BaseTTSConfig(BaseTrainingConfig):
         compute_linear_spec (bool):
             If True data loader computes and returns linear spectrograms alongside the other data.
 
+        compute_spec_on_device (bool):
+            If True the data loader returns the raw audio instead of the spectrograms and the model computes the mel
+            and linear spectrograms of the batch on the training device with the same audio parameters. It moves the
+            STFT out of the data loader workers when they are the training bottleneck. Defaults to False.
+
         precompute_num_workers (int):
             Number of workers to precompute features. Defaults to 0.
 
+        feature_store_path (str):
+            Path to a feature store packed by `TTS/bin/pack_features.py`. The audio, token ids, pitch and energy of
+            the samples are read from its memory-mapped shards instead of the audio files and the per-file caches.
+            Defaults to None.
+
         use_noise_augment (bool):
             Augment the input audio with random noise.
 
@@ -298,16 +325,20 @@ class BaseTTSConfig(BaseTrainingConfig):
     use_phonemes: bool = False
     phonemizer: str = None
     phoneme_language: str = None
+    phonemizer_persistent: bool = True
     compute_input_seq_cache: bool = False
     text_cleaner: str = None
     enable_eos_bos_chars: bool = False
     test_sentences_file: str = ""
     phoneme_cache_path: str = None
+    tokenizer_cache_size: int = 0
+    tokenizer_cache_path: str = None
     # vocabulary parameters
     characters: CharactersConfig = None
     add_blank: bool = False
     # training params
     batch_group_size: int = 0
+    batch_max_frames: int = None
     loss_masking: bool = None
     # dataloading
     min_audio_len: int = 1
@@ -317,7 +348,9 @@ class BaseTTSConfig(BaseTrainingConfig):
     compute_f0: bool = False
     compute_energy: bool = False
     compute_linear_spec: bool = False
+    compute_spec_on_device: bool = False
     precompute_num_workers: int = 0
+    feature_store_path: str = None
     use_noise_augment: bool = False
     start_by_longest: bool = False
     shuffle: bool = False
@@ -56,6 +56,13 @@ class XttsConfig(BaseTTSConfig):
         sound_norm_refs (bool):
             Whether to normalize the conditioning audio. Defaults to `False`.
 
+        latent_cache_size (int):
+            Number of speaker conditioning latents kept in memory, keyed on the content of the reference audio files.
+            Repeated requests with the same `speaker_wav` skip the conditioning. 0 disables the cache. Defaults to `32`.
+
+        latent_cache_dir (str):
+            Folder to also store the cached conditioning latents on disk. Defaults to None.
+
     Note:
         Check :class:`TTS.tts.configs.shared_configs.BaseTTSConfig` for the inherited parameters.
 
@@ -105,3 +112,7 @@ class XttsConfig(BaseTTSConfig):
     gpt_cond_chunk_len: int = 4
     max_ref_len: int = 10
     sound_norm_refs: bool = False
+
+    # conditioning latent cache
+    latent_cache_size: int = 32
+    latent_cache_dir: str = None
@@ -8,6 +8,7 @@ import numpy as np
 
 from TTS.tts.datasets.dataset import *
 from TTS.tts.datasets.formatters import *
+from TTS.utils.audio.manifest import get_audio_manifest
 
 
 def split_dataset(items, eval_split_max_size=None, eval_split_size=0.01):
@@ -73,6 +74,7 @@ def load_tts_samples(
     formatter: Callable = None,
     eval_split_max_size=None,
     eval_split_size=0.01,
+    compute_lengths=False,
 ) -> Tuple[List[List], List[List]]:
     """Parse the dataset from the datasets config, load the samples as a List and load the attention alignments if provided.
     If `formatter` is not None, apply the formatter to the samples else pick the formatter from the available ones based
@@ -97,6 +99,10 @@ def load_tts_samples(
             If between 0.0 and 1.0 represents the proportion of the dataset to include in the evaluation set.
             If > 1, represents the absolute number of evaluation samples. Defaults to 0.01 (1%).
 
+        compute_lengths (bool):
+            If true, add the `audio_length` and `text_length` of the samples. The audio lengths are read from the
+            shared audio manifest, only the audio files missing from it are opened. Defaults to False.
+
     Returns:
         Tuple[List[List], List[List]: training and evaluation splits of the dataset.
     """
@@ -145,6 +151,12 @@ def load_tts_samples(
                     meta_data_eval_all[idx].update({"alignment_file": attn_file})
         # set none for the next iter
         formatter = None
+    if compute_lengths:
+        for samples in [meta_data_train_all, meta_data_eval_all or []]:
+            audio_lengths = get_audio_manifest().lengths([item["audio_file"] for item in samples])
+            for item, audio_length in zip(samples, audio_lengths):
+                item["audio_length"] = audio_length
+                item["text_length"] = len(item["text"])
     return meta_data_train_all, meta_data_eval_all
 
 
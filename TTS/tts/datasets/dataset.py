@@ -1,7 +1,8 @@
 import base64
 import collections
 import os
-import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Union
 
 import numpy as np
@@ -9,12 +10,13 @@ import torch
 import tqdm
 from torch.utils.data import Dataset
 
+from TTS.tts.datasets.feature_store import FeatureStore
+from TTS.tts.datasets.sample_table import SampleTable
 from TTS.tts.utils.data import prepare_data, prepare_stop_target, prepare_tensor
 from TTS.utils.audio import AudioProcessor
+from TTS.utils.audio.manifest import get_audio_manifest, probe_audio
 from TTS.utils.audio.numpy_transforms import compute_energy as calculate_energy
 
-import mutagen
-
 # to prevent too many open files error as suggested here
 # https://github.com/pytorch/pytorch/issues/11201#issuecomment-421146936
 torch.multiprocessing.set_sharing_strategy("file_system")
@@ -44,13 +46,16 @@ def string2filename(string):
     return filename
 
 
-def get_audio_size(audiopath):
-    extension = audiopath.rpartition(".")[-1].lower()
-    if extension not in {"mp3", "wav", "flac"}:
-        raise RuntimeError(f"The audio format {extension} is not supported, please convert the audio files to mp3, flac, or wav format!")
+def save_array_atomic(file_path, array):
+    """Save a `.npy` file through a temporary file, so that readers never see a partially written file."""
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(temp_path, file_path)
 
-    audio_info = mutagen.File(audiopath).info
-    return int(audio_info.length * audio_info.sample_rate)
+
+def get_audio_size(audiopath):
+    return probe_audio(audiopath)[1]
 
 
 class TTSDataset(Dataset):
@@ -72,12 +77,14 @@ class TTSDataset(Dataset):
         min_audio_len: int = 0,
         max_audio_len: int = float("inf"),
         phoneme_cache_path: str = None,
+        feature_store_path: str = None,
         precompute_num_workers: int = 0,
         speaker_id_mapping: Dict = None,
         d_vector_mapping: Dict = None,
         language_id_mapping: Dict = None,
         use_noise_augment: bool = False,
         start_by_longest: bool = False,
+        compute_spec_on_device: bool = False,
         verbose: bool = False,
     ):
         """Generic 📂 data loader for `tts` models. It is configurable for different outputs and needs.
@@ -126,6 +133,10 @@ class TTSDataset(Dataset):
             phoneme_cache_path (str): Path to cache computed phonemes. It writes phonemes of each sample to a
                 separate file. Defaults to None.
 
+            feature_store_path (str): Path to a feature store packed by `TTS/bin/pack_features.py`. The audio, token
+                ids, pitch and energy of the samples in the store are read from its memory-mapped shards instead of
+                the audio files and the per-file caches. Defaults to None.
+
             precompute_num_workers (int): Number of workers to precompute features. Defaults to 0.
 
             speaker_id_mapping (dict): Mapping of speaker names to IDs used to compute embedding vectors by the
@@ -137,10 +148,17 @@ class TTSDataset(Dataset):
 
             start_by_longest (bool): Start by longest sequence. It is especially useful to check OOM. Defaults to False.
 
+            compute_spec_on_device (bool): Do not compute the spectrograms in `collate_fn()`. The batches have the raw
+                audio padded with zeros in `raw_wav` and its lengths in `raw_wav_lengths` instead, and `mel` and
+                `linear` are None. The model computes the spectrograms on its device with `TorchSpectrogram`.
+                Defaults to False.
+
             verbose (bool): Print diagnostic information. Defaults to false.
         """
         super().__init__()
         self.batch_group_size = batch_group_size
+        if samples and isinstance(samples[0], dict):
+            samples = SampleTable.from_samples(samples)
         self._samples = samples
         self.outputs_per_step = outputs_per_step
         self.compute_linear_spec = compute_linear_spec
@@ -160,36 +178,67 @@ class TTSDataset(Dataset):
         self.language_id_mapping = language_id_mapping
         self.use_noise_augment = use_noise_augment
         self.start_by_longest = start_by_longest
+        self.compute_spec_on_device = compute_spec_on_device
 
         self.verbose = verbose
         self.rescue_item_idx = 1
         self.pitch_computed = False
         self.tokenizer = tokenizer
 
+        self.feature_store = None
+        if feature_store_path is not None:
+            self.feature_store = FeatureStore(feature_store_path)
+            mismatches = [
+                f"{name}={value} instead of {getattr(self.ap, name, None)}"
+                for name, value in self.feature_store.audio.items()
+                if getattr(self.ap, name, None) != value
+            ]
+            if mismatches:
+                raise ValueError(
+                    f" [!] The feature store {feature_store_path} is packed with other audio parameters than the audio"
+                    f" processor: {', '.join(mismatches)}."
+                )
+
         if self.tokenizer.use_phonemes:
             self.phoneme_dataset = PhonemeDataset(
-                self.samples, self.tokenizer, phoneme_cache_path, precompute_num_workers=precompute_num_workers
+                self.samples,
+                self.tokenizer,
+                phoneme_cache_path,
+                precompute_num_workers=precompute_num_workers,
+                feature_store=self.feature_store,
             )
 
         if compute_f0:
             self.f0_dataset = F0Dataset(
-                self.samples, self.ap, cache_path=f0_cache_path, precompute_num_workers=precompute_num_workers
+                self.samples,
+                self.ap,
+                cache_path=f0_cache_path,
+                precompute_num_workers=precompute_num_workers,
+                feature_store=self.feature_store,
             )
         if compute_energy:
             self.energy_dataset = EnergyDataset(
-                self.samples, self.ap, cache_path=energy_cache_path, precompute_num_workers=precompute_num_workers
+                self.samples,
+                self.ap,
+                cache_path=energy_cache_path,
+                precompute_num_workers=precompute_num_workers,
+                feature_store=self.feature_store,
             )
         if self.verbose:
             self.print_logs()
 
     @property
     def lengths(self):
-        lens = []
-        for item in self.samples:
-            _, wav_file, *_ = _parse_sample(item)
-            audio_len = get_audio_size(wav_file)
-            lens.append(audio_len)
-        return lens
+        if isinstance(self.samples, SampleTable):
+            return get_audio_manifest().lengths(self.samples.column("audio_file"))
+        return get_audio_manifest().lengths([item["audio_file"] for item in self.samples])
+
+    @property
+    def durations(self):
+        """Duration of the audio files of the samples in seconds."""
+        if isinstance(self.samples, SampleTable):
+            return get_audio_manifest().durations(self.samples.column("audio_file"))
+        return get_audio_manifest().durations([item["audio_file"] for item in self.samples])
 
     @property
     def samples(self):
@@ -258,7 +307,10 @@ class TTSDataset(Dataset):
 
         raw_text = item["text"]
 
-        wav = np.asarray(self.load_wav(item["audio_file"]), dtype=np.float32)
+        if self.feature_store is not None and self.feature_store.has(item["audio_unique_name"], "wav"):
+            wav = self.feature_store.get(item["audio_unique_name"], "wav")
+        else:
+            wav = np.asarray(self.load_wav(item["audio_file"]), dtype=np.float32)
 
         # apply noise for augmentation
         if self.use_noise_augment:
@@ -304,51 +356,33 @@ class TTSDataset(Dataset):
 
     @staticmethod
     def _compute_lengths(samples):
-        new_samples = []
-        for item in samples:
-            audio_length = get_audio_size(item["audio_file"])
-            text_lenght = len(item["text"])
-            item["audio_length"] = audio_length
-            item["text_length"] = text_lenght
-            new_samples += [item]
-        return new_samples
+        samples = SampleTable.from_samples(samples)
+        samples.set_column("audio_length", np.array(get_audio_manifest().lengths(samples.column("audio_file"))))
+        samples.set_column("text_length", np.array([len(text) for text in samples.column("text")], dtype=np.int64))
+        return samples
 
     @staticmethod
     def filter_by_length(lengths: List[int], min_len: int, max_len: int):
-        idxs = np.argsort(lengths)  # ascending order
-        ignore_idx = []
-        keep_idx = []
-        for idx in idxs:
-            length = lengths[idx]
-            if length < min_len or length > max_len:
-                ignore_idx.append(idx)
-            else:
-                keep_idx.append(idx)
-        return ignore_idx, keep_idx
+        lengths = np.asarray(lengths)
+        idxs = np.argsort(lengths, kind="stable")  # ascending order
+        keep = (lengths[idxs] >= min_len) & (lengths[idxs] <= max_len)
+        return idxs[~keep].tolist(), idxs[keep].tolist()
 
     @staticmethod
-    def sort_by_length(samples: List[List]):
-        audio_lengths = [s["audio_length"] for s in samples]
-        idxs = np.argsort(audio_lengths)  # ascending order
-        return idxs
+    def sort_by_length(samples: SampleTable):
+        return np.argsort(samples.column("audio_length"), kind="stable")  # ascending order
 
     @staticmethod
-    def create_buckets(samples, batch_group_size: int):
+    def create_buckets(samples: SampleTable, batch_group_size: int):
+        """Shuffle the samples within consecutive groups of `batch_group_size` samples."""
         assert batch_group_size > 0
-        for i in range(len(samples) // batch_group_size):
-            offset = i * batch_group_size
-            end_offset = offset + batch_group_size
-            temp_items = samples[offset:end_offset]
-            random.shuffle(temp_items)
-            samples[offset:end_offset] = temp_items
-        return samples
-
-    @staticmethod
-    def _select_samples_by_idx(idxs, samples):
-        samples_new = []
-        for idx in idxs:
-            samples_new.append(samples[idx])
-        return samples_new
+        num_groups = len(samples) // batch_group_size
+        idxs = np.arange(len(samples))
+        # a random permutation of each group
+        group_idxs = np.argsort(np.random.rand(num_groups, batch_group_size), axis=1)
+        group_idxs += np.arange(num_groups)[:, None] * batch_group_size
+        idxs[: num_groups * batch_group_size] = group_idxs.reshape(-1)
+        return samples.take(idxs)
 
     def preprocess_samples(self):
         r"""Sort `items` based on text length or audio length in ascending order. Filter out samples out or the length
@@ -356,27 +390,23 @@ class TTSDataset(Dataset):
         """
         samples = self._compute_lengths(self.samples)
 
-        # sort items based on the sequence length in ascending order
-        text_lengths = [i["text_length"] for i in samples]
-        audio_lengths = [i["audio_length"] for i in samples]
-        text_ignore_idx, text_keep_idx = self.filter_by_length(text_lengths, self.min_text_len, self.max_text_len)
-        audio_ignore_idx, audio_keep_idx = self.filter_by_length(audio_lengths, self.min_audio_len, self.max_audio_len)
-        keep_idx = list(set(audio_keep_idx) & set(text_keep_idx))
-        ignore_idx = list(set(audio_ignore_idx) | set(text_ignore_idx))
+        text_lengths = samples.column("text_length")
+        audio_lengths = samples.column("audio_length")
+        keep = (text_lengths >= self.min_text_len) & (text_lengths <= self.max_text_len)
+        keep &= (audio_lengths >= self.min_audio_len) & (audio_lengths <= self.max_audio_len)
+        num_ignored = int((~keep).sum())
 
-        samples = self._select_samples_by_idx(keep_idx, samples)
+        samples = samples.take(np.flatnonzero(keep))
+        if len(samples) == 0:
+            raise RuntimeError(" [!] No samples left")
 
+        # sort items based on the sequence length in ascending order
         sorted_idxs = self.sort_by_length(samples)
 
         if self.start_by_longest:
-            longest_idxs = sorted_idxs[-1]
-            sorted_idxs[-1] = sorted_idxs[0]
-            sorted_idxs[0] = longest_idxs
+            sorted_idxs[[0, -1]] = sorted_idxs[[-1, 0]]
 
-        samples = self._select_samples_by_idx(sorted_idxs, samples)
-
-        if len(samples) == 0:
-            raise RuntimeError(" [!] No samples left")
+        samples = samples.take(sorted_idxs)
 
         # shuffle batch groups
         # create batches with similar length items
@@ -385,8 +415,8 @@ class TTSDataset(Dataset):
             samples = self.create_buckets(samples, self.batch_group_size)
 
         # update items to the new sorted items
-        audio_lengths = [s["audio_length"] for s in samples]
-        text_lengths = [s["text_length"] for s in samples]
+        audio_lengths = samples.column("audio_length")
+        text_lengths = samples.column("text_length")
         self.samples = samples
 
         if self.verbose:
@@ -398,7 +428,7 @@ class TTSDataset(Dataset):
             print(" | > Max audio length: {}".format(np.max(audio_lengths)))
             print(" | > Min audio length: {}".format(np.min(audio_lengths)))
             print(" | > Avg audio length: {}".format(np.mean(audio_lengths)))
-            print(f" | > Num. instances discarded samples: {len(ignore_idx)}")
+            print(f" | > Num. instances discarded samples: {num_ignored}")
             print(" | > Batch group size: {}.".format(self.batch_group_size))
 
     @staticmethod
@@ -450,17 +480,22 @@ class TTSDataset(Dataset):
             else:
                 speaker_ids = None
             # compute features
-            mel = [self.ap.melspectrogram(w).astype("float32") for w in batch["wav"]]
-
-            mel_lengths = [m.shape[1] for m in mel]
+            mel, linear, raw_wav, raw_wav_lengths = None, None, None, None
+            if self.compute_spec_on_device:
+                # the model computes the features from the raw audio on its device
+                mel_lengths = [w.shape[0] // self.ap.hop_length + 1 for w in batch["wav"]]
+            else:
+                mel = [self.ap.melspectrogram(w).astype("float32") for w in batch["wav"]]
+                mel_lengths = [m.shape[1] for m in mel]
 
             # lengths adjusted by the reduction factor
             mel_lengths_adjusted = [
-                m.shape[1] + (self.outputs_per_step - (m.shape[1] % self.outputs_per_step))
-                if m.shape[1] % self.outputs_per_step
-                else m.shape[1]
-                for m in mel
+                mel_len + (self.outputs_per_step - (mel_len % self.outputs_per_step))
+                if mel_len % self.outputs_per_step
+                else mel_len
+                for mel_len in mel_lengths
             ]
+            num_frames = max(mel_lengths_adjusted)
 
             # compute 'stop token' targets
             stop_targets = [np.array([0.0] * (mel_len - 1) + [1.0]) for mel_len in mel_lengths]
@@ -471,16 +506,9 @@ class TTSDataset(Dataset):
             # PAD sequences with longest instance in the batch
             token_ids = prepare_data(batch["token_ids"]).astype(np.int32)
 
-            # PAD features with longest instance
-            mel = prepare_tensor(mel, self.outputs_per_step)
-
-            # B x D x T --> B x T x D
-            mel = mel.transpose(0, 2, 1)
-
             # convert things to pytorch
             token_ids_lengths = torch.LongTensor(token_ids_lengths)
             token_ids = torch.LongTensor(token_ids)
-            mel = torch.FloatTensor(mel).contiguous()
             mel_lengths = torch.LongTensor(mel_lengths)
             stop_targets = torch.FloatTensor(stop_targets)
 
@@ -494,14 +522,27 @@ class TTSDataset(Dataset):
             if language_ids is not None:
                 language_ids = torch.LongTensor(language_ids)
 
-            # compute linear spectrogram
-            linear = None
-            if self.compute_linear_spec:
-                linear = [self.ap.spectrogram(w).astype("float32") for w in batch["wav"]]
-                linear = prepare_tensor(linear, self.outputs_per_step)
-                linear = linear.transpose(0, 2, 1)
-                assert mel.shape[1] == linear.shape[1]
-                linear = torch.FloatTensor(linear).contiguous()
+            if self.compute_spec_on_device:
+                # PAD raw audio with zeros
+                raw_wav_lengths = torch.LongTensor([w.shape[0] for w in batch["wav"]])
+                raw_wav = torch.zeros(len(batch["wav"]), int(raw_wav_lengths.max()))
+                for i, w in enumerate(batch["wav"]):
+                    raw_wav[i, : w.shape[0]] = torch.from_numpy(w)
+            else:
+                # PAD features with longest instance
+                mel = prepare_tensor(mel, self.outputs_per_step)
+
+                # B x D x T --> B x T x D
+                mel = mel.transpose(0, 2, 1)
+                mel = torch.FloatTensor(mel).contiguous()
+
+                # compute linear spectrogram
+                if self.compute_linear_spec:
+                    linear = [self.ap.spectrogram(w).astype("float32") for w in batch["wav"]]
+                    linear = prepare_tensor(linear, self.outputs_per_step)
+                    linear = linear.transpose(0, 2, 1)
+                    assert mel.shape[1] == linear.shape[1]
+                    linear = torch.FloatTensor(linear).contiguous()
 
             # format waveforms
             wav_padded = None
@@ -520,14 +561,14 @@ class TTSDataset(Dataset):
             # format F0
             if self.compute_f0:
                 pitch = prepare_data(batch["pitch"])
-                assert mel.shape[1] == pitch.shape[1], f"[!] {mel.shape} vs {pitch.shape}"
+                assert num_frames == pitch.shape[1], f"[!] {num_frames} vs {pitch.shape}"
                 pitch = torch.FloatTensor(pitch)[:, None, :].contiguous()  # B x 1 xT
             else:
                 pitch = None
             # format energy
             if self.compute_energy:
                 energy = prepare_data(batch["energy"])
-                assert mel.shape[1] == energy.shape[1], f"[!] {mel.shape} vs {energy.shape}"
+                assert num_frames == energy.shape[1], f"[!] {num_frames} vs {energy.shape}"
                 energy = torch.FloatTensor(energy)[:, None, :].contiguous()  # B x 1 xT
             else:
                 energy = None
@@ -536,7 +577,7 @@ class TTSDataset(Dataset):
             if batch["attn"][0] is not None:
                 attns = [batch["attn"][idx].T for idx in ids_sorted_decreasing]
                 for idx, attn in enumerate(attns):
-                    pad2 = mel.shape[1] - attn.shape[1]
+                    pad2 = num_frames - attn.shape[1]
                     pad1 = token_ids.shape[1] - attn.shape[0]
                     assert pad1 >= 0 and pad2 >= 0, f"[!] Negative padding - {pad1} and {pad2}"
                     attn = np.pad(attn, [[0, pad1], [0, pad2]])
@@ -551,6 +592,8 @@ class TTSDataset(Dataset):
                 "linear": linear,
                 "mel": mel,
                 "mel_lengths": mel_lengths,
+                "raw_wav": raw_wav,
+                "raw_wav_lengths": raw_wav_lengths,
                 "stop_targets": stop_targets,
                 "item_idxs": batch["item_idx"],
                 "d_vectors": d_vectors,
@@ -578,7 +621,8 @@ class PhonemeDataset(Dataset):
     """Phoneme Dataset for converting input text to phonemes and then token IDs
 
     At initialization, it pre-computes the phonemes under `cache_path` and loads them in training to reduce data
-    loading latency. If `cache_path` is already present, it skips the pre-computation.
+    loading latency. The samples already in `cache_path` are skipped, so only the new samples of a dataset are
+    pre-computed.
 
     Args:
         samples (Union[List[List], List[Dict]]):
@@ -588,10 +632,13 @@ class PhonemeDataset(Dataset):
             Tokenizer to convert input text to phonemes.
 
         cache_path (str):
-            Path to cache phonemes. If `cache_path` is already present or None, it skips the pre-computation.
+            Path to cache phonemes. If None, it skips the pre-computation.
 
         precompute_num_workers (int):
-            Number of workers used for pre-computing the phonemes. Defaults to 0.
+            Number of processes used for pre-computing the phonemes. Defaults to 0.
+
+        feature_store (FeatureStore):
+            Packed features. The token ids in the store are used instead of the cache. Defaults to None.
     """
 
     def __init__(
@@ -600,54 +647,97 @@ class PhonemeDataset(Dataset):
         tokenizer: "TTSTokenizer",
         cache_path: str,
         precompute_num_workers=0,
+        feature_store: FeatureStore = None,
     ):
         self.samples = samples
         self.tokenizer = tokenizer
         self.cache_path = cache_path
-        if cache_path is not None and not os.path.exists(cache_path):
-            os.makedirs(cache_path)
+        self.feature_store = feature_store
+        in_store = feature_store is not None and feature_store.covers(samples, "token_ids")
+        if cache_path is not None and not in_store:
+            os.makedirs(cache_path, exist_ok=True)
             self.precompute(precompute_num_workers)
 
     def __getitem__(self, index):
         item = self.samples[index]
-        ids = self.compute_or_load(string2filename(item["audio_unique_name"]), item["text"], item["language"])
+        if self.feature_store is not None and self.feature_store.has(item["audio_unique_name"], "token_ids"):
+            ids = self.feature_store.get(item["audio_unique_name"], "token_ids")
+        else:
+            ids = self.compute_or_load(string2filename(item["audio_unique_name"]), item["text"], item["language"])
         ph_hat = self.tokenizer.ids_to_text(ids)
         return {"text": item["text"], "ph_hat": ph_hat, "token_ids": ids, "token_ids_len": len(ids)}
 
     def __len__(self):
         return len(self.samples)
 
+    @staticmethod
+    def create_phoneme_file_path(file_name, cache_path):
+        return os.path.join(cache_path, file_name + "_phoneme.npy")
+
     def compute_or_load(self, file_name, text, language):
         """Compute phonemes for the given text.
 
         If the phonemes are already cached, load them from cache.
         """
-        file_ext = "_phoneme.npy"
-        cache_path = os.path.join(self.cache_path, file_name + file_ext)
+        cache_path = self.create_phoneme_file_path(file_name, self.cache_path)
         try:
             ids = np.load(cache_path)
         except FileNotFoundError:
             ids = self.tokenizer.text_to_ids(text, language=language)
-            np.save(cache_path, ids)
+            save_array_atomic(cache_path, ids)
         return ids
 
     def get_pad_id(self):
         """Get pad token ID for sequence padding"""
         return self.tokenizer.pad_id
 
-    def precompute(self, num_workers=1):
-        """Precompute phonemes for all samples.
+    def precompute(self, num_workers=0, batch_size=64):
+        """Precompute phonemes for the samples missing from the cache.
+
+        The missing samples are split into batches of the same language that are phonemized together by
+        `TTSTokenizer.texts_to_ids()` and written to the cache by a pool of `num_workers` processes.
 
-        We use pytorch dataloader because we are lazy.
+        Args:
+            num_workers (int): Number of processes. 0 phonemizes in the current process. Defaults to 0.
+            batch_size (int): Number of texts sent at once to the phonemizer backend. Defaults to 64.
         """
-        print("[*] Pre-computing phonemes...")
-        with tqdm.tqdm(total=len(self)) as pbar:
-            batch_size = num_workers if num_workers > 0 else 1
-            dataloder = torch.utils.data.DataLoader(
-                batch_size=batch_size, dataset=self, shuffle=False, num_workers=num_workers, collate_fn=self.collate_fn
-            )
-            for _ in dataloder:
-                pbar.update(batch_size)
+        cached = set(os.listdir(self.cache_path))
+        batches = {}
+        for item in self.samples:
+            file_name = string2filename(item["audio_unique_name"])
+            if os.path.basename(self.create_phoneme_file_path(file_name, self.cache_path)) not in cached:
+                batches.setdefault(item["language"], []).append((file_name, item["text"]))
+        num_missing = sum(len(items) for items in batches.values())
+        if num_missing == 0:
+            return
+        batches = [
+            (language, items[i : i + batch_size])
+            for language, items in batches.items()
+            for i in range(0, len(items), batch_size)
+        ]
+
+        print(f"[*] Pre-computing phonemes of {num_missing} samples, {len(self.samples) - num_missing} are cached...")
+        start = time.time()
+        num_tokens = 0
+        with tqdm.tqdm(total=num_missing) as pbar:
+            if num_workers > 0:
+                with ProcessPoolExecutor(
+                    num_workers, initializer=_init_phoneme_worker, initargs=(self.tokenizer, self.cache_path)
+                ) as executor:
+                    for batch_tokens, batch_len in executor.map(_phonemize_and_save, batches):
+                        num_tokens += batch_tokens
+                        pbar.update(batch_len)
+            else:
+                _init_phoneme_worker(self.tokenizer, self.cache_path)
+                for batch in batches:
+                    batch_tokens, batch_len = _phonemize_and_save(batch)
+                    num_tokens += batch_tokens
+                    pbar.update(batch_len)
+        elapsed = max(time.time() - start, 1e-6)
+        print(
+            f" > Pre-computed the phonemes of {num_missing} samples in {elapsed:.1f}s"
+            f" ({num_missing / elapsed:.1f} samples/s, {num_tokens / elapsed:.1f} tokens/s)."
+        )
 
     def collate_fn(self, batch):
         ids = [item["token_ids"] for item in batch]
@@ -669,6 +759,25 @@ class PhonemeDataset(Dataset):
         print(f"{indent}| > Number of instances : {len(self.samples)}")
 
 
+_PHONEME_WORKER = {}
+
+
+def _init_phoneme_worker(tokenizer, cache_path):
+    _PHONEME_WORKER["tokenizer"] = tokenizer
+    _PHONEME_WORKER["cache_path"] = cache_path
+
+
+def _phonemize_and_save(batch):
+    """Phonemize a batch of `(file_name, text)` of the same language and write them to the phoneme cache."""
+    language, items = batch
+    tokenizer = _PHONEME_WORKER["tokenizer"]
+    token_ids = tokenizer.texts_to_ids([text for _, text in items], language=language)
+    for (file_name, _), ids in zip(items, token_ids):
+        file_path = PhonemeDataset.create_phoneme_file_path(file_name, _PHONEME_WORKER["cache_path"])
+        save_array_atomic(file_path, ids)
+    return sum(len(ids) for ids in token_ids), len(items)
+
+
 class F0Dataset:
     """F0 Dataset for computing F0 from wav files in CPU
 
@@ -691,6 +800,9 @@ class F0Dataset:
 
         normalize_f0 (bool):
             Whether to normalize F0 values by mean and std. Defaults to True.
+
+        feature_store (FeatureStore):
+            Packed features. The F0 values and stats in the store are used instead of the cache. Defaults to None.
     """
 
     def __init__(
@@ -702,24 +814,34 @@ class F0Dataset:
         cache_path: str = None,
         precompute_num_workers=0,
         normalize_f0=True,
+        feature_store: FeatureStore = None,
     ):
         self.samples = samples
         self.ap = ap
         self.verbose = verbose
         self.cache_path = cache_path
         self.normalize_f0 = normalize_f0
+        self.feature_store = feature_store
         self.pad_id = 0.0
         self.mean = None
         self.std = None
-        if cache_path is not None and not os.path.exists(cache_path):
+        in_store = feature_store is not None and feature_store.covers(samples, "pitch")
+        if cache_path is not None and not os.path.exists(cache_path) and not in_store:
             os.makedirs(cache_path)
             self.precompute(precompute_num_workers)
         if normalize_f0:
-            self.load_stats(cache_path)
+            if in_store and "pitch" in feature_store.stats:
+                self.mean = np.float32(feature_store.stats["pitch"]["mean"])
+                self.std = np.float32(feature_store.stats["pitch"]["std"])
+            else:
+                self.load_stats(cache_path)
 
     def __getitem__(self, idx):
         item = self.samples[idx]
-        f0 = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
+        if self.feature_store is not None and self.feature_store.has(item["audio_unique_name"], "pitch"):
+            f0 = self.feature_store.get(item["audio_unique_name"], "pitch")
+        else:
+            f0 = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
         if self.normalize_f0:
             assert self.mean is not None and self.std is not None, " [!] Mean and STD is not available"
             f0 = self.normalize(f0)
@@ -843,6 +965,9 @@ class EnergyDataset:
 
         normalize_Energy (bool):
             Whether to normalize Energy values by mean and std. Defaults to True.
+
+        feature_store (FeatureStore):
+            Packed features. The Energy values and stats in the store are used instead of the cache. Defaults to None.
     """
 
     def __init__(
@@ -853,24 +978,34 @@ class EnergyDataset:
         cache_path: str = None,
         precompute_num_workers=0,
         normalize_energy=True,
+        feature_store: FeatureStore = None,
     ):
         self.samples = samples
         self.ap = ap
         self.verbose = verbose
         self.cache_path = cache_path
         self.normalize_energy = normalize_energy
+        self.feature_store = feature_store
         self.pad_id = 0.0
         self.mean = None
         self.std = None
-        if cache_path is not None and not os.path.exists(cache_path):
+        in_store = feature_store is not None and feature_store.covers(samples, "energy")
+        if cache_path is not None and not os.path.exists(cache_path) and not in_store:
             os.makedirs(cache_path)
             self.precompute(precompute_num_workers)
         if normalize_energy:
-            self.load_stats(cache_path)
+            if in_store and "energy" in feature_store.stats:
+                self.mean = np.float32(feature_store.stats["energy"]["mean"])
+                self.std = np.float32(feature_store.stats["energy"]["std"])
+            else:
+                self.load_stats(cache_path)
 
     def __getitem__(self, idx):
         item = self.samples[idx]
-        energy = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
+        if self.feature_store is not None and self.feature_store.has(item["audio_unique_name"], "energy"):
+            energy = self.feature_store.get(item["audio_unique_name"], "energy")
+        else:
+            energy = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
         if self.normalize_energy:
             assert self.mean is not None and self.std is not None, " [!] Mean and STD is not available"
             energy = self.normalize(energy)
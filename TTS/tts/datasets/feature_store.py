@@ -0,0 +1,317 @@
+import json
+import os
+from typing import Dict, List
+
+import numpy as np
+import torch
+import tqdm
+
+from TTS.utils.audio.numpy_transforms import compute_energy as calculate_energy
+
+INDEX_FILE = "index.json"
+
+FEATURE_DTYPES = {"wav": "float32", "token_ids": "int32", "pitch": "float32", "energy": "float32"}
+
+# `AudioProcessor` parameters the packed audio, pitch and energy are computed with
+AUDIO_PARAMETERS = [
+    "sample_rate",
+    "hop_length",
+    "win_length",
+    "fft_size",
+    "do_trim_silence",
+    "trim_db",
+    "do_sound_norm",
+    "do_rms_norm",
+    "db_level",
+    "pitch_fmin",
+    "pitch_fmax",
+]
+
+
+class FeatureStore:
+    """Read-only store of the features of a dataset packed by `FeatureStoreWriter`.
+
+    The features of all the samples are concatenated into a few large shard files per feature, `<feature>_<shard>.bin`,
+    and an `index.json` file maps each `audio_unique_name` to the shard, offset and length of its features. The shards
+    are memory-mapped, so reading a sample is a slice of the page cache instead of opening and decoding a file.
+
+    The store is interchangeable with the per-file caches. Samples or features missing from the store are loaded or
+    computed as before.
+
+    Args:
+        path (str): Path to the store folder.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.features = index["features"]
+        self.stats = index["stats"]
+        self.audio = index["audio"]
+        self.samples = index["samples"]
+        self._shards = {}
+
+    def __getstate__(self):
+        # every data loader worker maps the shards on its own
+        state = self.__dict__.copy()
+        state["_shards"] = {}
+        return state
+
+    def __contains__(self, audio_unique_name: str) -> bool:
+        return audio_unique_name in self.samples
+
+    def __len__(self):
+        return len(self.samples)
+
+    def has(self, audio_unique_name: str, feature: str) -> bool:
+        return audio_unique_name in self.samples and feature in self.samples[audio_unique_name]
+
+    def covers(self, samples: List[Dict], feature: str) -> bool:
+        """Check if the store has the `feature` of all the `samples`."""
+        return all(self.has(item["audio_unique_name"], feature) for item in samples)
+
+    def _shard(self, feature: str, shard: int) -> np.ndarray:
+        key = (feature, shard)
+        if key not in self._shards:
+            file_path = os.path.join(self.path, f"{feature}_{shard:05d}.bin")
+            if os.path.getsize(file_path) == 0:
+                self._shards[key] = np.zeros(0, dtype=self.features[feature])
+            else:
+                self._shards[key] = np.memmap(file_path, dtype=self.features[feature], mode="r")
+        return self._shards[key]
+
+    def get(self, audio_unique_name: str, feature: str) -> np.ndarray:
+        """Return a read-only view of the `feature` of a sample, without copying it."""
+        entry = self.samples[audio_unique_name]
+        offset, length = entry[feature]
+        return self._shard(feature, entry["shard"])[offset : offset + length]
+
+
+class FeatureStoreWriter:
+    """Pack the features of a dataset into a `FeatureStore`.
+
+    The index is written by `close()`, a store interrupted while packing is not loadable.
+
+    Args:
+        path (str): Path to the store folder.
+
+        features (List[str]): Features of the samples, some of `wav`, `token_ids`, `pitch` and `energy`.
+
+        shard_size (int): Size in bytes after which a new shard is started. Defaults to 1GB.
+
+        audio (Dict): Audio parameters the features are computed with. Defaults to None.
+    """
+
+    def __init__(self, path: str, features: List[str], shard_size: int = 2**30, audio: Dict = None):
+        self.path = path
+        self.features = {feature: FEATURE_DTYPES[feature] for feature in features}
+        self.shard_size = shard_size
+        self.audio = audio or {}
+        self.samples = {}
+        self.shard = -1
+        self._files = {}
+        self._offsets = {}
+        self._shard_bytes = 0
+        os.makedirs(path, exist_ok=True)
+        self._new_shard()
+
+    def _new_shard(self):
+        self._close_files()
+        self.shard += 1
+        self._shard_bytes = 0
+        for feature in self.features:
+            self._files[feature] = open(os.path.join(self.path, f"{feature}_{self.shard:05d}.bin"), "wb")
+            self._offsets[feature] = 0
+
+    def _close_files(self):
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def add(self, audio_unique_name: str, **features):
+        if self._shard_bytes >= self.shard_size:
+            self._new_shard()
+        entry = {"shard": self.shard}
+        for feature, value in features.items():
+            if value is None:
+                continue
+            value = np.ascontiguousarray(value, dtype=self.features[feature]).reshape(-1)
+            self._files[feature].write(value.tobytes())
+            entry[feature] = [self._offsets[feature], len(value)]
+            self._offsets[feature] += len(value)
+            self._shard_bytes += value.nbytes
+        self.samples[audio_unique_name] = entry
+
+    def close(self, stats: Dict = None):
+        self._close_files()
+        index = {
+            "features": self.features,
+            "stats": stats or {},
+            "audio": self.audio,
+            "samples": self.samples,
+        }
+        index_path = os.path.join(self.path, INDEX_FILE)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(index_path + ".tmp", index_path)
+
+
+def _identity(item):
+    return item
+
+
+class _PackDataset(torch.utils.data.Dataset):
+    """Compute the features of the samples to pack, reusing the per-file caches when they are there."""
+
+    def __init__(
+        self,
+        samples: List[Dict],
+        ap: "AudioProcessor",
+        tokenizer: "TTSTokenizer" = None,
+        compute_f0: bool = False,
+        compute_energy: bool = False,
+        f0_cache_path: str = None,
+        energy_cache_path: str = None,
+        phoneme_cache_path: str = None,
+    ):
+        self.samples = samples
+        self.ap = ap
+        self.tokenizer = tokenizer
+        self.compute_f0 = compute_f0
+        self.compute_energy = compute_energy
+        self.f0_cache_path = f0_cache_path
+        self.energy_cache_path = energy_cache_path
+        self.phoneme_cache_path = phoneme_cache_path
+
+    def __len__(self):
+        return len(self.samples)
+
+    @staticmethod
+    def _load_or_compute(cache_file, compute_fn):
+        if cache_file is not None and os.path.exists(cache_file):
+            return np.load(cache_file)
+        return compute_fn()
+
+    def __getitem__(self, idx):
+        # pylint: disable=import-outside-toplevel
+        from TTS.tts.datasets.dataset import EnergyDataset, F0Dataset, string2filename
+
+        item = self.samples[idx]
+        file_name = string2filename(item["audio_unique_name"])
+        wav = self.ap.load_wav(item["audio_file"])
+        features = {"wav": wav}
+        if self.tokenizer is not None:
+            features["token_ids"] = self._load_or_compute(
+                os.path.join(self.phoneme_cache_path, file_name + "_phoneme.npy") if self.phoneme_cache_path else None,
+                lambda: self.tokenizer.text_to_ids(item["text"], language=item["language"]),
+            )
+        if self.compute_f0:
+            features["pitch"] = self._load_or_compute(
+                F0Dataset.create_pitch_file_path(file_name, self.f0_cache_path) if self.f0_cache_path else None,
+                lambda: self.ap.compute_f0(wav),
+            )
+        if self.compute_energy:
+            features["energy"] = self._load_or_compute(
+                EnergyDataset.create_energy_file_path(file_name, self.energy_cache_path)
+                if self.energy_cache_path
+                else None,
+                lambda: calculate_energy(
+                    wav, fft_size=self.ap.fft_size, hop_length=self.ap.hop_length, win_length=self.ap.win_length
+                ),
+            )
+        return item["audio_unique_name"], features
+
+
+def pack_features(
+    samples: List[Dict],
+    output_path: str,
+    ap: "AudioProcessor",
+    tokenizer: "TTSTokenizer" = None,
+    compute_f0: bool = False,
+    compute_energy: bool = False,
+    f0_cache_path: str = None,
+    energy_cache_path: str = None,
+    phoneme_cache_path: str = None,
+    shard_size: int = 2**30,
+    num_workers: int = 0,
+) -> FeatureStore:
+    """Pack the audio, token ids, pitch and energy of the samples into a `FeatureStore`.
+
+    Features already in the per-file caches are copied from them instead of being computed again.
+
+    Args:
+        samples (List[Dict]): Samples returned by `load_tts_samples`.
+
+        output_path (str): Path to the store folder.
+
+        ap (AudioProcessor): Audio processor used to load the audio and compute the pitch and energy.
+
+        tokenizer (TTSTokenizer): Tokenizer used to compute the token ids. Set it for phoneme based models, the token
+            ids are used instead of the phoneme cache. Defaults to None.
+
+        compute_f0 (bool): Pack the pitch of the samples. Defaults to False.
+
+        compute_energy (bool): Pack the energy of the samples. Defaults to False.
+
+        f0_cache_path (str): Path to the per-file F0 cache to reuse. Defaults to None.
+
+        energy_cache_path (str): Path to the per-file energy cache to reuse. Defaults to None.
+
+        phoneme_cache_path (str): Path to the per-file phoneme cache to reuse. Defaults to None.
+
+        shard_size (int): Size in bytes after which a new shard is started. Defaults to 1GB.
+
+        num_workers (int): Number of workers computing the features. Defaults to 0.
+
+    Returns:
+        FeatureStore: The packed store.
+    """
+    # pylint: disable=import-outside-toplevel
+    from TTS.tts.datasets.dataset import EnergyDataset, F0Dataset
+
+    features = ["wav"]
+    if tokenizer is not None:
+        features.append("token_ids")
+    if compute_f0:
+        features.append("pitch")
+    if compute_energy:
+        features.append("energy")
+    audio = {name: getattr(ap, name) for name in AUDIO_PARAMETERS}
+    writer = FeatureStoreWriter(output_path, features, shard_size=shard_size, audio=audio)
+    dataset = _PackDataset(
+        samples,
+        ap,
+        tokenizer=tokenizer,
+        compute_f0=compute_f0,
+        compute_energy=compute_energy,
+        f0_cache_path=f0_cache_path,
+        energy_cache_path=energy_cache_path,
+        phoneme_cache_path=phoneme_cache_path,
+    )
+    loader = torch.utils.data.DataLoader(
+        dataset, batch_size=None, shuffle=False, num_workers=num_workers, collate_fn=_identity
+    )
+    for audio_unique_name, item_features in tqdm.tqdm(loader, total=len(dataset)):
+        writer.add(audio_unique_name, **item_features)
+    writer.close()
+
+    # the stats of the per-file caches are kept so the features are normalized the same way with and without the
+    # store, otherwise they are computed over the packed values
+    store = FeatureStore(output_path)
+    stats = {}
+    for feature, cache_path, stats_fn in [
+        ("pitch", f0_cache_path if compute_f0 else None, F0Dataset.compute_pitch_stats),
+        ("energy", energy_cache_path if compute_energy else None, EnergyDataset.compute_energy_stats),
+    ]:
+        if feature not in writer.features:
+            continue
+        stats_file = os.path.join(cache_path, f"{feature}_stats.npy") if cache_path else None
+        if stats_file is not None and os.path.exists(stats_file):
+            cache_stats = np.load(stats_file, allow_pickle=True).item()
+            mean, std = cache_stats["mean"], cache_stats["std"]
+        else:
+            mean, std = stats_fn([store.get(name, feature) for name in store.samples])
+        stats[feature] = {"mean": float(mean), "std": float(std)}
+    writer.close(stats)
+    return FeatureStore(output_path)
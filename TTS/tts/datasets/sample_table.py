@@ -0,0 +1,221 @@
+import collections.abc
+from typing import Dict, Iterator, List, Union
+
+import numpy as np
+
+
+class _NumericColumn:
+    """Integer or float values in a NumPy array."""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+
+    def get(self, row: int):
+        return self.values[row].item()
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        return self.values[rows]
+
+
+class _CategoryColumn:
+    """Repeated values stored as integer codes into the list of unique values."""
+
+    def __init__(self, codes: np.ndarray, categories: List):
+        self.codes = codes
+        self.categories = categories
+
+    def get(self, row: int):
+        return self.categories[self.codes[row]]
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        categories = np.empty(len(self.categories), dtype=object)
+        categories[:] = self.categories
+        return categories[self.codes[rows]]
+
+
+class _StringColumn:
+    """Strings packed into a single UTF-8 buffer with the offsets of each string."""
+
+    def __init__(self, buffer: bytes, offsets: np.ndarray):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def get(self, row: int):
+        return self.buffer[self.offsets[row] : self.offsets[row + 1]].decode("utf-8")
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        values = np.empty(len(rows), dtype=object)
+        values[:] = [self.get(row) for row in rows]
+        return values
+
+
+class _ObjectColumn:
+    """Any other values in an object array."""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+
+    def get(self, row: int):
+        return self.values[row]
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        return self.values[rows]
+
+
+def _object_array(values: List) -> np.ndarray:
+    # fill element-wise so that list values are not broadcast into a 2D array
+    array = np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        array[idx] = value
+    return array
+
+
+def _encode_column(values: List, max_categories: int):
+    types = {type(value) for value in values}
+    if types and types <= {int, float}:
+        return _NumericColumn(np.asarray(values, dtype=np.int64 if types == {int} else np.float64))
+    try:
+        category_ids = {}
+        codes = np.fromiter(
+            (category_ids.setdefault(value, len(category_ids)) for value in values), dtype=np.int64, count=len(values)
+        )
+        if len(category_ids) <= max_categories:
+            dtype = np.int16 if len(category_ids) < 2**15 else np.int32
+            return _CategoryColumn(codes.astype(dtype), list(category_ids))
+    except TypeError:
+        # unhashable values
+        pass
+    if types == {str}:
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return _StringColumn(b"".join(encoded), offsets)
+    return _ObjectColumn(_object_array(values))
+
+
+class SampleTable(collections.abc.Sequence):
+    """Columnar table of the dataset samples.
+
+    A list of sample dicts costs a few hundred bytes of Python objects per sample, and every data loader worker ends up
+    with its own copy of them as their reference counts are updated. The table stores each key of the samples in a
+    single column instead:
+
+    - integer and float values in NumPy arrays.
+    - repeated values, like speaker names, languages and root paths, as integer codes into the list of unique values.
+    - other strings, like texts and audio file paths, packed into one UTF-8 buffer.
+    - any other value in an object array.
+
+    The order of the samples is an index array into the columns, so filtering, sorting and bucketing the samples are
+    vectorized and the tables they return share the columns. Indexing the table returns the sample as a dict, like a
+    list of samples. The dicts are built on access, so changes to them are not kept, use `set_column()` instead.
+
+    Args:
+        columns (Dict): Columns by sample key.
+        present (Dict): Boolean mask of the rows having a value, for the keys missing from some of the samples.
+        index (np.ndarray): Rows of the table in order.
+        num_rows (int): Number of rows of the columns.
+
+    Example:
+        >>> samples = SampleTable.from_samples(samples)
+        >>> lengths = samples.column("audio_length")
+        >>> samples = samples.take(np.argsort(lengths))
+        >>> samples[0]["audio_file"]
+    """
+
+    def __init__(self, columns: Dict, present: Dict[str, np.ndarray], index: np.ndarray, num_rows: int):
+        self._columns = columns
+        self._present = present
+        self._index = index
+        self._num_rows = num_rows
+
+    @classmethod
+    def from_samples(cls, samples: List[Dict], max_category_ratio: float = 0.5) -> "SampleTable":
+        """Create a table from a list of sample dicts.
+
+        Args:
+            samples (List[Dict]): Samples as returned by `load_tts_samples()`.
+            max_category_ratio (float): Values of a key are stored as categories when the number of unique values is
+                at most this ratio of the number of samples. Defaults to 0.5.
+        """
+        if isinstance(samples, SampleTable):
+            return samples
+        keys = dict.fromkeys(key for item in samples for key in item)
+        max_categories = max(1, int(len(samples) * max_category_ratio))
+        columns, present = {}, {}
+        for key in keys:
+            mask = np.fromiter((key in item for item in samples), dtype=bool, count=len(samples))
+            if mask.all():
+                values = [item[key] for item in samples]
+            else:
+                present[key] = mask
+                values = [item.get(key) for item in samples]
+            columns[key] = _encode_column(values, max_categories)
+        return cls(columns, present, np.arange(len(samples), dtype=np.int64), len(samples))
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _row(self, row: int) -> Dict:
+        item = {}
+        for key, column in self._columns.items():
+            if key in self._present and not self._present[key][row]:
+                continue
+            item[key] = column.get(row)
+        return item
+
+    def __getitem__(self, idx: Union[int, slice]):
+        if isinstance(idx, slice):
+            return self.take(np.arange(len(self))[idx])
+        return self._row(self._index[idx])
+
+    def __iter__(self) -> Iterator[Dict]:
+        for row in self._index:
+            yield self._row(row)
+
+    def __repr__(self) -> str:
+        return f"SampleTable(num_samples={len(self)}, keys={self.keys})"
+
+    def take(self, indices: np.ndarray) -> "SampleTable":
+        """Return a table with the samples at `indices`, in that order. The columns are shared with this table."""
+        index = self._index[np.asarray(indices, dtype=np.int64)]
+        return SampleTable(dict(self._columns), dict(self._present), index, self._num_rows)
+
+    def column(self, key: str) -> np.ndarray:
+        """Return the values of `key` for the samples in order. Missing values are `None`."""
+        values = self._columns[key].take(self._index)
+        if key in self._present:
+            values = values.astype(object)
+            values[~self._present[key][self._index]] = None
+        return values
+
+    def set_column(self, key: str, values: Union[List, np.ndarray]):
+        """Set the values of `key` for the samples in order.
+
+        The other tables sharing the columns of this table are not changed.
+        """
+        if len(values) != len(self):
+            raise ValueError(f" [!] Expected {len(self)} values for '{key}', got {len(values)}.")
+        num_rows = self._num_rows
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+            full_values = np.zeros(num_rows, dtype=np.int64 if values.dtype.kind in "iu" else np.float64)
+            full_values[self._index] = values
+            column = _NumericColumn(full_values)
+        else:
+            full_values = [None] * num_rows
+            for row, value in zip(self._index, values):
+                full_values[row] = value
+            column = _encode_column(full_values, max(1, num_rows // 2))
+        mask = np.zeros(num_rows, dtype=bool)
+        mask[self._index] = True
+        self._columns = {**self._columns, key: column}
+        self._present = {k: v for k, v in self._present.items() if k != key}
+        if not mask.all():
+            self._present[key] = mask
+
+    def to_list(self) -> List[Dict]:
+        """Return the samples as a list of dicts."""
+        return list(self)
@@ -1 +1,10 @@
-from TTS.tts.layers.losses import *
+import importlib
+
+
+def __getattr__(name: str):
+    # the losses are imported on first use, so that importing a single layer does not import all their dependencies
+    losses = importlib.import_module("TTS.tts.layers.losses")
+    try:
+        return getattr(losses, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
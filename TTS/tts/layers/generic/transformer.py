@@ -26,7 +26,12 @@ class FFTransformer(nn.Module):
         src = self.norm1(src + src2)
         # T x B x D -> B x D x T
         src = src.permute(1, 2, 0)
-        src2 = self.conv2(F.relu(self.conv1(src)))
+        if src_key_padding_mask is not None:
+            # zero the padded frames so the convolutions give the same outputs as without padding
+            frame_mask = ~src_key_padding_mask.unsqueeze(1)
+            src2 = self.conv2(F.relu(self.conv1(src * frame_mask)) * frame_mask)
+        else:
+            src2 = self.conv2(F.relu(self.conv1(src)))
         src2 = self.dropout2(src2)
         src = src + src2
         src = src.transpose(1, 2)
@@ -7,6 +7,7 @@ from tqdm.auto import tqdm
 
 from TTS.tts.layers.tacotron.common_layers import Linear
 from TTS.tts.layers.tacotron.tacotron2 import ConvBNBlock
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
 
 
 class Encoder(nn.Module):
@@ -222,7 +223,10 @@ class Outputnet(nn.Module):
 class OverflowUtils:
     @staticmethod
     def get_data_parameters_for_flat_start(
-        data_loader: torch.utils.data.DataLoader, out_channels: int, states_per_phone: int
+        data_loader: torch.utils.data.DataLoader,
+        out_channels: int,
+        states_per_phone: int,
+        torch_spec: TorchSpectrogram = None,
     ):
         """Generates data parameters for flat starting the HMM.
 
@@ -230,6 +234,8 @@ class OverflowUtils:
             data_loader (torch.utils.data.Dataloader): _description_
             out_channels (int): mel spectrogram channels
             states_per_phone (_type_): HMM states per phone
+            torch_spec (TorchSpectrogram): computes the mel spectrograms of the batches that have the raw audio
+                instead (`compute_spec_on_device`). Defaults to None.
         """
 
         # State related information for transition_p
@@ -243,6 +249,8 @@ class OverflowUtils:
         for batch in tqdm(data_loader, leave=False):
             text_lengths = batch["token_id_lengths"]
             mels = batch["mel"]
+            if mels is None:
+                mels = torch_spec.melspectrogram(batch["raw_wav"], batch["raw_wav_lengths"])
             mel_lengths = batch["mel_lengths"]
 
             total_state_len += torch.sum(text_lengths)
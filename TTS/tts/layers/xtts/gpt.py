@@ -195,7 +195,7 @@ class GPT(nn.Module):
             "heads": list(self.text_head.parameters()) + list(self.mel_head.parameters()),
         }
 
-    def init_gpt_for_inference(self, kv_cache=True, use_deepspeed=False):
+    def init_gpt_for_inference(self, kv_cache=True, use_deepspeed=False, static_kv_cache=False):
         seq_length = self.max_prompt_tokens + self.max_mel_tokens + self.max_text_tokens + 1
         gpt_config = GPT2Config(
             vocab_size=self.max_mel_tokens,
@@ -215,6 +215,7 @@ class GPT(nn.Module):
             self.final_norm,
             self.mel_head,
             kv_cache=kv_cache,
+            static_kv_cache=static_kv_cache and not use_deepspeed,
         )
         self.gpt.wte = self.mel_embedding
 
@@ -562,10 +563,35 @@ class GPT(nn.Module):
         self,
         cond_latents,
         text_inputs,
+        text_lengths=None,
     ):
-        text_inputs = F.pad(text_inputs, (0, 1), value=self.stop_text_token)
-        text_inputs = F.pad(text_inputs, (1, 0), value=self.start_text_token)
-        emb = self.text_embedding(text_inputs) + self.text_pos_embedding(text_inputs)
+        """Store the conditioning and text embeddings as the generation prefix and return the dummy GPT inputs.
+
+        Without `text_lengths` all the rows of `text_inputs` are used in full. With `text_lengths`, the rows are
+        right-padded texts of different lengths. Their embeddings are then left-padded to end at the same position
+        and the returned attention mask hides the padding.
+
+        Shapes:
+            cond_latents: [B or 1, T_cond, C]
+            text_inputs: [B, T_text]
+            text_lengths: [B]
+        """
+        if text_lengths is None:
+            text_inputs = F.pad(text_inputs, (0, 1), value=self.stop_text_token)
+            text_inputs = F.pad(text_inputs, (1, 0), value=self.start_text_token)
+            emb = self.text_embedding(text_inputs) + self.text_pos_embedding(text_inputs)
+            text_pad_lengths = None
+        else:
+            embs = []
+            for tokens, length in zip(text_inputs, text_lengths):
+                tokens = F.pad(tokens[:length].unsqueeze(0), (0, 1), value=self.stop_text_token)
+                tokens = F.pad(tokens, (1, 0), value=self.start_text_token)
+                embs.append(self.text_embedding(tokens) + self.text_pos_embedding(tokens))
+            max_len = max(e.shape[1] for e in embs)
+            text_pad_lengths = [max_len - e.shape[1] for e in embs]
+            emb = torch.cat([F.pad(e, (0, 0, pad_len, 0)) for e, pad_len in zip(embs, text_pad_lengths)], dim=0)
+        if cond_latents.shape[0] != emb.shape[0]:
+            cond_latents = cond_latents.expand(emb.shape[0], -1, -1)
         emb = torch.cat([cond_latents, emb], dim=1)
         self.gpt_inference.store_prefix_emb(emb)
         gpt_inputs = torch.full(
@@ -578,15 +604,43 @@ class GPT(nn.Module):
             device=text_inputs.device,
         )
         gpt_inputs[:, -1] = self.start_audio_token
-        return gpt_inputs
+        if text_pad_lengths is None:
+            return gpt_inputs
+        attention_mask = torch.ones_like(gpt_inputs)
+        for idx, pad_len in enumerate(text_pad_lengths):
+            attention_mask[idx, cond_latents.shape[1] : cond_latents.shape[1] + pad_len] = 0
+        return gpt_inputs, attention_mask
 
     def generate(
         self,
         cond_latents,
         text_inputs,
+        text_lengths=None,
+        return_latents=False,
         **hf_generate_kwargs,
     ):
-        gpt_inputs = self.compute_embeddings(cond_latents, text_inputs)
+        """Generate the audio codes of the given texts.
+
+        If `text_lengths` is given, the rows of `text_inputs` are texts of different lengths generated together in a
+        single batch. Each row stops on its own and is padded with `stop_audio_token` after that.
+
+        If `return_latents` is True, the latents of the generated codes are also returned. They are the normalized
+        last hidden states of each decoding step, the same latents `forward(..., return_latent=True)` computes with
+        a second pass over the codes. It does not work with beam search since beams are reordered while decoding.
+
+        Shapes:
+            codes: [B, T_codes]
+            latents: [B, T_codes, C]
+        """
+        if text_lengths is None:
+            gpt_inputs = self.compute_embeddings(cond_latents, text_inputs)
+        else:
+            gpt_inputs, attention_mask = self.compute_embeddings(cond_latents, text_inputs, text_lengths)
+            hf_generate_kwargs["attention_mask"] = attention_mask
+        if return_latents:
+            assert hf_generate_kwargs.get("num_beams", 1) == 1, " ❗ `return_latents` does not support beam search."
+            hf_generate_kwargs["output_hidden_states"] = True
+            hf_generate_kwargs["return_dict_in_generate"] = True
         gen = self.gpt_inference.generate(
             gpt_inputs,
             bos_token_id=self.start_audio_token,
@@ -595,6 +649,10 @@ class GPT(nn.Module):
             max_length=self.max_gen_mel_tokens + gpt_inputs.shape[-1],
             **hf_generate_kwargs,
         )
+        if return_latents:
+            # the last hidden state of each step is the one that predicted the generated code
+            latents = torch.cat([hidden_states[-1][:, -1:] for hidden_states in gen.hidden_states], dim=1)
+            return gen.sequences[:, gpt_inputs.shape[1] :], self.final_norm(latents)
         if "return_dict_in_generate" in hf_generate_kwargs:
             return gen.sequences[:, gpt_inputs.shape[1] :], gen
         return gen[:, gpt_inputs.shape[1] :]
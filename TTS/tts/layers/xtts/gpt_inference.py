@@ -1,15 +1,73 @@
 import math
 
 import torch
+import torch.nn.functional as F
+import transformers
+from packaging import version
 from torch import nn
 from transformers import GPT2PreTrainedModel
 from transformers.modeling_outputs import CausalLMOutputWithCrossAttentions
 
 
+class StaticKVCache:
+    """Pre-allocated key/value cache of a GPT-2 model, written in place at each decoding step.
+
+    The default Hugging Face cache concatenates the new keys and values to the past ones, allocating new tensors at
+    every step for every layer. This cache allocates them once for `max_length` positions at the start of each
+    generation, so concurrent generations never share it.
+
+    Args:
+        num_layers (int): number of transformer layers.
+        batch_size (int): batch size.
+        num_heads (int): number of attention heads.
+        max_length (int): maximum number of positions.
+        head_dim (int): size of each attention head.
+        dtype (torch.dtype): dtype of the cache.
+        device (torch.device): device of the cache.
+    """
+
+    def __init__(self, num_layers, batch_size, num_heads, max_length, head_dim, dtype=None, device=None):
+        shape = (num_layers, batch_size, num_heads, max_length, head_dim)
+        self.keys = torch.zeros(shape, dtype=dtype, device=device)
+        self.values = torch.zeros(shape, dtype=dtype, device=device)
+        self.max_length = max_length
+        self.length = 0
+
+    def update(self, layer_idx, key, value):
+        """Write the keys and values of the new positions of a layer and return all the keys and values so far.
+
+        The new positions are only counted in `self.length` by `advance()` after all the layers are updated.
+
+        Shapes:
+            key, value: [B, H, T_new, D]
+            outputs: [B, H, T_past + T_new, D]
+        """
+        end = self.length + key.shape[-2]
+        if end > self.max_length:
+            raise ValueError(f" [!] The static KV cache is full ({self.max_length} positions).")
+        self.keys[layer_idx, :, :, self.length : end] = key
+        self.values[layer_idx, :, :, self.length : end] = value
+        return self.keys[layer_idx, :, :, :end], self.values[layer_idx, :, :, :end]
+
+    def advance(self, num_positions):
+        self.length += num_positions
+
+    def reorder_cache(self, beam_idx):
+        """Reorder the batch in place for beam search."""
+        beam_idx = beam_idx.to(self.keys.device)
+        self.keys = self.keys.index_select(1, beam_idx)
+        self.values = self.values.index_select(1, beam_idx)
+
+
 class GPT2InferenceModel(GPT2PreTrainedModel):
-    """Override GPT2LMHeadModel to allow for prefix conditioning."""
+    """Override GPT2LMHeadModel to allow for prefix conditioning.
+
+    With `static_kv_cache`, the keys and values are stored in a `StaticKVCache` instead of the growing
+    `past_key_values` tuples and the transformer blocks are run by `_forward_static()`. It reimplements the blocks of
+    the transformers GPT-2 model and is only allowed with the transformers versions it was checked against.
+    """
 
-    def __init__(self, config, gpt, pos_emb, embeddings, norm, linear, kv_cache):
+    def __init__(self, config, gpt, pos_emb, embeddings, norm, linear, kv_cache, static_kv_cache=False):
         super().__init__(config)
         self.transformer = gpt
         self.pos_embedding = pos_emb
@@ -17,15 +75,46 @@ class GPT2InferenceModel(GPT2PreTrainedModel):
         self.final_norm = norm
         self.lm_head = nn.Sequential(norm, linear)
         self.kv_cache = kv_cache
+        self.static_kv_cache = static_kv_cache
+        assert not (
+            static_kv_cache
+            and not version.parse("4.33.0") <= version.parse(transformers.__version__) < version.parse("4.37.0")
+        ), "the static KV cache relies on the GPT-2 internals of transformers>=4.33.0,<4.37.0"
 
     def store_prefix_emb(self, prefix_emb):
         self.cached_prefix_emb = prefix_emb
 
+    def _new_static_cache(self, batch_size):
+        """Allocate the cache of a new generation, passed along in `past_key_values` so each generation has its own."""
+        attn = self.transformer.h[0].attn
+        return StaticKVCache(
+            num_layers=len(self.transformer.h),
+            batch_size=batch_size,
+            num_heads=attn.num_heads,
+            max_length=self.config.n_positions,
+            head_dim=attn.head_dim,
+            dtype=self.cached_prefix_emb.dtype,
+            device=self.cached_prefix_emb.device,
+        )
+
     def prepare_inputs_for_generation(self, input_ids, past_key_values=None, **kwargs):
         token_type_ids = kwargs.get("token_type_ids", None)  # usually None
         if not self.kv_cache:
             past_key_values = None
 
+        if self.kv_cache and self.static_kv_cache:
+            # the first step computes the whole prefix, the next ones only the last token
+            if isinstance(past_key_values, StaticKVCache):
+                input_ids = input_ids[:, -1:]
+            else:
+                past_key_values = self._new_static_cache(input_ids.shape[0])
+            return {
+                "input_ids": input_ids,
+                "past_key_values": past_key_values,
+                "use_cache": True,
+                "attention_mask": kwargs.get("attention_mask", None),
+            }
+
         # only last token for inputs_ids if past is defined in kwargs
         if past_key_values is not None:
             input_ids = input_ids[:, -1].unsqueeze(-1)
@@ -94,6 +183,17 @@ class GPT2InferenceModel(GPT2PreTrainedModel):
             emb = emb + self.pos_embedding.get_fixed_embedding(
                 attention_mask.shape[1] - (prefix_len + 1), attention_mask.device
             )
+        if isinstance(past_key_values, StaticKVCache):
+            hidden_states, all_hidden_states = self._forward_static(
+                emb, past_key_values, attention_mask, output_hidden_states
+            )
+            lm_logits = self.lm_head(hidden_states)
+            if not return_dict:
+                return (lm_logits, past_key_values)
+            return CausalLMOutputWithCrossAttentions(
+                logits=lm_logits, past_key_values=past_key_values, hidden_states=all_hidden_states
+            )
+
         transformer_outputs = self.transformer(
             inputs_embeds=emb,
             past_key_values=past_key_values,
@@ -123,6 +223,53 @@ class GPT2InferenceModel(GPT2PreTrainedModel):
             cross_attentions=transformer_outputs.cross_attentions,
         )
 
+    def _forward_static(self, emb, kv_cache, attention_mask=None, output_hidden_states=False):
+        """Run the GPT-2 blocks of `self.transformer` over the new positions `emb` with a `StaticKVCache`.
+
+        It computes the same as `GPT2Model.forward()` with `past_key_values`, writing the new keys and values in
+        place instead of concatenating them.
+
+        Shapes:
+            emb: [B, T_new, C]
+            attention_mask: [B, T_past + T_new]
+        """
+        batch_size, num_positions = emb.shape[:2]
+        start = kv_cache.length
+        end = start + num_positions
+        # causal mask of the new positions over all the positions, merged with the padding mask
+        positions = torch.arange(end, device=emb.device)
+        allowed = (positions[None, :] <= positions[start:end, None])[None, None]
+        if attention_mask is not None:
+            allowed = allowed & attention_mask[:, None, None, :end].bool()
+        attn_mask = torch.zeros(allowed.shape, dtype=emb.dtype, device=emb.device)
+        attn_mask.masked_fill_(~allowed, torch.finfo(emb.dtype).min)
+
+        hidden_states = self.transformer.drop(emb)
+        all_hidden_states = () if output_hidden_states else None
+        for layer_idx, block in enumerate(self.transformer.h):
+            if output_hidden_states:
+                all_hidden_states += (hidden_states,)
+            attn = block.attn
+            scale = 1.0 / math.sqrt(attn.head_dim) if attn.scale_attn_weights else 1.0
+            if attn.scale_attn_by_inverse_layer_idx:
+                scale /= float(layer_idx + 1)
+            query, key, value = attn.c_attn(block.ln_1(hidden_states)).split(attn.split_size, dim=2)
+            query, key, value = [
+                x.view(batch_size, num_positions, attn.num_heads, attn.head_dim).transpose(1, 2)
+                for x in (query, key, value)
+            ]
+            key, value = kv_cache.update(layer_idx, key, value)
+            attn_output = F.scaled_dot_product_attention(query, key, value, attn_mask=attn_mask, scale=scale)
+            attn_output = attn_output.transpose(1, 2).reshape(batch_size, num_positions, attn.embed_dim)
+            hidden_states = hidden_states + attn.resid_dropout(attn.c_proj(attn_output))
+            hidden_states = hidden_states + block.mlp(block.ln_2(hidden_states))
+        kv_cache.advance(num_positions)
+
+        hidden_states = self.transformer.ln_f(hidden_states)
+        if output_hidden_states:
+            all_hidden_states += (hidden_states,)
+        return hidden_states, all_hidden_states
+
     @staticmethod
     def _reorder_cache(past, beam_idx):
         """
@@ -130,6 +277,9 @@ class GPT2InferenceModel(GPT2PreTrainedModel):
         :meth:`~transformers.PreTrainedModel.beam_search` or :meth:`~transformers.PreTrainedModel.beam_sample` is
         called. This is required to match :obj:`past_key_values` with the correct beam_idx at every generation step.
         """
+        if isinstance(past, StaticKVCache):
+            past.reorder_cache(beam_idx)
+            return past
         return tuple(
             tuple(past_state.index_select(0, beam_idx.to(past_state.device)) for past_state in layer_past)
             for layer_past in past
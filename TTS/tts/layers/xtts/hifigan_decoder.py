@@ -6,7 +6,7 @@ from torch.nn import functional as F
 from torch.nn.utils.parametrizations import weight_norm
 from torch.nn.utils.parametrize import remove_parametrizations
 
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 
 LRELU_SLOPE = 0.1
 
@@ -578,7 +578,7 @@ class ResNetSpeakerEncoder(nn.Module):
     ):
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
         try:
-            self.load_state_dict(state["model"])
+            self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
             print(" > Model fully restored. ")
         except (KeyError, RuntimeError) as error:
             # If eval raise the error
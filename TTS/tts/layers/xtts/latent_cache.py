@@ -0,0 +1,134 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
+
+import torch
+
+
+class ConditioningLatentCache:
+    """LRU cache of the XTTS speaker conditioning `(gpt_cond_latent, speaker_embedding)` pairs.
+
+    Entries are keyed on the content hash of the reference audio files and the conditioning settings, so the same
+    voice is recognized under any file name and an edited file is never served stale. Latents are kept on CPU and
+    can be shared by model replicas on different devices. If `cache_dir` is set, entries are also stored on disk and
+    survive restarts.
+
+    Args:
+        max_size (int): maximum number of entries kept in memory. Defaults to 32.
+        cache_dir (str, optional): folder to store the entries on disk. Defaults to None.
+        max_file_hashes (int): maximum number of file content hashes memoized in memory. Defaults to 4096.
+
+    Example:
+        >>> cache = ConditioningLatentCache(max_size=8)
+        >>> key = cache.get_key(["speaker.wav"], gpt_cond_len=6)
+        >>> latents = cache.get(key)
+        >>> if latents is None:
+        ...     latents = model.get_conditioning_latents("speaker.wav", gpt_cond_len=6)
+        ...     cache.put(key, latents)
+    """
+
+    def __init__(self, max_size: int = 32, cache_dir: str = None, max_file_hashes: int = 4096):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.max_file_hashes = max_file_hashes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._file_hashes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _file_hash(self, file_path: str) -> str:
+        """Content hash of a file, memoized on its path, size and modification time."""
+        stat = os.stat(file_path)
+        abs_path = os.path.abspath(file_path)
+        with self._lock:
+            memo = self._file_hashes.get(abs_path)
+            if memo is not None:
+                self._file_hashes.move_to_end(abs_path)
+        if memo is not None and memo[:2] == (stat.st_size, stat.st_mtime_ns):
+            return memo[2]
+        sha = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        with self._lock:
+            # an edited file replaces its previous hash
+            self._file_hashes[abs_path] = (stat.st_size, stat.st_mtime_ns, digest)
+            self._file_hashes.move_to_end(abs_path)
+            while len(self._file_hashes) > self.max_file_hashes:
+                self._file_hashes.popitem(last=False)
+        return digest
+
+    def get_key(self, audio_paths: Union[str, List[str]], **settings) -> str:
+        """Return the cache key of the reference audio files and conditioning settings or None if they cannot be
+        hashed, e.g. a path that is not a local file."""
+        if not isinstance(audio_paths, (list, tuple)):
+            audio_paths = [audio_paths]
+        if not all(isinstance(p, (str, os.PathLike)) and os.path.isfile(p) for p in audio_paths):
+            return None
+        sha = hashlib.sha256()
+        for audio_path in audio_paths:
+            sha.update(self._file_hash(audio_path).encode())
+        for name, value in sorted(settings.items()):
+            sha.update(f"{name}={value}".encode())
+        return sha.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pth")
+
+    def get(self, key: str, device: Union[str, torch.device] = "cpu") -> Tuple[torch.Tensor, torch.Tensor]:
+        """Return the cached latents moved to `device` or None and update the hit/miss counters."""
+        with self._lock:
+            latents = self._entries.get(key)
+            if latents is not None:
+                self._entries.move_to_end(key)
+        if latents is None and self.cache_dir is not None and os.path.isfile(self._entry_path(key)):
+            latents = torch.load(self._entry_path(key), map_location="cpu")
+            self._put(key, latents)
+        if latents is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tuple(t.to(device) for t in latents)
+
+    def put(self, key: str, latents: Tuple[torch.Tensor, torch.Tensor]):
+        """Add an entry to the cache and to `cache_dir` if set."""
+        latents = tuple(t.detach().cpu() for t in latents)
+        self._put(key, latents)
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # write to a temp file first to never leave a truncated entry behind
+            tmp_path = f"{self._entry_path(key)}.{os.getpid()}.tmp"
+            torch.save(latents, tmp_path)
+            os.replace(tmp_path, self._entry_path(key))
+
+    def _put(self, key, latents):
+        with self._lock:
+            self._entries[key] = latents
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove the entries from memory and reset the counters. Entries on disk are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._file_hashes.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Return the number of entries in memory, hits and misses and the hit rate."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
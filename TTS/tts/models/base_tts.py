@@ -1,7 +1,9 @@
+import math
 import os
 import random
 from typing import Dict, List, Tuple, Union
 
+import numpy as np
 import torch
 import torch.distributed as dist
 from coqpit import Coqpit
@@ -17,6 +19,8 @@ from TTS.tts.utils.languages import LanguageManager, get_language_balancer_weigh
 from TTS.tts.utils.speakers import SpeakerManager, get_speaker_balancer_weights, get_speaker_manager
 from TTS.tts.utils.synthesis import synthesis
 from TTS.tts.utils.visual import plot_alignment, plot_spectrogram
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
+from TTS.utils.samplers import DynamicBatchSampler
 
 # pylint: skip-file
 
@@ -237,9 +241,33 @@ class BaseTTS(BaseTrainerModel):
             "energy": energy,
             "language_ids": language_ids,
             "audio_unique_names": batch["audio_unique_names"],
+            "raw_wav": batch.get("raw_wav"),
+            "raw_wav_lengths": batch.get("raw_wav_lengths"),
         }
 
-    def get_sampler(self, config: Coqpit, dataset: TTSDataset, num_gpus=1):
+    def format_batch_on_device(self, batch: Dict) -> Dict:
+        """Compute the spectrograms of the batch on the training device if the data loader sends the raw audio.
+
+        See `compute_spec_on_device` in `BaseTTSConfig`. The spectrograms are padded to a multiple of the reduction
+        factor like in `TTSDataset.collate_fn()`.
+        """
+        if batch.get("raw_wav") is None:
+            return batch
+        if getattr(self, "torch_spec", None) is None:
+            self.torch_spec = TorchSpectrogram(self.ap)
+        wav, wav_lengths = batch["raw_wav"], batch["raw_wav_lengths"]
+        num_frames = math.ceil(batch["max_spec_length"] / self.config.r) * self.config.r
+
+        def _format_spec(S):
+            # B x D x T --> B x T x D
+            return torch.nn.functional.pad(S, (0, num_frames - S.shape[2])).transpose(1, 2).contiguous()
+
+        batch["mel_input"] = _format_spec(self.torch_spec.melspectrogram(wav, wav_lengths))
+        if self.config.model.lower() == "tacotron" or self.config.compute_linear_spec:
+            batch["linear_input"] = _format_spec(self.torch_spec.spectrogram(wav, wav_lengths))
+        return batch
+
+    def get_sampler(self, config: Coqpit, dataset: TTSDataset, num_gpus=1, is_eval=False):
         weights = None
         data_items = dataset.samples
 
@@ -269,6 +297,18 @@ class BaseTTS(BaseTrainerModel):
         else:
             sampler = None
 
+        if config.get("batch_max_frames", None) and not is_eval:
+            mel_lengths = np.array(dataset.durations) * self.ap.sample_rate / self.ap.hop_length
+            sampler = DynamicBatchSampler(
+                mel_lengths, config.batch_max_frames, sampler=sampler, seed=config.get("training_seed", 0)
+            )
+            print(
+                f" > Using dynamic batches of {config.batch_max_frames} frames: {len(sampler)} batches of"
+                f" {len(dataset) / len(sampler):.1f} samples on average, padding efficiency"
+                f" {sampler.padding_efficiency:.1%}"
+            )
+            return DistributedSamplerWrapper(sampler) if num_gpus > 1 else sampler
+
         # sampler for DDP
         if sampler is None:
             sampler = DistributedSampler(dataset) if num_gpus > 1 else None
@@ -328,6 +368,7 @@ class BaseTTS(BaseTrainerModel):
                 min_audio_len=config.min_audio_len,
                 max_audio_len=config.max_audio_len,
                 phoneme_cache_path=config.phoneme_cache_path,
+                feature_store_path=config.get("feature_store_path", None),
                 precompute_num_workers=config.precompute_num_workers,
                 use_noise_augment=False if is_eval else config.use_noise_augment,
                 verbose=verbose,
@@ -336,6 +377,7 @@ class BaseTTS(BaseTrainerModel):
                 tokenizer=self.tokenizer,
                 start_by_longest=config.start_by_longest,
                 language_id_mapping=language_id_mapping,
+                compute_spec_on_device=config.get("compute_spec_on_device", False),
             )
 
             # wait all the DDP process to be ready
@@ -346,18 +388,27 @@ class BaseTTS(BaseTrainerModel):
             dataset.preprocess_samples()
 
             # get samplers
-            sampler = self.get_sampler(config, dataset, num_gpus)
-
-            loader = DataLoader(
-                dataset,
-                batch_size=config.eval_batch_size if is_eval else config.batch_size,
-                shuffle=config.shuffle if sampler is None else False,  # if there is no other sampler
-                collate_fn=dataset.collate_fn,
-                drop_last=config.drop_last,  # setting this False might cause issues in AMP training.
-                sampler=sampler,
-                num_workers=config.num_eval_loader_workers if is_eval else config.num_loader_workers,
-                pin_memory=False,
-            )
+            sampler = self.get_sampler(config, dataset, num_gpus, is_eval=is_eval)
+
+            if config.get("batch_max_frames", None) and not is_eval:
+                loader = DataLoader(
+                    dataset,
+                    batch_sampler=sampler,
+                    collate_fn=dataset.collate_fn,
+                    num_workers=config.num_loader_workers,
+                    pin_memory=False,
+                )
+            else:
+                loader = DataLoader(
+                    dataset,
+                    batch_size=config.eval_batch_size if is_eval else config.batch_size,
+                    shuffle=config.shuffle if sampler is None else False,  # if there is no other sampler
+                    collate_fn=dataset.collate_fn,
+                    drop_last=config.drop_last,  # setting this False might cause issues in AMP training.
+                    sampler=sampler,
+                    num_workers=config.num_eval_loader_workers if is_eval else config.num_loader_workers,
+                    pin_memory=False,
+                )
         return loader
 
     def _get_test_aux_input(
@@ -16,7 +16,7 @@ from TTS.tts.utils.helpers import average_over_durations, generate_path, maximum
 from TTS.tts.utils.speakers import SpeakerManager
 from TTS.tts.utils.text.tokenizer import TTSTokenizer
 from TTS.tts.utils.visual import plot_alignment, plot_avg_energy, plot_avg_pitch, plot_spectrogram
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 
 
 @dataclass
@@ -673,6 +673,9 @@ class ForwardTTS(BaseTTS):
     def inference(self, x, aux_input={"d_vectors": None, "speaker_ids": None}):  # pylint: disable=unused-argument
         """Model's inference pass.
 
+        Note:
+            To run in batch mode, provide `x_lengths` in `aux_input` else model assumes that the batch size is 1.
+
         Args:
             x (torch.LongTensor): Input character sequence.
             aux_input (Dict): Auxiliary model inputs. Defaults to `{"d_vectors": None, "speaker_ids": None}`.
@@ -683,13 +686,16 @@ class ForwardTTS(BaseTTS):
             - g: [B, C]
         """
         g = self._set_speaker_input(aux_input)
-        x_lengths = torch.tensor(x.shape[1:2]).to(x.device)
+        x_lengths = aux_input.get("x_lengths", None)
+        if x_lengths is None:
+            x_lengths = torch.tensor(x.shape[1:2]).to(x.device)
         x_mask = torch.unsqueeze(sequence_mask(x_lengths, x.shape[1]), 1).to(x.dtype).float()
         # encoder pass
         o_en, x_mask, g, _ = self._forward_encoder(x, x_mask, g)
         # duration predictor pass
         o_dr_log = self.duration_predictor(o_en.squeeze(), x_mask)
-        o_dr = self.format_durations(o_dr_log, x_mask).squeeze(1)
+        # `format_durations` sets the padded positions to 1, mask them again
+        o_dr = (self.format_durations(o_dr_log, x_mask) * x_mask).squeeze(1)
         y_lengths = o_dr.sum(1)
 
         # pitch predictor pass
@@ -710,6 +716,8 @@ class ForwardTTS(BaseTTS):
             "pitch": o_pitch,
             "energy": o_energy,
             "durations_log": o_dr_log,
+            "durations": o_dr,
+            "y_mask": torch.unsqueeze(sequence_mask(y_lengths, None), 1).to(o_de.dtype),
         }
         return outputs
 
@@ -831,7 +839,7 @@ class ForwardTTS(BaseTTS):
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
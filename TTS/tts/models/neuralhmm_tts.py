@@ -16,8 +16,9 @@ from TTS.tts.models.base_tts import BaseTTS
 from TTS.tts.utils.speakers import SpeakerManager
 from TTS.tts.utils.text.tokenizer import TTSTokenizer
 from TTS.tts.utils.visual import plot_alignment, plot_spectrogram
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
 from TTS.utils.generic_utils import format_aux_input
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 
 
 class NeuralhmmTTS(BaseTTS):
@@ -255,7 +256,7 @@ class NeuralhmmTTS(BaseTTS):
         self, config: Coqpit, checkpoint_path: str, eval: bool = False, strict: bool = True, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"))
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
@@ -270,7 +271,10 @@ class NeuralhmmTTS(BaseTTS):
                 f" | > Data parameters not found for: {trainer.config.mel_statistics_parameter_path}. Computing mel normalization parameters..."
             )
             data_mean, data_std, init_transition_prob = OverflowUtils.get_data_parameters_for_flat_start(
-                dataloader, trainer.config.out_channels, trainer.config.state_per_phone
+                dataloader,
+                trainer.config.out_channels,
+                trainer.config.state_per_phone,
+                torch_spec=TorchSpectrogram(self.ap) if trainer.config.compute_spec_on_device else None,
             )
             print(
                 f" | > Saving data parameters to: {trainer.config.mel_statistics_parameter_path}: value: {data_mean, data_std, init_transition_prob}"
@@ -33,7 +33,7 @@ from TTS.tts.utils.synthesis import synthesis
 from TTS.tts.utils.text.characters import BaseCharacters, BaseVocabulary, _characters, _pad, _phonemes, _punctuations
 from TTS.tts.utils.text.tokenizer import TTSTokenizer
 from TTS.tts.utils.visual import plot_alignment
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.utils.samplers import BucketBatchSampler
 from TTS.vocoder.models.hifigan_generator import HifiganGenerator
 from TTS.vocoder.utils.generic_utils import plot_results
@@ -1604,6 +1604,7 @@ class Vits(BaseTTS):
                 min_audio_len=config.min_audio_len,
                 max_audio_len=config.max_audio_len,
                 phoneme_cache_path=config.phoneme_cache_path,
+                feature_store_path=config.get("feature_store_path", None),
                 precompute_num_workers=config.precompute_num_workers,
                 verbose=verbose,
                 tokenizer=self.tokenizer,
@@ -1695,6 +1696,11 @@ class Vits(BaseTTS):
 
         return [VitsDiscriminatorLoss(self.config), VitsGeneratorLoss(self.config)]
 
+    def get_quantizable_modules(self) -> List[nn.Module]:
+        """Return the modules quantized by `TTS.utils.quantization.quantize_model()`, all the inference modules."""
+        modules = [self.text_encoder, self.flow, self.duration_predictor, self.posterior_encoder]
+        return modules + self.waveform_decoder.get_quantizable_modules()
+
     def load_checkpoint(
         self, config, checkpoint_path, eval=False, strict=True, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
@@ -1718,7 +1724,7 @@ class Vits(BaseTTS):
             emb_g = torch.cat([emb_g, new_row], axis=0)
             state["model"]["emb_g.weight"] = emb_g
         # load the model weights
-        self.load_state_dict(state["model"], strict=strict)
+        self.load_state_dict(state["model"], strict=strict, assign=is_safetensors_file(checkpoint_path))
 
         if eval:
             self.eval()
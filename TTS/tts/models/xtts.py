@@ -1,3 +1,4 @@
+import hashlib
 import os
 from dataclasses import dataclass
 
@@ -9,11 +10,12 @@ from coqpit import Coqpit
 
 from TTS.tts.layers.xtts.gpt import GPT
 from TTS.tts.layers.xtts.hifigan_decoder import HifiDecoder
+from TTS.tts.layers.xtts.latent_cache import ConditioningLatentCache
 from TTS.tts.layers.xtts.stream_generator import init_stream_support
 from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer, split_sentence
 from TTS.tts.layers.xtts.xtts_manager import SpeakerManager, LanguageManager
 from TTS.tts.models.base_tts import BaseTTS
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 
 init_stream_support()
 
@@ -129,6 +131,8 @@ class XttsArgs(Coqpit):
         gpt_batch_size (int): The size of the auto-regressive batch.
         enable_redaction (bool, optional): Whether to enable redaction. Defaults to True.
         kv_cache (bool, optional): Whether to use the kv_cache. Defaults to True.
+        static_kv_cache (bool, optional): Whether to write the kv_cache in place in a pre-allocated buffer instead of
+            growing it at each step. Not used with DeepSpeed. Defaults to False.
         gpt_checkpoint (str, optional): The checkpoint for the autoregressive model. Defaults to None.
         clvp_checkpoint (str, optional): The checkpoint for the ConditionalLatentVariablePerseq model. Defaults to None.
         decoder_checkpoint (str, optional): The checkpoint for the DiffTTS model. Defaults to None.
@@ -153,6 +157,7 @@ class XttsArgs(Coqpit):
     gpt_batch_size: int = 1
     enable_redaction: bool = False
     kv_cache: bool = True
+    static_kv_cache: bool = False
     gpt_checkpoint: str = None
     clvp_checkpoint: str = None
     decoder_checkpoint: str = None
@@ -215,6 +220,11 @@ class Xtts(BaseTTS):
         self.init_models()
         self.register_buffer("mel_stats", torch.ones(80))
 
+        self._conditioning_weights_hash = None
+        self.latent_cache = None
+        if config.get("latent_cache_size", 0) > 0:
+            self.latent_cache = ConditioningLatentCache(config.latent_cache_size, config.get("latent_cache_dir", None))
+
     def init_models(self):
         """Initialize the models. We do it here since we need to load the tokenizer first."""
         if self.tokenizer.tokenizer is not None:
@@ -322,6 +332,38 @@ class Xtts(BaseTTS):
             .to(self.device)
         )
 
+    def conditioning_weights_hash(self) -> str:
+        """Hash of the weights computing the conditioning latents, to tell the latents of different checkpoints apart.
+
+        Fine-tunes of the same base model share the mel stats but not the conditioning encoders, so the encoder
+        weights are hashed. It is computed once per loaded checkpoint.
+        """
+        if self._conditioning_weights_hash is None:
+            prefixes = (
+                "mel_stats",
+                "gpt.conditioning_encoder.",
+                "gpt.conditioning_perceiver.",
+                "hifigan_decoder.speaker_encoder.",
+            )
+            sha = hashlib.sha256()
+
+            def _update(value):
+                if isinstance(value, (tuple, list)):
+                    for v in value:
+                        _update(v)
+                elif torch.is_tensor(value):
+                    value = value.detach().cpu()
+                    if value.is_quantized:
+                        value = value.int_repr()
+                    sha.update(value.reshape(-1).contiguous().view(torch.uint8).numpy().tobytes())
+
+            for name, value in self.state_dict().items():
+                if name.startswith(prefixes):
+                    sha.update(name.encode())
+                    _update(value)
+            self._conditioning_weights_hash = sha.hexdigest()
+        return self._conditioning_weights_hash
+
     @torch.inference_mode()
     def get_conditioning_latents(
         self,
@@ -343,6 +385,8 @@ class Xtts(BaseTTS):
             librosa_trim_db (int, optional): Trim the audio using this value. If None, not trimming. Defaults to None.
             sound_norm_refs (bool, optional): Whether to normalize the audio. Defaults to False.
             load_sr (int, optional): Sample rate to load the audio. Defaults to 24000.
+
+        The latents are looked up in and added to `self.latent_cache` when it is set.
         """
         # deal with multiples references
         if not isinstance(audio_path, list):
@@ -350,6 +394,23 @@ class Xtts(BaseTTS):
         else:
             audio_paths = audio_path
 
+        cache_key = None
+        if self.latent_cache is not None:
+            cache_key = self.latent_cache.get_key(
+                audio_paths,
+                # latents of another checkpoint must not be reused
+                model=self.conditioning_weights_hash(),
+                max_ref_length=max_ref_length,
+                gpt_cond_len=gpt_cond_len,
+                gpt_cond_chunk_len=gpt_cond_chunk_len,
+                librosa_trim_db=librosa_trim_db,
+                sound_norm_refs=sound_norm_refs,
+                load_sr=load_sr,
+            )
+            latents = self.latent_cache.get(cache_key, self.device) if cache_key is not None else None
+            if latents is not None:
+                return latents
+
         speaker_embeddings = []
         audios = []
         speaker_embedding = None
@@ -377,6 +438,8 @@ class Xtts(BaseTTS):
             speaker_embedding = torch.stack(speaker_embeddings)
             speaker_embedding = speaker_embedding.mean(dim=0)
 
+        if cache_key is not None:
+            self.latent_cache.put(cache_key, (gpt_cond_latents, speaker_embedding))
         return gpt_cond_latents, speaker_embedding
 
     def synthesize(self, text, config, speaker_wav, language, speaker_id=None, **kwargs):
@@ -418,6 +481,43 @@ class Xtts(BaseTTS):
         })
         return self.full_inference(text, speaker_wav, language, **settings)
 
+    @torch.inference_mode()
+    def synthesize_stream(self, text, config, speaker_wav, language, speaker_id=None, **kwargs):
+        """Synthesize speech with the given input text and yield it in chunks with `inference_stream()`.
+
+        Args:
+            text (str): Input text.
+            config (XttsConfig): Config with inference parameters.
+            speaker_wav (list): List of paths to the speaker audio files to be used for cloning.
+            language (str): Language ID of the speaker.
+            **kwargs: Inference settings. See `inference_stream()`.
+
+        Yields:
+            torch.Tensor: crossfaded waveform chunk.
+        """
+        assert (
+            "zh-cn" if language == "zh" else language in self.config.languages
+        ), f" ❗ Language {language} is not supported. Supported languages are {self.config.languages}"
+        settings = {
+            "temperature": config.temperature,
+            "length_penalty": config.length_penalty,
+            "repetition_penalty": config.repetition_penalty,
+            "top_k": config.top_k,
+            "top_p": config.top_p,
+        }
+        settings.update(kwargs)
+        if speaker_id is not None:
+            gpt_cond_latent, speaker_embedding = self.speaker_manager.speakers[speaker_id].values()
+        else:
+            gpt_cond_latent, speaker_embedding = self.get_conditioning_latents(
+                audio_path=speaker_wav,
+                gpt_cond_len=config.gpt_cond_len,
+                gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+                max_ref_length=config.max_ref_len,
+                sound_norm_refs=config.sound_norm_refs,
+            )
+        yield from self.inference_stream(text, language, gpt_cond_latent, speaker_embedding, **settings)
+
     @torch.inference_mode()
     def full_inference(
         self,
@@ -516,8 +616,19 @@ class Xtts(BaseTTS):
         num_beams=1,
         speed=1.0,
         enable_text_splitting=False,
+        batch_sentences=False,
         **hf_generate_kwargs,
     ):
+        """Synthesize `text` with the given conditioning latents.
+
+        With `enable_text_splitting`, the text is split into sentences synthesized one after the other. With
+        `batch_sentences` too, all the sentences are generated in a single padded GPT batch and, on GPU, decoded in a
+        single HiFi-GAN batch, so a paragraph costs about as much as its longest sentence. Batching only applies
+        when `gpt_batch_size == 1` and without beam search.
+
+        Without beam search, the GPT latents are the hidden states collected while generating the codes, so no
+        second GPT pass is needed.
+        """
         language = language.split("-")[0]  # remove the country code
         length_scale = 1.0 / max(speed, 0.05)
         gpt_cond_latent = gpt_cond_latent.to(self.device)
@@ -527,6 +638,23 @@ class Xtts(BaseTTS):
         else:
             text = [text]
 
+        if batch_sentences and len(text) > 1 and self.gpt_batch_size == 1 and num_beams == 1:
+            return self._inference_batch(
+                text,
+                language,
+                gpt_cond_latent,
+                speaker_embedding,
+                length_scale=length_scale,
+                temperature=temperature,
+                length_penalty=length_penalty,
+                repetition_penalty=repetition_penalty,
+                top_k=top_k,
+                top_p=top_p,
+                do_sample=do_sample,
+                num_beams=num_beams,
+                **hf_generate_kwargs,
+            )
+
         wavs = []
         gpt_latents_list = []
         for sent in text:
@@ -538,10 +666,13 @@ class Xtts(BaseTTS):
             ), " ❗ XTTS can only generate text with a maximum of 400 tokens."
 
             with torch.no_grad():
-                gpt_codes = self.gpt.generate(
+                # without beam search, the latents are collected while generating instead of with a second GPT pass
+                reuse_latents = num_beams == 1
+                outputs = self.gpt.generate(
                     cond_latents=gpt_cond_latent,
                     text_inputs=text_tokens,
                     input_tokens=None,
+                    return_latents=reuse_latents,
                     do_sample=do_sample,
                     top_p=top_p,
                     top_k=top_k,
@@ -553,20 +684,23 @@ class Xtts(BaseTTS):
                     output_attentions=False,
                     **hf_generate_kwargs,
                 )
-                expected_output_len = torch.tensor(
-                    [gpt_codes.shape[-1] * self.gpt.code_stride_len], device=text_tokens.device
-                )
-
-                text_len = torch.tensor([text_tokens.shape[-1]], device=self.device)
-                gpt_latents = self.gpt(
-                    text_tokens,
-                    text_len,
-                    gpt_codes,
-                    expected_output_len,
-                    cond_latents=gpt_cond_latent,
-                    return_attentions=False,
-                    return_latent=True,
-                )
+                if reuse_latents:
+                    gpt_codes, gpt_latents = outputs
+                else:
+                    gpt_codes = outputs
+                    expected_output_len = torch.tensor(
+                        [gpt_codes.shape[-1] * self.gpt.code_stride_len], device=text_tokens.device
+                    )
+                    text_len = torch.tensor([text_tokens.shape[-1]], device=self.device)
+                    gpt_latents = self.gpt(
+                        text_tokens,
+                        text_len,
+                        gpt_codes,
+                        expected_output_len,
+                        cond_latents=gpt_cond_latent,
+                        return_attentions=False,
+                        return_latent=True,
+                    )
 
                 if length_scale != 1.0:
                     gpt_latents = F.interpolate(
@@ -582,6 +716,76 @@ class Xtts(BaseTTS):
             "speaker_embedding": speaker_embedding,
         }
 
+    def _decoder_num_samples(self, num_latents: int, upsample_factor: int) -> int:
+        """Number of samples the HiFi-GAN decoder outputs for `num_latents` GPT latents."""
+        decoder = self.hifigan_decoder
+        num_frames = int(num_latents * decoder.ar_mel_length_compression / decoder.output_hop_length)
+        if decoder.output_sample_rate != decoder.input_sample_rate:
+            num_frames = int(num_frames * decoder.output_sample_rate / decoder.input_sample_rate)
+        return num_frames * upsample_factor
+
+    def _inference_batch(self, sentences, language, gpt_cond_latent, speaker_embedding, length_scale, **kwargs):
+        """Batched version of the sentence loop in `inference()`."""
+        text_tokens = [
+            torch.IntTensor(self.tokenizer.encode(sent.strip().lower(), lang=language)) for sent in sentences
+        ]
+        for tokens in text_tokens:
+            assert (
+                tokens.shape[-1] < self.args.gpt_max_text_tokens
+            ), " ❗ XTTS can only generate text with a maximum of 400 tokens."
+        text_lengths = torch.tensor([tokens.shape[-1] for tokens in text_tokens], device=self.device)
+        text_inputs = torch.nn.utils.rnn.pad_sequence(text_tokens, batch_first=True).to(self.device)
+
+        gpt_codes, gpt_latents_batch = self.gpt.generate(
+            cond_latents=gpt_cond_latent,
+            text_inputs=text_inputs,
+            text_lengths=text_lengths,
+            input_tokens=None,
+            return_latents=True,
+            num_return_sequences=1,
+            output_attentions=False,
+            **kwargs,
+        )
+
+        gpt_latents_list = []
+        for idx in range(len(sentences)):
+            # finished rows are padded with the stop token, keep the first one as the unbatched codes do
+            codes = gpt_codes[idx]
+            stop_idxs = (codes == self.gpt.stop_audio_token).nonzero()
+            num_codes = stop_idxs[0, 0] + 1 if len(stop_idxs) > 0 else codes.shape[-1]
+            gpt_latents = gpt_latents_batch[idx : idx + 1, :num_codes]
+            if length_scale != 1.0:
+                gpt_latents = F.interpolate(
+                    gpt_latents.transpose(1, 2), scale_factor=length_scale, mode="linear"
+                ).transpose(1, 2)
+            gpt_latents_list.append(gpt_latents)
+
+        if self.device.type == "cpu":
+            # batching does not speed up the convolutions on CPU and the padding costs extra work
+            wavs = [self.hifigan_decoder(latents, g=speaker_embedding).cpu().squeeze() for latents in gpt_latents_list]
+        else:
+            # decode all the sentences at once, repeating the last latent frame as padding
+            latent_lengths = [latents.shape[1] for latents in gpt_latents_list]
+            max_length = max(latent_lengths)
+            batch = torch.cat(
+                [
+                    F.pad(latents.transpose(1, 2), (0, max_length - latents.shape[1]), mode="replicate").transpose(1, 2)
+                    for latents in gpt_latents_list
+                ],
+                dim=0,
+            )
+            wav_batch = self.hifigan_decoder(batch, g=speaker_embedding.expand(len(sentences), -1, -1))
+            upsample_factor = wav_batch.shape[-1] // self._decoder_num_samples(max_length, 1)
+            wavs = [
+                wav_batch[idx, 0, : self._decoder_num_samples(length, upsample_factor)].cpu()
+                for idx, length in enumerate(latent_lengths)
+            ]
+        return {
+            "wav": torch.cat(wavs, dim=0).numpy(),
+            "gpt_latents": torch.cat([latents.cpu() for latents in gpt_latents_list], dim=1).numpy(),
+            "speaker_embedding": speaker_embedding,
+        }
+
     def handle_chunks(self, wav_gen, wav_gen_prev, wav_overlap, overlap_len):
         """Handle chunk formatting in streaming mode"""
         wav_chunk = wav_gen[:-overlap_len]
@@ -710,6 +914,10 @@ class Xtts(BaseTTS):
         self.gpt.init_gpt_for_inference()
         super().eval()
 
+    def get_quantizable_modules(self):
+        """Return the modules quantized by `TTS.utils.quantization.quantize_model()`, the GPT."""
+        return [self.gpt]
+
     def get_compatible_checkpoint_state_dict(self, model_path):
         checkpoint = load_fsspec(model_path, map_location=torch.device("cpu"))["model"]
         # remove xtts gpt trainer extra keys
@@ -754,7 +962,12 @@ class Xtts(BaseTTS):
             None
         """
 
-        model_path = checkpoint_path or os.path.join(checkpoint_dir, "model.pth")
+        model_path = checkpoint_path
+        if model_path is None:
+            # prefer the memory-mapped weights written by `TTS/bin/convert_to_safetensors.py`
+            model_path = os.path.join(checkpoint_dir, "model.safetensors")
+            if not os.path.exists(model_path):
+                model_path = os.path.join(checkpoint_dir, "model.pth")
         vocab_path = vocab_path or os.path.join(checkpoint_dir, "vocab.json")
 
         if speaker_file_path is None and checkpoint_dir is not None:
@@ -769,20 +982,25 @@ class Xtts(BaseTTS):
             self.tokenizer = VoiceBpeTokenizer(vocab_file=vocab_path)
 
         self.init_models()
+        self._conditioning_weights_hash = None
 
         checkpoint = self.get_compatible_checkpoint_state_dict(model_path)
+        # share the pages of memory-mapped weights instead of copying them
+        assign = is_safetensors_file(model_path)
 
         # deal with v1 and v1.1. V1 has the init_gpt_for_inference keys, v1.1 do not
         try:
-            self.load_state_dict(checkpoint, strict=strict)
+            self.load_state_dict(checkpoint, strict=strict, assign=assign)
         except:
             if eval:
-                self.gpt.init_gpt_for_inference(kv_cache=self.args.kv_cache)
-            self.load_state_dict(checkpoint, strict=strict)
+                self.gpt.init_gpt_for_inference(kv_cache=self.args.kv_cache, static_kv_cache=self.args.static_kv_cache)
+            self.load_state_dict(checkpoint, strict=strict, assign=assign)
 
         if eval:
             self.hifigan_decoder.eval()
-            self.gpt.init_gpt_for_inference(kv_cache=self.args.kv_cache, use_deepspeed=use_deepspeed)
+            self.gpt.init_gpt_for_inference(
+                kv_cache=self.args.kv_cache, use_deepspeed=use_deepspeed, static_kv_cache=self.args.static_kv_cache
+            )
             self.gpt.eval()
 
     def train_step(self):
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 import numpy as np
 import torch
@@ -68,6 +68,11 @@ def trim_silence(wav, ap):
     return wav[: ap.find_endpoint(wav)]
 
 
+def trim_silence_stream(chunks, ap):
+    """Streaming version of `trim_silence()` over waveform chunks."""
+    yield from ap.find_endpoint_stream(chunks)
+
+
 def inv_spectrogram(postnet_output, ap, CONFIG):
     if CONFIG.model.lower() in ["tacotron"]:
         wav = ap.inv_spectrogram(postnet_output.T)
@@ -228,21 +233,20 @@ def synthesis(
         language_id=language_id,
     )
     model_outputs = outputs["model_outputs"]
-    model_outputs = model_outputs[0].data.cpu().numpy()
+    model_outputs = model_outputs[0].data.squeeze()
     alignments = outputs["alignments"]
 
-    # convert outputs to numpy
+    # convert outputs to numpy only when they are used on CPU, spectrograms for a vocoder stay on the device
     # plot results
     wav = None
-    model_outputs = model_outputs.squeeze()
     if model_outputs.ndim == 2:  # [T, C_spec]
         if use_griffin_lim:
-            wav = inv_spectrogram(model_outputs, model.ap, CONFIG)
+            wav = inv_spectrogram(model_outputs.cpu().numpy(), model.ap, CONFIG)
             # trim silence
             if do_trim_silence:
                 wav = trim_silence(wav, model.ap)
     else:  # [T,]
-        wav = model_outputs
+        wav = model_outputs.cpu().numpy()
     return_dict = {
         "wav": wav,
         "alignments": alignments,
@@ -252,6 +256,127 @@ def synthesis(
     return return_dict
 
 
+def batch_text_to_ids(model, texts: List[str], language_id: int = None) -> List[List[int]]:
+    """Convert sentences to token IDs with a single call to the phonemizer.
+
+    Args:
+        model (TTS.tts.models):
+            The TTS model with the tokenizer.
+
+        texts (List[str]):
+            The input sentences.
+
+        language_id (int):
+            Language ID of the sentences in multi-langual model. Defaults to None.
+
+    Returns:
+        List[List[int]]: token IDs of each sentence.
+    """
+    language_name = None
+    if language_id is not None:
+        language = [k for k, v in model.language_manager.name_to_id.items() if v == language_id]
+        assert len(language) == 1, "language_id must be a valid language"
+        language_name = language[0]
+    return model.tokenizer.texts_to_ids(texts, language=language_name)
+
+
+def batch_synthesis(
+    model,
+    texts: List[str],
+    CONFIG,
+    use_cuda,
+    speaker_id=None,
+    d_vector=None,
+    language_id=None,
+    token_ids: List[List[int]] = None,
+) -> List[np.ndarray]:
+    """Synthesize a batch of sentences with a single padded model pass.
+
+    The model must accept `x_lengths` in `aux_input` and return a `y_mask` for the outputs, like `Vits` and
+    `ForwardTTS`. All the sentences share the same speaker and language.
+
+    Args:
+        model (TTS.tts.models):
+            The TTS model to synthesize audio with.
+
+        texts (List[str]):
+            The input sentences.
+
+        CONFIG (Coqpit):
+            Model configuration.
+
+        use_cuda (bool):
+            Enable/disable CUDA.
+
+        speaker_id (int):
+            Speaker ID passed to the speaker embedding layer in multi-speaker model. Defaults to None.
+
+        d_vector (torch.Tensor):
+            d-vector for multi-speaker models in share :math:`[1, D]`. Defaults to None.
+
+        language_id (int):
+            Language ID passed to the language embedding layer in multi-langual model. Defaults to None.
+
+        token_ids (List[List[int]]):
+            Token IDs of the sentences computed by `batch_text_to_ids()`. The texts are tokenized when None.
+            Defaults to None.
+
+    Returns:
+        List[np.ndarray]: model output of each sentence without the padding. A waveform :math:`[T]` for end-to-end
+        models or a spectrogram :math:`[T, C]` for the others.
+    """
+    # pylint: disable=unused-argument
+    device = next(model.parameters()).device
+    if use_cuda:
+        device = "cuda"
+    batch_size = len(texts)
+
+    # convert texts to padded sequences of token IDs
+    if token_ids is None:
+        token_ids = batch_text_to_ids(model, texts, language_id=language_id)
+    x_lengths = torch.tensor([len(ids) for ids in token_ids], dtype=torch.long)
+    text_inputs = torch.zeros(batch_size, int(x_lengths.max()), dtype=torch.long)
+    for idx, ids in enumerate(token_ids):
+        text_inputs[idx, : len(ids)] = torch.as_tensor(ids, dtype=torch.long)
+
+    # repeat the conditioning for each sentence
+    if speaker_id is not None:
+        speaker_id = id_to_torch(speaker_id, device=device).reshape(-1).expand(batch_size)
+    if d_vector is not None:
+        d_vector = embedding_to_torch(d_vector, device=device).expand(batch_size, -1)
+    if language_id is not None:
+        language_id = id_to_torch(language_id, device=device).reshape(-1).expand(batch_size)
+
+    if hasattr(model, "module"):
+        _func = model.module.inference
+    else:
+        _func = model.inference
+    outputs = _func(
+        text_inputs.to(device),
+        aux_input={
+            "x_lengths": x_lengths.to(device),
+            "speaker_ids": speaker_id,
+            "d_vectors": d_vector,
+            "language_ids": language_id,
+        },
+    )
+    model_outputs = outputs["model_outputs"].data.cpu()
+    y_mask = outputs["y_mask"].cpu()
+    y_lengths = y_mask.sum([1, 2]).long()
+
+    results = []
+    if model_outputs.ndim == 3 and model_outputs.shape[1] == 1:  # [B, 1, T_wav]
+        # the output can be cut by `max_inference_len`
+        num_frames = min(y_mask.shape[-1], getattr(model, "max_inference_len", None) or y_mask.shape[-1])
+        samples_per_frame = round(model_outputs.shape[-1] / num_frames)
+        for idx in range(batch_size):
+            results.append(model_outputs[idx, 0, : y_lengths[idx] * samples_per_frame].numpy())
+    else:  # [B, T, C]
+        for idx in range(batch_size):
+            results.append(model_outputs[idx, : y_lengths[idx]].numpy())
+    return results
+
+
 def transfer_voice(
     model,
     CONFIG,
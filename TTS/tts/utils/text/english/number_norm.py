@@ -1,11 +1,9 @@
 """ from https://github.com/keithito/tacotron """
 
 import re
+from functools import lru_cache
 from typing import Dict
 
-import inflect
-
-_inflect = inflect.engine()
 _comma_number_re = re.compile(r"([0-9][0-9\,]+[0-9])")
 _decimal_number_re = re.compile(r"([0-9]+\.[0-9]+)")
 _currency_re = re.compile(r"(£|\$|¥)([0-9\,\.]*[0-9]+)")
@@ -13,6 +11,14 @@ _ordinal_re = re.compile(r"[0-9]+(st|nd|rd|th)")
 _number_re = re.compile(r"-?[0-9]+")
 
 
+@lru_cache(maxsize=1)
+def _inflect():
+    # inflect is slow to import, only load it when numbers are expanded
+    import inflect  # pylint: disable=import-outside-toplevel
+
+    return inflect.engine()
+
+
 def _remove_commas(m):
     return m.group(1).replace(",", "")
 
@@ -72,7 +78,7 @@ def _expand_currency(m: "re.Match") -> str:
 
 
 def _expand_ordinal(m):
-    return _inflect.number_to_words(m.group(0))
+    return _inflect().number_to_words(m.group(0))
 
 
 def _expand_number(m):
@@ -81,11 +87,11 @@ def _expand_number(m):
         if num == 2000:
             return "two thousand"
         if 2000 < num < 2010:
-            return "two thousand " + _inflect.number_to_words(num % 100)
+            return "two thousand " + _inflect().number_to_words(num % 100)
         if num % 100 == 0:
-            return _inflect.number_to_words(num // 100) + " hundred"
-        return _inflect.number_to_words(num, andword="", zero="oh", group=2).replace(", ", " ")
-    return _inflect.number_to_words(num, andword="")
+            return _inflect().number_to_words(num // 100) + " hundred"
+        return _inflect().number_to_words(num, andword="", zero="oh", group=2).replace(", ", " ")
+    return _inflect().number_to_words(num, andword="")
 
 
 def normalize_numbers(text):
@@ -1,79 +1,108 @@
-from TTS.tts.utils.text.phonemizers.bangla_phonemizer import BN_Phonemizer
-from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
-from TTS.tts.utils.text.phonemizers.belarusian_phonemizer import BEL_Phonemizer
-from TTS.tts.utils.text.phonemizers.espeak_wrapper import ESpeak
-from TTS.tts.utils.text.phonemizers.gruut_wrapper import Gruut
-from TTS.tts.utils.text.phonemizers.ko_kr_phonemizer import KO_KR_Phonemizer
-from TTS.tts.utils.text.phonemizers.zh_cn_phonemizer import ZH_CN_Phonemizer
-
-try:
-    from TTS.tts.utils.text.phonemizers.ja_jp_phonemizer import JA_JP_Phonemizer
-except ImportError:
-    JA_JP_Phonemizer = None
-    pass
-
-PHONEMIZERS = {b.name(): b for b in (ESpeak, Gruut, KO_KR_Phonemizer, BN_Phonemizer)}
-
-
-ESPEAK_LANGS = list(ESpeak.supported_languages().keys())
-GRUUT_LANGS = list(Gruut.supported_languages())
-
-
-# Dict setting default phonemizers for each language
-# Add Gruut languages
-_ = [Gruut.name()] * len(GRUUT_LANGS)
-DEF_LANG_TO_PHONEMIZER = dict(list(zip(GRUUT_LANGS, _)))
-
-
-# Add ESpeak languages and override any existing ones
-_ = [ESpeak.name()] * len(ESPEAK_LANGS)
-_new_dict = dict(list(zip(list(ESPEAK_LANGS), _)))
-DEF_LANG_TO_PHONEMIZER.update(_new_dict)
-
-
-# Force default for some languages
-DEF_LANG_TO_PHONEMIZER["en"] = DEF_LANG_TO_PHONEMIZER["en-us"]
-DEF_LANG_TO_PHONEMIZER["zh-cn"] = ZH_CN_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["ko-kr"] = KO_KR_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["bn"] = BN_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["be"] = BEL_Phonemizer.name()
-
-
-# JA phonemizer has deal breaking dependencies like MeCab for some systems.
-# So we only have it when we have it.
-if JA_JP_Phonemizer is not None:
-    PHONEMIZERS[JA_JP_Phonemizer.name()] = JA_JP_Phonemizer
-    DEF_LANG_TO_PHONEMIZER["ja-jp"] = JA_JP_Phonemizer.name()
-
-
-def get_phonemizer_by_name(name: str, **kwargs) -> BasePhonemizer:
-    """Initiate a phonemizer by name
-
-    Args:
-        name (str):
-            Name of the phonemizer that should match `phonemizer.name()`.
-
-        kwargs (dict):
-            Extra keyword arguments that should be passed to the phonemizer.
-    """
-    if name == "espeak":
-        return ESpeak(**kwargs)
-    if name == "gruut":
-        return Gruut(**kwargs)
-    if name == "zh_cn_phonemizer":
-        return ZH_CN_Phonemizer(**kwargs)
-    if name == "ja_jp_phonemizer":
-        if JA_JP_Phonemizer is None:
-            raise ValueError(" ❗ You need to install JA phonemizer dependencies. Try `pip install TTS[ja]`.")
-        return JA_JP_Phonemizer(**kwargs)
-    if name == "ko_kr_phonemizer":
-        return KO_KR_Phonemizer(**kwargs)
-    if name == "bn_phonemizer":
-        return BN_Phonemizer(**kwargs)
-    if name == "be_phonemizer":
-        return BEL_Phonemizer(**kwargs)
-    raise ValueError(f"Phonemizer {name} not found")
-
-
-if __name__ == "__main__":
-    print(DEF_LANG_TO_PHONEMIZER)
+import importlib
+from functools import lru_cache
+from typing import Dict
+
+from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
+
+# The phonemizers are imported on first use, as most of them pull in large language specific dependencies.
+# `ESpeak`, `DEF_LANG_TO_PHONEMIZER` etc. are still importable from this module.
+_PHONEMIZER_CLASSES = {
+    "espeak": ("TTS.tts.utils.text.phonemizers.espeak_wrapper", "ESpeak"),
+    "gruut": ("TTS.tts.utils.text.phonemizers.gruut_wrapper", "Gruut"),
+    "zh_cn_phonemizer": ("TTS.tts.utils.text.phonemizers.zh_cn_phonemizer", "ZH_CN_Phonemizer"),
+    "ja_jp_phonemizer": ("TTS.tts.utils.text.phonemizers.ja_jp_phonemizer", "JA_JP_Phonemizer"),
+    "ko_kr_phonemizer": ("TTS.tts.utils.text.phonemizers.ko_kr_phonemizer", "KO_KR_Phonemizer"),
+    "bn_phonemizer": ("TTS.tts.utils.text.phonemizers.bangla_phonemizer", "BN_Phonemizer"),
+    "be_phonemizer": ("TTS.tts.utils.text.phonemizers.belarusian_phonemizer", "BEL_Phonemizer"),
+}
+_CLASS_NAME_TO_PHONEMIZER = {class_name: name for name, (_, class_name) in _PHONEMIZER_CLASSES.items()}
+
+
+@lru_cache(maxsize=None)
+def _import_phonemizer(name: str) -> type:
+    module_name, class_name = _PHONEMIZER_CLASSES[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        # JA phonemizer has deal breaking dependencies like MeCab for some systems.
+        # So we only have it when we have it.
+        if name == "ja_jp_phonemizer":
+            return None
+        raise
+    return getattr(module, class_name)
+
+
+@lru_cache(maxsize=None)
+def _default_phonemizers() -> Dict:
+    ESpeak = _import_phonemizer("espeak")
+    Gruut = _import_phonemizer("gruut")
+    JA_JP_Phonemizer = _import_phonemizer("ja_jp_phonemizer")
+
+    phonemizers = {name: _import_phonemizer(name) for name in ["espeak", "gruut", "ko_kr_phonemizer", "bn_phonemizer"]}
+
+    espeak_langs = list(ESpeak.supported_languages().keys())
+    gruut_langs = list(Gruut.supported_languages())
+
+    # Dict setting default phonemizers for each language
+    # Add Gruut languages
+    _ = [Gruut.name()] * len(gruut_langs)
+    def_lang_to_phonemizer = dict(list(zip(gruut_langs, _)))
+
+    # Add ESpeak languages and override any existing ones
+    _ = [ESpeak.name()] * len(espeak_langs)
+    _new_dict = dict(list(zip(list(espeak_langs), _)))
+    def_lang_to_phonemizer.update(_new_dict)
+
+    # Force default for some languages
+    def_lang_to_phonemizer["en"] = def_lang_to_phonemizer["en-us"]
+    def_lang_to_phonemizer["zh-cn"] = "zh_cn_phonemizer"
+    def_lang_to_phonemizer["ko-kr"] = "ko_kr_phonemizer"
+    def_lang_to_phonemizer["bn"] = "bn_phonemizer"
+    def_lang_to_phonemizer["be"] = "be_phonemizer"
+
+    if JA_JP_Phonemizer is not None:
+        phonemizers[JA_JP_Phonemizer.name()] = JA_JP_Phonemizer
+        def_lang_to_phonemizer["ja-jp"] = JA_JP_Phonemizer.name()
+
+    return {
+        "PHONEMIZERS": phonemizers,
+        "ESPEAK_LANGS": espeak_langs,
+        "GRUUT_LANGS": gruut_langs,
+        "DEF_LANG_TO_PHONEMIZER": def_lang_to_phonemizer,
+    }
+
+
+def __getattr__(name: str):
+    if name in _CLASS_NAME_TO_PHONEMIZER:
+        return _import_phonemizer(_CLASS_NAME_TO_PHONEMIZER[name])
+    if name in ["PHONEMIZERS", "ESPEAK_LANGS", "GRUUT_LANGS", "DEF_LANG_TO_PHONEMIZER"]:
+        return _default_phonemizers()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_phonemizer_by_name(name: str, persistent: bool = False, **kwargs) -> BasePhonemizer:
+    """Initiate a phonemizer by name
+
+    Args:
+        name (str):
+            Name of the phonemizer that should match `phonemizer.name()`.
+
+        persistent (bool):
+            Run a long-lived espeak process for the `espeak` phonemizer. Ignored by the other phonemizers. Defaults to
+            False.
+
+        kwargs (dict):
+            Extra keyword arguments that should be passed to the phonemizer.
+    """
+    if name not in _PHONEMIZER_CLASSES:
+        raise ValueError(f"Phonemizer {name} not found")
+    phonemizer = _import_phonemizer(name)
+    if phonemizer is None:
+        raise ValueError(" ❗ You need to install JA phonemizer dependencies. Try `pip install TTS[ja]`.")
+    if name == "espeak":
+        kwargs["persistent"] = persistent
+    return phonemizer(**kwargs)
+
+
+if __name__ == "__main__":
+    print(_default_phonemizers()["DEF_LANG_TO_PHONEMIZER"])
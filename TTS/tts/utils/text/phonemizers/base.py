@@ -134,6 +134,35 @@ class BasePhonemizer(abc.ABC):
         phonemized = self._phonemize_postprocess(phonemized, punctuations)
         return phonemized
 
+    def _phonemize_batch(self, texts: List[str], separator) -> List[str]:
+        """Phonemize a list of texts. Override this if the backend can process many texts at once."""
+        return [self._phonemize(t, separator) for t in texts]
+
+    def phonemize_batch(self, texts: List[str], separator="|", language: str = None) -> List[str]:
+        """Returns the `texts` phonemized for the given language, the same as calling `phonemize()` on each text.
+
+        Args:
+            texts (List[str]):
+                Texts to be phonemized.
+
+            separator (str):
+                string separator used between phonemes. Default to '_'.
+
+        Returns:
+            (List[str]): Phonemized texts
+        """
+        if type(self).phonemize is not BasePhonemizer.phonemize:
+            # the backend has its own `phonemize()`
+            return [self.phonemize(text, separator=separator, language=language) for text in texts]
+        # phonemize the pieces of all the texts at once
+        preprocessed = [self._phonemize_preprocess(text) for text in texts]
+        pieces = [t for text, _ in preprocessed for t in text]
+        phonemized_pieces = iter(self._phonemize_batch(pieces, separator) if pieces else [])
+        phonemized = []
+        for text, punctuations in preprocessed:
+            phonemized.append(self._phonemize_postprocess([next(phonemized_pieces) for _ in text], punctuations))
+        return phonemized
+
     def print_logs(self, level: int = 0):
         indent = "\t" * level
         print(f"{indent}| > phoneme language: {self.language}")
@@ -1,7 +1,8 @@
 import logging
 import re
 import subprocess
-from typing import Dict, List
+import threading
+from typing import IO, Dict, List
 
 from packaging.version import Version
 
@@ -80,6 +81,116 @@ def _espeak_exe(espeak_lib: str, args: List, sync=False) -> List[str]:
     return res2
 
 
+class ESpeakProcess:
+    """A long-lived `espeak` or `espeak-ng` process reading texts line by line from stdin.
+
+    `--stdin` makes espeak synthesize and flush each input line on its own, the same way `_espeak_exe()` does with the
+    text passed as argument. Since the output of a text can span several lines, a sentinel line is written after each
+    text and its output marks the end of the text.
+
+    Args:
+        espeak_lib (str): `espeak` or `espeak-ng`.
+        args (List[str]): espeak arguments without the text.
+    """
+
+    SENTINEL = "qxqxq zjzjz"
+
+    def __init__(self, espeak_lib: str, args: List[str]):
+        self._cmd = [espeak_lib, "-q", "-b", "1", *args, "--stdin"]
+        self._lock = threading.Lock()
+        self._process = None
+        self._start()
+
+    def _start(self):
+        logging.debug("espeakng: starting %s", repr(self._cmd))
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            self._cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        try:
+            self._write(self._process.stdin, [])
+            self._sentinel_output = self._readline()
+        except BaseException:
+            self._kill()
+            raise
+
+    def _kill(self):
+        """Kill the process, dropping any output that was not read yet."""
+        self._process.kill()
+        self._process.wait()
+        for pipe in [self._process.stdin, self._process.stdout]:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        self._process = None
+
+    def _readline(self) -> bytes:
+        line = self._process.stdout.readline()
+        if not line:
+            raise RuntimeError(f" [!] espeak process exited with code {self._process.poll()}.")
+        return line
+
+    def _write(self, stdin: IO[bytes], texts: List[str]):
+        for text in texts:
+            # a newline would split the text into two inputs
+            stdin.write(text.replace("\n", " ").encode("utf8") + b"\n")
+            stdin.write(self.SENTINEL.encode("utf8") + b"\n")
+        if not texts:
+            stdin.write(self.SENTINEL.encode("utf8") + b"\n")
+        stdin.flush()
+
+    def _write_async(self, process: subprocess.Popen, texts: List[str]):
+        try:
+            self._write(process.stdin, texts)
+        except (OSError, ValueError):
+            # the process was killed by `run()`, which raises the actual error
+            if process.poll() is None:
+                raise
+
+    def run(self, texts: List[str]) -> List[List[bytes]]:
+        """Phonemize the texts in one round-trip.
+
+        If anything fails on the way, the process is killed and started again on the next call, so that the output
+        left in the pipe is never read for the next texts.
+
+        Returns:
+            List[List[bytes]]: raw output lines of each text, as returned by `_espeak_exe()`.
+        """
+        with self._lock:
+            if self._process is None:
+                self._start()
+            # write from another thread so that large batches cannot dead-lock on the full pipe buffers
+            writer = threading.Thread(target=self._write_async, args=(self._process, texts), daemon=True)
+            writer.start()
+            try:
+                outputs = []
+                for _ in texts:
+                    lines = []
+                    line = self._readline()
+                    while line != self._sentinel_output:
+                        lines.append(line)
+                        line = self._readline()
+                    outputs.append(lines)
+            except BaseException:
+                self._kill()
+                raise
+            finally:
+                writer.join()
+        return outputs
+
+    def close(self):
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+        self._process.stdout.close()
+        self._process = None
+
+
 class ESpeak(BasePhonemizer):
     """ESpeak wrapper calling `espeak` or `espeak-ng` from the command-line the perform G2P
 
@@ -97,6 +208,10 @@ class ESpeak(BasePhonemizer):
         keep_puncs (bool):
             If True, keep the punctuations after phonemization. Defaults to True.
 
+        persistent (bool):
+            If True, run a long-lived espeak process fed over a pipe instead of starting a new one for every call.
+            The output is the same. Defaults to False.
+
     Example:
 
         >>> from TTS.tts.utils.text.phonemizers import ESpeak
@@ -109,7 +224,14 @@ class ESpeak(BasePhonemizer):
     _ESPEAK_LIB = _DEF_ESPEAK_LIB
     _ESPEAK_VER = _DEF_ESPEAK_VER
 
-    def __init__(self, language: str, backend=None, punctuations=Punctuation.default_puncs(), keep_puncs=True):
+    def __init__(
+        self,
+        language: str,
+        backend=None,
+        punctuations=Punctuation.default_puncs(),
+        keep_puncs=True,
+        persistent=False,
+    ):
         if self._ESPEAK_LIB is None:
             raise Exception(" [!] No espeak backend found. Install espeak-ng or espeak to your system.")
         self.backend = self._ESPEAK_LIB
@@ -123,6 +245,26 @@ class ESpeak(BasePhonemizer):
         super().__init__(language, punctuations=punctuations, keep_puncs=keep_puncs)
         if backend is not None:
             self.backend = backend
+        self.persistent = persistent
+        self._processes = {}
+
+    def __getstate__(self):
+        # processes can not be pickled, e.g. for dataloader workers
+        state = self.__dict__.copy()
+        state["_processes"] = {}
+        return state
+
+    def _get_process(self, args: List[str]) -> ESpeakProcess:
+        key = (self.backend, *args)
+        if key not in self._processes:
+            self._processes[key] = ESpeakProcess(self.backend, args)
+        return self._processes[key]
+
+    def close(self):
+        """Stop the espeak processes started by the persistent mode."""
+        for process in self._processes.values():
+            process.close()
+        self._processes = {}
 
     @property
     def backend(self):
@@ -153,18 +295,8 @@ class ESpeak(BasePhonemizer):
     def name():
         return "espeak"
 
-    def phonemize_espeak(self, text: str, separator: str = "|", tie=False) -> str:
-        """Convert input text to phonemes.
-
-        Args:
-            text (str):
-                Text to be converted to phonemes.
-
-            tie (bool, optional) : When True use a '͡' character between
-                consecutive characters of a single phoneme. Else separate phoneme
-                with '_'. This option requires espeak>=1.49. Default to False.
-        """
-        # set arguments
+    def _get_args(self, tie=False) -> List[str]:
+        """Get the espeak arguments, without the text."""
         args = ["-v", f"{self._language}"]
         # espeak and espeak-ng parses `ipa` differently
         if tie:
@@ -184,11 +316,13 @@ class ESpeak(BasePhonemizer):
                 args.append("--ipa=1")
         if tie:
             args.append("--tie=%s" % tie)
+        return args
 
-        args.append(text)
-        # compute phonemes
+    @staticmethod
+    def _parse_output(lines: List[bytes], separator: str = "|") -> str:
+        """Convert the espeak output lines to a phoneme string."""
         phonemes = ""
-        for line in _espeak_exe(self._ESPEAK_LIB, args, sync=True):
+        for line in lines:
             logging.debug("line: %s", repr(line))
             ph_decoded = line.decode("utf8").strip()
             # espeak:
@@ -205,9 +339,50 @@ class ESpeak(BasePhonemizer):
             phonemes += ph_decoded.strip()
         return phonemes.replace("_", separator)
 
+    def phonemize_espeak(self, text: str, separator: str = "|", tie=False) -> str:
+        """Convert input text to phonemes.
+
+        Args:
+            text (str):
+                Text to be converted to phonemes.
+
+            tie (bool, optional) : When True use a '͡' character between
+                consecutive characters of a single phoneme. Else separate phoneme
+                with '_'. This option requires espeak>=1.49. Default to False.
+        """
+        args = self._get_args(tie)
+        if self.persistent:
+            lines = self._get_process(args).run([text])[0]
+        else:
+            lines = _espeak_exe(self._ESPEAK_LIB, args + [text], sync=True)
+        return self._parse_output(lines, separator)
+
+    def phonemize_espeak_batch(self, texts: List[str], separator: str = "|", tie=False) -> List[str]:
+        """Convert a list of texts to phonemes in one round-trip with a single espeak process.
+
+        Args:
+            texts (List[str]):
+                Texts to be converted to phonemes.
+
+            tie (bool, optional) : see `phonemize_espeak()`.
+        """
+        args = self._get_args(tie)
+        if self.persistent:
+            outputs = self._get_process(args).run(texts)
+        else:
+            process = ESpeakProcess(self.backend, args)
+            try:
+                outputs = process.run(texts)
+            finally:
+                process.close()
+        return [self._parse_output(lines, separator) for lines in outputs]
+
     def _phonemize(self, text, separator=None):
         return self.phonemize_espeak(text, separator, tie=False)
 
+    def _phonemize_batch(self, texts, separator=None):
+        return self.phonemize_espeak_batch(texts, separator, tie=False)
+
     @staticmethod
     def supported_languages() -> Dict:
         """Get a dictionary of supported languages.
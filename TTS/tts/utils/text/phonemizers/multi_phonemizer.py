@@ -1,6 +1,7 @@
 from typing import Dict, List
 
-from TTS.tts.utils.text.phonemizers import DEF_LANG_TO_PHONEMIZER, get_phonemizer_by_name
+from TTS.tts.utils.text import phonemizers
+from TTS.tts.utils.text.phonemizers import get_phonemizer_by_name
 
 
 class MultiPhonemizer:
@@ -11,25 +12,32 @@ class MultiPhonemizer:
             Custom phonemizer mapping if you want to change the defaults. In the format of
             `{"lang_code", "phonemizer_name"}`. When it is None, `DEF_LANG_TO_PHONEMIZER` is used. Defaults to `{}`.
 
+        persistent (bool):
+            Run long-lived espeak processes for the `espeak` phonemizers. Defaults to False.
+
     TODO: find a way to pass custom kwargs to the phonemizers
     """
 
     lang_to_phonemizer = {}
 
-    def __init__(self, lang_to_phonemizer_name: Dict = {}) -> None:  # pylint: disable=dangerous-default-value
+    def __init__(
+        self,
+        lang_to_phonemizer_name: Dict = {},  # pylint: disable=dangerous-default-value
+        persistent: bool = False,
+    ) -> None:
         for k, v in lang_to_phonemizer_name.items():
-            if v == "" and k in DEF_LANG_TO_PHONEMIZER.keys():
-                lang_to_phonemizer_name[k] = DEF_LANG_TO_PHONEMIZER[k]
+            if v == "" and k in phonemizers.DEF_LANG_TO_PHONEMIZER.keys():
+                lang_to_phonemizer_name[k] = phonemizers.DEF_LANG_TO_PHONEMIZER[k]
             elif v == "":
                 raise ValueError(f"Phonemizer wasn't set for language {k} and doesn't have a default.")
         self.lang_to_phonemizer_name = lang_to_phonemizer_name
-        self.lang_to_phonemizer = self.init_phonemizers(self.lang_to_phonemizer_name)
+        self.lang_to_phonemizer = self.init_phonemizers(self.lang_to_phonemizer_name, persistent=persistent)
 
     @staticmethod
-    def init_phonemizers(lang_to_phonemizer_name: Dict) -> Dict:
+    def init_phonemizers(lang_to_phonemizer_name: Dict, persistent: bool = False) -> Dict:
         lang_to_phonemizer = {}
         for k, v in lang_to_phonemizer_name.items():
-            lang_to_phonemizer[k] = get_phonemizer_by_name(v, language=k)
+            lang_to_phonemizer[k] = get_phonemizer_by_name(v, persistent=persistent, language=k)
         return lang_to_phonemizer
 
     @staticmethod
@@ -41,6 +49,11 @@ class MultiPhonemizer:
             raise ValueError("Language must be set for multi-phonemizer to phonemize.")
         return self.lang_to_phonemizer[language].phonemize(text, separator)
 
+    def phonemize_batch(self, texts, separator="|", language=""):
+        if language == "":
+            raise ValueError("Language must be set for multi-phonemizer to phonemize.")
+        return self.lang_to_phonemizer[language].phonemize_batch(texts, separator)
+
     def supported_languages(self) -> List:
         return list(self.lang_to_phonemizer.keys())
 
@@ -1,12 +1,130 @@
-from typing import Callable, Dict, List, Union
-
-from TTS.tts.utils.text import cleaners
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Tuple, Union
+
+from TTS.tts.utils.text import cleaners, phonemizers
 from TTS.tts.utils.text.characters import Graphemes, IPAPhonemes
-from TTS.tts.utils.text.phonemizers import DEF_LANG_TO_PHONEMIZER, get_phonemizer_by_name
+from TTS.tts.utils.text.phonemizers import get_phonemizer_by_name
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
 from TTS.utils.generic_utils import get_import_path, import_class
 
 
+class TokenCache:
+    """Size-bounded LRU cache of token ID sequences.
+
+    It can be saved to and loaded from a JSON file so that a restarted process starts with a warm cache. Entries
+    written by a tokenizer with a different vocabulary are dropped on load.
+
+    Args:
+        max_size (int):
+            Maximum number of entries. The least recently used entry is dropped when it is full. Defaults to 1024.
+
+        cache_path (str):
+            Path to the JSON file to persist the cache. It is loaded if it exists. Defaults to None.
+
+        signature (str):
+            Identifies the token set. A saved cache with a different signature is ignored. Defaults to "".
+    """
+
+    def __init__(self, max_size: int = 1024, cache_path: str = None, signature: str = ""):
+        self.max_size = max_size
+        self.cache_path = cache_path
+        self.signature = signature
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._num_new_entries = 0
+        if cache_path is not None and os.path.isfile(cache_path):
+            self.load(cache_path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # locks can not be pickled, e.g. for dataloader workers started with spawn
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[int]:
+        """Return the cached token IDs for `key` or None and update the hit/miss counters."""
+        with self._lock:
+            token_ids = self._entries.get(key)
+            if token_ids is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return token_ids
+
+    def put(self, key: Hashable, token_ids: List[int]):
+        """Add an entry and drop the least recently used one if the cache is full."""
+        with self._lock:
+            self._entries[key] = tuple(token_ids)
+            self._num_new_entries += 1
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Return the number of entries, hits and misses and the hit rate."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
+
+    def save(self, cache_path: str = None):
+        """Write the entries to `cache_path` or to `self.cache_path`."""
+        cache_path = cache_path or self.cache_path
+        if cache_path is None:
+            raise ValueError(" [!] No path given to save the token cache.")
+        with self._lock:
+            data = {"signature": self.signature, "entries": [[list(k), list(v)] for k, v in self._entries.items()]}
+            self._num_new_entries = 0
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        # write to a temp file first to never leave a truncated cache behind
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+
+    def load(self, cache_path: str = None):
+        """Add the entries saved in `cache_path` or in `self.cache_path`."""
+        cache_path = cache_path or self.cache_path
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("signature") != self.signature:
+            print(f" > Token cache {cache_path} was built with a different vocabulary. Ignoring it.")
+            return
+        for key, token_ids in data["entries"][-self.max_size :]:
+            self.put(tuple(key), token_ids)
+        self._num_new_entries = 0
+
+    def save_at_exit(self):
+        """Save the new entries to `self.cache_path` if its folder still exists."""
+        if self._num_new_entries > 0 and os.path.isdir(os.path.dirname(os.path.abspath(self.cache_path))):
+            self.save()
+
+
 class TTSTokenizer:
     """🐸TTS tokenizer to convert input characters to token IDs and back.
 
@@ -25,6 +143,12 @@ class TTSTokenizer:
         phonemizer (Phonemizer):
             A phonemizer object or a dict that maps language codes to phonemizer objects. Defaults to None.
 
+        cache_size (int):
+            Number of `text_to_ids()` outputs to keep in an LRU cache. 0 disables the cache. Defaults to 0.
+
+        cache_path (str):
+            Path to a JSON file to persist the cache. It is loaded at init and saved at exit. Defaults to None.
+
     Example:
 
         >>> from TTS.tts.utils.text.tokenizer import TTSTokenizer
@@ -43,6 +167,8 @@ class TTSTokenizer:
         phonemizer: Union["Phonemizer", Dict] = None,
         add_blank: bool = False,
         use_eos_bos=False,
+        cache_size: int = 0,
+        cache_path: str = None,
     ):
         self.text_cleaner = text_cleaner
         self.use_phonemes = use_phonemes
@@ -51,6 +177,11 @@ class TTSTokenizer:
         self.characters = characters
         self.not_found_characters = []
         self.phonemizer = phonemizer
+        self.cache = None
+        if cache_size > 0:
+            self.cache = TokenCache(cache_size, cache_path, signature=self._vocab_signature)
+            if cache_path is not None:
+                atexit.register(self.cache.save_at_exit)
 
     @property
     def characters(self):
@@ -61,6 +192,7 @@ class TTSTokenizer:
         self._characters = new_characters
         self.pad_id = self.characters.char_to_id(self.characters.pad) if self.characters.pad else None
         self.blank_id = self.characters.char_to_id(self.characters.blank) if self.characters.blank else None
+        self._vocab_signature = hashlib.md5("\n".join(self.characters.vocab).encode("utf-8")).hexdigest()
 
     def encode(self, text: str) -> List[int]:
         """Encodes a string of text as a sequence of IDs."""
@@ -102,12 +234,59 @@ class TTSTokenizer:
         3. Add blank char between characters
         4. Add BOS and EOS characters
         5. Text to token IDs
+
+        The output is looked up in and added to `self.cache` when it is enabled.
+        """
+        if self.cache is not None:
+            key = self._cache_key(text, language)
+            token_ids = self.cache.get(key)
+            if token_ids is None:
+                token_ids = self._text_to_ids(text, language)
+                self.cache.put(key, token_ids)
+            return list(token_ids)
+        return self._text_to_ids(text, language)
+
+    def texts_to_ids(self, texts: List[str], language: str = None) -> List[List[int]]:
+        """Converts many texts to sequences of token IDs, the same as calling `text_to_ids()` on each text.
+
+        The texts missing from `self.cache` are phonemized together with `phonemize_batch()`, in a single call to
+        the phonemizer backend.
+
+        Args:
+            texts(List[str]):
+                The texts to convert to token IDs.
+
+            language(str):
+                The language code of the texts. Defaults to None.
         """
+        token_ids = [None] * len(texts)
+        missing = []
+        for idx, text in enumerate(texts):
+            cached = self.cache.get(self._cache_key(text, language)) if self.cache is not None else None
+            if cached is None:
+                missing.append(idx)
+            else:
+                token_ids[idx] = list(cached)
+        # TODO: text cleaner should pick the right routine based on the language
+        missing_texts = [self.text_cleaner(texts[idx]) if self.text_cleaner else texts[idx] for idx in missing]
+        if self.use_phonemes and missing_texts:
+            missing_texts = self.phonemizer.phonemize_batch(missing_texts, separator="", language=language)
+        for idx, text in zip(missing, missing_texts):
+            token_ids[idx] = self._encode_ids(text)
+            if self.cache is not None:
+                self.cache.put(self._cache_key(texts[idx], language), token_ids[idx])
+        return token_ids
+
+    def _text_to_ids(self, text: str, language: str = None) -> List[int]:
         # TODO: text cleaner should pick the right routine based on the language
         if self.text_cleaner is not None:
             text = self.text_cleaner(text)
         if self.use_phonemes:
             text = self.phonemizer.phonemize(text, separator="", language=language)
+        return self._encode_ids(text)
+
+    def _encode_ids(self, text: str) -> List[int]:
+        """Converts a cleaned and phonemized text to token IDs with the blank, BOS and EOS tokens."""
         text = self.encode(text)
         if self.add_blank:
             text = self.intersperse_blank_char(text, True)
@@ -115,6 +294,34 @@ class TTSTokenizer:
             text = self.pad_with_bos_eos(text)
         return text
 
+    def _phonemizer_config(self) -> str:
+        if not self.use_phonemes or self.phonemizer is None:
+            return ""
+        if isinstance(self.phonemizer, MultiPhonemizer):
+            return f"{self.phonemizer.name()}:{json.dumps(self.phonemizer.lang_to_phonemizer_name, sort_keys=True)}"
+        return ":".join(
+            [
+                self.phonemizer.name(),
+                str(getattr(self.phonemizer, "backend", "")),
+                str(self.phonemizer.language),
+                str(self.phonemizer._keep_puncs),  # pylint: disable=protected-access
+                self.phonemizer._punctuator.puncs,  # pylint: disable=protected-access
+            ]
+        )
+
+    def _cache_key(self, text: str, language: str = None) -> Tuple:
+        """Key of `text` in the cache, covering everything that changes the token IDs."""
+        cleaner = getattr(self.text_cleaner, "__name__", str(self.text_cleaner)) if self.text_cleaner else ""
+        return (
+            text,
+            language or "",
+            cleaner,
+            self._phonemizer_config(),
+            self._vocab_signature,
+            self.add_blank,
+            self.use_eos_bos,
+        )
+
     def ids_to_text(self, id_sequence: List[int]) -> str:
         """Converts a sequence of token IDs to a string of text."""
         return self.decode(id_sequence)
@@ -138,6 +345,8 @@ class TTSTokenizer:
         print(f"{indent}| > add_blank: {self.add_blank}")
         print(f"{indent}| > use_eos_bos: {self.use_eos_bos}")
         print(f"{indent}| > use_phonemes: {self.use_phonemes}")
+        if self.cache is not None:
+            print(f"{indent}| > cache: {self.cache.stats()}")
         if self.use_phonemes:
             print(f"{indent}| > phonemizer:")
             self.phonemizer.print_logs(level + 1)
@@ -184,6 +393,7 @@ class TTSTokenizer:
         # init phonemizer
         phonemizer = None
         if config.use_phonemes:
+            persistent = config.phonemizer_persistent if "phonemizer_persistent" in config else False
             if "phonemizer" in config and config.phonemizer == "multi_phonemizer":
                 lang_to_phonemizer_name = {}
                 for dataset in config.datasets:
@@ -191,15 +401,15 @@ class TTSTokenizer:
                         lang_to_phonemizer_name[dataset.language] = dataset.phonemizer
                     else:
                         raise ValueError("Multi phonemizer requires language to be set for each dataset.")
-                phonemizer = MultiPhonemizer(lang_to_phonemizer_name)
+                phonemizer = MultiPhonemizer(lang_to_phonemizer_name, persistent=persistent)
             else:
-                phonemizer_kwargs = {"language": config.phoneme_language}
+                phonemizer_kwargs = {"language": config.phoneme_language, "persistent": persistent}
                 if "phonemizer" in config and config.phonemizer:
                     phonemizer = get_phonemizer_by_name(config.phonemizer, **phonemizer_kwargs)
                 else:
                     try:
                         phonemizer = get_phonemizer_by_name(
-                            DEF_LANG_TO_PHONEMIZER[config.phoneme_language], **phonemizer_kwargs
+                            phonemizers.DEF_LANG_TO_PHONEMIZER[config.phoneme_language], **phonemizer_kwargs
                         )
                         new_config.phonemizer = phonemizer.name()
                     except KeyError as e:
@@ -210,7 +420,14 @@ class TTSTokenizer:
 
         return (
             TTSTokenizer(
-                config.use_phonemes, text_cleaner, characters, phonemizer, config.add_blank, config.enable_eos_bos_chars
+                config.use_phonemes,
+                text_cleaner,
+                characters,
+                phonemizer,
+                config.add_blank,
+                config.enable_eos_bos_chars,
+                cache_size=config.tokenizer_cache_size if "tokenizer_cache_size" in config else 0,
+                cache_path=config.tokenizer_cache_path if "tokenizer_cache_path" in config else None,
             ),
             new_config,
         )
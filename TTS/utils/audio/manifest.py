@@ -0,0 +1,164 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, List, Tuple
+
+import mutagen
+
+from TTS.utils.generic_utils import get_user_data_dir
+
+SUPPORTED_FORMATS = {"mp3", "wav", "flac"}
+
+
+def probe_audio(audiopath: str) -> Tuple[int, int]:
+    """Read the sample rate and the number of samples of an audio file from its header, without decoding it."""
+    extension = audiopath.rpartition(".")[-1].lower()
+    if extension not in SUPPORTED_FORMATS:
+        raise RuntimeError(
+            f"The audio format {extension} is not supported, please convert the audio files to mp3, flac, or wav format!"
+        )
+    audio_info = mutagen.File(audiopath).info
+    return audio_info.sample_rate, int(audio_info.length * audio_info.sample_rate)
+
+
+class AudioManifest:
+    """Persistent index of the sample rate and length of audio files stored in a SQLite database.
+
+    Reading the length of an audio file means opening it and parsing its header, which takes minutes for large
+    datasets on network filesystems. The manifest keeps the lengths with the modification time and size of the files,
+    so only the new and changed files are read again. The files are read by a pool of threads.
+
+    Args:
+        db_path (str): path to the database. Defaults to None, the `TTS_AUDIO_MANIFEST` environment variable if it is
+            set, `audio_manifest.db` in the 🐸TTS user data folder otherwise.
+        num_workers (int): number of threads reading the audio files. Defaults to 16.
+
+    Example:
+        >>> manifest = AudioManifest()
+        >>> manifest.lengths(["/data/LJSpeech-1.1/wavs/LJ001-0001.wav"])
+        [212893]
+    """
+
+    def __init__(self, db_path: str = None, num_workers: int = 16):
+        if db_path is None:
+            db_path = os.environ.get("TTS_AUDIO_MANIFEST") or os.path.join(
+                get_user_data_dir("tts"), "audio_manifest.db"
+            )
+        self.db_path = db_path
+        self.num_workers = num_workers
+        # entries already checked by this process
+        self._entries = {}
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS audio (
+                        path TEXT PRIMARY KEY,
+                        mtime_ns INTEGER NOT NULL,
+                        size INTEGER NOT NULL,
+                        sample_rate INTEGER NOT NULL,
+                        num_samples INTEGER NOT NULL
+                    )"""
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f" > Audio manifest {db_path} is not available, the audio lengths are not persisted: {e}")
+            self.db_path = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return closing(conn)
+
+    def _load_rows(self, paths: List[str]) -> Dict[str, sqlite3.Row]:
+        rows = {}
+        if self.db_path is None:
+            return rows
+        with self._connect() as conn:
+            # stay under the SQLite limit of query parameters
+            for i in range(0, len(paths), 500):
+                chunk = paths[i : i + 500]
+                query = f"SELECT * FROM audio WHERE path IN ({','.join('?' * len(chunk))})"
+                rows.update((row["path"], row) for row in conn.execute(query, chunk))
+        return rows
+
+    @staticmethod
+    def _entry(path, mtime_ns, size, sample_rate, num_samples) -> Dict:
+        return {
+            "path": path,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sample_rate": sample_rate,
+            "num_samples": num_samples,
+            "duration": num_samples / sample_rate,
+        }
+
+    def update(self, paths: List[str]):
+        """Read the new and changed audio files of `paths` and store them in the manifest."""
+        paths = list(dict.fromkeys(paths))
+        abs_paths = [os.path.abspath(path) for path in paths]
+        rows = self._load_rows(abs_paths)
+
+        def _check(abs_path):
+            stat = os.stat(abs_path)
+            row = rows.get(abs_path)
+            if row is not None and row["mtime_ns"] == stat.st_mtime_ns and row["size"] == stat.st_size:
+                return self._entry(*tuple(row)), False
+            sample_rate, num_samples = probe_audio(abs_path)
+            return self._entry(abs_path, stat.st_mtime_ns, stat.st_size, sample_rate, num_samples), True
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            results = list(executor.map(_check, abs_paths))
+
+        changed = [entry for entry, is_changed in results if is_changed]
+        if changed and self.db_path is not None:
+            with self._connect() as conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO audio VALUES (?, ?, ?, ?, ?)",
+                    [(e["path"], e["mtime_ns"], e["size"], e["sample_rate"], e["num_samples"]) for e in changed],
+                )
+                conn.execute("COMMIT")
+        with self._lock:
+            self._entries.update((path, entry) for path, (entry, _) in zip(paths, results))
+        return len(changed)
+
+    def get(self, paths: List[str]) -> List[Dict]:
+        """Return the manifest entries of the audio files, reading the files that are not in the manifest yet.
+
+        An entry has the `path`, `mtime_ns`, `size`, `sample_rate`, `num_samples` and `duration` of the file.
+        """
+        missing = [path for path in paths if path not in self._entries]
+        if missing:
+            self.update(missing)
+        return [self._entries[path] for path in paths]
+
+    def lengths(self, paths: List[str]) -> List[int]:
+        """Return the number of samples of the audio files at their own sample rate."""
+        return [entry["num_samples"] for entry in self.get(paths)]
+
+    def durations(self, paths: List[str]) -> List[float]:
+        """Return the duration of the audio files in seconds."""
+        return [entry["duration"] for entry in self.get(paths)]
+
+
+_AUDIO_MANIFEST = None
+
+
+def get_audio_manifest() -> AudioManifest:
+    """Return the audio manifest shared by the datasets of the process."""
+    global _AUDIO_MANIFEST  # pylint: disable=global-statement
+    if _AUDIO_MANIFEST is None:
+        _AUDIO_MANIFEST = AudioManifest()
+    return _AUDIO_MANIFEST
@@ -1,5 +1,6 @@
+import struct
 from io import BytesIO
-from typing import Tuple
+from typing import Iterable, Iterator, Tuple
 
 import librosa
 import numpy as np
@@ -356,6 +357,57 @@ def find_endpoint(
     return len(wav)
 
 
+def find_endpoint_stream(
+    *,
+    chunks: Iterable[np.ndarray] = None,
+    trim_db: float = -40,
+    sample_rate: int = None,
+    min_silence_sec=0.8,
+    gain: float = None,
+    base: int = None,
+    **kwargs,
+) -> Iterator[np.ndarray]:
+    """Cut a streamed audio signal at the point found by `find_endpoint()` on the full signal.
+
+    Samples are yielded as soon as they are known to come before the endpoint and `chunks` is not consumed past it.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Audio signal chunks.
+        trim_db (int, optional): Silence threshold in decibels. Defaults to -40.
+        min_silence_sec (float, optional): Ignore silences that are shorter then this in secs. Defaults to 0.8.
+        gain (float, optional): Gain to be used to convert trim_db to trim_amp. Defaults to None.
+        base (int, optional): Base of the logarithm used to convert trim_db to trim_amp. Defaults to 10.
+
+    Yields:
+        np.ndarray: Audio signal chunk before the endpoint.
+    """
+    window_length = int(sample_rate * min_silence_sec)
+    hop_length = int(window_length / 4)
+    threshold = db_to_amp(x=-trim_db, gain=gain, base=base)
+    buffer = np.zeros(0, dtype=np.float32)
+    offset = 0  # position of `buffer[0]` in the signal
+    emitted = 0  # number of samples yielded so far
+    x = hop_length  # start of the next window to check
+    for chunk in chunks:
+        buffer = np.concatenate([buffer, chunk])
+        length = offset + len(buffer)
+        while x + window_length < length:
+            if np.max(buffer[x - offset : x + window_length - offset]) < threshold:
+                yield buffer[emitted - offset : x + hop_length - offset]
+                return
+            x += hop_length
+        # the endpoint is never before `x + hop_length`
+        end = min(x + hop_length, length)
+        if end > emitted:
+            yield buffer[emitted - offset : end - offset]
+            emitted = end
+        keep_from = min(x, length)
+        buffer = buffer[keep_from - offset :]
+        offset = keep_from
+    if offset + len(buffer) > emitted:
+        yield buffer[emitted - offset :]
+
+
 def trim_silence(
     *,
     wav: np.ndarray = None,
@@ -447,6 +499,34 @@ def save_wav(*, wav: np.ndarray, path: str, sample_rate: int = None, pipe_out=No
     scipy.io.wavfile.write(path, sample_rate, wav_norm)
 
 
+def wav_stream_header(*, sample_rate: int = None, **kwargs) -> bytes:
+    """Header of a mono 16-bit PCM wav file of unknown length, used to stream audio chunk by chunk.
+
+    The size fields are set to the maximum value as done by streaming encoders, so players read until the end of the
+    stream.
+
+    Args:
+        sample_rate (int): Sampling rate of the stream.
+    """
+    num_channels, bits_per_sample = 1, 16
+    block_align = num_channels * bits_per_sample // 8
+    byte_rate = sample_rate * block_align
+    fmt_chunk = struct.pack("<IHHIIHH", 16, 1, num_channels, sample_rate, byte_rate, block_align, bits_per_sample)
+    return b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVEfmt " + fmt_chunk + b"data" + struct.pack("<I", 0xFFFFFFFF)
+
+
+def wav_to_pcm16(*, wav: np.ndarray, **kwargs) -> bytes:
+    """Convert a float waveform chunk to 16-bit PCM bytes.
+
+    Unlike `save_wav()`, the chunk is not peak normalized since the rest of the stream is not known yet. Values out of
+    [-1, 1] are clipped.
+
+    Args:
+        wav (np.ndarray): Waveform with float values in range [-1, 1].
+    """
+    return (np.clip(wav, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
 def mulaw_encode(*, wav: np.ndarray, mulaw_qc: int, **kwargs) -> np.ndarray:
     mu = 2**mulaw_qc - 1
     signal = np.sign(wav) * np.log(1 + mu * np.abs(wav)) / np.log(1.0 + mu)
@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 import librosa
 import numpy as np
@@ -14,6 +14,7 @@ from TTS.utils.audio.numpy_transforms import (
     db_to_amp,
     deemphasis,
     find_endpoint,
+    find_endpoint_stream,
     griffin_lim,
     load_wav,
     mel_to_spec,
@@ -539,6 +540,25 @@ class AudioProcessor(object):
             base=self.base,
         )
 
+    def find_endpoint_stream(self, chunks: Iterable[np.ndarray], min_silence_sec=0.8) -> Iterator[np.ndarray]:
+        """Cut a streamed audio signal at the point found by `find_endpoint()` on the full signal.
+
+        Args:
+            chunks (Iterable[np.ndarray]): Audio signal chunks.
+            min_silence_sec (float, optional): Ignore silences that are shorter then this in secs. Defaults to 0.8.
+
+        Yields:
+            np.ndarray: Audio signal chunk before the endpoint.
+        """
+        yield from find_endpoint_stream(
+            chunks=chunks,
+            trim_db=self.trim_db,
+            sample_rate=self.sample_rate,
+            min_silence_sec=min_silence_sec,
+            gain=self.spec_gain,
+            base=self.base,
+        )
+
     def trim_silence(self, wav):
         """Trim silent parts with a threshold and 0.01 sec margin"""
         return trim_silence(
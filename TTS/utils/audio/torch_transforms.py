@@ -1,3 +1,5 @@
+import math
+
 import librosa
 import torch
 from torch import nn
@@ -163,3 +165,219 @@ class TorchSTFT(nn.Module):  # pylint: disable=abstract-method
     @staticmethod
     def _db_to_amp(x, spec_gain=1.0):
         return torch.exp(x) / spec_gain
+
+
+class TorchSpecNormalizer:
+    """Torch version of the `AudioProcessor.normalize()` and `denormalize()` spectrogram scaling.
+
+    It runs on the device and in the precision of the input tensor, so spectrograms can be rescaled between models
+    without copying them to numpy. The mean-var statistics are moved to the input device once and kept there.
+
+    Args:
+        ap (AudioProcessor): audio processor to copy the normalization parameters and statistics from.
+
+    Example:
+        >>> normalizer = TorchSpecNormalizer(ap)
+        >>> mel = normalizer.denormalize(model_outputs[0].T)
+    """
+
+    def __init__(self, ap):
+        self.signal_norm = ap.signal_norm
+        self.symmetric_norm = ap.symmetric_norm
+        self.max_norm = ap.max_norm
+        self.clip_norm = ap.clip_norm
+        self.min_level_db = ap.min_level_db
+        self.ref_level_db = ap.ref_level_db
+        self.num_mels = ap.num_mels
+        self.fft_size = ap.fft_size
+        self.stats = None
+        if hasattr(ap, "mel_scaler"):
+            self.stats = {
+                ap.num_mels: (ap.mel_scaler.mean_, ap.mel_scaler.scale_),
+                ap.fft_size / 2: (ap.linear_scaler.mean_, ap.linear_scaler.scale_),
+            }
+            self.stats = {k: tuple(torch.as_tensor(s, dtype=torch.float32) for s in v) for k, v in self.stats.items()}
+
+    def _get_stats(self, S):
+        if S.shape[-2] not in self.stats:
+            raise RuntimeError(" [!] Mean-Var stats does not match the given feature dimensions.")
+        mean, scale = self.stats[S.shape[-2]]
+        if mean.device != S.device or mean.dtype != S.dtype:
+            mean, scale = mean.to(S), scale.to(S)
+            self.stats[S.shape[-2]] = (mean, scale)
+        return mean.unsqueeze(-1), scale.unsqueeze(-1)
+
+    def normalize(self, S: torch.Tensor) -> torch.Tensor:
+        """Normalize values into `[0, self.max_norm]` or `[-self.max_norm, self.max_norm]`.
+
+        Shapes:
+            - S: :math:`[..., C, T]`
+        """
+        if not self.signal_norm:
+            return S
+        if self.stats is not None:
+            mean, scale = self._get_stats(S)
+            return (S - mean) / scale
+        S_norm = (S - self.ref_level_db - self.min_level_db) / (-self.min_level_db)
+        if self.symmetric_norm:
+            S_norm = ((2 * self.max_norm) * S_norm) - self.max_norm
+            if self.clip_norm:
+                S_norm = torch.clamp(S_norm, -self.max_norm, self.max_norm)
+            return S_norm
+        S_norm = self.max_norm * S_norm
+        if self.clip_norm:
+            S_norm = torch.clamp(S_norm, 0, self.max_norm)
+        return S_norm
+
+    def denormalize(self, S: torch.Tensor) -> torch.Tensor:
+        """Denormalize spectrogram values.
+
+        Shapes:
+            - S: :math:`[..., C, T]`
+        """
+        if not self.signal_norm:
+            return S
+        if self.stats is not None:
+            mean, scale = self._get_stats(S)
+            return S * scale + mean
+        if self.symmetric_norm:
+            if self.clip_norm:
+                S = torch.clamp(S, -self.max_norm, self.max_norm)
+            S = ((S + self.max_norm) * -self.min_level_db / (2 * self.max_norm)) + self.min_level_db
+            return S + self.ref_level_db
+        if self.clip_norm:
+            S = torch.clamp(S, 0, self.max_norm)
+        S = (S * -self.min_level_db / self.max_norm) + self.min_level_db
+        return S + self.ref_level_db
+
+
+class TorchSpectrogram:
+    """Torch version of `AudioProcessor.spectrogram()` and `melspectrogram()` for batches of padded waveforms.
+
+    It applies the same pre-emphasis, STFT padding, mel filters, amplitude to dB conversion and normalization as the
+    audio processor, on the device of the input, so the data loader workers can send the raw audio and the model
+    computes the features on the training device. Each waveform is padded at its own length like `librosa.stft()`
+    pads a single waveform, so the frames of a waveform do not depend on the other waveforms of the batch. The frames
+    after the end of a waveform are set to zero like the padding of the spectrograms in `TTSDataset.collate_fn()`.
+
+    Args:
+        ap (AudioProcessor): audio processor to copy the parameters, the mel filters and the statistics from.
+
+    Example:
+        >>> torch_spec = TorchSpectrogram(ap)
+        >>> mel = torch_spec.melspectrogram(wav, wav_lengths)
+    """
+
+    def __init__(self, ap):
+        if ap.stft_pad_mode not in ("reflect", "constant"):
+            raise ValueError(f" [!] Unsupported STFT pad mode: {ap.stft_pad_mode}")
+        self.preemphasis = ap.preemphasis
+        self.fft_size = ap.fft_size
+        self.hop_length = ap.hop_length
+        self.win_length = ap.win_length
+        self.stft_pad_mode = ap.stft_pad_mode
+        self.spec_gain = ap.spec_gain
+        self.base = ap.base
+        self.do_amp_to_db_linear = ap.do_amp_to_db_linear
+        self.do_amp_to_db_mel = ap.do_amp_to_db_mel
+        # kept in double precision and cast to the input precision once
+        self.window = torch.hann_window(ap.win_length, dtype=torch.float64)
+        self.mel_basis = torch.from_numpy(ap.mel_basis).double()
+        self._tensors = {}
+        self.normalizer = TorchSpecNormalizer(ap)
+
+    def _get_tensors(self, x):
+        key = (x.device, x.dtype)
+        if key not in self._tensors:
+            self._tensors[key] = (self.window.to(x), self.mel_basis.to(x))
+        return self._tensors[key]
+
+    def num_frames(self, lengths: torch.Tensor) -> torch.Tensor:
+        """Number of spectrogram frames of waveforms with the given lengths."""
+        return lengths // self.hop_length + 1
+
+    def apply_preemphasis(self, wav: torch.Tensor) -> torch.Tensor:
+        """Apply pre-emphasis to a batch of waveforms, like `AudioProcessor.apply_preemphasis()`.
+
+        Shapes:
+            - wav: :math:`[B, T]`
+        """
+        if self.preemphasis == 0:
+            return wav
+        return torch.cat([wav[:, :1], wav[:, 1:] - self.preemphasis * wav[:, :-1]], dim=1)
+
+    def pad(self, wav: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+        """Pad each waveform with `fft_size // 2` samples on both sides of its own length, like a centered STFT.
+
+        Shapes:
+            - wav: :math:`[B, T]`
+            - lengths: :math:`[B]`
+            - output: :math:`[B, T + fft_size // 2 * 2]`
+        """
+        pad = self.fft_size // 2
+        positions = torch.arange(-pad, wav.shape[1] + pad, device=wav.device).expand(wav.shape[0], -1)
+        lengths = lengths.to(wav.device).unsqueeze(1)
+        if self.stft_pad_mode == "reflect":
+            idxs = positions.abs()
+            idxs = torch.where(idxs >= lengths, 2 * (lengths - 1) - idxs, idxs)
+            return wav.gather(1, idxs.clamp(0, wav.shape[1] - 1))
+        mask = (positions >= 0) & (positions < lengths)
+        return wav.gather(1, positions.clamp(0, wav.shape[1] - 1)) * mask
+
+    def _magnitude(self, wav: torch.Tensor, lengths: torch.Tensor, padded: bool) -> torch.Tensor:
+        if not padded:
+            if lengths is None:
+                lengths = torch.full((wav.shape[0],), wav.shape[1], dtype=torch.long, device=wav.device)
+            wav = self.pad(self.apply_preemphasis(wav), lengths)
+        D = torch.stft(
+            wav,
+            n_fft=self.fft_size,
+            hop_length=self.hop_length,
+            win_length=self.win_length,
+            window=self._get_tensors(wav)[0],
+            center=False,
+            return_complex=True,
+        )
+        return D.abs()
+
+    def _amp_to_db(self, x: torch.Tensor) -> torch.Tensor:
+        return self.spec_gain * torch.log(torch.clamp(x, min=1e-8)) / math.log(self.base)
+
+    def _mask(self, S: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+        if lengths is None:
+            return S
+        frames = torch.arange(S.shape[-1], device=S.device)
+        return S * (frames.unsqueeze(0) < self.num_frames(lengths.to(S.device)).unsqueeze(1)).unsqueeze(1)
+
+    def spectrogram(self, wav: torch.Tensor, lengths: torch.Tensor = None, padded: bool = False) -> torch.Tensor:
+        """Compute the linear spectrograms of a batch of waveforms.
+
+        Args:
+            wav (torch.Tensor): Waveforms padded with zeros.
+            lengths (torch.Tensor): Length of each waveform. Defaults to None, all the waveforms are full length.
+            padded (bool): If True, the waveforms are already pre-emphasized and padded for the STFT, e.g. windows of
+                a pre-emphasized and padded waveform, and the frames cover the whole input. Defaults to False.
+
+        Shapes:
+            - wav: :math:`[B, T]`
+            - lengths: :math:`[B]`
+            - output: :math:`[B, fft_size // 2 + 1, T // hop_length + 1]`
+        """
+        S = self._magnitude(wav, lengths, padded)
+        if self.do_amp_to_db_linear:
+            S = self._amp_to_db(S)
+        return self._mask(self.normalizer.normalize(S), lengths)
+
+    def melspectrogram(self, wav: torch.Tensor, lengths: torch.Tensor = None, padded: bool = False) -> torch.Tensor:
+        """Compute the melspectrograms of a batch of waveforms. See `spectrogram()` for the arguments.
+
+        Shapes:
+            - wav: :math:`[B, T]`
+            - lengths: :math:`[B]`
+            - output: :math:`[B, num_mels, T // hop_length + 1]`
+        """
+        S = self._magnitude(wav, lengths, padded)
+        S = torch.matmul(self._get_tensors(S)[1], S)
+        if self.do_amp_to_db_mel:
+            S = self._amp_to_db(S)
+        return self._mask(self.normalizer.normalize(S), lengths)
@@ -0,0 +1,118 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, List
+
+
+class BatchScheduler:
+    """Collect the items submitted by concurrent callers and run them together in batches.
+
+    A background thread waits for the first item, keeps collecting items for at most `max_wait_time` seconds or
+    until `max_batch_size` items are gathered, then calls `batch_fn` once per group of compatible items. Items are
+    compatible when `key_fn` returns the same key for them, e.g. the same speaker and language.
+
+    Args:
+        batch_fn (Callable[[List[Any]], List[Any]]): runs a list of items and returns one result per item.
+        max_batch_size (int): maximum number of items in a batch. Defaults to 8.
+        max_wait_time (float): seconds to wait for more items after the first one. Defaults to 0.01.
+        key_fn (Callable[[Any], Hashable], optional): returns the grouping key of an item. Defaults to None, meaning
+            all items are compatible.
+
+    Example:
+        >>> scheduler = BatchScheduler(lambda items: [i * 2 for i in items], max_batch_size=4)
+        >>> scheduler.run([1, 2, 3])
+        [2, 4, 6]
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.01,
+        key_fn: Callable[[Any], Hashable] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self.key_fn = key_fn
+        self.num_batches = 0
+        self.num_items = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of items per batch run so far."""
+        return self.num_items / max(self.num_batches, 1)
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item and return a future for its result. Once closed, the item is run right away on its own."""
+        future = Future()
+        with self._close_lock:
+            if not self._closed:
+                self._queue.put((item, future))
+                return future
+        self._run_batch([(item, future)])
+        return future
+
+    def run(self, items: List[Any]) -> List[Any]:
+        """Queue the items, wait for them and return their results in order."""
+        futures = [self.submit(item) for item in items]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Stop the background thread after the queued items are done, so it no longer holds `batch_fn`."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_time
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # put the stop signal back to handle it after this batch
+                self._queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _loop(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            groups = OrderedDict()
+            for item, future in self._collect(request):
+                key = self.key_fn(item) if self.key_fn is not None else None
+                groups.setdefault(key, []).append((item, future))
+            for requests in groups.values():
+                self._run_batch(requests)
+
+    def _run_batch(self, requests):
+        items = [item for item, _ in requests]
+        try:
+            results = self.batch_fn(items)
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in requests:
+                future.set_exception(e)
+            return
+        self.num_batches += 1
+        self.num_items += len(items)
+        for (_, future), result in zip(requests, results):
+            future.set_result(result)
@@ -1,3 +1,4 @@
+import json
 import os
 import pickle as pickle_tts
 from typing import Any, Callable, Dict, Union
@@ -32,6 +33,8 @@ def load_fsspec(
 ) -> Any:
     """Like torch.load but can load from other locations (e.g. s3:// , gs://).
 
+    `.safetensors` checkpoints are loaded with `load_safetensors()` and memory-mapped.
+
     Args:
         path: Any path or url supported by fsspec.
         map_location: torch.device or str.
@@ -42,6 +45,12 @@ def load_fsspec(
         Object stored in path.
     """
     is_local = os.path.isdir(path) or os.path.isfile(path)
+    if is_safetensors_file(path):
+        if not is_local and cache:
+            path = fsspec.open_local(
+                f"filecache::{path}", filecache={"cache_storage": str(get_user_data_dir("tts_cache"))}
+            )
+        return load_safetensors(path, map_location=map_location)
     if cache and not is_local:
         with fsspec.open(
             f"filecache::{path}",
@@ -54,6 +63,117 @@ def load_fsspec(
             return torch.load(f, map_location=map_location, **kwargs)
 
 
+def is_safetensors_file(path: str) -> bool:
+    """Check if the checkpoint at `path` is a safetensors file, whose tensors are memory-mapped on load."""
+    return str(path).endswith(".safetensors")
+
+
+def load_safetensors(path: str, map_location: Union[str, torch.device] = None) -> Dict:
+    """Load a checkpoint saved by `save_safetensors()`.
+
+    Local files are memory-mapped, the tensors are backed by the pages of the file instead of being read into the
+    process memory. Loaded into a model with `model.load_state_dict(state["model"], assign=True)`, the weights stay
+    in the page cache and are shared by all the processes using the same file.
+
+    Args:
+        path (str): Local path or url of the safetensors file.
+        map_location (Union[str, torch.device]): Device to load the tensors to. Defaults to None, on CPU.
+
+    Returns:
+        Dict: Checkpoint with the weights in `model` and its other entries, like `config`, as saved.
+    """
+    from safetensors import safe_open  # pylint: disable=import-outside-toplevel
+    from safetensors.torch import load, load_file  # pylint: disable=import-outside-toplevel
+
+    device = str(map_location) if isinstance(map_location, (str, torch.device)) else "cpu"
+    if os.path.isfile(path):
+        state_dict = load_file(path, device=device)
+        with safe_open(path, framework="pt") as f:
+            metadata = f.metadata() or {}
+    else:
+        with fsspec.open(path, "rb") as f:
+            data = f.read()
+        state_dict = {key: value.to(device) for key, value in load(data).items()}
+        # the metadata is a JSON header after the 8 bytes of its length
+        header_size = int.from_bytes(data[:8], "little")
+        metadata = json.loads(data[8 : 8 + header_size]).get("__metadata__", {})
+    # tensors saved once for several keys, e.g. tied weights
+    for key, source_key in json.loads(metadata.get("tts_aliases", "{}")).items():
+        state_dict[key] = state_dict[source_key]
+    state = json.loads(metadata.get("tts_checkpoint", "{}"))
+    state["model"] = state_dict
+    return state
+
+
+def save_safetensors(state: Dict, path: str) -> None:
+    """Save a checkpoint to a safetensors file for memory-mapped loading.
+
+    The weights are taken from `state["model"]`. The other entries of the checkpoint that are JSON serializable, like
+    `config` or `step`, are kept in the metadata of the file and the others, like the optimizer state, are dropped,
+    so the file is meant for inference.
+
+    Args:
+        state (Dict): Checkpoint as saved by the trainer.
+        path (str): Output file path.
+    """
+    from safetensors.torch import save_file  # pylint: disable=import-outside-toplevel
+
+    tensors = {}
+    aliases = {}
+    views = {}
+    storages = set()
+    for key, value in state["model"].items():
+        if not torch.is_tensor(value):
+            raise ValueError(f" [!] `{key}` is not a tensor, the checkpoint cannot be saved as safetensors.")
+        value = value.detach().cpu()
+        view = (value.untyped_storage().data_ptr(), value.storage_offset(), tuple(value.shape), value.stride())
+        if view in views:
+            aliases[key] = views[view]
+            continue
+        views[view] = key
+        # safetensors does not store overlapping tensors, copy the ones sharing memory with another
+        if value.untyped_storage().data_ptr() in storages:
+            value = value.clone()
+        storages.add(value.untyped_storage().data_ptr())
+        tensors[key] = value.contiguous()
+
+    checkpoint = {}
+    for key, value in state.items():
+        if key == "model":
+            continue
+        try:
+            json.dumps(value)
+        except TypeError:
+            continue
+        checkpoint[key] = value
+    metadata = {"format": "pt", "tts_checkpoint": json.dumps(checkpoint), "tts_aliases": json.dumps(aliases)}
+    save_file(tensors, path, metadata=metadata)
+
+
+def convert_to_safetensors(checkpoint_path: str, output_path: str = None) -> str:
+    """Convert a 🐸TTS `.pth` checkpoint to a safetensors file with `save_safetensors()`.
+
+    Args:
+        checkpoint_path (str): Path or url of the checkpoint.
+        output_path (str): Output file path. Defaults to None, the checkpoint path with the `.safetensors` extension.
+
+    Returns:
+        str: Path of the safetensors file.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(checkpoint_path)[0]
+        if output_path.endswith(".pth"):
+            output_path = output_path[: -len(".pth")]
+        output_path += ".safetensors"
+    try:
+        state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=False)
+    except ModuleNotFoundError:
+        pickle_tts.Unpickler = RenamingUnpickler
+        state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), pickle_module=pickle_tts, cache=False)
+    save_safetensors(state, output_path)
+    return output_path
+
+
 def load_checkpoint(
     model, checkpoint_path, use_cuda=False, eval=False, cache=False
 ):  # pylint: disable=redefined-builtin
@@ -62,7 +182,7 @@ def load_checkpoint(
     except ModuleNotFoundError:
         pickle_tts.Unpickler = RenamingUnpickler
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), pickle_module=pickle_tts, cache=cache)
-    model.load_state_dict(state["model"])
+    model.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
     if use_cuda:
         model.cuda()
     if eval:
@@ -1,11 +1,15 @@
+import hashlib
 import json
 import os
 import re
+import shutil
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shutil import copyfile, rmtree
+from shutil import rmtree
 from typing import Dict, List, Tuple
+from urllib.parse import urlparse
 
 import fsspec
 import requests
@@ -26,6 +30,12 @@ LICENSE_URLS = {
     "cpml": "https://coqui.ai/cpml.txt",
 }
 
+DOWNLOAD_CHUNK_SIZE = 2**20
+
+
+class IntegrityError(requests.RequestException):
+    """A downloaded file does not match its expected size or hash."""
+
 
 class ModelManager(object):
     tqdm_progress = None
@@ -36,17 +46,32 @@ class ModelManager(object):
     Models are downloaded under '.TTS' folder in the user's
     home path.
 
+    The files of a model are downloaded in parallel. An interrupted download is resumed by the next call, which keeps
+    the files already complete, and the downloaded files are checked against their size and, when the model lists
+    them in `file_hashes`, their hashes. The `hash.md5` file published with a model is checked against its
+    `model_hash`.
+
+    With a mirror folder, the files are first looked up in it and the downloaded files are copied to it, so nodes
+    without internet access can load the models from a shared artifact store filled by a connected node.
+
     Args:
         models_file (str): path to .model.json file. Defaults to None.
         output_prefix (str): prefix to `tts` to download models. Defaults to None
         progress_bar (bool): print a progress bar when donwloading a file. Defaults to False.
         verbose (bool): print info. Defaults to True.
+        mirror_dir (str): folder mirroring the model files by url. Defaults to None, the `TTS_MIRROR_DIR` environment
+            variable if it is set.
+        max_workers (int): maximum number of files downloaded at the same time. Defaults to 4.
     """
 
-    def __init__(self, models_file=None, output_prefix=None, progress_bar=False, verbose=True):
+    def __init__(
+        self, models_file=None, output_prefix=None, progress_bar=False, verbose=True, mirror_dir=None, max_workers=4
+    ):
         super().__init__()
         self.progress_bar = progress_bar
         self.verbose = verbose
+        self.mirror_dir = mirror_dir if mirror_dir is not None else os.environ.get("TTS_MIRROR_DIR")
+        self.max_workers = max_workers
         if output_prefix is None:
             self.output_prefix = get_user_data_dir("tts")
         else:
@@ -226,23 +251,31 @@ class ModelManager(object):
         else:
             print(" > Model's license - No license information available")
 
-    def _download_github_model(self, model_item: Dict, output_path: str):
-        if isinstance(model_item["github_rls_url"], list):
-            self._download_model_files(model_item["github_rls_url"], output_path, self.progress_bar)
+    def _download_urls(self, model_item: Dict, urls, output_path: str):
+        hashes = model_item.get("file_hashes")
+        if isinstance(urls, list):
+            self._download_model_files(
+                urls,
+                output_path,
+                self.progress_bar,
+                mirror_dir=self.mirror_dir,
+                hashes=hashes,
+                max_workers=self.max_workers,
+            )
         else:
-            self._download_zip_file(model_item["github_rls_url"], output_path, self.progress_bar)
+            self._download_zip_file(urls, output_path, self.progress_bar, mirror_dir=self.mirror_dir, hashes=hashes)
+
+    def _download_github_model(self, model_item: Dict, output_path: str):
+        self._download_urls(model_item, model_item["github_rls_url"], output_path)
 
     def _download_hf_model(self, model_item: Dict, output_path: str):
-        if isinstance(model_item["hf_url"], list):
-            self._download_model_files(model_item["hf_url"], output_path, self.progress_bar)
-        else:
-            self._download_zip_file(model_item["hf_url"], output_path, self.progress_bar)
+        self._download_urls(model_item, model_item["hf_url"], output_path)
 
     def download_fairseq_model(self, model_name, output_path):
         URI_PREFIX = "https://coqui.gateway.scarf.sh/fairseq/"
         _, lang, _, _ = model_name.split("/")
         model_download_uri = os.path.join(URI_PREFIX, f"{lang}.tar.gz")
-        self._download_tar_file(model_download_uri, output_path, self.progress_bar)
+        self._download_tar_file(model_download_uri, output_path, self.progress_bar, mirror_dir=self.mirror_dir)
 
     @staticmethod
     def set_model_url(model_item: Dict):
@@ -331,27 +364,51 @@ class ModelManager(object):
         return True
 
     def create_dir_and_download_model(self, model_name, model_item, output_path):
-        os.makedirs(output_path, exist_ok=True)
+        # the files are downloaded next to the model folder and the model folder is only created by renaming the
+        # complete download, so the partial files of a failed download are kept and resumed by the next call
+        download_path = output_path + ".download"
+        os.makedirs(download_path, exist_ok=True)
         # handle TOS
-        if not self.tos_agreed(model_item, output_path):
-            if not self.ask_tos(output_path):
-                os.rmdir(output_path)
+        if not self.tos_agreed(model_item, output_path) and not self.tos_agreed(model_item, download_path):
+            if not self.ask_tos(download_path):
+                rmtree(download_path)
                 raise Exception(" [!] You must agree to the terms of service to use this model.")
         print(f" > Downloading model to {output_path}")
         try:
             if "fairseq" in model_name:
-                self.download_fairseq_model(model_name, output_path)
+                self.download_fairseq_model(model_name, download_path)
             elif "github_rls_url" in model_item:
-                self._download_github_model(model_item, output_path)
+                self._download_github_model(model_item, download_path)
             elif "hf_url" in model_item:
-                self._download_hf_model(model_item, output_path)
+                self._download_hf_model(model_item, download_path)
 
         except requests.RequestException as e:
             print(f" > Failed to download the model file to {output_path}")
-            rmtree(output_path)
             raise e
+        self._check_model_hash(model_item, download_path)
+        if os.path.isdir(output_path):
+            # keep the agreement of the outdated model being replaced
+            tos_path = os.path.join(output_path, "tos_agreed.txt")
+            if os.path.isfile(tos_path) and not os.path.isfile(os.path.join(download_path, "tos_agreed.txt")):
+                os.replace(tos_path, os.path.join(download_path, "tos_agreed.txt"))
+            rmtree(output_path)
+        os.replace(download_path, output_path)
         self.print_model_license(model_item=model_item)
 
+    @staticmethod
+    def _check_model_hash(model_item: Dict, output_path: str):
+        """Check the downloaded `hash.md5` file of the model against the `model_hash` of the model."""
+        hash_path = os.path.join(output_path, "hash.md5")
+        if model_item.get("model_hash") is None or not os.path.isfile(hash_path):
+            return
+        with open(hash_path, "r", encoding="utf-8") as f:
+            model_hash = f.read().strip()
+        if model_hash != model_item["model_hash"]:
+            os.remove(hash_path)
+            raise IntegrityError(
+                f" [!] The downloaded model hash {model_hash} does not match the expected {model_item['model_hash']}."
+            )
+
     def check_if_configs_are_equal(self, model_name, model_item, output_path):
         with fsspec.open(self._find_files(output_path)[1], "r", encoding="utf-8") as f:
             config_local = json.load(f)
@@ -385,7 +442,8 @@ class ModelManager(object):
         model_item, model_full_name, model, md5sum = self._set_model_item(model_name)
         # set the model specific output path
         output_path = os.path.join(self.output_prefix, model_full_name)
-        if os.path.exists(output_path):
+        # a left over staging folder is an interrupted download to resume
+        if os.path.exists(output_path) and not os.path.isdir(output_path + ".download"):
             if md5sum is not None:
                 md5sum_file = os.path.join(output_path, "hash.md5")
                 if os.path.isfile(md5sum_file):
@@ -438,6 +496,9 @@ class ModelManager(object):
                 model_file = os.path.join(output_path, file_name)
             elif file_name == "config.json":
                 config_file = os.path.join(output_path, file_name)
+        # prefer the memory-mapped weights written by `TTS/bin/convert_to_safetensors.py`
+        if os.path.isfile(os.path.join(output_path, "model.safetensors")):
+            model_file = os.path.join(output_path, "model.safetensors")
         if model_file is None:
             raise ValueError(" [!] Model file not found in the output path")
         if config_file is None:
@@ -525,91 +586,209 @@ class ModelManager(object):
             config.save_json(config_path)
 
     @staticmethod
-    def _download_zip_file(file_url, output_folder, progress_bar):
+    def _mirror_path(mirror_dir: str, file_url: str) -> str:
+        """Path of the copy of `file_url` in the mirror folder."""
+        url = urlparse(file_url)
+        return os.path.join(mirror_dir, url.netloc, *url.path.strip("/").split("/"))
+
+    @staticmethod
+    def _file_hash(path: str, algorithm: str = "sha256") -> str:
+        hasher = hashlib.new(algorithm)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _check_hash(path: str, expected_hash: str, file_url: str):
+        """Check the file against a `sha256:<hex>` or `md5:<hex>` hash, sha256 if the algorithm is not given."""
+        if not ModelManager._has_hash(path, expected_hash):
+            os.remove(path)
+            raise IntegrityError(f" [!] Hash mismatch for {file_url}, the downloaded file is corrupted.")
+
+    @staticmethod
+    def _has_hash(path: str, expected_hash: str) -> bool:
+        algorithm, _, digest = expected_hash.rpartition(":")
+        return ModelManager._file_hash(path, algorithm or "sha256") == digest.lower()
+
+    @staticmethod
+    def _is_complete(path: str, file_url: str, expected_hash: str = None) -> bool:
+        """Check a file downloaded by a previous call against its hash, or the size of the file on the server."""
+        if expected_hash is not None:
+            return ModelManager._has_hash(path, expected_hash)
+        try:
+            r = requests.head(file_url, allow_redirects=True, timeout=60)
+            r.raise_for_status()
+        except requests.RequestException:
+            return False
+        size = r.headers.get("content-length")
+        return size is not None and int(size) == os.path.getsize(path)
+
+    @staticmethod
+    def _download_file(
+        file_url: str, output_path: str, progress_bar: bool, expected_hash: str = None, mirror_dir: str = None
+    ) -> str:
+        """Download a file, resuming a previous partial download of it and checking its integrity.
+
+        The file is written to `<output_path>.part` and renamed once complete. A partial file left by a failed
+        download is resumed with a HTTP range request if the server still has the same version of the file, and a
+        complete file left by a failed model download is kept.
+
+        Args:
+            file_url (str): url of the file.
+            output_path (str): path of the downloaded file.
+            progress_bar (bool): print a progress bar.
+            expected_hash (str): `sha256:<hex>` or `md5:<hex>` hash of the file. Defaults to None, only the size of
+                the file is checked.
+            mirror_dir (str): folder mirroring the files by url. The file is copied from it if it is there and copied
+                to it after the download otherwise. Defaults to None.
+
+        Returns:
+            str: path of the downloaded file.
+        """
+        if os.path.isfile(output_path):
+            if ModelManager._is_complete(output_path, file_url, expected_hash):
+                return output_path
+            os.remove(output_path)
+        mirror_path = ModelManager._mirror_path(mirror_dir, file_url) if mirror_dir is not None else None
+        part_path = output_path + ".part"
+        if mirror_path is not None and os.path.isfile(mirror_path):
+            shutil.copyfile(mirror_path, part_path)
+            mirror_hash = expected_hash
+            if mirror_hash is None and os.path.isfile(mirror_path + ".sha256"):
+                with open(mirror_path + ".sha256", "r", encoding="utf-8") as f:
+                    mirror_hash = f.read().strip()
+            try:
+                if mirror_hash is not None:
+                    ModelManager._check_hash(part_path, mirror_hash, mirror_path)
+                os.replace(part_path, output_path)
+                return output_path
+            except IntegrityError:
+                print(f" > The mirrored {mirror_path} is corrupted, downloading {file_url} again.")
+
+        # the part file is only resumed if the server still serves the same version of the file
+        info_path = part_path + ".json"
+        headers = {}
+        offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        if offset > 0 and os.path.isfile(info_path):
+            with open(info_path, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            if info["url"] == file_url and info["validator"]:
+                headers = {"Range": f"bytes={offset}-", "If-Range": info["validator"]}
+        r = requests.get(file_url, stream=True, headers=headers, timeout=60)
+        if r.status_code == 416:
+            # the range is not satisfiable, start again
+            r = requests.get(file_url, stream=True, timeout=60)
+        r.raise_for_status()
+        if r.status_code != 206:
+            offset = 0
+        total_size = offset + int(r.headers.get("content-length", 0))
+        with open(info_path, "w", encoding="utf-8") as f:
+            json.dump({"url": file_url, "validator": r.headers.get("ETag") or r.headers.get("Last-Modified")}, f)
+
+        progress = None
+        if progress_bar:
+            progress = tqdm(
+                total=total_size, initial=offset, unit="iB", unit_scale=True, desc=os.path.basename(output_path)
+            )
+            ModelManager.tqdm_progress = progress
+        with open(part_path, "ab" if offset > 0 else "wb") as f:
+            for data in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(data)
+                if progress is not None:
+                    progress.update(len(data))
+        if progress is not None:
+            progress.close()
+        if total_size > offset and os.path.getsize(part_path) != total_size:
+            raise IntegrityError(
+                f" [!] Incomplete download of {file_url}: {os.path.getsize(part_path)} of {total_size} bytes."
+            )
+        os.remove(info_path)
+        if expected_hash is not None:
+            ModelManager._check_hash(part_path, expected_hash, file_url)
+        os.replace(part_path, output_path)
+
+        if mirror_path is not None:
+            try:
+                os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+                shutil.copyfile(output_path, mirror_path + ".part")
+                with open(mirror_path + ".sha256", "w", encoding="utf-8") as f:
+                    f.write(f"sha256:{ModelManager._file_hash(output_path)}")
+                os.replace(mirror_path + ".part", mirror_path)
+            except OSError as e:
+                print(f" > Failed to copy {output_path} to the mirror {mirror_dir}: {e}")
+        return output_path
+
+    @staticmethod
+    def _extract_archive(archive_path: str, output_folder: str):
+        """Extract the files of a zip or tar archive into `output_folder` without their folders.
+
+        The files are streamed from the archive to disk one by one.
+        """
+        if zipfile.is_zipfile(archive_path):
+            with zipfile.ZipFile(archive_path) as z:
+                members = [(info.filename, info) for info in z.infolist() if not info.is_dir()]
+                for name, info in members:
+                    if os.path.basename(name):
+                        with z.open(info) as src, open(
+                            os.path.join(output_folder, os.path.basename(name)), "wb"
+                        ) as dst:
+                            shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+        else:
+            with tarfile.open(archive_path) as t:
+                for member in t:
+                    if member.isfile() and os.path.basename(member.name):
+                        src = t.extractfile(member)
+                        with src, open(os.path.join(output_folder, os.path.basename(member.name)), "wb") as dst:
+                            shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+    @staticmethod
+    def _download_zip_file(file_url, output_folder, progress_bar, mirror_dir=None, hashes=None):
         """Download the github releases"""
-        # download the file
-        r = requests.get(file_url, stream=True)
-        # extract the file
+        file_name = file_url.split("/")[-1]
+        expected_hash = hashes.get(file_name) if hashes else None
+        temp_zip_name = ModelManager._download_file(
+            file_url, os.path.join(output_folder, file_name), progress_bar, expected_hash, mirror_dir
+        )
         try:
-            total_size_in_bytes = int(r.headers.get("content-length", 0))
-            block_size = 1024  # 1 Kibibyte
-            if progress_bar:
-                ModelManager.tqdm_progress = tqdm(total=total_size_in_bytes, unit="iB", unit_scale=True)
-            temp_zip_name = os.path.join(output_folder, file_url.split("/")[-1])
-            with open(temp_zip_name, "wb") as file:
-                for data in r.iter_content(block_size):
-                    if progress_bar:
-                        ModelManager.tqdm_progress.update(len(data))
-                    file.write(data)
-            with zipfile.ZipFile(temp_zip_name) as z:
-                z.extractall(output_folder)
-            os.remove(temp_zip_name)  # delete zip after extract
+            ModelManager._extract_archive(temp_zip_name, output_folder)
         except zipfile.BadZipFile:
             print(f" > Error: Bad zip file - {file_url}")
             raise zipfile.BadZipFile  # pylint: disable=raise-missing-from
-        # move the files to the outer path
-        for file_path in z.namelist():
-            src_path = os.path.join(output_folder, file_path)
-            if os.path.isfile(src_path):
-                dst_path = os.path.join(output_folder, os.path.basename(file_path))
-                if src_path != dst_path:
-                    copyfile(src_path, dst_path)
-        # remove redundant (hidden or not) folders
-        for file_path in z.namelist():
-            if os.path.isdir(os.path.join(output_folder, file_path)):
-                rmtree(os.path.join(output_folder, file_path))
+        os.remove(temp_zip_name)  # delete zip after extract
 
     @staticmethod
-    def _download_tar_file(file_url, output_folder, progress_bar):
+    def _download_tar_file(file_url, output_folder, progress_bar, mirror_dir=None, hashes=None):
         """Download the github releases"""
-        # download the file
-        r = requests.get(file_url, stream=True)
-        # extract the file
+        file_name = file_url.split("/")[-1]
+        expected_hash = hashes.get(file_name) if hashes else None
+        temp_tar_name = ModelManager._download_file(
+            file_url, os.path.join(output_folder, file_name), progress_bar, expected_hash, mirror_dir
+        )
         try:
-            total_size_in_bytes = int(r.headers.get("content-length", 0))
-            block_size = 1024  # 1 Kibibyte
-            if progress_bar:
-                ModelManager.tqdm_progress = tqdm(total=total_size_in_bytes, unit="iB", unit_scale=True)
-            temp_tar_name = os.path.join(output_folder, file_url.split("/")[-1])
-            with open(temp_tar_name, "wb") as file:
-                for data in r.iter_content(block_size):
-                    if progress_bar:
-                        ModelManager.tqdm_progress.update(len(data))
-                    file.write(data)
-            with tarfile.open(temp_tar_name) as t:
-                t.extractall(output_folder)
-                tar_names = t.getnames()
-            os.remove(temp_tar_name)  # delete tar after extract
+            ModelManager._extract_archive(temp_tar_name, output_folder)
         except tarfile.ReadError:
             print(f" > Error: Bad tar file - {file_url}")
             raise tarfile.ReadError  # pylint: disable=raise-missing-from
-        # move the files to the outer path
-        for file_path in os.listdir(os.path.join(output_folder, tar_names[0])):
-            src_path = os.path.join(output_folder, tar_names[0], file_path)
-            dst_path = os.path.join(output_folder, os.path.basename(file_path))
-            if src_path != dst_path:
-                copyfile(src_path, dst_path)
-        # remove the extracted folder
-        rmtree(os.path.join(output_folder, tar_names[0]))
+        os.remove(temp_tar_name)  # delete tar after extract
 
     @staticmethod
-    def _download_model_files(file_urls, output_folder, progress_bar):
-        """Download the github releases"""
-        for file_url in file_urls:
-            # download the file
-            r = requests.get(file_url, stream=True)
-            # extract the file
-            bease_filename = file_url.split("/")[-1]
-            temp_zip_name = os.path.join(output_folder, bease_filename)
-            total_size_in_bytes = int(r.headers.get("content-length", 0))
-            block_size = 1024  # 1 Kibibyte
-            with open(temp_zip_name, "wb") as file:
-                if progress_bar:
-                    ModelManager.tqdm_progress = tqdm(total=total_size_in_bytes, unit="iB", unit_scale=True)
-                for data in r.iter_content(block_size):
-                    if progress_bar:
-                        ModelManager.tqdm_progress.update(len(data))
-                    file.write(data)
+    def _download_model_files(file_urls, output_folder, progress_bar, mirror_dir=None, hashes=None, max_workers=4):
+        """Download the files of a model in parallel"""
+        os.makedirs(output_folder, exist_ok=True)
+
+        def _download(file_url):
+            file_name = file_url.split("/")[-1]
+            expected_hash = hashes.get(file_name) if hashes else None
+            return ModelManager._download_file(
+                file_url, os.path.join(output_folder, file_name), progress_bar, expected_hash, mirror_dir
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_urls)))) as executor:
+            # raise the first error once all the downloads are done or failed
+            futures = [executor.submit(_download, file_url) for file_url in file_urls]
+        for future in futures:
+            future.result()
 
     @staticmethod
     def _check_dict_key(my_dict, key):
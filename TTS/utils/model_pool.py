@@ -0,0 +1,162 @@
+import gc
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+import torch
+from torch import nn
+
+from TTS.utils.quantization import model_size
+
+
+def synthesizer_size(synthesizer: Any) -> int:
+    """Return the size in bytes of the model weights held by a `Synthesizer` or a pool of `Synthesizer` replicas."""
+    if hasattr(synthesizer, "workers"):
+        return sum(synthesizer_size(worker) for worker in synthesizer.workers)
+    models = [getattr(synthesizer, name, None) for name in ["tts_model", "vocoder_model", "vc_model"]]
+    return sum(model_size(model) for model in models if isinstance(model, nn.Module))
+
+
+def close_model(model: Any):
+    """Call the `close()` method of a model if it has one, e.g. to stop the batching thread of a `Synthesizer`."""
+    close = getattr(model, "close", None)
+    if callable(close):
+        close()
+
+
+class ModelPool:
+    """Load models by name on first use and keep the most recently used ones in memory.
+
+    When a new model takes the pool over `max_models` models or over `max_memory` bytes of weights, the least
+    recently used models are dropped, so frequently used models stay warm and rarely used ones do not pin memory.
+    The model just requested is always kept, even if it alone exceeds the budget. A model is only loaded once when
+    several threads request it at the same time, and loading one model does not block the requests of the others.
+
+    Args:
+        load_fn (Callable[[str], Any]): loads a model by name, e.g. builds a `Synthesizer`.
+        max_models (int): maximum number of models kept in memory. Defaults to 1.
+        max_memory (int): maximum size in bytes of the models kept in memory, as computed by `size_fn`. Defaults to
+            None, no limit.
+        size_fn (Callable[[Any], int]): returns the size of a model in bytes. Defaults to `synthesizer_size`.
+        on_evict (Callable[[Any], None]): releases what a dropped model holds beyond its own memory, like threads that
+            would keep it alive. Defaults to `close_model`.
+
+    Example:
+        >>> pool = ModelPool(lambda name: load_synthesizer(name), max_models=4, max_memory=8 * 2**30)
+        >>> wav = pool.get("tts_models/en/ljspeech/vits").tts("Hello world!")
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[str], Any],
+        max_models: int = 1,
+        max_memory: int = None,
+        size_fn: Callable[[Any], int] = synthesizer_size,
+        on_evict: Callable[[Any], None] = close_model,
+    ):
+        if max_models < 1:
+            raise ValueError(f" [!] `max_models` must be at least 1, got {max_models}.")
+        self.load_fn = load_fn
+        self.max_models = max_models
+        self.max_memory = max_memory
+        self.size_fn = size_fn
+        self.on_evict = on_evict
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the loaded models from the least to the most recently used."""
+        with self._lock:
+            return list(self._models)
+
+    @property
+    def memory(self) -> int:
+        """Total size in bytes of the loaded models."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def get(self, name: str) -> Any:
+        """Return the model `name`, loading it first if it is not in memory."""
+        with self._lock:
+            if name in self._models:
+                self._models.move_to_end(name)
+                self.hits += 1
+                return self._models[name]
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+        with load_lock:
+            with self._lock:
+                # loaded by another thread in the meantime
+                if name in self._models:
+                    self._models.move_to_end(name)
+                    self.hits += 1
+                    return self._models[name]
+                self.misses += 1
+            print(f" > Loading model `{name}`.")
+            model = self.load_fn(name)
+            size = self.size_fn(model)
+            with self._lock:
+                self._models[name] = model
+                self._sizes[name] = size
+                self._load_locks.pop(name, None)
+                evicted_names, evicted_models = self._evict()
+        if evicted_names:
+            print(f" > Evicted models {evicted_names}.")
+            self._release(evicted_models)
+        return model
+
+    def _evict(self) -> Tuple[List[str], List[Any]]:
+        evicted_names, evicted_models = [], []
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_models
+            or (self.max_memory is not None and sum(self._sizes.values()) > self.max_memory)
+        ):
+            name, model = self._models.popitem(last=False)
+            self._sizes.pop(name)
+            evicted_names.append(name)
+            evicted_models.append(model)
+        return evicted_names, evicted_models
+
+    def evict(self, name: str) -> bool:
+        """Drop the model `name` from memory. Returns False if it is not loaded."""
+        with self._lock:
+            if name not in self._models:
+                return False
+            models = [self._models.pop(name)]
+            del self._sizes[name]
+        self._release(models)
+        return True
+
+    def clear(self):
+        """Drop all the models."""
+        with self._lock:
+            models = list(self._models.values())
+            self._models.clear()
+            self._sizes.clear()
+        self._release(models)
+
+    def _release(self, models: List[Any]):
+        """Call `on_evict` on the dropped models and free them. The list is emptied so it does not keep them alive."""
+        while models:
+            model = models.pop()
+            if self.on_evict is not None:
+                self.on_evict(model)
+            del model
+        self._free_memory()
+
+    @staticmethod
+    def _free_memory():
+        # the evicted models are freed once the requests still using them are done
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
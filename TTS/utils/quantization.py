@@ -0,0 +1,149 @@
+from typing import List
+
+import torch
+import torch.ao.nn.quantized.dynamic as nnqd
+from torch import nn
+from torch.nn import functional as F
+from torch.nn.utils import parametrize
+
+QUANTIZATION_MODES = ("int8",)
+
+# layers run with the dynamic int8 kernels. The dynamic conv kernels are inaccurate and memory hungry, convolutions
+# are converted to `Int8WeightConv1d` instead.
+DYNAMIC_QUANTIZATION_MAPPING = {
+    nn.Linear: nnqd.Linear,
+    nn.LSTM: nnqd.LSTM,
+    nn.GRU: nnqd.GRU,
+}
+
+
+class Int8WeightConv1d(nn.Module):
+    """`nn.Conv1d` or `nn.ConvTranspose1d` with its weight stored in int8.
+
+    The weight is quantized per output channel and dequantized on the fly, so the layer takes about 4x less memory
+    and computes in the original precision.
+
+    Args:
+        conv (Union[nn.Conv1d, nn.ConvTranspose1d]): layer to convert.
+    """
+
+    def __init__(self, conv: nn.Module):
+        super().__init__()
+        self.transposed = isinstance(conv, nn.ConvTranspose1d)
+        self.stride = conv.stride
+        self.padding = conv.padding
+        self.output_padding = conv.output_padding
+        self.dilation = conv.dilation
+        self.groups = conv.groups
+        weight = conv.weight.detach()
+        # output channels are on dim 1 for transposed convolutions
+        reduce_dim = (0, 2) if self.transposed else (1, 2)
+        scale = weight.abs().amax(dim=reduce_dim, keepdim=True).clamp(min=1e-8) / 127
+        self.register_buffer("weight_int8", torch.round(weight / scale).to(torch.int8))
+        self.register_buffer("weight_scale", scale)
+        self.register_buffer("bias", None if conv.bias is None else conv.bias.detach().clone())
+
+    @property
+    def weight(self) -> torch.Tensor:
+        return self.weight_int8.to(self.weight_scale.dtype) * self.weight_scale
+
+    def forward(self, x):
+        if self.transposed:
+            return F.conv_transpose1d(
+                x, self.weight, self.bias, self.stride, self.padding, self.output_padding, self.groups, self.dilation
+            )
+        return F.conv1d(x, self.weight, self.bias, self.stride, self.padding, self.dilation, self.groups)
+
+    def extra_repr(self):
+        in_channels = self.weight_int8.shape[0] if self.transposed else self.weight_int8.shape[1] * self.groups
+        out_channels = self.weight_int8.shape[1] * self.groups if self.transposed else self.weight_int8.shape[0]
+        return f"{in_channels}, {out_channels}, kernel_size={self.weight_int8.shape[2]}, transposed={self.transposed}"
+
+
+def remove_weight_norm(module: nn.Module):
+    """Fold the weight norm parametrizations of all the layers in `module` into plain weights."""
+    for layer in module.modules():
+        if parametrize.is_parametrized(layer, "weight"):
+            parametrize.remove_parametrizations(layer, "weight")
+
+
+def conv1d_to_linear(module: nn.Module):
+    """Replace the `transformers` GPT-2 `Conv1D` layers in `module` by the equivalent `nn.Linear` layers."""
+    from transformers.pytorch_utils import Conv1D  # pylint: disable=import-outside-toplevel
+
+    for name, child in module.named_children():
+        if isinstance(child, Conv1D):
+            linear = nn.Linear(child.weight.shape[0], child.nf)
+            linear.weight.data = child.weight.data.t().contiguous()
+            linear.bias.data = child.bias.data
+            setattr(module, name, linear)
+        else:
+            conv1d_to_linear(child)
+
+
+def convert_conv1d_to_int8(module: nn.Module):
+    """Replace the `nn.Conv1d` and `nn.ConvTranspose1d` layers in `module` by `Int8WeightConv1d` layers."""
+    for name, child in module.named_children():
+        if type(child) in (nn.Conv1d, nn.ConvTranspose1d) and child.padding_mode == "zeros":
+            setattr(module, name, Int8WeightConv1d(child))
+        else:
+            convert_conv1d_to_int8(child)
+
+
+def quantize_int8(module: nn.Module) -> nn.Module:
+    """Quantize the layers of `module` in place to int8.
+
+    Linear, LSTM and GRU layers are quantized dynamically: weights are stored in int8 and activations are quantized
+    on the fly, so they run with the int8 CPU kernels. Convolutions keep computing in float with int8 weights. All
+    the quantized layers take about 4x less memory. Weight norm is removed first since the parametrized layers
+    cannot be converted.
+    """
+    remove_weight_norm(module)
+    conv1d_to_linear(module)
+    convert_conv1d_to_int8(module)
+    qconfig_spec = {layer: torch.ao.quantization.default_dynamic_qconfig for layer in DYNAMIC_QUANTIZATION_MAPPING}
+    return torch.ao.quantization.quantize_dynamic(
+        module, qconfig_spec=qconfig_spec, mapping=DYNAMIC_QUANTIZATION_MAPPING, inplace=True
+    )
+
+
+def quantize_model(model: nn.Module, mode: str = "int8") -> List[nn.Module]:
+    """Quantize the layers returned by `model.get_quantizable_modules()` for CPU inference.
+
+    Models choose the layers that keep their accuracy when quantized, e.g. the `Xtts` GPT or the `Vits` text encoder
+    and flow. The model must be in eval mode and on CPU.
+
+    Args:
+        model (nn.Module): model to quantize in place.
+        mode (str): quantization mode, one of `QUANTIZATION_MODES`. Defaults to "int8".
+
+    Returns:
+        List[nn.Module]: the quantized modules.
+
+    Example:
+        >>> vocoder = setup_vocoder_model(config)
+        >>> vocoder.load_checkpoint(config, checkpoint_path, eval=True)
+        >>> quantize_model(vocoder, "int8")
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f" [!] Unknown quantization mode `{mode}`. Use one of {QUANTIZATION_MODES}.")
+    if not hasattr(model, "get_quantizable_modules"):
+        raise ValueError(f" [!] Quantization is not supported by `{model.__class__.__name__}`.")
+    if any(p.is_cuda for p in model.parameters()):
+        raise ValueError(" [!] Dynamic quantization runs on CPU only. Quantize the model before moving it to GPU.")
+    modules = model.get_quantizable_modules()
+    for module in modules:
+        quantize_int8(module)
+    return modules
+
+
+def model_size(model: nn.Module) -> int:
+    """Return the size of the model weights in bytes, including the packed weights of quantized layers."""
+    size = 0
+    for value in model.state_dict().values():
+        if isinstance(value, torch.Tensor):
+            size += value.numel() * value.element_size()
+        elif isinstance(value, tuple):
+            # packed params of the quantized layers are stored as (weight, bias) tuples
+            size += sum(t.numel() * t.element_size() for t in value if isinstance(t, torch.Tensor))
+    return size
@@ -1,7 +1,9 @@
 import math
 import random
-from typing import Callable, List, Union
+from typing import Callable, Iterator, List, Union
 
+import numpy as np
+import torch
 from torch.utils.data.sampler import BatchSampler, Sampler, SubsetRandomSampler
 
 
@@ -199,3 +201,111 @@ class BucketBatchSampler(BatchSampler):
         if self.drop_last:
             return len(self.sampler) // self.batch_size
         return math.ceil(len(self.sampler) / self.batch_size)
+
+
+class DynamicBatchSampler(Sampler):
+    """Batch sampler making batches of similar length samples with a budget of padded frames instead of a fixed size.
+
+    The sample indices are drawn from `sampler`, sorted by length in buckets of `bucket_size` indices and split into
+    batches as long as `number of samples * longest sample` stays under `max_frames`. So short samples are batched
+    together in large batches and long samples in small ones, keeping the memory use steady. The batches are shuffled.
+
+    The batches of an epoch only depend on `seed` and the epoch number, that is incremented after each iteration or
+    set with `set_epoch()`. So all the processes of a distributed training iterate the same batches and
+    `DistributedSamplerWrapper` can split them between the processes. The random generator of `sampler` is seeded the
+    same way, so weighted samplers of the balancers can be used as `sampler`.
+
+    Args:
+        lengths (List[float]): Length of each sample of the dataset, e.g. the number of spectrogram frames.
+        max_frames (float): Maximum number of padded frames in a batch. A sample longer than that makes a batch alone.
+        sampler (Sampler, optional): Sampler of the dataset indices. Defaults to None, all the samples in random order.
+        max_batch_size (int, optional): Maximum number of samples in a batch. Defaults to None.
+        bucket_size (int): Number of sampled indices sorted together. Defaults to 4096.
+        shuffle (bool): Shuffle the samples and the batches. Defaults to True.
+        seed (int): Random seed of the batches. Defaults to 0.
+
+    Example:
+        >>> sampler = WeightedRandomSampler(get_speaker_balancer_weights(samples), len(samples))
+        >>> sampler = DynamicBatchSampler(mel_lengths, max_frames=20000, sampler=sampler)
+        >>> loader = DataLoader(dataset, batch_sampler=DistributedSamplerWrapper(sampler))
+    """
+
+    def __init__(
+        self,
+        lengths: List[float],
+        max_frames: float,
+        sampler: Sampler = None,
+        max_batch_size: int = None,
+        bucket_size: int = 4096,
+        shuffle: bool = True,
+        seed: int = 0,
+    ):
+        super().__init__(lengths)
+        self.lengths = np.asarray(lengths)
+        self.max_frames = max_frames
+        self.sampler = sampler
+        self.max_batch_size = max_batch_size
+        self.bucket_size = bucket_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+        self._batches = None
+        self._batches_epoch = None
+
+    def set_epoch(self, epoch: int):
+        self.epoch = epoch
+
+    def _split(self, idxs: np.ndarray) -> List[List[int]]:
+        batches = []
+        batch, max_length = [], 0
+        for idx, length in zip(idxs.tolist(), self.lengths[idxs].tolist()):
+            max_length = max(max_length, length)
+            if batch and (
+                (len(batch) + 1) * max_length > self.max_frames
+                or (self.max_batch_size is not None and len(batch) == self.max_batch_size)
+            ):
+                batches.append(batch)
+                batch, max_length = [], length
+            batch.append(idx)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _make_batches(self, epoch: int) -> List[List[int]]:
+        rng = np.random.default_rng(self.seed + epoch)
+        if self.sampler is None:
+            idxs = rng.permutation(len(self.lengths)) if self.shuffle else np.arange(len(self.lengths))
+        else:
+            if hasattr(self.sampler, "generator"):
+                self.sampler.generator = torch.Generator().manual_seed(self.seed + epoch)
+            idxs = np.fromiter(iter(self.sampler), dtype=np.int64)
+        batches = []
+        for start in range(0, len(idxs), self.bucket_size):
+            bucket = idxs[start : start + self.bucket_size]
+            batches += self._split(bucket[np.argsort(self.lengths[bucket], kind="stable")])
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+        return batches
+
+    @property
+    def batches(self) -> List[List[int]]:
+        """Batches of the current epoch."""
+        if self._batches_epoch != self.epoch:
+            self._batches = self._make_batches(self.epoch)
+            self._batches_epoch = self.epoch
+        return self._batches
+
+    @property
+    def padding_efficiency(self) -> float:
+        """Ratio of the frames of the samples to the padded frames of the batches of the current epoch."""
+        num_frames = sum(self.lengths[batch].sum() for batch in self.batches)
+        num_padded_frames = sum(len(batch) * self.lengths[batch].max() for batch in self.batches)
+        return float(num_frames / max(num_padded_frames, 1))
+
+    def __iter__(self) -> Iterator[List[int]]:
+        batches = self.batches
+        self.epoch += 1
+        return iter(batches)
+
+    def __len__(self) -> int:
+        return len(self.batches)
@@ -1,25 +1,45 @@
+import itertools
 import os
+import sys
 import time
-from typing import List
+from typing import Dict, Iterator, List, Union
 
 import numpy as np
 import pysbd
 import torch
 from torch import nn
+from torch.nn import functional as F
 
 from TTS.config import load_config
-from TTS.tts.configs.vits_config import VitsConfig
 from TTS.tts.models import setup_model as setup_tts_model
-from TTS.tts.models.vits import Vits
 
 # pylint: disable=unused-wildcard-import
 # pylint: disable=wildcard-import
-from TTS.tts.utils.synthesis import synthesis, transfer_voice, trim_silence
-from TTS.utils.audio import AudioProcessor
-from TTS.utils.audio.numpy_transforms import save_wav
+from TTS.tts.utils.synthesis import (
+    batch_synthesis,
+    batch_text_to_ids,
+    inv_spectrogram,
+    synthesis,
+    transfer_voice,
+    trim_silence,
+    trim_silence_stream,
+)
+from TTS.utils.batch_scheduler import BatchScheduler
+from TTS.utils.quantization import QUANTIZATION_MODES, quantize_model
 from TTS.vc.models import setup_model as setup_vc_model
 from TTS.vocoder.models import setup_model as setup_vocoder_model
-from TTS.vocoder.utils.generic_utils import interpolate_vocoder_input
+
+
+def _supports_batch_inference(model: nn.Module) -> bool:
+    """Check if the model is a `Vits` or a `ForwardTTS` model, which synthesize batches of sentences.
+
+    The classes are looked up in the imported modules only, so the check does not import the model implementations.
+    """
+    for module_name, class_name in [("TTS.tts.models.vits", "Vits"), ("TTS.tts.models.forward_tts", "ForwardTTS")]:
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(model, getattr(module, class_name)):
+            return True
+    return False
 
 
 class Synthesizer(nn.Module):
@@ -38,6 +58,9 @@ class Synthesizer(nn.Module):
         model_dir: str = "",
         voice_dir: str = None,
         use_cuda: bool = False,
+        max_batch_size: int = 1,
+        max_wait_time: float = 0.01,
+        quantize: str = None,
     ) -> None:
         """General 🐸 TTS interface for inference. It takes a tts and a vocoder
         model and synthesize speech from the provided text.
@@ -60,6 +83,12 @@ class Synthesizer(nn.Module):
             vc_checkpoint (str, optional): path to the voice conversion model file. Defaults to `""`,
             vc_config (str, optional): path to the voice conversion config file. Defaults to `""`,
             use_cuda (bool, optional): enable/disable cuda. Defaults to False.
+            max_batch_size (int, optional): maximum number of sentences from concurrent `tts()` calls run together
+                in a single model pass. Only used by models with batched inference (`Vits`, `ForwardTTS`). Defaults
+                to 1, no batching.
+            max_wait_time (float, optional): seconds to wait for more sentences to fill a batch. Defaults to 0.01.
+            quantize (str, optional): quantize the models for CPU inference, e.g. "int8". Only used by the models
+                supporting it (`Xtts`, `Vits` and the HiFiGAN vocoders). Defaults to None, no quantization.
         """
         super().__init__()
         self.tts_checkpoint = tts_checkpoint
@@ -76,6 +105,8 @@ class Synthesizer(nn.Module):
 
         self.tts_model = None
         self.vocoder_model = None
+        self._tts_normalizer = None
+        self._vocoder_normalizer = None
         self.vc_model = None
         self.speaker_manager = None
         self.tts_speakers = {}
@@ -109,6 +140,42 @@ class Synthesizer(nn.Module):
                 self._load_tts_from_dir(model_dir, use_cuda)
                 self.output_sample_rate = self.tts_config.audio["output_sample_rate"]
 
+        if quantize is not None:
+            self._quantize(quantize)
+
+        self.batch_scheduler = None
+        if max_batch_size > 1 and _supports_batch_inference(self.tts_model):
+            self.batch_scheduler = BatchScheduler(
+                self._batch_tts, max_batch_size=max_batch_size, max_wait_time=max_wait_time, key_fn=self._batch_key
+            )
+
+    def close(self) -> None:
+        """Stop the batching thread. It refers to the synthesizer, which is otherwise never freed.
+
+        The calls made after it are run without batching.
+        """
+        if self.batch_scheduler is not None:
+            self.batch_scheduler.close()
+
+    def _quantize(self, mode: str) -> None:
+        """Quantize the loaded models that support it and keep the others in full precision.
+
+        Args:
+            mode (str): quantization mode, e.g. "int8".
+        """
+        if mode not in QUANTIZATION_MODES:
+            raise ValueError(f" [!] Unknown quantization mode `{mode}`. Use one of {QUANTIZATION_MODES}.")
+        if self.use_cuda:
+            raise ValueError(" [!] Quantization is only supported on CPU.")
+        for model in [self.tts_model, self.vocoder_model]:
+            if model is None:
+                continue
+            try:
+                quantize_model(model, mode)
+                print(f" > {model.__class__.__name__} quantized to {mode}.")
+            except ValueError as e:
+                print(f"{e} Keeping it in full precision.")
+
     @staticmethod
     def _get_segmenter(lang: str):
         """get the sentence segmenter for the given language.
@@ -146,6 +213,9 @@ class Synthesizer(nn.Module):
 
         We assume it is VITS and the model knows how to load itself from the directory and there is a config.json file in the directory.
         """
+        from TTS.tts.configs.vits_config import VitsConfig  # pylint: disable=import-outside-toplevel
+        from TTS.tts.models.vits import Vits  # pylint: disable=import-outside-toplevel
+
         self.tts_config = VitsConfig()
         self.tts_model = Vits.init_from_config(self.tts_config)
         self.tts_model.load_fairseq_checkpoint(self.tts_config, checkpoint_dir=model_dir, eval=True)
@@ -217,6 +287,8 @@ class Synthesizer(nn.Module):
             model_config (str): path to the model config file.
             use_cuda (bool): enable/disable CUDA use.
         """
+        from TTS.utils.audio import AudioProcessor  # pylint: disable=import-outside-toplevel
+
         self.vocoder_config = load_config(model_config)
         self.vocoder_ap = AudioProcessor(verbose=False, **self.vocoder_config.audio)
         self.vocoder_model = setup_vocoder_model(self.vocoder_config)
@@ -224,6 +296,131 @@ class Synthesizer(nn.Module):
         if use_cuda:
             self.vocoder_model.cuda()
 
+    @property
+    def vocoder_device(self):
+        if self.use_cuda:
+            return "cuda"
+        if self.vocoder_model is None:
+            return "cpu"
+        # fully quantized vocoders keep their weights in buffers
+        for tensor in itertools.chain(self.vocoder_model.parameters(), self.vocoder_model.buffers()):
+            return tensor.device
+        return "cpu"
+
+    def _vocoder_input(self, mel_postnet_spec: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
+        """Convert a TTS model output spectrogram to the vocoder input.
+
+        The spectrogram is moved to the vocoder device and rescaled there in its own precision, so the TTS model
+        outputs go to the vocoder without a round trip through numpy.
+
+        Args:
+            mel_postnet_spec (Union[torch.Tensor, np.ndarray]): spectrogram normalized by the TTS audio config.
+
+        Shapes:
+            - mel_postnet_spec: :math:`[T, C]`
+            - Tensor: :math:`[1, C, T']`
+        """
+        from TTS.utils.audio.torch_transforms import TorchSpecNormalizer  # pylint: disable=import-outside-toplevel
+        from TTS.vocoder.utils.generic_utils import interpolate_vocoder_input  # pylint: disable=import-outside-toplevel
+
+        if self._tts_normalizer is None:
+            self._tts_normalizer = TorchSpecNormalizer(self.tts_model.ap)
+            self._vocoder_normalizer = TorchSpecNormalizer(self.vocoder_ap)
+        spec = torch.as_tensor(mel_postnet_spec, device=self.vocoder_device).T
+        if not spec.is_floating_point():
+            spec = spec.float()
+        # denormalize tts output based on tts audio config
+        spec = self._tts_normalizer.denormalize(spec)
+        # renormalize spectrogram based on vocoder config
+        vocoder_input = self._vocoder_normalizer.normalize(spec)
+        # compute scale factor for possible sample rate mismatch
+        scale_factor = [
+            1,
+            self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
+        ]
+        if scale_factor[1] != 1:
+            print(" > interpolating tts model output.")
+            vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
+        else:
+            vocoder_input = vocoder_input.unsqueeze(0)
+        return vocoder_input
+
+    @staticmethod
+    def _batch_key(item: Dict):
+        d_vector = item["d_vector"]
+        if d_vector is not None:
+            d_vector = np.asarray(d_vector, dtype=np.float32).tobytes()
+        return item["speaker_id"], item["language_id"], d_vector
+
+    def _batch_vocode(self, vocoder_inputs: List[torch.Tensor]) -> List[np.ndarray]:
+        """Run the vocoder on a list of inputs in one padded pass.
+
+        Vocoders without `inference_padding` run the inputs one by one since their output length is not known.
+        """
+        padding = getattr(self.vocoder_model, "inference_padding", None)
+        if padding is None:
+            return [
+                self.vocoder_model.inference(x.to(self.vocoder_device)).cpu().numpy().squeeze() for x in vocoder_inputs
+            ]
+        lengths = [x.shape[-1] for x in vocoder_inputs]
+        max_length = max(lengths)
+        # pad with the last frame like the vocoder's own `replicate` padding
+        batch = torch.cat([F.pad(x, (0, max_length - x.shape[-1]), mode="replicate") for x in vocoder_inputs])
+        waveforms = self.vocoder_model.inference(batch.to(self.vocoder_device)).cpu()
+        samples_per_frame = waveforms.shape[-1] // (max_length + 2 * padding)
+        return [
+            waveforms[idx, 0, : (length + 2 * padding) * samples_per_frame].numpy()
+            for idx, length in enumerate(lengths)
+        ]
+
+    def _batch_tts(self, items: List[Dict]) -> List[np.ndarray]:
+        """Synthesize the sentences collected by `self.batch_scheduler`. They share the same speaker and language."""
+        outputs = batch_synthesis(
+            model=self.tts_model,
+            texts=[item["text"] for item in items],
+            CONFIG=self.tts_config,
+            use_cuda=self.use_cuda,
+            speaker_id=items[0]["speaker_id"],
+            d_vector=items[0]["d_vector"],
+            language_id=items[0]["language_id"],
+            token_ids=[item["token_ids"] for item in items] if "token_ids" in items[0] else None,
+        )
+        if outputs[0].ndim == 1:  # end-to-end model
+            return outputs
+        if self.vocoder_model is None:
+            return [inv_spectrogram(spec, self.tts_model.ap, self.tts_config) for spec in outputs]
+        return self._batch_vocode([self._vocoder_input(spec) for spec in outputs])
+
+    def _tts_sentences_batched(
+        self, sens: List[str], speaker_id=None, speaker_embedding=None, language_id=None, batch_size: int = 8
+    ) -> List[np.ndarray]:
+        """Synthesize sentences in padded batches of up to `batch_size` sentences.
+
+        All the sentences are tokenized up front with one phonemizer call and sorted by length, so each batch holds
+        sentences of similar lengths and wastes little padding in the TTS model and the vocoder.
+
+        Returns:
+            List[np.ndarray]: waveform of each sentence in the order of `sens`.
+        """
+        token_ids = batch_text_to_ids(self.tts_model, sens, language_id=language_id)
+        order = sorted(range(len(sens)), key=lambda idx: len(token_ids[idx]), reverse=True)
+        waveforms = [None] * len(sens)
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            items = [
+                {
+                    "text": sens[idx],
+                    "token_ids": token_ids[idx],
+                    "speaker_id": speaker_id,
+                    "d_vector": speaker_embedding,
+                    "language_id": language_id,
+                }
+                for idx in batch
+            ]
+            for idx, waveform in zip(batch, self._batch_tts(items)):
+                waveforms[idx] = waveform
+        return waveforms
+
     def split_into_sentences(self, text) -> List[str]:
         """Split give text into sentences.
 
@@ -243,6 +440,8 @@ class Synthesizer(nn.Module):
             path (str): output path to save the waveform.
             pipe_out (BytesIO, optional): Flag to stdout the generated TTS wav file for shell pipe.
         """
+        from TTS.utils.audio.numpy_transforms import save_wav  # pylint: disable=import-outside-toplevel
+
         # if tensor convert to numpy
         if torch.is_tensor(wav):
             wav = wav.cpu().numpy()
@@ -254,54 +453,13 @@ class Synthesizer(nn.Module):
         output_wav = self.vc_model.voice_conversion(source_wav, target_wav)
         return output_wav
 
-    def tts(
-        self,
-        text: str = "",
-        speaker_name: str = "",
-        language_name: str = "",
-        speaker_wav=None,
-        style_wav=None,
-        style_text=None,
-        reference_wav=None,
-        reference_speaker_name=None,
-        split_sentences: bool = True,
-        **kwargs,
-    ) -> List[int]:
-        """🐸 TTS magic. Run all the models and generate speech.
+    def _get_speaker_and_language(self, speaker_name: str = "", language_name: str = "", speaker_wav=None):
+        """Get the speaker and language inputs of the TTS model from their names or the speaker clip.
 
-        Args:
-            text (str): input text.
-            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
-            language_name (str, optional): language id for multi-language models. Defaults to "".
-            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
-            style_wav ([type], optional): style waveform for GST. Defaults to None.
-            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
-            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
-            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
-            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
-            **kwargs: additional arguments to pass to the TTS model.
         Returns:
-            List[int]: [description]
+            Tuple[int, np.ndarray, int]: speaker id, speaker embedding and language id. Unused ones are None.
         """
-        start_time = time.time()
-        wavs = []
-
-        if not text and not reference_wav:
-            raise ValueError(
-                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
-            )
-
-        if text:
-            sens = [text]
-            if split_sentences:
-                print(" > Text splitted to sentences.")
-                sens = self.split_into_sentences(text)
-            print(sens)
-
         # handle multi-speaker
-        if "voice_dir" in kwargs:
-            self.voice_dir = kwargs["voice_dir"]
-            kwargs.pop("voice_dir")
         speaker_embedding = None
         speaker_id = None
         if self.tts_speakers_file or hasattr(self.tts_model.speaker_manager, "name_to_id"):
@@ -372,66 +530,204 @@ class Synthesizer(nn.Module):
             and self.tts_model.speaker_manager.encoder_ap is not None
         ):
             speaker_embedding = self.tts_model.speaker_manager.compute_embedding_from_clip(speaker_wav)
+        return speaker_id, speaker_embedding, language_id
 
-        vocoder_device = "cpu"
+    def _tts_sentence(
+        self,
+        sen: str,
+        speaker_name: str = "",
+        speaker_id: int = None,
+        speaker_wav=None,
+        speaker_embedding=None,
+        language_name: str = "",
+        language_id: int = None,
+        style_wav=None,
+        style_text=None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Synthesize a single sentence with the TTS model and the vocoder."""
         use_gl = self.vocoder_model is None
+        outputs = self._tts_sentence_outputs(
+            sen,
+            speaker_name=speaker_name,
+            speaker_id=speaker_id,
+            speaker_wav=speaker_wav,
+            speaker_embedding=speaker_embedding,
+            language_name=language_name,
+            language_id=language_id,
+            style_wav=style_wav,
+            style_text=style_text,
+            **kwargs,
+        )
+        waveform = outputs["wav"]
         if not use_gl:
-            vocoder_device = next(self.vocoder_model.parameters()).device
-        if self.use_cuda:
-            vocoder_device = "cuda"
+            vocoder_input = self._vocoder_input(outputs["outputs"]["model_outputs"][0].detach())
+            # run vocoder model
+            # [1, T, C]
+            waveform = self.vocoder_model.inference(vocoder_input.to(self.vocoder_device))
+        if torch.is_tensor(waveform) and waveform.device != torch.device("cpu") and not use_gl:
+            waveform = waveform.cpu()
+        if not use_gl:
+            waveform = waveform.numpy()
+        return waveform.squeeze()
+
+    @property
+    def can_stream_vocoder(self) -> bool:
+        """Whether the vocoder can run on chunks of the spectrogram (HiFiGAN and MelGAN vocoders)."""
+        generator = getattr(self.vocoder_model, "model_g", self.vocoder_model)
+        return hasattr(generator, "inference_stream") and not hasattr(self.tts_model, "synthesize")
+
+    def _tts_sentence_stream(self, sen: str, vocoder_chunk_size: int = 64, **kwargs) -> Iterator[np.ndarray]:
+        """Synthesize a single sentence and yield the vocoder output as soon as each chunk of `vocoder_chunk_size`
+        spectrogram frames is vocoded. Without a streaming vocoder, the whole sentence is yielded at once.
+
+        The concatenated chunks match the output of `_tts_sentence()`.
+        """
+        if not self.can_stream_vocoder or vocoder_chunk_size < 1:
+            yield self._tts_sentence(sen, **kwargs)
+            return
+        outputs = self._tts_sentence_outputs(sen, **kwargs)
+        vocoder_input = self._vocoder_input(outputs["outputs"]["model_outputs"][0].detach())
+        for chunk in self.vocoder_model.inference_stream(
+            vocoder_input.to(self.vocoder_device), chunk_size=vocoder_chunk_size
+        ):
+            yield chunk.cpu().numpy().reshape(-1)
+
+    def _tts_sentence_outputs(
+        self,
+        sen: str,
+        speaker_name: str = "",
+        speaker_id: int = None,
+        speaker_wav=None,
+        speaker_embedding=None,
+        language_name: str = "",
+        language_id: int = None,
+        style_wav=None,
+        style_text=None,
+        **kwargs,
+    ) -> Dict:
+        """Run the TTS model on a single sentence and return its outputs."""
+        use_gl = self.vocoder_model is None
+        if hasattr(self.tts_model, "synthesize"):
+            outputs = self.tts_model.synthesize(
+                text=sen,
+                config=self.tts_config,
+                speaker_id=speaker_name,
+                voice_dirs=self.voice_dir,
+                d_vector=speaker_embedding,
+                speaker_wav=speaker_wav,
+                language=language_name,
+                **kwargs,
+            )
+        else:
+            # synthesize voice
+            outputs = synthesis(
+                model=self.tts_model,
+                text=sen,
+                CONFIG=self.tts_config,
+                use_cuda=self.use_cuda,
+                speaker_id=speaker_id,
+                style_wav=style_wav,
+                style_text=style_text,
+                use_griffin_lim=use_gl,
+                d_vector=speaker_embedding,
+                language_id=language_id,
+            )
+        return outputs
+
+    def tts(
+        self,
+        text: str = "",
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        reference_wav=None,
+        reference_speaker_name=None,
+        split_sentences: bool = True,
+        sentence_batch_size: int = 1,
+        **kwargs,
+    ) -> List[int]:
+        """🐸 TTS magic. Run all the models and generate speech.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
+            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            sentence_batch_size (int, optional): synthesize the sentences in padded batches of this size, sorted by
+                length. It speeds up long texts. Only used by models with batched inference (`Vits`, `ForwardTTS`).
+                Defaults to 1, one sentence at a time.
+            **kwargs: additional arguments to pass to the TTS model.
+        Returns:
+            List[int]: [description]
+        """
+        start_time = time.time()
+        wavs = []
+
+        if not text and not reference_wav:
+            raise ValueError(
+                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
+            )
+
+        if text:
+            sens = [text]
+            if split_sentences:
+                print(" > Text splitted to sentences.")
+                sens = self.split_into_sentences(text)
+            print(sens)
+
+        # handle multi-speaker
+        if "voice_dir" in kwargs:
+            self.voice_dir = kwargs["voice_dir"]
+            kwargs.pop("voice_dir")
+        speaker_id, speaker_embedding, language_id = self._get_speaker_and_language(
+            speaker_name, language_name, speaker_wav
+        )
+
+        use_gl = self.vocoder_model is None
 
         if not reference_wav:  # not voice conversion
-            for sen in sens:
-                if hasattr(self.tts_model, "synthesize"):
-                    outputs = self.tts_model.synthesize(
-                        text=sen,
-                        config=self.tts_config,
-                        speaker_id=speaker_name,
-                        voice_dirs=self.voice_dir,
-                        d_vector=speaker_embedding,
-                        speaker_wav=speaker_wav,
-                        language=language_name,
-                        **kwargs,
-                    )
+            batched_waveforms = None
+            can_batch = _supports_batch_inference(self.tts_model) and style_wav is None and style_text is None
+            if can_batch and sentence_batch_size > 1:
+                batched_waveforms = self._tts_sentences_batched(
+                    sens, speaker_id, speaker_embedding, language_id, batch_size=sentence_batch_size
+                )
+            elif self.batch_scheduler is not None and can_batch:
+                batched_waveforms = self.batch_scheduler.run(
+                    [
+                        {
+                            "text": sen,
+                            "speaker_id": speaker_id,
+                            "d_vector": speaker_embedding,
+                            "language_id": language_id,
+                        }
+                        for sen in sens
+                    ]
+                )
+            for idx, sen in enumerate(sens):
+                if batched_waveforms is not None:
+                    waveform = batched_waveforms[idx]
                 else:
-                    # synthesize voice
-                    outputs = synthesis(
-                        model=self.tts_model,
-                        text=sen,
-                        CONFIG=self.tts_config,
-                        use_cuda=self.use_cuda,
+                    waveform = self._tts_sentence(
+                        sen,
+                        speaker_name=speaker_name,
                         speaker_id=speaker_id,
+                        speaker_wav=speaker_wav,
+                        speaker_embedding=speaker_embedding,
+                        language_name=language_name,
+                        language_id=language_id,
                         style_wav=style_wav,
                         style_text=style_text,
-                        use_griffin_lim=use_gl,
-                        d_vector=speaker_embedding,
-                        language_id=language_id,
+                        **kwargs,
                     )
-                waveform = outputs["wav"]
-                if not use_gl:
-                    mel_postnet_spec = outputs["outputs"]["model_outputs"][0].detach().cpu().numpy()
-                    # denormalize tts output based on tts audio config
-                    mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                    # renormalize spectrogram based on vocoder config
-                    vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                    # compute scale factor for possible sample rate mismatch
-                    scale_factor = [
-                        1,
-                        self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                    ]
-                    if scale_factor[1] != 1:
-                        print(" > interpolating tts model output.")
-                        vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                    else:
-                        vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
-                    # run vocoder model
-                    # [1, T, C]
-                    waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
-                if torch.is_tensor(waveform) and waveform.device != torch.device("cpu") and not use_gl:
-                    waveform = waveform.cpu()
-                if not use_gl:
-                    waveform = waveform.numpy()
-                waveform = waveform.squeeze()
 
                 # trim silence
                 if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
@@ -473,24 +769,10 @@ class Synthesizer(nn.Module):
             )
             waveform = outputs
             if not use_gl:
-                mel_postnet_spec = outputs[0].detach().cpu().numpy()
-                # denormalize tts output based on tts audio config
-                mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                # renormalize spectrogram based on vocoder config
-                vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                # compute scale factor for possible sample rate mismatch
-                scale_factor = [
-                    1,
-                    self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                ]
-                if scale_factor[1] != 1:
-                    print(" > interpolating tts model output.")
-                    vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                else:
-                    vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
+                vocoder_input = self._vocoder_input(outputs[0].detach())
                 # run vocoder model
                 # [1, T, C]
-                waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
+                waveform = self.vocoder_model.inference(vocoder_input.to(self.vocoder_device))
             if torch.is_tensor(waveform) and waveform.device != torch.device("cpu"):
                 waveform = waveform.cpu()
             if not use_gl:
@@ -503,3 +785,98 @@ class Synthesizer(nn.Module):
         print(f" > Processing time: {process_time}")
         print(f" > Real-time factor: {process_time / audio_time}")
         return wavs
+
+    def tts_stream(
+        self,
+        text: str,
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        split_sentences: bool = True,
+        vocoder_chunk_size: int = 64,
+        **kwargs,
+    ) -> Iterator[np.ndarray]:
+        """Run all the models and yield the speech in chunks as soon as they are ready.
+
+        Models with `synthesize_stream()` (XTTS) yield chunks within each sentence. Spectrogram models with a HiFiGAN
+        or MelGAN vocoder yield a chunk per `vocoder_chunk_size` spectrogram frames. The others yield one chunk per
+        sentence, so the time to the first audio only depends on the first sentence. The concatenated chunks match
+        the output of `tts()`.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            vocoder_chunk_size (int, optional): number of spectrogram frames vocoded at a time. 0 vocodes whole
+                sentences. Defaults to 64.
+            **kwargs: additional arguments to pass to the TTS model.
+
+        Yields:
+            np.ndarray: waveform chunk.
+        """
+        if not text:
+            raise ValueError("You need to define `text` to stream speech with the Coqui TTS API.")
+        sens = self.split_into_sentences(text) if split_sentences else [text]
+
+        if "voice_dir" in kwargs:
+            self.voice_dir = kwargs["voice_dir"]
+            kwargs.pop("voice_dir")
+        speaker_id, speaker_embedding, language_id = self._get_speaker_and_language(
+            speaker_name, language_name, speaker_wav
+        )
+        silence = np.zeros(10000, dtype=np.float32)
+
+        if hasattr(self.tts_model, "synthesize_stream"):
+            for sen in sens:
+                for chunk in self.tts_model.synthesize_stream(
+                    text=sen,
+                    config=self.tts_config,
+                    speaker_wav=speaker_wav,
+                    language=language_name,
+                    speaker_id=speaker_name or None,
+                    **kwargs,
+                ):
+                    if torch.is_tensor(chunk):
+                        chunk = chunk.cpu().numpy()
+                    yield chunk
+                yield silence
+            return
+
+        futures = None
+        if self.batch_scheduler is not None and style_wav is None and style_text is None:
+            # queue all the sentences at once and yield them in order as the batches are done
+            futures = [
+                self.batch_scheduler.submit(
+                    {"text": sen, "speaker_id": speaker_id, "d_vector": speaker_embedding, "language_id": language_id}
+                )
+                for sen in sens
+            ]
+        for idx, sen in enumerate(sens):
+            if futures is not None:
+                chunks = [futures[idx].result()]
+            else:
+                chunks = self._tts_sentence_stream(
+                    sen,
+                    vocoder_chunk_size=vocoder_chunk_size,
+                    speaker_name=speaker_name,
+                    speaker_id=speaker_id,
+                    speaker_wav=speaker_wav,
+                    speaker_embedding=speaker_embedding,
+                    language_name=language_name,
+                    language_id=language_id,
+                    style_wav=style_wav,
+                    style_text=style_text,
+                    **kwargs,
+                )
+            # trim silence
+            if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
+                chunks = trim_silence_stream((np.asarray(chunk) for chunk in chunks), self.tts_model.ap)
+            for chunk in chunks:
+                yield np.asarray(chunk)
+            yield silence
@@ -14,7 +14,7 @@ from torch.nn.utils.parametrize import remove_parametrizations
 import TTS.vc.modules.freevc.commons as commons
 import TTS.vc.modules.freevc.modules as modules
 from TTS.tts.utils.speakers import SpeakerManager
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vc.configs.freevc_config import FreeVCConfig
 from TTS.vc.models.base_vc import BaseVC
 from TTS.vc.modules.freevc.commons import get_padding, init_weights
@@ -554,7 +554,7 @@ class FreeVC(BaseVC):
 
     def load_checkpoint(self, config, checkpoint_path, eval=False, strict=True, cache=False):
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"], strict=strict)
+        self.load_state_dict(state["model"], strict=strict, assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
 
@@ -26,8 +26,17 @@ class BaseVocoderConfig(BaseTrainingConfig):
             Extra padding for the feature frames against convolution of the edge frames. Defaults to MISSING.
             Defaults to 0.
         use_cache (bool):
-            enable / disable in memory caching of the computed features. If the RAM is not enough, if may cause OOM.
-            Defaults to False.
+            enable / disable caching of the computed features. The features are shared by the data loader workers
+            through memory-mapped files. Defaults to False.
+        cache_path (str):
+            Folder of the feature cache. The features cached by a previous run are reused, so clear it when the audio
+            settings change. Defaults to None, a temporary folder in shared memory removed at the end of the training.
+        cache_max_size (int):
+            Maximum size of the feature cache in MB. The features of the items that do not fit are computed on the
+            fly. Defaults to 4096.
+        precompute_cache (bool):
+            Fill the feature cache with all the items using the data loader workers before the training, instead of
+            filling it as the items are loaded in the first epoch. Defaults to False.
         epochs (int):
             Number of training epochs to. Defaults to 10000.
         wd (float):
@@ -48,7 +57,10 @@ class BaseVocoderConfig(BaseTrainingConfig):
     seq_len: int = 1000  # signal length used in training.
     pad_short: int = 0  # additional padding for short wavs
     conv_pad: int = 0  # additional padding against convolutions applied to spectrograms
-    use_cache: bool = False  # use in memory cache to keep the computed features. This might cause OOM.
+    use_cache: bool = False  # cache the computed features in memory-mapped files shared by the loader workers.
+    cache_path: str = None
+    cache_max_size: int = 4096
+    precompute_cache: bool = False
     # OPTIMIZER
     epochs: int = 10000  # total number of epochs to train.
     wd: float = 0.0  # Weight decay weight.
@@ -124,6 +136,10 @@ class BaseGANVocoderConfig(BaseVocoderConfig):
         diff_samples_for_G_and_D (bool):
             enable / disable use of different training samples for the generator and the discriminator iterations.
             Enabling it results in slower iterations but faster convergance in some cases. Defaults to False.
+        compute_spec_on_device (bool):
+            If True the data loader returns the pre-emphasized and padded audio of the segments instead of their mel
+            spectrograms and the model computes the mel spectrograms of the batch on the training device. It needs the
+            audio files only, not precomputed features. Defaults to False.
     """
 
     model: str = "gan"
@@ -180,3 +196,4 @@ class BaseGANVocoderConfig(BaseVocoderConfig):
     use_pqmf: bool = False  # enable/disable using pqmf for multi-band training. (Multi-band MelGAN)
     steps_to_start_discriminator = 0  # start training the discriminator after this number of steps.
     diff_samples_for_G_and_D: bool = False  # use different samples for G and D training steps.
+    compute_spec_on_device: bool = False  # compute the mel spectrograms of the batches on the training device.
@@ -24,6 +24,9 @@ def setup_dataset(config: Coqpit, ap: AudioProcessor, is_eval: bool, data_items:
             return_segments=not is_eval,
             use_noise_augment=config.use_noise_augment,
             use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
+            compute_spec_on_device=config.get("compute_spec_on_device", False),
             verbose=verbose,
         )
         dataset.shuffle_mapping()
@@ -39,6 +42,8 @@ def setup_dataset(config: Coqpit, ap: AudioProcessor, is_eval: bool, data_items:
             return_segments=True,
             use_noise_augment=False,
             use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
             verbose=verbose,
         )
     elif config.model.lower() == "wavernn":
@@ -52,6 +57,9 @@ def setup_dataset(config: Coqpit, ap: AudioProcessor, is_eval: bool, data_items:
             mulaw=config.model_params.mulaw,
             is_training=not is_eval,
             verbose=verbose,
+            use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
         )
     else:
         raise ValueError(f" [!] Dataset for model {config.model.lower()} cannot be found.")
@@ -0,0 +1,129 @@
+import hashlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Callable, List, Optional
+
+import numpy as np
+from torch.utils.data import DataLoader, Dataset
+from tqdm import tqdm
+
+
+def _remove_cache_folder(cache_path, owner_pid):
+    # forked data loader workers inherit the finalizer, only the process that created the folder removes it
+    if os.getpid() == owner_pid:
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+class _FillDataset(Dataset):
+    """Load the items of a dataset to fill its cache without sending the features back to the main process."""
+
+    def __init__(self, load_fn, num_items):
+        self.load_fn = load_fn
+        self.num_items = num_items
+
+    def __len__(self):
+        return self.num_items
+
+    def __getitem__(self, idx):
+        self.load_fn(idx)
+        return idx
+
+
+class FeatureCache:
+    """Cache of the features of the dataset items shared by all the data loader workers.
+
+    The features of an item are saved as `.npy` files by the first process loading the item and memory-mapped by the
+    processes reading them afterwards. So all the workers read the same copy of the features from the page cache,
+    without copying them or sending them between processes. By default the files are written in a temporary folder in
+    shared memory, `/dev/shm` if it exists, that is removed with the cache.
+
+    The cache stops growing when it reaches `max_size` or when there is no space left in its folder. The items that
+    are not cached are computed on the fly as before.
+
+    Args:
+        cache_path (str): Folder of the cache. Items cached in the folder by a previous run are reused, so the folder
+            must be cleared when the audio settings change. Defaults to None, a temporary folder.
+        max_size (int): Maximum size of the cache in bytes. Defaults to None, no limit.
+
+    Example:
+        >>> cache = FeatureCache(max_size=4 * 2**30)
+        >>> features = cache.get(wav_path)
+        >>> if features is None:
+        >>>     features = compute_features(wav_path)
+        >>>     cache.put(wav_path, features)
+    """
+
+    def __init__(self, cache_path: str = None, max_size: int = None):
+        if cache_path is None:
+            shm_path = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            cache_path = tempfile.mkdtemp(prefix="tts_feature_cache_", dir=shm_path)
+            self._finalizer = weakref.finalize(self, _remove_cache_folder, cache_path, os.getpid())
+        os.makedirs(cache_path, exist_ok=True)
+        self.cache_path = cache_path
+        self.max_size = max_size
+        # shared by the forked workers
+        self._size = multiprocessing.Value("q", self._folder_size())
+        self._full = multiprocessing.Value("b", 0)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_finalizer", None)
+        return state
+
+    def _folder_size(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.cache_path) if entry.name.endswith(".npy"))
+
+    @property
+    def size(self) -> int:
+        """Number of bytes used by the cache."""
+        return self._size.value
+
+    def _file_path(self, key: str, idx: int) -> str:
+        name = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_path, f"{name}_{idx}.npy")
+
+    def get(self, key: str) -> Optional[List[np.ndarray]]:
+        """Return the memory-mapped features of `key`, or None if they are not cached."""
+        arrays = []
+        while True:
+            try:
+                arrays.append(np.load(self._file_path(key, len(arrays)), mmap_mode="r"))
+            except FileNotFoundError:
+                # the first array is written last, so the others are complete when it exists
+                return arrays or None
+
+    def put(self, key: str, arrays: List[np.ndarray]) -> bool:
+        """Save the features of `key` if the cache is not full. Return True if they are cached."""
+        nbytes = sum(array.nbytes for array in arrays)
+        with self._size.get_lock():
+            if self._full.value:
+                return False
+            if self.max_size is not None and self._size.value + nbytes > self.max_size:
+                self._full.value = 1
+                print(f" > Feature cache reached its maximum size of {self.max_size / 2**20:.0f}MB.")
+                return False
+            self._size.value += nbytes
+        for idx in reversed(range(len(arrays))):
+            file_path = self._file_path(key, idx)
+            temp_path = f"{file_path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    np.save(f, arrays[idx])
+                os.replace(temp_path, file_path)
+            except OSError as e:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                self._full.value = 1
+                print(f" > Feature cache {self.cache_path} is full: {e}")
+                return False
+        return True
+
+    def fill(self, load_fn: Callable[[int], None], num_items: int, num_workers: int = 0):
+        """Fill the cache by calling `load_fn` for each item in `num_workers` data loader workers."""
+        loader = DataLoader(_FillDataset(load_fn, num_items), batch_size=None, num_workers=num_workers)
+        for _ in tqdm(loader, total=num_items):
+            pass
+        print(f" > Feature cache {self.cache_path} is filled with {self.size / 2**20:.1f}MB.")
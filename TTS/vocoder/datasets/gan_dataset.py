@@ -1,18 +1,27 @@
 import glob
 import os
 import random
-from multiprocessing import Manager
 
 import numpy as np
 import torch
 from torch.utils.data import Dataset
 
+from TTS.utils.audio.manifest import get_audio_manifest
+from TTS.vocoder.datasets.feature_cache import FeatureCache
+
 
 class GANDataset(Dataset):
     """
     GAN Dataset searchs for all the wav files under root path
     and converts them to acoustic features on the fly and returns
     random segments of (audio, feature) couples.
+
+    If `use_cache` is True, the (audio, feature) couples are kept in a `FeatureCache` shared by the data loader workers,
+    in `cache_path` or in a temporary folder in shared memory, up to `cache_max_size` MB.
+
+    If `compute_spec_on_device` is True, the features are not computed. The (feature, audio) couples have the
+    pre-emphasized and padded audio of the segment in place of the feature, and the model computes the mel
+    spectrogram segment on its device with `TorchSpectrogram`.
     """
 
     def __init__(
@@ -28,6 +37,9 @@ class GANDataset(Dataset):
         return_segments=True,
         use_noise_augment=False,
         use_cache=False,
+        cache_path=None,
+        cache_max_size=None,
+        compute_spec_on_device=False,
         verbose=False,
     ):
         super().__init__()
@@ -42,10 +54,15 @@ class GANDataset(Dataset):
         self.is_training = is_training
         self.return_segments = return_segments
         self.use_cache = use_cache
+        self.cache_path = cache_path
+        self.cache_max_size = cache_max_size
+        self.compute_spec_on_device = compute_spec_on_device
         self.use_noise_augment = use_noise_augment
         self.verbose = verbose
 
         assert seq_len % hop_len == 0, " [!] seq_len has to be a multiple of hop_len."
+        if compute_spec_on_device and not self.compute_feat:
+            raise ValueError(" [!] `compute_spec_on_device` computes the features from the audio files only.")
         self.feat_frame_len = seq_len // hop_len + (2 * conv_pad)
 
         # map G and D instances
@@ -57,14 +74,23 @@ class GANDataset(Dataset):
             self.create_feature_cache()
 
     def create_feature_cache(self):
-        self.manager = Manager()
-        self.cache = self.manager.list()
-        self.cache += [None for _ in range(len(self.item_list))]
+        max_size = self.cache_max_size * 2**20 if self.cache_max_size is not None else None
+        self.cache = FeatureCache(self.cache_path, max_size)
+
+    def precompute_cache(self, num_workers=0):
+        """Fill the feature cache before the training instead of on the first epoch."""
+        self.cache.fill(self.load_features, len(self), num_workers)
 
     @staticmethod
     def find_wav_files(path):
         return glob.glob(os.path.join(path, "**", "*.wav"), recursive=True)
 
+    @property
+    def lengths(self):
+        """Number of samples of the audio files at the sample rate of the audio processor, before trimming."""
+        wav_paths = [item if self.compute_feat else item[0] for item in self.item_list]
+        return [int(duration * self.ap.sample_rate) for duration in get_audio_manifest().durations(wav_paths)]
+
     def __len__(self):
         return len(self.item_list)
 
@@ -104,29 +130,73 @@ class GANDataset(Dataset):
     def shuffle_mapping(self):
         random.shuffle(self.G_to_D_mappings)
 
-    def load_item(self, idx):
-        """load (audio, feat) couple"""
-        if self.compute_feat:
+    def load_features(self, idx):
+        """Load the (audio, feature) couple of an item from the cache or compute it."""
+        wavpath = self.item_list[idx] if self.compute_feat else self.item_list[idx][0]
+        # only the audio is cached when the model computes the features
+        key = f"{wavpath}:audio" if self.compute_spec_on_device else wavpath
+        if self.use_cache:
+            features = self.cache.get(key)
+            if features is not None:
+                return features if len(features) == 2 else (features[0], None)
+
+        if self.compute_spec_on_device:
+            audio = self.ap.load_wav(wavpath)
+            mel = None
+        elif self.compute_feat:
             # compute features from wav
-            wavpath = self.item_list[idx]
-            # print(wavpath)
-
-            if self.use_cache and self.cache[idx] is not None:
-                audio, mel = self.cache[idx]
-            else:
-                audio = self.ap.load_wav(wavpath)
-                mel = self.ap.melspectrogram(audio)
-                audio, mel = self._pad_short_samples(audio, mel)
+            audio = self.ap.load_wav(wavpath)
+            mel = self.ap.melspectrogram(audio)
         else:
             # load precomputed features
-            wavpath, feat_path = self.item_list[idx]
+            audio = self.ap.load_wav(wavpath)
+            mel = np.load(self.item_list[idx][1])
+        audio, mel = self._pad_short_samples(audio, mel)
+
+        if self.use_cache:
+            self.cache.put(key, [audio] if mel is None else [audio, mel])
+        return audio, mel
+
+    def load_stft_item(self, idx):
+        """Load the (stft input, audio) couple of an item for `compute_spec_on_device`.
+
+        The STFT input is the audio pre-emphasized and padded like in `AudioProcessor.melspectrogram()` and cut to the
+        frames of the segment, so the mel spectrogram computed by the model is the mel spectrogram segment.
+        """
+        audio, _ = self.load_features(idx)
+        # pad short samples to the frames of a segment
+        min_len = (self.feat_frame_len - 1) * self.hop_len
+        if audio.shape[0] < min_len:
+            audio = np.pad(audio, (0, min_len - audio.shape[0]), mode="constant", constant_values=0.0)
+        num_frames = audio.shape[0] // self.hop_len + 1
+
+        stft_input = self.ap.apply_preemphasis(audio) if self.ap.preemphasis != 0 else audio
+        stft_input = np.pad(stft_input, self.ap.fft_size // 2, mode=self.ap.stft_pad_mode)
+
+        # correct the audio length wrt padding applied in stft
+        audio = np.pad(audio, (0, self.hop_len), mode="edge")
+        audio = audio[: num_frames * self.hop_len]
 
-            if self.use_cache and self.cache[idx] is not None:
-                audio, mel = self.cache[idx]
-            else:
-                audio = self.ap.load_wav(wavpath)
-                mel = np.load(feat_path)
-                audio, mel = self._pad_short_samples(audio, mel)
+        mel_start, mel_end = 0, num_frames
+        if self.return_segments:
+            mel_start = random.randint(0, num_frames - self.feat_frame_len)
+            mel_end = mel_start + self.feat_frame_len
+            audio_start = mel_start * self.hop_len
+            audio = audio[audio_start : audio_start + self.seq_len]
+        stft_input = stft_input[mel_start * self.hop_len : (mel_end - 1) * self.hop_len + self.ap.fft_size]
+
+        audio = torch.from_numpy(audio).float().unsqueeze(0)
+        stft_input = torch.from_numpy(stft_input).float()
+
+        if self.use_noise_augment and self.is_training and self.return_segments:
+            audio = audio + (1 / 32768) * torch.randn_like(audio)
+        return (stft_input, audio)
+
+    def load_item(self, idx):
+        """load (audio, feat) couple"""
+        if self.compute_spec_on_device:
+            return self.load_stft_item(idx)
+        audio, mel = self.load_features(idx)
 
         # correct the audio length wrt padding applied in stft
         audio = np.pad(audio, (0, self.hop_len), mode="edge")
@@ -136,7 +206,8 @@ class GANDataset(Dataset):
         ), f" [!] {mel.shape[-1] * self.hop_len} vs {audio.shape[-1]}"
 
         audio = torch.from_numpy(audio).float().unsqueeze(0)
-        mel = torch.from_numpy(mel).float().squeeze(0)
+        # copy the mel spectrogram, it may be read-only if it comes from the cache
+        mel = torch.tensor(mel, dtype=torch.float32).squeeze(0)
 
         if self.return_segments:
             max_mel_start = mel.shape[1] - self.feat_frame_len
@@ -1,19 +1,24 @@
 import glob
 import os
 import random
-from multiprocessing import Manager
 from typing import List, Tuple
 
 import numpy as np
 import torch
 from torch.utils.data import Dataset
 
+from TTS.vocoder.datasets.feature_cache import FeatureCache
+
 
 class WaveGradDataset(Dataset):
     """
     WaveGrad Dataset searchs for all the wav files under root path
     and converts them to acoustic features on the fly and returns
     random segments of (audio, feature) couples.
+
+    If `use_cache` is True, the padded audio is kept in a `FeatureCache` shared by the data loader workers, in
+    `cache_path` or in a temporary folder in shared memory, up to `cache_max_size` MB. The features are computed from
+    the audio segments.
     """
 
     def __init__(
@@ -28,6 +33,8 @@ class WaveGradDataset(Dataset):
         return_segments=True,
         use_noise_augment=False,
         use_cache=False,
+        cache_path=None,
+        cache_max_size=None,
         verbose=False,
     ):
         super().__init__()
@@ -40,6 +47,8 @@ class WaveGradDataset(Dataset):
         self.is_training = is_training
         self.return_segments = return_segments
         self.use_cache = use_cache
+        self.cache_path = cache_path
+        self.cache_max_size = cache_max_size
         self.use_noise_augment = use_noise_augment
         self.verbose = verbose
 
@@ -52,9 +61,12 @@ class WaveGradDataset(Dataset):
             self.create_feature_cache()
 
     def create_feature_cache(self):
-        self.manager = Manager()
-        self.cache = self.manager.list()
-        self.cache += [None for _ in range(len(self.item_list))]
+        max_size = self.cache_max_size * 2**20 if self.cache_max_size is not None else None
+        self.cache = FeatureCache(self.cache_path, max_size)
+
+    def precompute_cache(self, num_workers=0):
+        """Fill the feature cache before the training instead of on the first epoch."""
+        self.cache.fill(self.load_audio, len(self), num_workers)
 
     @staticmethod
     def find_wav_files(path):
@@ -89,32 +101,39 @@ class WaveGradDataset(Dataset):
         self.return_segments = return_segments
         return samples
 
-    def load_item(self, idx):
-        """load (audio, feat) couple"""
-        # compute features from wav
+    def load_audio(self, idx):
+        """Load the padded audio of an item from the cache or from its file."""
         wavpath = self.item_list[idx]
+        # the audio is padded differently for the full clips of the test samples
+        use_cache = self.use_cache and self.return_segments
+        if use_cache:
+            features = self.cache.get(wavpath)
+            if features is not None:
+                return features[0]
 
-        if self.use_cache and self.cache[idx] is not None:
-            audio = self.cache[idx]
-        else:
-            audio = self.ap.load_wav(wavpath)
+        audio = self.ap.load_wav(wavpath)
 
-            if self.return_segments:
-                # correct audio length wrt segment length
-                if audio.shape[-1] < self.seq_len + self.pad_short:
-                    audio = np.pad(
-                        audio, (0, self.seq_len + self.pad_short - len(audio)), mode="constant", constant_values=0.0
-                    )
-                assert (
-                    audio.shape[-1] >= self.seq_len + self.pad_short
-                ), f"{audio.shape[-1]} vs {self.seq_len + self.pad_short}"
+        if self.return_segments:
+            # correct audio length wrt segment length
+            if audio.shape[-1] < self.seq_len + self.pad_short:
+                audio = np.pad(
+                    audio, (0, self.seq_len + self.pad_short - len(audio)), mode="constant", constant_values=0.0
+                )
+            assert (
+                audio.shape[-1] >= self.seq_len + self.pad_short
+            ), f"{audio.shape[-1]} vs {self.seq_len + self.pad_short}"
+
+        # correct the audio length wrt hop length
+        p = (audio.shape[-1] // self.hop_len + 1) * self.hop_len - audio.shape[-1]
+        audio = np.pad(audio, (0, p), mode="constant", constant_values=0.0)
 
-            # correct the audio length wrt hop length
-            p = (audio.shape[-1] // self.hop_len + 1) * self.hop_len - audio.shape[-1]
-            audio = np.pad(audio, (0, p), mode="constant", constant_values=0.0)
+        if use_cache:
+            self.cache.put(wavpath, [audio])
+        return audio
 
-            if self.use_cache:
-                self.cache[idx] = audio
+    def load_item(self, idx):
+        """load (audio, feat) couple"""
+        audio = self.load_audio(idx)
 
         if self.return_segments:
             max_start = len(audio) - self.seq_len
@@ -128,7 +147,8 @@ class WaveGradDataset(Dataset):
         mel = self.ap.melspectrogram(audio)
         mel = mel[..., :-1]  # ignore the padding
 
-        audio = torch.from_numpy(audio).float()
+        # copy the audio, it may be read-only if it comes from the cache
+        audio = torch.tensor(audio, dtype=torch.float32)
         mel = torch.from_numpy(mel).float().squeeze(0)
         return (mel, audio)
 
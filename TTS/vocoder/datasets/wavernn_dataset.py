@@ -3,16 +3,33 @@ import torch
 from torch.utils.data import Dataset
 
 from TTS.utils.audio.numpy_transforms import mulaw_encode, quantize
+from TTS.vocoder.datasets.feature_cache import FeatureCache
 
 
 class WaveRNNDataset(Dataset):
     """
     WaveRNN Dataset searchs for all the wav files under root path
     and converts them to acoustic features on the fly.
+
+    If `use_cache` is True, the (feature, input) couples are kept in a `FeatureCache` shared by the data loader
+    workers, in `cache_path` or in a temporary folder in shared memory, up to `cache_max_size` MB.
     """
 
     def __init__(
-        self, ap, items, seq_len, hop_len, pad, mode, mulaw, is_training=True, verbose=False, return_segments=True
+        self,
+        ap,
+        items,
+        seq_len,
+        hop_len,
+        pad,
+        mode,
+        mulaw,
+        is_training=True,
+        verbose=False,
+        return_segments=True,
+        use_cache=False,
+        cache_path=None,
+        cache_max_size=None,
     ):
         super().__init__()
         self.ap = ap
@@ -27,9 +44,20 @@ class WaveRNNDataset(Dataset):
         self.is_training = is_training
         self.verbose = verbose
         self.return_segments = return_segments
+        self.use_cache = use_cache
+        self.cache_path = cache_path
+        self.cache_max_size = cache_max_size
 
         assert self.seq_len % self.hop_len == 0
 
+        # cache acoustic features
+        if use_cache:
+            self.create_feature_cache()
+
+    def create_feature_cache(self):
+        max_size = self.cache_max_size * 2**20 if self.cache_max_size is not None else None
+        self.cache = FeatureCache(self.cache_path, max_size)
+
     def __len__(self):
         return len(self.item_list)
 
@@ -47,7 +75,27 @@ class WaveRNNDataset(Dataset):
         self.return_segments = return_segments
         return samples
 
+    def precompute_cache(self, num_workers=0):
+        """Fill the feature cache before the training instead of on the first epoch."""
+        self.cache.fill(self.load_item, len(self), num_workers)
+
     def load_item(self, index):
+        """Load the (feat, input) couple of an item from the cache or compute it."""
+        wavpath = self.item_list[index] if self.compute_feat else self.item_list[index][0]
+        # the audio is padded differently for the full clips of the test samples
+        use_cache = self.use_cache and self.return_segments
+        if use_cache:
+            features = self.cache.get(wavpath)
+            if features is not None:
+                mel, x_input = features
+                return mel, x_input, wavpath
+
+        mel, x_input, _ = self.compute_item(index)
+        if use_cache:
+            self.cache.put(wavpath, [mel, x_input])
+        return mel, x_input, wavpath
+
+    def compute_item(self, index):
         """
         load (audio, feat) couple if feature_path is set
         else compute it on the fly
@@ -1,5 +1,5 @@
 from inspect import signature
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
 import torch
@@ -10,7 +10,8 @@ from torch.utils.data.distributed import DistributedSampler
 from trainer.trainer_utils import get_optimizer, get_scheduler
 
 from TTS.utils.audio import AudioProcessor
-from TTS.utils.io import load_fsspec
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vocoder.datasets.gan_dataset import GANDataset
 from TTS.vocoder.layers.losses import DiscriminatorLoss, GeneratorLoss
 from TTS.vocoder.models import setup_discriminator, setup_generator
@@ -65,6 +66,23 @@ class GAN(BaseVocoder):
         """
         return self.model_g.inference(x)
 
+    def inference_stream(self, x: torch.Tensor, **kwargs) -> Iterator[torch.Tensor]:
+        """Run the generator's streaming inference pass if it has one.
+
+        Args:
+            x (torch.Tensor): Input tensor.
+            **kwargs: streaming parameters of the generator's `inference_stream()`.
+        Yields:
+            torch.Tensor: output waveform chunk.
+        """
+        yield from self.model_g.inference_stream(x, **kwargs)
+
+    def get_quantizable_modules(self) -> List[nn.Module]:
+        """Return the generator modules quantized by `TTS.utils.quantization.quantize_model()`."""
+        if not hasattr(self.model_g, "get_quantizable_modules"):
+            raise ValueError(f" [!] Quantization is not supported by `{self.model_g.__class__.__name__}`.")
+        return self.model_g.get_quantizable_modules()
+
     def train_step(self, batch: Dict, criterion: Dict, optimizer_idx: int) -> Tuple[Dict, Dict]:
         """Compute model outputs and the loss values. `optimizer_idx` selects the generator or the discriminator for
         network on the current pass.
@@ -245,7 +263,7 @@ class GAN(BaseVocoder):
         if "model_disc" in state:
             self.model_g.load_checkpoint(config, checkpoint_path, eval)
         else:
-            self.load_state_dict(state["model"])
+            self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
             if eval:
                 self.model_d = None
                 if hasattr(self.model_g, "remove_weight_norm"):
@@ -313,6 +331,20 @@ class GAN(BaseVocoder):
         x, y = batch
         return {"input": x, "waveform": y}
 
+    def format_batch_on_device(self, batch: Dict) -> Dict:
+        """Compute the mel spectrograms of the batch on the training device if `compute_spec_on_device` is set.
+
+        The inputs are the pre-emphasized and padded audio segments returned by `GANDataset.load_stft_item()`.
+        """
+        if not self.config.get("compute_spec_on_device", False):
+            return batch
+        if getattr(self, "torch_spec", None) is None:
+            self.torch_spec = TorchSpectrogram(self.ap)
+        for key in ["input", "input_disc"]:
+            if key in batch:
+                batch[key] = self.torch_spec.melspectrogram(batch[key], padded=True)
+        return batch
+
     def get_data_loader(  # pylint: disable=no-self-use, unused-argument
         self,
         config: Coqpit,
@@ -349,9 +381,14 @@ class GAN(BaseVocoder):
             return_segments=not is_eval,
             use_noise_augment=config.use_noise_augment,
             use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
+            compute_spec_on_device=config.get("compute_spec_on_device", False),
             verbose=verbose,
         )
         dataset.shuffle_mapping()
+        if config.use_cache and config.get("precompute_cache", False):
+            dataset.precompute_cache(config.num_eval_loader_workers if is_eval else config.num_loader_workers)
         sampler = DistributedSampler(dataset, shuffle=True) if num_gpus > 1 else None
         loader = DataLoader(
             dataset,
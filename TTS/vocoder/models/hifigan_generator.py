@@ -6,7 +6,8 @@ from torch.nn import functional as F
 from torch.nn.utils.parametrizations import weight_norm
 from torch.nn.utils.parametrize import remove_parametrizations
 
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
+from TTS.vocoder.utils.streaming import vocode_stream
 
 LRELU_SLOPE = 0.1
 
@@ -281,6 +282,25 @@ class HifiganGenerator(torch.nn.Module):
         c = torch.nn.functional.pad(c, (self.inference_padding, self.inference_padding), "replicate")
         return self.forward(c)
 
+    @torch.no_grad()
+    def inference_stream(self, c, chunk_size=64, context=16, crossfade=1):
+        """Run `inference()` on windows of `c` and yield the waveform chunk by chunk.
+
+        The concatenated chunks match the output of `inference()`. See `TTS.vocoder.utils.streaming.vocode_stream()`.
+
+        Args:
+            c (Tensor): conditioning input tensor.
+            chunk_size (int): number of frames vocoded at a time. Defaults to 64.
+            context (int): number of frames added on both sides of each chunk. Defaults to 16.
+            crossfade (int): number of frames crossfaded between chunks. Defaults to 1.
+
+        Shapes:
+            c: [B, C, T]
+        """
+        c = c.to(self.conv_pre.weight.device)
+        c = torch.nn.functional.pad(c, (self.inference_padding, self.inference_padding), "replicate")
+        yield from vocode_stream(self.forward, c, chunk_size=chunk_size, context=context, crossfade=crossfade)
+
     def remove_weight_norm(self):
         print("Removing weight norm...")
         for l in self.ups:
@@ -290,11 +310,15 @@ class HifiganGenerator(torch.nn.Module):
         remove_parametrizations(self.conv_pre, "weight")
         remove_parametrizations(self.conv_post, "weight")
 
+    def get_quantizable_modules(self):
+        """Return the modules quantized by `TTS.utils.quantization.quantize_model()`, the whole generator."""
+        return [self]
+
     def load_checkpoint(
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
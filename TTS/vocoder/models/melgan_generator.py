@@ -2,8 +2,9 @@ import torch
 from torch import nn
 from torch.nn.utils.parametrizations import weight_norm
 
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vocoder.layers.melgan import ResidualStack
+from TTS.vocoder.utils.streaming import vocode_stream
 
 
 class MelganGenerator(nn.Module):
@@ -76,6 +77,16 @@ class MelganGenerator(nn.Module):
         c = torch.nn.functional.pad(c, (self.inference_padding, self.inference_padding), "replicate")
         return self.layers(c)
 
+    @torch.no_grad()
+    def inference_stream(self, c, chunk_size=64, context=16, crossfade=1):
+        """Run `inference()` on windows of `c` and yield the waveform chunk by chunk.
+
+        The concatenated chunks match the output of `inference()`. See `TTS.vocoder.utils.streaming.vocode_stream()`.
+        """
+        c = c.to(self.layers[1].weight.device)
+        c = torch.nn.functional.pad(c, (self.inference_padding, self.inference_padding), "replicate")
+        yield from vocode_stream(self.layers, c, chunk_size=chunk_size, context=context, crossfade=crossfade)
+
     def remove_weight_norm(self):
         for _, layer in enumerate(self.layers):
             if len(layer.state_dict()) != 0:
@@ -88,7 +99,7 @@ class MelganGenerator(nn.Module):
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
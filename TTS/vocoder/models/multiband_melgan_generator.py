@@ -2,6 +2,7 @@ import torch
 
 from TTS.vocoder.layers.pqmf import PQMF
 from TTS.vocoder.models.melgan_generator import MelganGenerator
+from TTS.vocoder.utils.streaming import vocode_stream
 
 
 class MultibandMelganGenerator(MelganGenerator):
@@ -39,3 +40,19 @@ class MultibandMelganGenerator(MelganGenerator):
             cond_features, (self.inference_padding, self.inference_padding), "replicate"
         )
         return self.pqmf_synthesis(self.layers(cond_features))
+
+    @torch.no_grad()
+    def inference_stream(self, cond_features, chunk_size=64, context=16, crossfade=1):
+        """Run `inference()` on windows of `cond_features` and yield the waveform chunk by chunk. The PQMF synthesis
+        runs on each window, so `context` also covers the PQMF filter."""
+        cond_features = cond_features.to(self.layers[1].weight.device)
+        cond_features = torch.nn.functional.pad(
+            cond_features, (self.inference_padding, self.inference_padding), "replicate"
+        )
+        yield from vocode_stream(
+            lambda x: self.pqmf_synthesis(self.layers(x)),
+            cond_features,
+            chunk_size=chunk_size,
+            context=context,
+            crossfade=crossfade,
+        )
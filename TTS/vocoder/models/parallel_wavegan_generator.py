@@ -4,7 +4,7 @@ import numpy as np
 import torch
 from torch.nn.utils.parametrize import remove_parametrizations
 
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vocoder.layers.parallel_wavegan import ResidualBlock
 from TTS.vocoder.layers.upsample import ConvUpsample
 
@@ -156,7 +156,7 @@ class ParallelWaveganGenerator(torch.nn.Module):
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
@@ -11,7 +11,7 @@ from torch.utils.data import DataLoader
 from torch.utils.data.distributed import DistributedSampler
 from trainer.trainer_utils import get_optimizer, get_scheduler
 
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vocoder.datasets import WaveGradDataset
 from TTS.vocoder.layers.wavegrad import Conv1d, DBlock, FiLM, UBlock
 from TTS.vocoder.models.base_vocoder import BaseVocoder
@@ -222,7 +222,7 @@ class Wavegrad(BaseVocoder):
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
@@ -321,8 +321,12 @@ class Wavegrad(BaseVocoder):
             return_segments=True,
             use_noise_augment=False,
             use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
             verbose=verbose,
         )
+        if config.use_cache and config.get("precompute_cache", False):
+            dataset.precompute_cache(config.num_eval_loader_workers if is_eval else config.num_loader_workers)
         sampler = DistributedSampler(dataset) if num_gpus > 1 else None
         loader = DataLoader(
             dataset,
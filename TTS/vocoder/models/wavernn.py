@@ -14,7 +14,7 @@ from torch.utils.data.distributed import DistributedSampler
 from TTS.tts.utils.visual import plot_spectrogram
 from TTS.utils.audio import AudioProcessor
 from TTS.utils.audio.numpy_transforms import mulaw_decode
-from TTS.utils.io import load_fsspec
+from TTS.utils.io import is_safetensors_file, load_fsspec
 from TTS.vocoder.datasets.wavernn_dataset import WaveRNNDataset
 from TTS.vocoder.layers.losses import WaveRNNLoss
 from TTS.vocoder.models.base_vocoder import BaseVocoder
@@ -544,7 +544,7 @@ class Wavernn(BaseVocoder):
         self, config, checkpoint_path, eval=False, cache=False
     ):  # pylint: disable=unused-argument, redefined-builtin
         state = load_fsspec(checkpoint_path, map_location=torch.device("cpu"), cache=cache)
-        self.load_state_dict(state["model"])
+        self.load_state_dict(state["model"], assign=is_safetensors_file(checkpoint_path))
         if eval:
             self.eval()
             assert not self.training
@@ -624,7 +624,12 @@ class Wavernn(BaseVocoder):
             mulaw=config.model_args.mulaw,
             is_training=not is_eval,
             verbose=verbose,
+            use_cache=config.use_cache,
+            cache_path=config.get("cache_path", None),
+            cache_max_size=config.get("cache_max_size", None),
         )
+        if config.use_cache and config.get("precompute_cache", False):
+            dataset.precompute_cache(config.num_eval_loader_workers if is_eval else config.num_loader_workers)
         sampler = DistributedSampler(dataset, shuffle=True) if num_gpus > 1 else None
         loader = DataLoader(
             dataset,
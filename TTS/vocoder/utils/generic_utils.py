@@ -2,9 +2,7 @@ from typing import Dict
 
 import numpy as np
 import torch
-from matplotlib import pyplot as plt
 
-from TTS.tts.utils.visual import plot_spectrogram
 from TTS.utils.audio import AudioProcessor
 
 
@@ -15,13 +13,13 @@ def interpolate_vocoder_input(scale_factor, spec):
 
     Args:
         scale_factor (float): scale factor to interpolate the spectrogram
-        spec (np.array): spectrogram to be interpolated
+        spec (Union[np.array, torch.Tensor]): spectrogram to be interpolated. Tensors are interpolated on their device.
 
     Returns:
         torch.tensor: interpolated spectrogram.
     """
     print(" > before interpolation :", spec.shape)
-    spec = torch.tensor(spec).unsqueeze(0).unsqueeze(0)  # pylint: disable=not-callable
+    spec = torch.as_tensor(spec).unsqueeze(0).unsqueeze(0)
     spec = torch.nn.functional.interpolate(
         spec, scale_factor=scale_factor, recompute_scale_factor=True, mode="bilinear", align_corners=False
     ).squeeze(0)
@@ -41,6 +39,10 @@ def plot_results(y_hat: torch.tensor, y: torch.tensor, ap: AudioProcessor, name_
     Returns:
         Dict: output figures keyed by the name of the figures.
     """ """Plot vocoder model results"""
+    from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    from TTS.tts.utils.visual import plot_spectrogram  # pylint: disable=import-outside-toplevel
+
     if name_prefix is None:
         name_prefix = ""
 
@@ -0,0 +1,59 @@
+from typing import Callable, Iterator
+
+import torch
+
+
+def vocode_stream(
+    generate_fn: Callable[[torch.Tensor], torch.Tensor],
+    c: torch.Tensor,
+    chunk_size: int = 64,
+    context: int = 16,
+    crossfade: int = 1,
+) -> Iterator[torch.Tensor]:
+    """Run a convolutional vocoder on fixed-size windows of a spectrogram and yield the waveform chunk by chunk.
+
+    Each chunk of `chunk_size` frames is vocoded with `context` frames of the spectrogram on both sides and only the
+    samples of the chunk itself are kept. When `context` covers the receptive field of the vocoder, the samples are
+    the same as the ones of the full spectrogram. The last `crossfade` frames of samples of a chunk are linearly
+    crossfaded with the next one to hide any discontinuity left by a shorter context.
+
+    Args:
+        generate_fn (Callable[[torch.Tensor], torch.Tensor]): vocoder pass mapping `[B, C, T]` spectrograms to
+            `[B, 1, T * hop_length]` waveforms.
+        c (torch.Tensor): input spectrogram, padded like the full sequence inference pass.
+        chunk_size (int): number of frames vocoded at a time. Defaults to 64.
+        context (int): number of frames added on both sides of each chunk. Defaults to 16.
+        crossfade (int): number of frames crossfaded between chunks. Must not exceed `context`. Defaults to 1.
+
+    Yields:
+        torch.Tensor: waveform chunk of shape `[B, 1, T_chunk]`.
+
+    Shapes:
+        - c: :math:`[B, C, T]`
+    """
+    if chunk_size < 1 or context < crossfade or crossfade < 0:
+        raise ValueError(
+            f" [!] Invalid streaming parameters: chunk_size={chunk_size}, context={context}, crossfade={crossfade}."
+        )
+    num_frames = c.shape[-1]
+    tail = None
+    fade_in = None
+    for start in range(0, num_frames, chunk_size):
+        end = min(start + chunk_size, num_frames)
+        window_start = max(0, start - context)
+        window_end = min(num_frames, end + context)
+        o = generate_fn(c[:, :, window_start:window_end])
+        hop_length = o.shape[-1] // (window_end - window_start)
+        # keep the samples of the chunk and of the next frames to crossfade
+        fade_length = crossfade * hop_length if end < num_frames else 0
+        o = o[:, :, (start - window_start) * hop_length : (end - window_start) * hop_length + fade_length]
+        if tail is not None:
+            if fade_in is None or fade_in.shape[-1] != tail.shape[-1]:
+                fade_in = torch.linspace(0, 1, tail.shape[-1] + 2, device=o.device, dtype=o.dtype)[1:-1]
+            o = torch.cat([tail * (1 - fade_in) + o[:, :, : tail.shape[-1]] * fade_in, o[:, :, tail.shape[-1] :]], -1)
+        if fade_length > 0:
+            tail = o[:, :, -fade_length:]
+            o = o[:, :, :-fade_length]
+        else:
+            tail = None
+        yield o
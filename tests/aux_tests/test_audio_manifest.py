@@ -0,0 +1,56 @@
+import glob
+import os
+import shutil
+import unittest
+
+import mutagen
+
+from tests import get_tests_data_path, get_tests_input_path, get_tests_output_path
+from TTS.tts.configs.shared_configs import BaseDatasetConfig
+from TTS.tts.datasets import load_tts_samples
+from TTS.utils.audio.manifest import AudioManifest
+
+OUTPATH = os.path.join(get_tests_output_path(), "audio_manifest_tests")
+DATA_PATH = os.path.join(get_tests_data_path(), "ljspeech")
+
+
+class TestAudioManifest(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+        os.makedirs(OUTPATH)
+        self.db_path = os.path.join(OUTPATH, "manifest.db")
+        self.wav_files = sorted(
+            f for ext in ["wav", "mp3", "flac"] for f in glob.glob(os.path.join(DATA_PATH, "wavs", f"*.{ext}"))
+        )
+
+    def test_lengths(self):
+        manifest = AudioManifest(self.db_path, num_workers=4)
+        for wav_file, entry in zip(self.wav_files, manifest.get(self.wav_files)):
+            info = mutagen.File(wav_file).info
+            self.assertEqual(entry["num_samples"], int(info.length * info.sample_rate))
+            self.assertEqual(entry["sample_rate"], info.sample_rate)
+            self.assertAlmostEqual(entry["duration"], info.length, places=3)
+
+    def test_incremental_update(self):
+        manifest = AudioManifest(self.db_path)
+        self.assertEqual(manifest.update(self.wav_files), len(self.wav_files))
+        # a new process only reads the new and changed files
+        wav_file = os.path.join(OUTPATH, "example.wav")
+        shutil.copy(os.path.join(get_tests_input_path(), "example_1.wav"), wav_file)
+        manifest = AudioManifest(self.db_path)
+        self.assertEqual(manifest.update(self.wav_files + [wav_file]), 1)
+        self.assertEqual(AudioManifest(self.db_path).update(self.wav_files + [wav_file]), 0)
+
+        other_wav_file = os.path.join(DATA_PATH, "wavs", "LJ001-0001.wav")
+        shutil.copy(other_wav_file, wav_file)
+        manifest = AudioManifest(self.db_path)
+        self.assertEqual(manifest.update([wav_file]), 1)
+        self.assertEqual(manifest.lengths([wav_file]), manifest.lengths([other_wav_file]))
+
+    def test_load_tts_samples(self):
+        dataset_config = BaseDatasetConfig(formatter="coqui", meta_file_train="metadata_wav.csv", path=DATA_PATH)
+        samples, _ = load_tts_samples(dataset_config, eval_split=False, compute_lengths=True)
+        manifest = AudioManifest(self.db_path)
+        for item in samples:
+            self.assertEqual(item["audio_length"], manifest.lengths([item["audio_file"]])[0])
+            self.assertEqual(item["text_length"], len(item["text"]))
@@ -0,0 +1,67 @@
+import threading
+import unittest
+
+from TTS.utils.batch_scheduler import BatchScheduler
+
+
+class BatchSchedulerTest(unittest.TestCase):
+    def test_run(self):
+        batches = []
+
+        def _batch_fn(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        scheduler = BatchScheduler(_batch_fn, max_batch_size=4, max_wait_time=0.05)
+        self.assertEqual(scheduler.run([1, 2, 3, 4, 5]), [2, 4, 6, 8, 10])
+        self.assertEqual(sum(len(batch) for batch in batches), 5)
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        scheduler.close()
+
+    def test_concurrent_callers(self):
+        """Items from concurrent callers are batched together and each caller gets its own results back."""
+        scheduler = BatchScheduler(lambda items: [item.upper() for item in items], max_batch_size=8, max_wait_time=0.5)
+        results = {}
+
+        def _call(name):
+            results[name] = scheduler.run([f"{name}-a", f"{name}-b"])
+
+        threads = [threading.Thread(target=_call, args=(name,)) for name in ["x", "y", "z"]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for name in ["x", "y", "z"]:
+            self.assertEqual(results[name], [f"{name.upper()}-A", f"{name.upper()}-B"])
+        self.assertLess(scheduler.num_batches, 6)
+        scheduler.close()
+
+    def test_key_fn(self):
+        batches = []
+
+        def _batch_fn(items):
+            batches.append(items)
+            return items
+
+        scheduler = BatchScheduler(_batch_fn, max_batch_size=8, max_wait_time=0.05, key_fn=lambda item: item % 2)
+        self.assertEqual(scheduler.run([1, 2, 3, 4]), [1, 2, 3, 4])
+        for batch in batches:
+            self.assertEqual(len({item % 2 for item in batch}), 1)
+        scheduler.close()
+
+    def test_exception(self):
+        def _batch_fn(items):  # pylint: disable=unused-argument
+            raise RuntimeError("failed")
+
+        scheduler = BatchScheduler(_batch_fn)
+        with self.assertRaises(RuntimeError):
+            scheduler.run([1])
+        scheduler.close()
+
+    def test_close(self):
+        scheduler = BatchScheduler(lambda items: [item * 2 for item in items])
+        scheduler.close()
+        scheduler.close()
+        self.assertFalse(scheduler._thread.is_alive())  # pylint: disable=protected-access
+        # the items submitted after closing are run on their own
+        self.assertEqual(scheduler.run([1, 2]), [2, 4])
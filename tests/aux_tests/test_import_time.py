@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# `import TTS.api` may take this fraction of the time of `import torch`, which every entry point needs. Measuring it
+# relative to `torch` keeps the budget independent of the machine.
+RELATIVE_IMPORT_TIME_BUDGET = 0.5
+
+# seconds `import TTS.api` may take on top of `torch`, replaces the relative budget when set
+IMPORT_TIME_BUDGET = os.environ.get("TTS_IMPORT_TIME_BUDGET")
+
+# modules only needed by some models or at synthesis time, they must not be imported by `import TTS.api`
+LAZY_MODULES = [
+    "TTS.tts.models.vits",
+    "TTS.tts.models.xtts",
+    "TTS.tts.models.bark",
+    "TTS.tts.models.tortoise",
+    "TTS.tts.layers.losses",
+    "TTS.tts.layers.xtts",
+    "TTS.tts.layers.bark",
+    "TTS.tts.layers.tortoise",
+    "TTS.tts.utils.text",
+    "TTS.utils.audio",
+    "transformers",
+    "librosa",
+    "matplotlib",
+    "gruut",
+    "inflect",
+    "spacy",
+]
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_lazy_modules(self):
+        loaded = _run(f"import sys, TTS.api; print([m for m in {LAZY_MODULES} if m in sys.modules])")
+        self.assertEqual(loaded.strip(), "[]")
+
+    def test_import_time_budget(self):
+        code = (
+            "import time; start = time.perf_counter(); import numpy, torch; torch_end = time.perf_counter()\n"
+            "import TTS.api; print(torch_end - start, time.perf_counter() - torch_end)"
+        )
+        # best of a few runs to ignore the noise of the machine
+        times = [[float(t) for t in _run(code).split()] for _ in range(3)]
+        torch_time = min(t[0] for t in times)
+        import_time = min(t[1] for t in times)
+        if IMPORT_TIME_BUDGET is not None:
+            budget = float(IMPORT_TIME_BUDGET)
+        else:
+            budget = RELATIVE_IMPORT_TIME_BUDGET * torch_time
+        self.assertLess(import_time, budget, f"`import torch` takes {torch_time:.2f}s")
+
+    def test_lazy_phonemizers(self):
+        loaded = _run(
+            "import sys\n"
+            "from TTS.tts.utils.text.phonemizers import get_phonemizer_by_name\n"
+            "print([m for m in ['gruut', 'pypinyin', 'jamo', 'bangla'] if m in sys.modules])"
+        )
+        self.assertEqual(loaded.strip(), "[]")
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+from scipy.io import wavfile
+
+from TTS.server.jobs import JobQueue, JobWorker
+from TTS.server.pool import SynthesizerPool
+
+
+class FakeSynthesizer:
+    output_sample_rate = 16000
+
+    def __init__(self, fail_on: str = None):
+        self.fail_on = fail_on
+        self.calls = []
+        self.on_tts = None
+
+    @staticmethod
+    def split_into_sentences(text):
+        return [sen.strip() for sen in text.split(".") if sen.strip()]
+
+    def tts(self, text, split_sentences=True, speaker_name=""):  # pylint: disable=unused-argument
+        self.calls.append((text, speaker_name))
+        if text == self.fail_on:
+            raise RuntimeError("synthesis failed")
+        if self.on_tts is not None:
+            self.on_tts()
+        return list(np.linspace(-1, 1, 10 * len(text))) + [0] * 5
+
+
+class JobQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.jobs = JobQueue(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_run_job(self):
+        job_id = self.jobs.submit("One. Two two. Three", {"speaker_name": "p225"})
+        self.assertEqual(self.jobs.get(job_id)["status"], "queued")
+        synthesizer = FakeSynthesizer()
+        worker = JobWorker(self.jobs, SynthesizerPool(lambda: synthesizer))
+        worker.run_job(self.jobs.claim())
+        self.assertIsNone(self.jobs.claim())
+        job = self.jobs.get(job_id)
+        self.assertEqual((job["status"], job["num_sentences"], job["num_done"], job["progress"]), ("done", 3, 3, 1.0))
+        self.assertEqual(synthesizer.calls, [("One", "p225"), ("Two two", "p225"), ("Three", "p225")])
+        # the job audio is the same as synthesizing the whole text at once
+        sample_rate, wav = wavfile.read(self.jobs.audio_path(job_id))
+        target = np.concatenate([synthesizer.tts(sen) for sen in ["One", "Two two", "Three"]])
+        self.assertEqual(sample_rate, 16000)
+        np.testing.assert_allclose(wav / 32767, target, atol=1e-4)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, job_id)))
+
+    def test_resume(self):
+        job_id = self.jobs.submit("One. Two. Three. Four")
+        synthesizer = FakeSynthesizer()
+        worker = JobWorker(self.jobs, SynthesizerPool(lambda: synthesizer))
+        # stop after the second sentence
+        synthesizer.on_tts = lambda: len(synthesizer.calls) == 2 and worker.stop()
+        worker.run_job(self.jobs.claim())
+        self.assertEqual((self.jobs.get(job_id)["status"], self.jobs.get(job_id)["num_done"]), ("queued", 2))
+        # a crash leaves the job running, the restarted queue picks it up from its checkpoint
+        self.jobs.claim()
+        jobs = JobQueue(self.tmp_dir.name)
+        self.assertEqual(jobs.recover(), 1)
+        synthesizer = FakeSynthesizer()
+        JobWorker(jobs, SynthesizerPool(lambda: synthesizer)).run_job(jobs.claim())
+        self.assertEqual(jobs.get(job_id)["status"], "done")
+        self.assertEqual([text for text, _ in synthesizer.calls], ["Three", "Four"])
+
+    def test_failed_job(self):
+        job_id = self.jobs.submit("One. Two")
+        worker = JobWorker(self.jobs, SynthesizerPool(lambda: FakeSynthesizer(fail_on="Two")))
+        worker.run_job(self.jobs.claim())
+        job = self.jobs.get(job_id)
+        self.assertEqual((job["status"], job["num_done"], job["error"]), ("failed", 1, "synthesis failed"))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, job_id)))
+        self.assertIsNone(self.jobs.get("unknown"))
+
+    def test_expire(self):
+        done_id, failed_id, queued_id = [self.jobs.submit(text) for text in ["One", "Two", "Three"]]
+        worker = JobWorker(self.jobs, SynthesizerPool(lambda: FakeSynthesizer(fail_on="Two")))
+        worker.run_job(self.jobs.claim())
+        worker.run_job(self.jobs.claim())
+        self.assertEqual(self.jobs.expire(), 0)
+        self.jobs.retention = 0.0
+        self.assertEqual(self.jobs.expire(), 2)
+        self.assertIsNone(self.jobs.get(done_id))
+        self.assertIsNone(self.jobs.get(failed_id))
+        self.assertFalse(os.path.exists(self.jobs.audio_path(done_id)))
+        self.assertEqual(self.jobs.get(queued_id)["status"], "queued")
+        self.jobs.retention = None
+        self.assertEqual(self.jobs.expire(), 0)
+
+    def test_worker_thread(self):
+        job_ids = [self.jobs.submit(text) for text in ["One. Two", "Three"]]
+        worker = JobWorker(self.jobs, SynthesizerPool(FakeSynthesizer), poll_interval=0.01)
+        worker.start()
+        deadline = time.time() + 30
+        try:
+            for job_id in job_ids:
+                while self.jobs.get(job_id)["status"] != "done" and time.time() < deadline:
+                    worker.join(0.01)
+                self.assertEqual(self.jobs.get(job_id)["status"], "done")
+        finally:
+            worker.stop()
+            worker.join()
@@ -0,0 +1,216 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from tests import get_tests_output_path
+from TTS.utils.manage import IntegrityError, ModelManager
+
+FILES = {
+    "model.pth": os.urandom(300_000),
+    "config.json": b'{"model": "fake"}',
+    "speakers.json": b"{}",
+    "hash.md5": b"10f92b55c512af7a8d39d650547a15a7",
+}
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves `self.server.files` with ETag and range request support like the model hosts do."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        name = self.path.strip("/").split("/")[-1]
+        if name not in self.server.files:
+            self.send_error(404)
+            return
+        data = self.server.files[name]
+        self.server.requests.append((name, self.headers.get("Range")))
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        start = 0
+        if self.headers.get("Range") and self.headers.get("If-Range") == etag:
+            start = int(self.headers["Range"].split("=")[1].split("-")[0])
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        name = self.path.strip("/").split("/")[-1]
+        if name not in self.server.files:
+            self.send_error(404)
+            return
+        data = self.server.files[name]
+        self.server.requests.append((name, "HEAD"))
+        self.send_response(200)
+        self.send_header("ETag", f'"{hashlib.md5(data).hexdigest()}"')
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class ModelManagerDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+        self.server.files = dict(FILES)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/models"
+        self.output_path = os.path.join(get_tests_output_path(), "model_download")
+        shutil.rmtree(self.output_path, ignore_errors=True)
+        os.makedirs(self.output_path)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _check_files(self, folder, names):
+        self.assertEqual(sorted(os.listdir(folder)), sorted(names))
+        for name in names:
+            with open(os.path.join(folder, name), "rb") as f:
+                self.assertEqual(f.read(), FILES[name])
+
+    def test_parallel_download(self):
+        ModelManager._download_model_files(
+            [f"{self.url}/{name}" for name in FILES], self.output_path, progress_bar=False, max_workers=3
+        )
+        self._check_files(self.output_path, FILES)
+
+    def test_resume(self):
+        output_path = os.path.join(self.output_path, "model.pth")
+        ModelManager._download_file(f"{self.url}/model.pth", output_path, progress_bar=False)
+        # simulate a download interrupted halfway
+        os.rename(output_path, output_path + ".part")
+        with open(output_path + ".part", "r+b") as f:
+            f.truncate(100_000)
+        with open(output_path + ".part.json", "w", encoding="utf-8") as f:
+            f.write(
+                f'{{"url": "{self.url}/model.pth", "validator": "\\"{hashlib.md5(FILES["model.pth"]).hexdigest()}\\""}}'
+            )
+        ModelManager._download_file(
+            f"{self.url}/model.pth",
+            output_path,
+            progress_bar=False,
+            expected_hash=f"sha256:{hashlib.sha256(FILES['model.pth']).hexdigest()}",
+        )
+        self.assertEqual(self.server.requests[-1], ("model.pth", "bytes=100000-"))
+        self._check_files(self.output_path, ["model.pth"])
+
+    def test_hash_mismatch(self):
+        output_path = os.path.join(self.output_path, "config.json")
+        with self.assertRaises(IntegrityError):
+            ModelManager._download_file(
+                f"{self.url}/config.json", output_path, progress_bar=False, expected_hash="sha256:" + "0" * 64
+            )
+        self.assertEqual(os.listdir(self.output_path), [])
+
+    def test_complete_file(self):
+        output_path = os.path.join(self.output_path, "model.pth")
+        ModelManager._download_file(f"{self.url}/model.pth", output_path, progress_bar=False)
+        # a complete file is not downloaded again
+        ModelManager._download_file(f"{self.url}/model.pth", output_path, progress_bar=False)
+        self.assertEqual(self.server.requests, [("model.pth", None), ("model.pth", "HEAD")])
+        ModelManager._download_file(
+            f"{self.url}/model.pth",
+            output_path,
+            progress_bar=False,
+            expected_hash=f"sha256:{hashlib.sha256(FILES['model.pth']).hexdigest()}",
+        )
+        self.assertEqual(len(self.server.requests), 2)
+
+        # unless its size or hash do not match
+        with open(output_path, "r+b") as f:
+            f.truncate(100_000)
+        ModelManager._download_file(f"{self.url}/model.pth", output_path, progress_bar=False)
+        self.assertEqual(self.server.requests[-1], ("model.pth", None))
+        self._check_files(self.output_path, ["model.pth"])
+        with open(output_path, "r+b") as f:
+            f.write(b"corrupted")
+        ModelManager._download_file(
+            f"{self.url}/model.pth",
+            output_path,
+            progress_bar=False,
+            expected_hash=f"sha256:{hashlib.sha256(FILES['model.pth']).hexdigest()}",
+        )
+        self.assertEqual(self.server.requests[-1], ("model.pth", None))
+        self._check_files(self.output_path, ["model.pth"])
+
+    def test_archives(self):
+        zip_buffer, tar_buffer = io.BytesIO(), io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as z:
+            for name, data in FILES.items():
+                z.writestr(f"tts_model/{name}", data)
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as t:
+            for name, data in FILES.items():
+                info = tarfile.TarInfo(f"en/{name}")
+                info.size = len(data)
+                t.addfile(info, io.BytesIO(data))
+        self.server.files["model.zip"] = zip_buffer.getvalue()
+        self.server.files["en.tar.gz"] = tar_buffer.getvalue()
+
+        zip_path, tar_path = os.path.join(self.output_path, "zip"), os.path.join(self.output_path, "tar")
+        os.makedirs(zip_path)
+        os.makedirs(tar_path)
+        ModelManager._download_zip_file(f"{self.url}/model.zip", zip_path, progress_bar=False)
+        ModelManager._download_tar_file(f"{self.url}/en.tar.gz", tar_path, progress_bar=False)
+        self._check_files(zip_path, FILES)
+        self._check_files(tar_path, FILES)
+
+    def test_mirror(self):
+        mirror_dir = os.path.join(self.output_path, "mirror")
+        file_urls = [f"{self.url}/{name}" for name in FILES]
+        first_path, second_path = os.path.join(self.output_path, "first"), os.path.join(self.output_path, "second")
+        ModelManager._download_model_files(file_urls, first_path, progress_bar=False, mirror_dir=mirror_dir)
+        self.assertEqual(len(self.server.requests), len(FILES))
+
+        # the mirror is used without the network
+        self.tearDown()
+        ModelManager._download_model_files(file_urls, second_path, progress_bar=False, mirror_dir=mirror_dir)
+        self._check_files(second_path, FILES)
+
+    def _model_manager(self, model_item):
+        models_file = os.path.join(self.output_path, "models.json")
+        with open(models_file, "w", encoding="utf-8") as f:
+            json.dump({"tts_models": {"en": {"ljspeech": {"fake": model_item}}}}, f)
+        return ModelManager(models_file, output_prefix=self.output_path, max_workers=1)
+
+    def test_interrupted_download_model(self):
+        manager = self._model_manager({"hf_url": [f"{self.url}/model.pth", f"{self.url}/config.json"], "license": ""})
+        model_path = os.path.join(self.output_path, "tts", "tts_models--en--ljspeech--fake")
+        # the download fails halfway
+        del self.server.files["config.json"]
+        with self.assertRaises(requests.RequestException):
+            manager.download_model("tts_models/en/ljspeech/fake")
+        self.assertFalse(os.path.exists(model_path))
+        self.assertEqual(os.listdir(model_path + ".download"), ["model.pth"])
+
+        # the next call does not take the partial download for a downloaded model
+        self.server.files["config.json"] = FILES["config.json"]
+        output_model_path, output_config_path, _ = manager.download_model("tts_models/en/ljspeech/fake")
+        self.assertEqual(output_model_path, os.path.join(model_path, "model.pth"))
+        self.assertEqual(output_config_path, os.path.join(model_path, "config.json"))
+        self._check_files(model_path, ["model.pth", "config.json"])
+        self.assertFalse(os.path.exists(model_path + ".download"))
+        # the complete files of the failed download are kept
+        self.assertEqual(self.server.requests.count(("model.pth", None)), 1)
+
+    def test_model_hash(self):
+        file_urls = [f"{self.url}/model.pth", f"{self.url}/config.json", f"{self.url}/hash.md5"]
+        model_path = os.path.join(self.output_path, "tts", "tts_models--en--ljspeech--fake")
+        manager = self._model_manager({"hf_url": file_urls, "license": "", "model_hash": "0" * 32})
+        with self.assertRaises(IntegrityError):
+            manager.download_model("tts_models/en/ljspeech/fake")
+        self.assertFalse(os.path.exists(model_path))
+
+        manager = self._model_manager({"hf_url": file_urls, "license": "", "model_hash": FILES["hash.md5"].decode()})
+        manager.download_model("tts_models/en/ljspeech/fake")
+        self._check_files(model_path, ["model.pth", "config.json", "hash.md5"])
@@ -0,0 +1,111 @@
+import gc
+import threading
+import time
+import unittest
+import weakref
+
+from TTS.utils.batch_scheduler import BatchScheduler
+from TTS.utils.model_pool import ModelPool
+
+
+class FakeModel:
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+class BatchingModel(FakeModel):
+    """Holds a batching thread bound to itself like a `Synthesizer` with `max_batch_size > 1`."""
+
+    def __init__(self, name, size):
+        super().__init__(name, size)
+        self.batch_scheduler = BatchScheduler(self._batch)
+
+    def _batch(self, items):
+        return items
+
+    def close(self):
+        self.batch_scheduler.close()
+
+
+class ModelPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.loaded = []
+
+    def _load(self, name):
+        self.loaded.append(name)
+        time.sleep(0.01)
+        return FakeModel(name, size=int(name.split("_")[-1]))
+
+    def _pool(self, **kwargs):
+        return ModelPool(self._load, size_fn=lambda model: model.size, **kwargs)
+
+    def test_lru_eviction_by_count(self):
+        pool = self._pool(max_models=2)
+        pool.get("a_1")
+        pool.get("b_1")
+        self.assertEqual(pool.get("a_1").name, "a_1")
+        pool.get("c_1")
+        self.assertEqual(pool.names, ["a_1", "c_1"])
+        self.assertEqual(self.loaded, ["a_1", "b_1", "c_1"])
+        self.assertEqual((pool.hits, pool.misses), (1, 3))
+
+    def test_eviction_by_memory(self):
+        pool = self._pool(max_models=10, max_memory=10)
+        pool.get("a_4")
+        pool.get("b_4")
+        pool.get("c_4")
+        self.assertEqual(pool.names, ["b_4", "c_4"])
+        self.assertEqual(pool.memory, 8)
+        # a model over the budget on its own is still kept
+        pool.get("d_20")
+        self.assertEqual(pool.names, ["d_20"])
+
+    def test_concurrent_get_loads_once(self):
+        pool = self._pool(max_models=2)
+        models = []
+        threads = [threading.Thread(target=lambda: models.append(pool.get("a_1"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.loaded, ["a_1"])
+        self.assertTrue(all(model is models[0] for model in models))
+
+    def test_evict_and_clear(self):
+        pool = self._pool(max_models=3)
+        pool.get("a_1")
+        pool.get("b_1")
+        self.assertTrue(pool.evict("a_1"))
+        self.assertFalse(pool.evict("a_1"))
+        self.assertNotIn("a_1", pool)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        pool.get("a_1")
+        self.assertEqual(self.loaded, ["a_1", "b_1", "a_1"])
+
+    def test_invalid_max_models(self):
+        with self.assertRaises(ValueError):
+            self._pool(max_models=0)
+
+    def test_evicted_models_are_freed(self):
+        pool = ModelPool(lambda name: BatchingModel(name, 1), size_fn=lambda model: model.size, max_models=1)
+        model = pool.get("a_1")
+        self.assertEqual(model.batch_scheduler.run([1, 2]), [1, 2])
+        model_ref = weakref.ref(model)
+        del model
+        pool.get("b_1")
+        gc.collect()
+        self.assertIsNone(model_ref())
+        model_ref = weakref.ref(pool.get("b_1"))
+        pool.clear()
+        gc.collect()
+        self.assertIsNone(model_ref())
+
+    def test_on_evict(self):
+        evicted = []
+        pool = ModelPool(self._load, size_fn=lambda model: model.size, max_models=1, on_evict=evicted.append)
+        pool.get("a_1")
+        pool.get("b_1")
+        pool.evict("b_1")
+        self.assertEqual([model.name for model in evicted], ["a_1", "b_1"])
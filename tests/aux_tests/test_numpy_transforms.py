@@ -1,6 +1,8 @@
+import io
 import math
 import os
 import unittest
+import wave
 from dataclasses import dataclass
 
 import librosa
@@ -104,3 +106,25 @@ class TestNumpyTransforms(unittest.TestCase):
         wav_resample = np_transforms.load_wav(filename=WAV_FILE, resample=True, sample_rate=16000)
         self.assertEqual(wav.shape, (self.sample_wav.shape[0],))
         self.assertNotEqual(wav_resample.shape, (self.sample_wav.shape[0],))
+
+    def test_wav_stream(self):
+        """Check that a streamed wav header followed by PCM chunks reads as a wav file"""
+        chunks = np.array_split(self.sample_wav, 4)
+        data = np_transforms.wav_stream_header(**self.config)
+        data += b"".join(np_transforms.wav_to_pcm16(wav=chunk) for chunk in chunks)
+        with wave.open(io.BytesIO(data)) as f:
+            self.assertEqual(f.getframerate(), self.config.sample_rate)
+            self.assertEqual(f.getsampwidth(), 2)
+            self.assertEqual(f.getnchannels(), 1)
+            frames = np.frombuffer(f.readframes(len(self.sample_wav)), dtype="<i2")
+        self.assertEqual(frames.shape, self.sample_wav.shape)
+
+    def test_find_endpoint_stream(self):
+        """Check that the streamed endpoint matches `find_endpoint()` for any chunking"""
+        wav = np.concatenate([self.sample_wav, np.zeros(self.config.sample_rate, dtype=np.float32), self.sample_wav])
+        kwargs = {"trim_db": 40, "sample_rate": self.config.sample_rate, "gain": 20, "base": 10}
+        target = wav[: np_transforms.find_endpoint(wav=wav, **kwargs)]
+        self.assertLess(len(target), len(wav))
+        for num_chunks in [1, 3, 100]:
+            chunks = np_transforms.find_endpoint_stream(chunks=iter(np.array_split(wav, num_chunks)), **kwargs)
+            np.testing.assert_array_equal(np.concatenate(list(chunks)), target)
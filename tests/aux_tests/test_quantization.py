@@ -0,0 +1,78 @@
+import unittest
+
+import torch
+from torch import nn
+from transformers.pytorch_utils import Conv1D
+
+from TTS.tts.configs.vits_config import VitsConfig
+from TTS.tts.models.vits import Vits
+from TTS.utils.quantization import Int8WeightConv1d, conv1d_to_linear, model_size, quantize_model
+from TTS.vocoder.models.hifigan_generator import HifiganGenerator
+
+torch.manual_seed(1)
+
+
+def _snr(target, output):
+    return 10 * torch.log10(target.pow(2).mean() / (target - output).pow(2).mean()).item()
+
+
+class TestQuantization(unittest.TestCase):
+    def test_int8_weight_conv1d(self):
+        x = torch.randn(2, 16, 20)
+        for conv in [nn.Conv1d(16, 8, 3, padding=2, dilation=2), nn.ConvTranspose1d(16, 8, 4, stride=2, padding=1)]:
+            qconv = Int8WeightConv1d(conv)
+            self.assertEqual(qconv.weight_int8.dtype, torch.int8)
+            self.assertEqual(qconv.weight.shape, conv.weight.shape)
+            with torch.no_grad():
+                self.assertGreater(_snr(conv(x), qconv(x)), 30)
+
+    def test_conv1d_to_linear(self):
+        model = nn.Sequential(Conv1D(8, 4), nn.ReLU())
+        x = torch.randn(2, 5, 4)
+        with torch.no_grad():
+            target = model(x)
+            conv1d_to_linear(model)
+            self.assertIsInstance(model[0], nn.Linear)
+            self.assertTrue(torch.allclose(model(x), target, atol=1e-6))
+
+    def test_hifigan_generator(self):
+        model = HifiganGenerator(
+            in_channels=16,
+            out_channels=1,
+            resblock_type="1",
+            resblock_dilation_sizes=[[1, 3, 5]] * 2,
+            resblock_kernel_sizes=[3, 7],
+            upsample_kernel_sizes=[8, 8],
+            upsample_initial_channel=32,
+            upsample_factors=[4, 4],
+        ).eval()
+        x = torch.randn(1, 16, 10)
+        with torch.no_grad():
+            target = model.inference(x)
+            size = model_size(model)
+            # weight norm is removed before quantization
+            quantize_model(model, "int8")
+            self.assertIsInstance(model.conv_pre, Int8WeightConv1d)
+            self.assertLess(model_size(model), size / 3)
+            self.assertGreater(_snr(target, model.inference(x)), 20)
+
+    def test_vits(self):
+        config = VitsConfig()
+        config.model_args.hidden_channels = 32
+        config.model_args.hidden_channels_ffn_text_encoder = 64
+        config.model_args.upsample_initial_channel_decoder = 32
+        model = Vits.init_from_config(config, verbose=False).eval()
+        x = torch.randint(1, 10, (1, 12))
+        with torch.no_grad():
+            model.inference(x)
+            quantize_model(model, "int8")
+            outputs = model.inference(x)
+        self.assertIsInstance(model.text_encoder.proj, Int8WeightConv1d)
+        self.assertIsInstance(model.waveform_decoder.conv_post, Int8WeightConv1d)
+        self.assertEqual(outputs["model_outputs"].dim(), 3)
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            quantize_model(nn.Linear(2, 2), "int8")
+        with self.assertRaises(ValueError):
+            quantize_model(HifiganGenerator(4, 1, "1", [[1, 3, 5]], [3], [4], 8, [2]), "int4")
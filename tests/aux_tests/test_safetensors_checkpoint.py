@@ -0,0 +1,69 @@
+import os
+import unittest
+
+import torch
+from torch import nn
+
+from tests import get_tests_output_path, run_cli
+from TTS.utils.io import convert_to_safetensors, load_fsspec
+from TTS.vocoder.models.hifigan_generator import HifiganGenerator
+
+torch.manual_seed(1)
+
+
+def _hifigan():
+    return HifiganGenerator(
+        in_channels=16,
+        out_channels=1,
+        resblock_type="1",
+        resblock_dilation_sizes=[[1, 3, 5]] * 2,
+        resblock_kernel_sizes=[3, 7],
+        upsample_kernel_sizes=[8, 8],
+        upsample_initial_channel=32,
+        upsample_factors=[4, 4],
+    )
+
+
+class TestSafetensorsCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.output_path = get_tests_output_path()
+
+    def test_convert(self):
+        model = nn.Sequential(nn.Embedding(10, 4), nn.Linear(4, 10))
+        # tied weights are saved once and shared again on load
+        model[1].weight = model[0].weight
+        optimizer = torch.optim.Adam(model.parameters())
+        model(torch.tensor([1, 2])).sum().backward()
+        optimizer.step()
+        checkpoint_path = os.path.join(self.output_path, "tied.pth")
+        torch.save(
+            {"model": model.state_dict(), "optimizer": optimizer.state_dict(), "config": {"r": 2}, "step": 10},
+            checkpoint_path,
+        )
+        output_path = convert_to_safetensors(checkpoint_path)
+        self.assertEqual(output_path, os.path.join(self.output_path, "tied.safetensors"))
+
+        state = load_fsspec(output_path, map_location=torch.device("cpu"))
+        self.assertEqual(state["config"], {"r": 2})
+        self.assertEqual(state["step"], 10)
+        self.assertNotIn("optimizer", state)
+        self.assertEqual(set(state["model"]), set(model.state_dict()))
+        self.assertIs(state["model"]["0.weight"], state["model"]["1.weight"])
+        for key, value in model.state_dict().items():
+            self.assertTrue(torch.equal(state["model"][key], value))
+
+    def test_load_checkpoint(self):
+        model = _hifigan()
+        checkpoint_path = os.path.join(self.output_path, "hifigan.pth")
+        torch.save({"model": model.state_dict()}, checkpoint_path)
+        output_path = os.path.join(self.output_path, "hifigan_converted.safetensors")
+        run_cli(
+            f"python TTS/bin/convert_to_safetensors.py --checkpoint_path {checkpoint_path} --output_path {output_path}"
+        )
+
+        x = torch.randn(1, 16, 10)
+        pth_model, safetensors_model = _hifigan(), _hifigan()
+        pth_model.load_checkpoint(None, checkpoint_path, eval=True)
+        safetensors_model.load_checkpoint(None, output_path, eval=True)
+        with torch.no_grad():
+            self.assertTrue(torch.equal(pth_model.inference(x), safetensors_model.inference(x)))
@@ -0,0 +1,40 @@
+import os
+import shutil
+import unittest
+
+from tests import get_tests_input_path, get_tests_output_path
+from TTS.server.voices import resolve_speaker_wav
+
+OUTPATH = os.path.join(get_tests_output_path(), "server_voices_tests")
+
+
+class TestResolveSpeakerWav(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+        self.voices_dir = os.path.join(OUTPATH, "voices")
+        os.makedirs(os.path.join(self.voices_dir, "en"))
+        shutil.copy(os.path.join(get_tests_input_path(), "example_1.wav"), os.path.join(self.voices_dir, "en", "a.wav"))
+        shutil.copy(os.path.join(get_tests_input_path(), "example_1.wav"), os.path.join(OUTPATH, "outside.wav"))
+
+    def test_resolve(self):
+        path = resolve_speaker_wav(self.voices_dir, "en/a.wav")
+        self.assertEqual(path, os.path.realpath(os.path.join(self.voices_dir, "en", "a.wav")))
+        self.assertIsNone(resolve_speaker_wav(self.voices_dir, ""))
+        self.assertIsNone(resolve_speaker_wav(None, ""))
+
+    def test_reject(self):
+        outside = os.path.join(OUTPATH, "outside.wav")
+        os.symlink(outside, os.path.join(self.voices_dir, "link.wav"))
+        for name in [
+            "../outside.wav",
+            outside,
+            "link.wav",
+            "missing.wav",
+            "en",
+            os.path.join(get_tests_input_path(), "example_1.wav"),
+        ]:
+            with self.assertRaises(ValueError):
+                resolve_speaker_wav(self.voices_dir, name)
+        # disabled without a folder
+        with self.assertRaises(ValueError):
+            resolve_speaker_wav(None, "en/a.wav")
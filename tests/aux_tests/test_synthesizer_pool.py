@@ -0,0 +1,85 @@
+import threading
+import unittest
+
+from TTS.server.pool import ServerBusyError, SynthesizerPool
+
+
+class SynthesizerPoolTest(unittest.TestCase):
+    def test_run(self):
+        pool = SynthesizerPool(lambda: "worker", num_workers=2)
+        outputs, timing = pool.run(lambda worker, text: f"{worker}: {text}", "hello")
+        self.assertEqual(outputs, "worker: hello")
+        self.assertGreaterEqual(timing.queue_time, 0)
+        self.assertGreaterEqual(timing.process_time, 0)
+        self.assertIn("synthesis;dur=", timing.to_server_timing())
+        self.assertEqual(pool.num_pending, 0)
+
+    def test_concurrent_workers(self):
+        """Each running request must hold a different replica."""
+        pool = SynthesizerPool(object, num_workers=3, max_queue_size=0)
+        barrier = threading.Barrier(3)
+        used_workers = []
+
+        def _fn(worker):
+            used_workers.append(worker)
+            barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=pool.run, args=(_fn,)) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(map(id, used_workers))), 3)
+
+    def test_backpressure(self):
+        pool = SynthesizerPool(object, num_workers=1, max_queue_size=1, retry_after=7)
+        started = threading.Event()
+        release = threading.Event()
+
+        def _block(worker):  # pylint: disable=unused-argument
+            started.set()
+            release.wait(timeout=5)
+
+        running = threading.Thread(target=pool.run, args=(_block,))
+        running.start()
+        started.wait(timeout=5)
+        waiting = threading.Thread(target=pool.run, args=(lambda worker: None,))
+        waiting.start()
+        while pool.num_pending < 2:
+            pass
+        with self.assertRaises(ServerBusyError) as cm:
+            pool.run(lambda worker: None)
+        self.assertEqual(cm.exception.retry_after, 7)
+        release.set()
+        running.join()
+        waiting.join()
+        self.assertEqual(pool.num_pending, 0)
+
+    def test_shared_and_exclusive_workers(self):
+        """Only the shareable workers serve several requests, an exclusive request takes a worker alone."""
+        pool = SynthesizerPool(
+            lambda: {"batching": True}, num_workers=1, max_queue_size=4, requests_per_worker=3, is_shareable=bool
+        )
+        self.assertEqual(pool.capacity, 7)
+        worker1, _ = pool.acquire()
+        worker2, _ = pool.acquire()
+        self.assertIs(worker1, worker2)
+
+        acquired = threading.Event()
+
+        def _acquire_exclusive():
+            worker, _ = pool.acquire(exclusive=True)
+            acquired.set()
+            pool.release(worker)
+
+        thread = threading.Thread(target=_acquire_exclusive)
+        thread.start()
+        pool.release(worker1)
+        self.assertFalse(acquired.wait(timeout=0.1))
+        pool.release(worker2)
+        self.assertTrue(acquired.wait(timeout=5))
+        thread.join()
+        self.assertEqual(pool.num_pending, 0)
+
+        pool = SynthesizerPool(lambda: None, num_workers=2, max_queue_size=0, requests_per_worker=3, is_shareable=bool)
+        self.assertEqual(pool.capacity, 2)
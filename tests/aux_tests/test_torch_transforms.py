@@ -0,0 +1,99 @@
+import os
+import unittest
+
+import numpy as np
+import torch
+
+from tests import get_tests_input_path
+from TTS.config import BaseAudioConfig
+from TTS.utils.audio.processor import AudioProcessor
+from TTS.utils.audio.torch_transforms import TorchSpecNormalizer, TorchSpectrogram
+
+WAV_FILE = os.path.join(get_tests_input_path(), "example_1.wav")
+
+
+class TestTorchSpecNormalizer(unittest.TestCase):
+    def _check(self, ap):
+        normalizer = TorchSpecNormalizer(ap)
+        mel = ap.melspectrogram(ap.load_wav(WAV_FILE))
+        if ap.signal_norm:
+            # back to the dB values the normalizer takes
+            mel = ap.denormalize(mel)
+        mel = mel.astype(np.float32)
+        mel_norm = normalizer.normalize(torch.from_numpy(mel))
+        self.assertEqual(mel_norm.dtype, torch.float32)
+        np.testing.assert_allclose(mel_norm.numpy(), ap.normalize(mel), atol=1e-4)
+        # batched inputs
+        mel_denorm = normalizer.denormalize(mel_norm.unsqueeze(0).repeat(2, 1, 1))
+        np.testing.assert_allclose(mel_denorm[1].numpy(), ap.denormalize(mel_norm.numpy()), atol=1e-4)
+
+    def test_range_norm(self):
+        for symmetric_norm in [True, False]:
+            for clip_norm in [True, False]:
+                conf = BaseAudioConfig(symmetric_norm=symmetric_norm, clip_norm=clip_norm, signal_norm=True)
+                self._check(AudioProcessor(**conf))
+
+    def test_no_norm(self):
+        ap = AudioProcessor(**BaseAudioConfig(signal_norm=False))
+        x = torch.rand(80, 10)
+        self.assertIs(TorchSpecNormalizer(ap).normalize(x), x)
+        self.assertIs(TorchSpecNormalizer(ap).denormalize(x), x)
+
+    def test_mean_var_norm(self):
+        stats_path = os.path.join(get_tests_input_path(), "scale_stats.npy")
+        ap = AudioProcessor(**BaseAudioConfig(stats_path=stats_path, mel_fmax=8000, preemphasis=0.0))
+        self.assertIsNotNone(TorchSpecNormalizer(ap).stats)
+        self._check(ap)
+        with self.assertRaises(RuntimeError):
+            TorchSpecNormalizer(ap).normalize(torch.rand(7, 10))
+
+
+class TestTorchSpectrogram(unittest.TestCase):
+    def _check(self, ap, linear=True, dtype=torch.float64, atol=1e-3):
+        wav = ap.load_wav(WAV_FILE)
+        wavs = [wav, wav[:30001], wav[5000:20000]]
+        lengths = torch.LongTensor([w.shape[0] for w in wavs])
+        batch = torch.zeros(len(wavs), int(lengths.max()), dtype=dtype)
+        for i, w in enumerate(wavs):
+            batch[i, : w.shape[0]] = torch.from_numpy(w)
+        torch_spec = TorchSpectrogram(ap)
+        mel = torch_spec.melspectrogram(batch, lengths)
+        spec = torch_spec.spectrogram(batch, lengths) if linear else None
+        self.assertEqual(mel.dtype, dtype)
+        for i, w in enumerate(wavs):
+            mel_ref = ap.melspectrogram(w)
+            num_frames = mel_ref.shape[1]
+            self.assertEqual(num_frames, int(torch_spec.num_frames(lengths[i])))
+            np.testing.assert_allclose(mel[i, :, :num_frames].numpy(), mel_ref, atol=atol)
+            self.assertEqual(mel[i, :, num_frames:].abs().sum(), 0)
+            if linear:
+                np.testing.assert_allclose(spec[i, :, :num_frames].numpy(), ap.spectrogram(w), atol=atol)
+
+    def test_range_norm(self):
+        for symmetric_norm in [True, False]:
+            self._check(AudioProcessor(**BaseAudioConfig(symmetric_norm=symmetric_norm, preemphasis=0.97)))
+        # float32 inputs differ on the near-silent frequency bins only
+        self._check(AudioProcessor(**BaseAudioConfig()), linear=False, dtype=torch.float32, atol=1e-2)
+
+    def test_no_norm(self):
+        conf = BaseAudioConfig(signal_norm=False, do_amp_to_db_mel=False, do_amp_to_db_linear=False)
+        self._check(AudioProcessor(**conf), atol=1e-5)
+        conf = BaseAudioConfig(signal_norm=False, log_func="np.log", stft_pad_mode="constant", win_length=800)
+        self._check(AudioProcessor(**conf))
+
+    def test_mean_var_norm(self):
+        stats_path = os.path.join(get_tests_input_path(), "scale_stats.npy")
+        ap = AudioProcessor(**BaseAudioConfig(stats_path=stats_path, mel_fmax=8000, preemphasis=0.0))
+        self._check(ap, linear=False)
+
+    def test_padded_segments(self):
+        ap = AudioProcessor(**BaseAudioConfig(preemphasis=0.97))
+        wav = ap.load_wav(WAV_FILE)
+        mel_ref = ap.melspectrogram(wav)
+        # pre-emphasized and padded audio, cut to the frames of the segments
+        stft_input = np.pad(ap.apply_preemphasis(wav), ap.fft_size // 2, mode=ap.stft_pad_mode)
+        starts = [0, 7, 30]
+        segments = [stft_input[s * ap.hop_length : (s + 19) * ap.hop_length + ap.fft_size] for s in starts]
+        mel = TorchSpectrogram(ap).melspectrogram(torch.from_numpy(np.stack(segments)), padded=True)
+        for i, s in enumerate(starts):
+            np.testing.assert_allclose(mel[i].numpy(), mel_ref[:, s : s + 20], atol=1e-3)
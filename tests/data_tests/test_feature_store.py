@@ -0,0 +1,100 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from tests import get_tests_data_path, get_tests_output_path, run_cli
+from TTS.tts.configs.fast_pitch_config import FastPitchConfig
+from TTS.tts.configs.shared_configs import BaseDatasetConfig
+from TTS.tts.datasets import TTSDataset, load_tts_samples
+from TTS.tts.datasets.feature_store import FeatureStore, pack_features
+from TTS.tts.utils.text.tokenizer import TTSTokenizer
+from TTS.utils.audio import AudioProcessor
+
+OUTPATH = os.path.join(get_tests_output_path(), "feature_store_tests")
+
+c = FastPitchConfig(text_cleaner="english_cleaners", compute_f0=True, compute_energy=True)
+c.audio.pitch_fmin = 65.0
+c.f0_cache_path = os.path.join(OUTPATH, "f0_cache")
+c.energy_cache_path = os.path.join(OUTPATH, "energy_cache")
+c.datasets = [
+    BaseDatasetConfig(
+        formatter="coqui",
+        meta_file_train="metadata_wav.csv",
+        path=os.path.join(get_tests_data_path(), "ljspeech"),
+        language="en",
+    )
+]
+
+
+class TestFeatureStore(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+        os.makedirs(OUTPATH)
+        self.ap = AudioProcessor.init_from_config(c)
+        self.tokenizer, _ = TTSTokenizer.init_from_config(c)
+        self.samples = load_tts_samples(c.datasets, eval_split=False)[0][:8]
+
+    def _dataset(self, **kwargs):
+        return TTSDataset(
+            samples=self.samples,
+            ap=self.ap,
+            tokenizer=self.tokenizer,
+            compute_f0=True,
+            compute_energy=True,
+            f0_cache_path=c.f0_cache_path,
+            energy_cache_path=c.energy_cache_path,
+            **kwargs,
+        )
+
+    def test_interchangeable_with_caches(self):
+        # fill the per-file caches and pack the store from them
+        cached = self._dataset()
+        expected_items = [cached[idx] for idx in range(len(self.samples))]
+        store_path = os.path.join(OUTPATH, "store")
+        store = pack_features(
+            self.samples,
+            store_path,
+            self.ap,
+            tokenizer=self.tokenizer,
+            compute_f0=True,
+            compute_energy=True,
+            f0_cache_path=c.f0_cache_path,
+            energy_cache_path=c.energy_cache_path,
+            shard_size=2**18,
+        )
+        self.assertEqual(len(store), len(self.samples))
+        self.assertGreater(len([f for f in os.listdir(store_path) if f.startswith("wav_")]), 1)
+
+        # the store alone is enough, without the audio files and the caches
+        shutil.rmtree(c.f0_cache_path)
+        shutil.rmtree(c.energy_cache_path)
+        packed = self._dataset(feature_store_path=store_path)
+        self.assertFalse(os.path.exists(c.f0_cache_path))
+        self.assertEqual(packed.f0_dataset.mean, cached.f0_dataset.mean)
+        for idx, expected in enumerate(expected_items):
+            item = packed[idx]
+            self.assertIsInstance(item["wav"].base, np.memmap)
+            for key in ["wav", "token_ids", "pitch", "energy"]:
+                np.testing.assert_allclose(item[key], expected[key], atol=1e-5)
+            np.testing.assert_array_equal(
+                store.get(self.samples[idx]["audio_unique_name"], "token_ids"),
+                self.tokenizer.text_to_ids(self.samples[idx]["text"]),
+            )
+
+    def test_audio_mismatch(self):
+        store_path = os.path.join(OUTPATH, "store")
+        for name, value in [("sample_rate", 16000), ("hop_length", 128), ("do_trim_silence", False)]:
+            pack_features(self.samples[:1], store_path, AudioProcessor(**{**c.audio.to_dict(), name: value}))
+            with self.assertRaises(ValueError):
+                TTSDataset(samples=self.samples, ap=self.ap, tokenizer=self.tokenizer, feature_store_path=store_path)
+
+    def test_pack_command(self):
+        config_path = os.path.join(OUTPATH, "config.json")
+        store_path = os.path.join(OUTPATH, "cli_store")
+        c.save_json(config_path)
+        run_cli(f"python TTS/bin/pack_features.py --config_path {config_path} --output_path {store_path}")
+        store = FeatureStore(store_path)
+        self.assertEqual(sorted(store.features), ["energy", "pitch", "wav"])
+        self.assertIn("pitch", store.stats)
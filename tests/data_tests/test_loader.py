@@ -9,8 +9,10 @@ from torch.utils.data import DataLoader
 from tests import get_tests_data_path, get_tests_output_path
 from TTS.tts.configs.shared_configs import BaseDatasetConfig, BaseTTSConfig
 from TTS.tts.datasets import TTSDataset, load_tts_samples
+from TTS.tts.layers.overflow.common_layers import OverflowUtils
 from TTS.tts.utils.text.tokenizer import TTSTokenizer
 from TTS.utils.audio import AudioProcessor
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
 
 # pylint: disable=unused-variable
 
@@ -59,7 +61,16 @@ class TestTTSDataset(unittest.TestCase):
         self.max_loader_iter = 4
         self.ap = AudioProcessor(**c.audio)
 
-    def _create_dataloader(self, batch_size, r, bgs, dataset_config, start_by_longest=False, preprocess_samples=False):
+    def _create_dataloader(
+        self,
+        batch_size,
+        r,
+        bgs,
+        dataset_config,
+        start_by_longest=False,
+        preprocess_samples=False,
+        compute_spec_on_device=False,
+    ):
         # load dataset
         meta_data_train, meta_data_eval = load_tts_samples(dataset_config, eval_split=True, eval_split_size=0.2)
         items = meta_data_train + meta_data_eval
@@ -77,6 +88,7 @@ class TestTTSDataset(unittest.TestCase):
             min_audio_len=c.min_audio_len,
             max_audio_len=c.max_audio_len,
             start_by_longest=start_by_longest,
+            compute_spec_on_device=compute_spec_on_device,
         )
 
         # add preprocess to force the length computation
@@ -173,6 +185,41 @@ class TestTTSDataset(unittest.TestCase):
             print(mel_lengths)
             self.assertTrue(all(max_len >= mel_lengths))
 
+    def test_compute_spec_on_device(self):
+        dataloader, _ = self._create_dataloader(2, 2, 0, dataset_config_wav, preprocess_samples=True)
+        dataloader_raw, _ = self._create_dataloader(
+            2, 2, 0, dataset_config_wav, preprocess_samples=True, compute_spec_on_device=True
+        )
+        torch_spec = TorchSpectrogram(self.ap)
+        for i, (data, data_raw) in enumerate(zip(dataloader, dataloader_raw)):
+            if i == self.max_loader_iter:
+                break
+            self.assertIsNone(data_raw["mel"])
+            self.assertIsNone(data_raw["linear"])
+            for key in ["mel_lengths", "stop_targets", "waveform"]:
+                self.assertTrue(torch.equal(data[key], data_raw[key]))
+            wav, wav_lengths = data_raw["raw_wav"].double(), data_raw["raw_wav_lengths"]
+            mel = torch_spec.melspectrogram(wav, wav_lengths).transpose(1, 2)
+            linear = torch_spec.spectrogram(wav, wav_lengths).transpose(1, 2)
+            num_frames = mel.shape[1]
+            self.assertEqual(num_frames, int(data["mel_lengths"].max()))
+            # the rest of the frames is the padding to the reduction factor
+            self.assertEqual(data["mel"][:, num_frames:].abs().sum(), 0)
+            np.testing.assert_allclose(mel.numpy(), data["mel"][:, :num_frames].numpy(), atol=1e-3)
+            np.testing.assert_allclose(linear.numpy(), data["linear"][:, :num_frames].numpy(), atol=1e-3)
+
+    def test_flat_start_parameters_on_device(self):
+        dataloader, _ = self._create_dataloader(2, 1, 0, dataset_config_wav, preprocess_samples=True)
+        dataloader_raw, _ = self._create_dataloader(
+            2, 1, 0, dataset_config_wav, preprocess_samples=True, compute_spec_on_device=True
+        )
+        params = OverflowUtils.get_data_parameters_for_flat_start(dataloader, c.audio["num_mels"], 2)
+        params_raw = OverflowUtils.get_data_parameters_for_flat_start(
+            dataloader_raw, c.audio["num_mels"], 2, torch_spec=TorchSpectrogram(self.ap)
+        )
+        for param, param_raw in zip(params, params_raw):
+            self.assertAlmostEqual(param.item(), param_raw.item(), places=3)
+
     def test_padding_and_spectrograms(self):
         def check_conditions(idx, linear_input, mel_input, stop_target, mel_lengths):
             self.assertNotEqual(linear_input[idx, -1].sum(), 0)  # check padding
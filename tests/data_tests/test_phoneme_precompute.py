@@ -0,0 +1,58 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from tests import get_tests_data_path, get_tests_output_path
+from TTS.tts.configs.shared_configs import BaseDatasetConfig, BaseTTSConfig
+from TTS.tts.datasets import PhonemeDataset, load_tts_samples
+from TTS.tts.utils.text.tokenizer import TTSTokenizer
+
+OUTPATH = os.path.join(get_tests_output_path(), "phoneme_precompute_tests")
+
+c = BaseTTSConfig(use_phonemes=True, phonemizer="gruut", phoneme_language="en-us", text_cleaner="english_cleaners")
+dataset_config = BaseDatasetConfig(
+    formatter="coqui",
+    meta_file_train="metadata_wav.csv",
+    path=os.path.join(get_tests_data_path(), "ljspeech"),
+    language="en-us",
+)
+
+
+class TestPhonemePrecompute(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+        self.tokenizer, _ = TTSTokenizer.init_from_config(c)
+        self.samples = load_tts_samples(dataset_config, eval_split=False)[0]
+
+    def _cached_files(self):
+        return {f: os.stat(os.path.join(OUTPATH, f)).st_mtime_ns for f in os.listdir(OUTPATH)}
+
+    def test_precompute_only_new_samples(self):
+        dataset = PhonemeDataset(self.samples[:6], self.tokenizer, OUTPATH, precompute_num_workers=2)
+        cached = self._cached_files()
+        self.assertEqual(len(cached), 6)
+        for idx, item in enumerate(dataset.samples):
+            self.assertEqual(list(dataset[idx]["token_ids"]), self.tokenizer.text_to_ids(item["text"]))
+
+        # the cached samples are not computed again
+        PhonemeDataset(self.samples, self.tokenizer, OUTPATH, precompute_num_workers=0)
+        new_cached = self._cached_files()
+        self.assertEqual(len(new_cached), len(self.samples))
+        self.assertEqual({f: new_cached[f] for f in cached}, cached)
+        self.assertFalse(any(f.endswith(".tmp") for f in new_cached))
+
+    def test_same_cache_as_lazy_compute(self):
+        PhonemeDataset(self.samples, self.tokenizer, OUTPATH, precompute_num_workers=2)
+        lazy_path = os.path.join(OUTPATH, "lazy")
+        lazy = PhonemeDataset(self.samples, self.tokenizer, None)
+        lazy.cache_path = lazy_path
+        os.makedirs(lazy_path)
+        for idx in range(len(self.samples)):
+            lazy[idx]  # pylint: disable=pointless-statement
+        for file_name in os.listdir(lazy_path):
+            precomputed = np.load(os.path.join(OUTPATH, file_name))
+            computed = np.load(os.path.join(lazy_path, file_name))
+            self.assertEqual(precomputed.dtype, computed.dtype)
+            np.testing.assert_array_equal(precomputed, computed)
@@ -0,0 +1,60 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from TTS.tts.datasets.sample_table import SampleTable
+
+
+def _samples(num_samples=100):
+    return [
+        {
+            "text": f"sample {idx} 🐸",
+            "audio_file": f"/data/wavs/{idx}.wav",
+            "speaker_name": f"speaker_{idx % 3}",
+            "root_path": "/data",
+            "language": None,
+            "audio_unique_name": f"#/{idx}",
+            "audio_length": (idx * 7919) % 1000,
+            **({"alignment_file": f"/data/attn/{idx}.npy"} if idx % 2 else {}),
+        }
+        for idx in range(num_samples)
+    ]
+
+
+class TestSampleTable(unittest.TestCase):
+    def test_dict_access(self):
+        samples = _samples()
+        table = SampleTable.from_samples(samples)
+        self.assertEqual(len(table), len(samples))
+        self.assertEqual(list(table), samples)
+        self.assertEqual(table[-1], samples[-1])
+        self.assertEqual(table[10:20].to_list(), samples[10:20])
+        self.assertIsInstance(table[0]["audio_length"], int)
+        self.assertEqual(pickle.loads(pickle.dumps(table)).to_list(), samples)
+
+    def test_take_and_columns(self):
+        samples = _samples()
+        table = SampleTable.from_samples(samples)
+        lengths = table.column("audio_length")
+        self.assertEqual(lengths.dtype, np.int64)
+        idxs = np.argsort(lengths, kind="stable")[::-1]
+        sorted_table = table.take(idxs)
+        self.assertEqual(sorted_table.to_list(), [samples[idx] for idx in idxs])
+        self.assertEqual(sorted_table.column("speaker_name").tolist(), [samples[idx]["speaker_name"] for idx in idxs])
+        self.assertEqual(
+            sorted_table.column("alignment_file").tolist(), [samples[idx].get("alignment_file") for idx in idxs]
+        )
+
+    def test_set_column(self):
+        samples = _samples()
+        table = SampleTable.from_samples(samples)
+        subset = table.take(np.arange(0, len(samples), 10))
+        subset.set_column("text_length", np.arange(len(subset)))
+        subset.set_column("speaker_name", ["new"] * len(subset))
+        self.assertEqual([item["text_length"] for item in subset], list(range(len(subset))))
+        self.assertTrue(all(item["speaker_name"] == "new" for item in subset))
+        # the table sharing the columns is not changed
+        self.assertEqual(table.to_list(), samples)
+        with self.assertRaises(ValueError):
+            subset.set_column("text_length", [1])
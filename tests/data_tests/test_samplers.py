@@ -2,14 +2,16 @@ import functools
 import random
 import unittest
 
+import numpy as np
 import torch
+from trainer.torch import DistributedSamplerWrapper
 
 from TTS.config.shared_configs import BaseDatasetConfig
 from TTS.tts.datasets import load_tts_samples
 from TTS.tts.utils.data import get_length_balancer_weights
 from TTS.tts.utils.languages import get_language_balancer_weights
 from TTS.tts.utils.speakers import get_speaker_balancer_weights
-from TTS.utils.samplers import BucketBatchSampler, PerfectBatchSampler
+from TTS.utils.samplers import BucketBatchSampler, DynamicBatchSampler, PerfectBatchSampler
 
 # Fixing random state to avoid random fails
 torch.manual_seed(0)
@@ -190,3 +192,38 @@ class TestSamplers(unittest.TestCase):
 
         # check sampler length
         self.assertEqual(len(sampler), len(train_samples) // 7)
+
+    def test_dynamic_batch_sampler(self):
+        lengths = np.random.RandomState(0).randint(50, 1000, size=500)
+        sampler = DynamicBatchSampler(lengths, max_frames=4000, bucket_size=100, seed=1)
+        batches = list(sampler)
+        self.assertEqual(sorted(sum(batches, [])), list(range(len(lengths))))
+        for batch in batches:
+            self.assertLessEqual(len(batch) * lengths[batch].max(), 4000)
+        self.assertGreater(max(len(b) for b in batches), 3 * min(len(b) for b in batches))
+
+        # the batches are deterministic per epoch
+        self.assertNotEqual(list(sampler), batches)
+        sampler.set_epoch(0)
+        self.assertEqual(list(sampler), batches)
+        self.assertEqual(list(DynamicBatchSampler(lengths, max_frames=4000, bucket_size=100, seed=1)), batches)
+        fixed_batches = np.array_split(np.arange(len(lengths)), len(lengths) // 8)
+        fixed_efficiency = lengths.sum() / sum(len(b) * lengths[b].max() for b in fixed_batches)
+        self.assertGreater(sampler.padding_efficiency, fixed_efficiency)
+
+    def test_dynamic_batch_sampler_distributed(self):
+        lengths = np.array([len(item["text"]) for item in train_samples])
+        weights = get_speaker_balancer_weights(train_samples)
+        rank_batches = []
+        for rank in range(2):
+            sampler = DynamicBatchSampler(
+                lengths, max_frames=400, sampler=torch.utils.data.WeightedRandomSampler(weights, len(weights))
+            )
+            rank_batches.append(list(DistributedSamplerWrapper(sampler, num_replicas=2, rank=rank)))
+        batches = list(
+            DynamicBatchSampler(
+                lengths, max_frames=400, sampler=torch.utils.data.WeightedRandomSampler(weights, len(weights))
+            )
+        )
+        self.assertEqual(len(rank_batches[0]), len(rank_batches[1]))
+        self.assertEqual(rank_batches[0] + rank_batches[1], batches[: len(rank_batches[0]) * 2])
@@ -2,7 +2,7 @@ import unittest
 
 from packaging.version import Version
 
-from TTS.tts.utils.text.phonemizers import ESpeak, Gruut, JA_JP_Phonemizer, ZH_CN_Phonemizer
+from TTS.tts.utils.text.phonemizers import ESpeak, Gruut, JA_JP_Phonemizer, ZH_CN_Phonemizer, get_phonemizer_by_name
 from TTS.tts.utils.text.phonemizers.bangla_phonemizer import BN_Phonemizer
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
 
@@ -128,6 +128,52 @@ class TestEspeakNgPhonemizer(unittest.TestCase):
     def test_is_available(self):
         self.assertTrue(self.phonemizer.is_available())
 
+    def test_persistent(self):
+        texts = EXAMPLE_TEXTs + ["Be a voice, not an! echo?", "Be a voice, not an! echo.  ", "Two lines.\nOf text"]
+        target_phonemes = [self.phonemizer.phonemize(text) for text in texts]
+        phonemizer = ESpeak(language="en-us", backend="espeak-ng", persistent=True)
+        self.assertEqual([phonemizer.phonemize(text) for text in texts], target_phonemes)
+        self.assertEqual(phonemizer.phonemize_batch(texts), target_phonemes)
+        phonemizer.close()
+        # batches also work without a persistent process
+        self.assertEqual(self.phonemizer.phonemize_batch(texts), target_phonemes)
+
+    def test_persistent_failure(self):
+        target_phonemes = self.phonemizer.phonemize_batch(EXAMPLE_TEXTs)
+        phonemizer = ESpeak(language="en-us", backend="espeak-ng", persistent=True)
+        process = phonemizer._get_process(phonemizer._get_args())  # pylint: disable=protected-access
+        readline = process._readline  # pylint: disable=protected-access
+        num_lines = []
+
+        def failing_readline():
+            num_lines.append(1)
+            if len(num_lines) == 2:
+                raise RuntimeError("failed read")
+            return readline()
+
+        # fail after the first output line, with the rest of the batch left in the pipe
+        process._readline = failing_readline  # pylint: disable=protected-access
+        with self.assertRaises(RuntimeError):
+            phonemizer.phonemize_batch(EXAMPLE_TEXTs)
+        process._readline = readline  # pylint: disable=protected-access
+        self.assertEqual(phonemizer.phonemize_batch(EXAMPLE_TEXTs), target_phonemes)
+        self.assertEqual(phonemizer.phonemize(EXAMPLE_TEXTs[0]), target_phonemes[0])
+        phonemizer.close()
+
+
+class TestGetPhonemizerByName(unittest.TestCase):
+    def test_persistent(self):
+        # only espeak takes it, the others ignore it
+        phonemizer = get_phonemizer_by_name("gruut", persistent=True, language="en-us")
+        self.assertEqual(phonemizer.name(), "gruut")
+
+    @unittest.skipIf(not ESpeak.is_available(), "espeak is not installed")
+    def test_persistent_espeak(self):
+        self.assertFalse(get_phonemizer_by_name("espeak", language="en-us").persistent)
+        phonemizer = get_phonemizer_by_name("espeak", persistent=True, language="en-us")
+        self.assertTrue(phonemizer.persistent)
+        phonemizer.close()
+
 
 class TestGruutPhonemizer(unittest.TestCase):
     def setUp(self):
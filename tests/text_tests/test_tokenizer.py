@@ -1,3 +1,6 @@
+import os
+import pickle
+import tempfile
 import unittest
 from dataclasses import dataclass, field
 
@@ -54,6 +57,49 @@ class TestTTSTokenizer(unittest.TestCase):
         text_hat = self.tokenizer_ph.ids_to_text(ids)
         self.assertEqual(text_ph, text_hat)
 
+    def test_text_to_ids_cache(self):
+        tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), cache_size=2)
+        ids = tokenizer.text_to_ids("This is, a test.")
+        self.assertEqual(tokenizer.text_to_ids("This is, a test."), ids)
+        self.assertEqual(tokenizer.text_to_ids("This is, a test.", language="en"), ids)
+        self.assertEqual((tokenizer.cache.hits, tokenizer.cache.misses), (1, 2))
+        # settings that change the token IDs are part of the key
+        tokenizer.add_blank = True
+        self.assertEqual(tokenizer.text_to_ids("This is, a test."), self.tokenizer.intersperse_blank_char(ids, True))
+        # least recently used entries are dropped
+        self.assertEqual(len(tokenizer.cache), 2)
+        self.assertEqual(tokenizer.cache.stats()["misses"], 3)
+
+    def test_texts_to_ids(self):
+        texts = ["This is, a test.", "Another one!", "This is, a test."]
+        tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), add_blank=True, cache_size=8)
+        tokenizer.text_to_ids(texts[1])
+        # uncached reference
+        target_tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), add_blank=True)
+        self.assertEqual(tokenizer.texts_to_ids(texts), [target_tokenizer.text_to_ids(text) for text in texts])
+        self.assertEqual(tokenizer.texts_to_ids(texts)[0], tokenizer.text_to_ids(texts[0]))
+        self.assertEqual(len(tokenizer.cache), 2)
+
+    def test_text_to_ids_cache_pickle(self):
+        tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), cache_size=8)
+        ids = tokenizer.text_to_ids("This is, a test.")
+        tokenizer = pickle.loads(pickle.dumps(tokenizer))
+        self.assertEqual(tokenizer.text_to_ids("This is, a test."), ids)
+        self.assertEqual((tokenizer.cache.hits, tokenizer.cache.misses), (1, 1))
+
+    def test_text_to_ids_cache_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "token_cache.json")
+            tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), cache_size=8, cache_path=cache_path)
+            ids = tokenizer.text_to_ids("This is, a test.")
+            tokenizer.cache.save()
+            tokenizer = TTSTokenizer(use_phonemes=False, characters=Graphemes(), cache_size=8, cache_path=cache_path)
+            self.assertEqual(tokenizer.text_to_ids("This is, a test."), ids)
+            self.assertEqual((tokenizer.cache.hits, tokenizer.cache.misses), (1, 0))
+            # a cache saved with another vocabulary is ignored
+            tokenizer = TTSTokenizer(use_phonemes=False, characters=IPAPhonemes(), cache_size=8, cache_path=cache_path)
+            self.assertEqual(len(tokenizer.cache), 0)
+
     def test_print_logs(self):
         self.tokenizer.print_logs()
         self.tokenizer_ph.print_logs()
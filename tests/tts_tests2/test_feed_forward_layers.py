@@ -105,3 +105,27 @@ def test_decoder():
     ).to(device)
     output = layer(input_dummy, input_mask)
     assert list(output.shape) == [8, 11, 37]
+
+
+def test_fftransformer_padding():
+    """Padded frames of a batch do not change the outputs of the valid frames."""
+    input_dummy = torch.rand(2, 14, 37).to(device)
+    input_lengths = torch.tensor([37, 20]).to(device)
+    input_mask = torch.unsqueeze(sequence_mask(input_lengths, input_dummy.size(2)), 1).float()
+    encoder = Encoder(
+        out_channels=14,
+        in_hidden_channels=14,
+        encoder_type="fftransformer",
+        encoder_params={"hidden_channels_ffn": 31, "num_heads": 2, "num_layers": 2, "dropout_p": 0.1},
+    ).to(device)
+    decoder = Decoder(
+        out_channels=11,
+        in_hidden_channels=14,
+        decoder_type="fftransformer",
+        decoder_params={"hidden_channels_ffn": 31, "num_heads": 2, "dropout_p": 0.1, "num_layers": 2},
+    ).to(device)
+    for layer in [encoder.eval(), decoder.eval()]:
+        with torch.no_grad():
+            output = layer(input_dummy, input_mask)
+            output_single = layer(input_dummy[1:, :, :20], input_mask[1:, :, :20])
+        assert torch.allclose(output[1:, :, :20], output_single, atol=1e-5)
@@ -0,0 +1,70 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from tests import get_tests_output_path, get_tests_path
+from TTS.utils.audio import AudioProcessor
+from TTS.vocoder.configs import BaseGANVocoderConfig
+from TTS.vocoder.datasets.feature_cache import FeatureCache
+from TTS.vocoder.datasets.gan_dataset import GANDataset
+from TTS.vocoder.datasets.preprocess import load_wav_data
+from TTS.vocoder.datasets.wavegrad_dataset import WaveGradDataset
+
+OUTPATH = os.path.join(get_tests_output_path(), "feature_cache_tests")
+
+C = BaseGANVocoderConfig()
+test_data_path = os.path.join(get_tests_path(), "data/ljspeech/")
+
+
+class TestFeatureCache(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+        self.ap = AudioProcessor(**C.audio)
+        _, self.items = load_wav_data(test_data_path, 2)
+
+    def test_put_get(self):
+        cache = FeatureCache(OUTPATH, max_size=2**16)
+        audio, mel = np.random.rand(2000).astype(np.float32), np.random.rand(80, 10).astype(np.float32)
+        self.assertIsNone(cache.get("a.wav"))
+        self.assertTrue(cache.put("a.wav", [audio, mel]))
+        cached_audio, cached_mel = cache.get("a.wav")
+        self.assertIsInstance(cached_audio, np.memmap)
+        np.testing.assert_array_equal(cached_audio, audio)
+        np.testing.assert_array_equal(cached_mel, mel)
+        # the size limit is shared with the next runs using the folder
+        cache = FeatureCache(OUTPATH, max_size=2**16)
+        self.assertEqual(cache.size, audio.nbytes + mel.nbytes + 2 * 128)
+        self.assertFalse(cache.put("b.wav", [np.zeros(2**14, dtype=np.float32)]))
+        self.assertIsNone(cache.get("b.wav"))
+
+    def test_temporary_folder(self):
+        cache = FeatureCache()
+        cache_path = cache.cache_path
+        self.assertTrue(os.path.isdir(cache_path))
+        del cache
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_gan_dataset(self):
+        kwargs = {"seq_len": C.audio["hop_length"] * 10, "hop_len": C.audio["hop_length"], "pad_short": 2000}
+        dataset = GANDataset(self.ap, self.items, use_cache=True, cache_path=OUTPATH, **kwargs)
+        dataset.precompute_cache(num_workers=2)
+        reference = GANDataset(self.ap, self.items, use_cache=False, **kwargs)
+        for idx in range(len(self.items)):
+            audio, mel = dataset.cache.get(self.items[idx])
+            expected_audio, expected_mel = reference.load_features(idx)
+            np.testing.assert_array_equal(audio, expected_audio)
+            np.testing.assert_array_equal(mel, expected_mel)
+            mel, audio = dataset.load_item(idx)
+            self.assertEqual(mel.shape[-1], dataset.feat_frame_len)
+            self.assertEqual(audio.shape[-1], dataset.seq_len)
+
+    def test_wavegrad_dataset(self):
+        dataset = WaveGradDataset(
+            self.ap, self.items, seq_len=6144, hop_len=C.audio["hop_length"], pad_short=2000, use_cache=True
+        )
+        mel, audio = dataset.load_item(0)
+        self.assertEqual(audio.shape[-1], 6144)
+        self.assertEqual(mel.shape[-1] * C.audio["hop_length"], audio.shape[-1])
+        self.assertIsNotNone(dataset.cache.get(self.items[0]))
@@ -1,10 +1,12 @@
 import os
 
 import numpy as np
+import torch
 from torch.utils.data import DataLoader
 
 from tests import get_tests_output_path, get_tests_path
 from TTS.utils.audio import AudioProcessor
+from TTS.utils.audio.torch_transforms import TorchSpectrogram
 from TTS.vocoder.configs import BaseGANVocoderConfig
 from TTS.vocoder.datasets.gan_dataset import GANDataset
 from TTS.vocoder.datasets.preprocess import load_wav_data
@@ -107,3 +109,30 @@ def test_parametrized_gan_dataset():
     for param in params:
         print(param)
         gan_dataset_case(*param)
+
+
+def test_gan_dataset_compute_spec_on_device():
+    """test that the mel spectrograms computed by the model match the ones computed by the dataset"""
+    ap = AudioProcessor(**C.audio)
+    torch_spec = TorchSpectrogram(ap)
+    _, train_items = load_wav_data(test_data_path, 10)
+    seq_len, conv_pad = ap.hop_length * 10, 2
+    kwargs = {"seq_len": seq_len, "hop_len": ap.hop_length, "pad_short": 2000, "conv_pad": conv_pad}
+    dataset = GANDataset(ap, train_items, return_segments=False, **kwargs)
+    dataset_raw = GANDataset(ap, train_items, return_segments=False, compute_spec_on_device=True, **kwargs)
+    for idx in range(len(train_items)):
+        mel, wav = dataset[idx]
+        stft_input, wav_raw = dataset_raw[idx]
+        assert torch.equal(wav, wav_raw)
+        mel_raw = torch_spec.melspectrogram(stft_input.double().unsqueeze(0), padded=True)[0]
+        assert mel_raw.shape == mel.shape, f" [!] {mel_raw.shape} vs {mel.shape}"
+        max_diff = abs(mel_raw.numpy() - mel.numpy()).max()
+        assert max_diff <= 1e-3, f" [!] {max_diff}"
+
+    # random segments
+    dataset_raw = GANDataset(ap, train_items, compute_spec_on_device=True, **kwargs)
+    loader = DataLoader(dataset=dataset_raw, batch_size=4, shuffle=True, drop_last=True)
+    for stft_input, wav in loader:
+        mel = torch_spec.melspectrogram(stft_input, padded=True)
+        assert mel.shape == (4, ap.num_mels, seq_len // ap.hop_length + conv_pad * 2), f" [!] {mel.shape}"
+        assert wav.shape == (4, 1, seq_len), f" [!] {wav.shape}"
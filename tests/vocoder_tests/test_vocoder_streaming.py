@@ -0,0 +1,37 @@
+import torch
+
+from TTS.vocoder.models.hifigan_generator import HifiganGenerator
+from TTS.vocoder.models.melgan_generator import MelganGenerator
+from TTS.vocoder.models.multiband_melgan_generator import MultibandMelganGenerator
+
+
+def _check_stream(model):
+    model.eval()
+    dummy_input = torch.rand((2, 80, 100))
+    output = model.inference(dummy_input)
+    chunks = list(model.inference_stream(dummy_input, chunk_size=24, context=16, crossfade=1))
+    assert len(chunks) == 5
+    assert torch.allclose(torch.cat(chunks, dim=-1), output, atol=1e-5)
+
+
+def test_hifigan_generator_stream():
+    _check_stream(
+        HifiganGenerator(
+            in_channels=80,
+            out_channels=1,
+            resblock_type="1",
+            resblock_dilation_sizes=[[1, 3, 5]] * 3,
+            resblock_kernel_sizes=[3, 7, 11],
+            upsample_kernel_sizes=[16, 16, 4, 4],
+            upsample_initial_channel=32,
+            upsample_factors=[8, 8, 2, 2],
+        )
+    )
+
+
+def test_melgan_generator_stream():
+    _check_stream(MelganGenerator(base_channels=32))
+
+
+def test_multiband_melgan_generator_stream():
+    _check_stream(MultibandMelganGenerator(base_channels=32))
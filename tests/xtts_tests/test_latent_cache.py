@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+import torch
+
+from TTS.tts.configs.xtts_config import XttsConfig
+from TTS.tts.layers.xtts.latent_cache import ConditioningLatentCache
+from TTS.tts.models.xtts import Xtts, XttsArgs
+
+
+class TestConditioningLatentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.wav_paths = []
+        for idx, content in enumerate([b"voice_a", b"voice_a", b"voice_b"]):
+            wav_path = os.path.join(self.tmp_dir.name, f"speaker_{idx}.wav")
+            with open(wav_path, "wb") as f:
+                f.write(content)
+            self.wav_paths.append(wav_path)
+        self.latents = (torch.rand(1, 32, 1024), torch.rand(1, 512, 1))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_key(self):
+        cache = ConditioningLatentCache()
+        key = cache.get_key(self.wav_paths[0], gpt_cond_len=6)
+        # the key depends on the content, not on the file name
+        self.assertEqual(cache.get_key([self.wav_paths[1]], gpt_cond_len=6), key)
+        self.assertNotEqual(cache.get_key(self.wav_paths[2], gpt_cond_len=6), key)
+        self.assertNotEqual(cache.get_key(self.wav_paths[0], gpt_cond_len=12), key)
+        self.assertNotEqual(cache.get_key(self.wav_paths[:2], gpt_cond_len=6), key)
+        self.assertIsNone(cache.get_key(os.path.join(self.tmp_dir.name, "missing.wav")))
+
+    def test_get_put(self):
+        cache = ConditioningLatentCache(max_size=1)
+        key_a = cache.get_key(self.wav_paths[0])
+        key_b = cache.get_key(self.wav_paths[2])
+        self.assertIsNone(cache.get(key_a))
+        cache.put(key_a, self.latents)
+        gpt_cond_latent, speaker_embedding = cache.get(key_a)
+        self.assertTrue(torch.equal(gpt_cond_latent, self.latents[0]))
+        self.assertTrue(torch.equal(speaker_embedding, self.latents[1]))
+        # least recently used entries are dropped
+        cache.put(key_b, self.latents)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(key_a))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.tmp_dir.name, "latents")
+        cache = ConditioningLatentCache(cache_dir=cache_dir)
+        key = cache.get_key(self.wav_paths[0])
+        cache.put(key, self.latents)
+        cache = ConditioningLatentCache(cache_dir=cache_dir)
+        gpt_cond_latent, _ = cache.get(key)
+        self.assertTrue(torch.equal(gpt_cond_latent, self.latents[0]))
+        self.assertEqual(len(cache), 1)
+
+    def test_file_hashes(self):
+        cache = ConditioningLatentCache(max_file_hashes=2)
+        key = cache.get_key(self.wav_paths[0])
+        for wav_path in self.wav_paths:
+            cache.get_key(wav_path)
+        self.assertEqual(len(cache._file_hashes), 2)  # pylint: disable=protected-access
+        # an edited file is hashed again
+        with open(self.wav_paths[0], "wb") as f:
+            f.write(b"voice_c_")
+        self.assertNotEqual(cache.get_key(self.wav_paths[0]), key)
+
+    def test_model_key(self):
+        """Checkpoints sharing the mel stats but not the conditioning encoder weights must not share latents."""
+        args = XttsArgs(gpt_layers=1, gpt_n_model_channels=64, gpt_n_heads=4, gpt_number_text_tokens=64)
+        model = Xtts.init_from_config(XttsConfig(model_args=args))
+        weights_hash = model.conditioning_weights_hash()
+        self.assertEqual(model.conditioning_weights_hash(), weights_hash)
+        other_model = Xtts.init_from_config(XttsConfig(model_args=args))
+        other_model.load_state_dict(model.state_dict())
+        self.assertEqual(other_model.conditioning_weights_hash(), weights_hash)
+        other_model = Xtts.init_from_config(XttsConfig(model_args=args))
+        other_model.load_state_dict(model.state_dict())
+        with torch.no_grad():
+            next(other_model.gpt.conditioning_encoder.parameters()).add_(1.0)
+        self.assertNotEqual(other_model.conditioning_weights_hash(), weights_hash)
@@ -0,0 +1,85 @@
+import os
+import unittest
+
+import torch
+
+from tests import get_tests_input_path
+from TTS.tts.configs.xtts_config import XttsConfig
+from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer, split_sentence
+from TTS.tts.models.xtts import Xtts, XttsArgs
+
+torch.manual_seed(1)
+
+VOCAB_FILE = os.path.join(get_tests_input_path(), "xtts_vocab.json")
+
+
+def _small_xtts():
+    args = XttsArgs(
+        gpt_layers=2,
+        gpt_n_model_channels=128,
+        gpt_n_heads=4,
+        gpt_num_audio_tokens=1026,
+        gpt_start_audio_token=1024,
+        gpt_stop_audio_token=1025,
+        gpt_max_audio_tokens=40,
+        gpt_use_perceiver_resampler=True,
+        decoder_input_dim=128,
+    )
+    model = Xtts(XttsConfig(model_args=args))
+    model.tokenizer = VoiceBpeTokenizer(vocab_file=VOCAB_FILE)
+    # split the test paragraph into a few sentences
+    model.tokenizer.char_limits["en"] = 40
+    model.init_models()
+    model.gpt.init_gpt_for_inference(kv_cache=True)
+    model.eval()
+    return model
+
+
+class TestXttsBatchInference(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = _small_xtts()
+        cls.cond_latents = torch.randn(1, 32, 128)
+        cls.speaker_embedding = torch.randn(1, 512, 1)
+        cls.generate_kwargs = {"do_sample": False, "num_beams": 1, "repetition_penalty": 1.0}
+
+    @torch.inference_mode()
+    def test_batched_generation(self):
+        gpt = self.model.gpt
+        texts = [torch.randint(1, 60, (length,), dtype=torch.int32) for length in [5, 12, 8]]
+        text_lengths = torch.tensor([len(text) for text in texts])
+        text_inputs = torch.nn.utils.rnn.pad_sequence(texts, batch_first=True)
+        codes = gpt.generate(self.cond_latents, text_inputs, text_lengths=text_lengths, **self.generate_kwargs)
+        self.assertEqual(codes.shape[0], len(texts))
+        for idx, text in enumerate(texts):
+            target_codes = gpt.generate(self.cond_latents, text.unsqueeze(0), **self.generate_kwargs)
+            num_codes = target_codes.shape[-1]
+            self.assertTrue(torch.equal(codes[idx, :num_codes], target_codes[0]))
+            # the row is padded with the stop token once it is done
+            self.assertTrue(torch.all(codes[idx, num_codes:] == gpt.stop_audio_token))
+
+    @torch.inference_mode()
+    def test_batch_sentences(self):
+        text = "Hello there. This sentence is a little longer than the first one. Bye!"
+        self.assertEqual(len(split_sentence(text, "en", self.model.tokenizer.char_limits["en"])), 3)
+        outputs = [
+            self.model.inference(
+                text,
+                "en",
+                self.cond_latents,
+                self.speaker_embedding,
+                enable_text_splitting=True,
+                batch_sentences=batch_sentences,
+                **self.generate_kwargs,
+            )
+            for batch_sentences in [False, True]
+        ]
+        torch.testing.assert_close(
+            torch.from_numpy(outputs[1]["gpt_latents"]),
+            torch.from_numpy(outputs[0]["gpt_latents"]),
+            rtol=1e-4,
+            atol=1e-4,
+        )
+        torch.testing.assert_close(
+            torch.from_numpy(outputs[1]["wav"]), torch.from_numpy(outputs[0]["wav"]), rtol=1e-4, atol=1e-4
+        )
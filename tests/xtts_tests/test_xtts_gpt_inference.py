@@ -0,0 +1,90 @@
+import unittest
+
+import torch
+
+from TTS.tts.configs.xtts_config import XttsConfig
+from TTS.tts.models.xtts import Xtts, XttsArgs
+
+torch.manual_seed(1)
+
+
+def _small_xtts():
+    args = XttsArgs(
+        gpt_layers=2,
+        gpt_n_model_channels=128,
+        gpt_n_heads=4,
+        gpt_number_text_tokens=64,
+        gpt_start_text_token=62,
+        gpt_stop_text_token=63,
+        gpt_num_audio_tokens=1026,
+        gpt_start_audio_token=1024,
+        gpt_stop_audio_token=1025,
+        gpt_max_audio_tokens=40,
+        gpt_use_perceiver_resampler=True,
+        decoder_input_dim=128,
+    )
+    model = Xtts.init_from_config(XttsConfig(model_args=args))
+    model.gpt.init_gpt_for_inference(kv_cache=True)
+    model.eval()
+    return model
+
+
+class TestXttsGPTLatents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = _small_xtts()
+        cls.cond_latents = torch.randn(1, 32, 128)
+        cls.speaker_embedding = torch.randn(1, 512, 1)
+        cls.generate_kwargs = {"do_sample": False, "num_beams": 1, "repetition_penalty": 1.0}
+
+    @torch.inference_mode()
+    def test_generation_latents_match_second_pass(self):
+        gpt = self.model.gpt
+        text_tokens = torch.randint(1, 60, (1, 12), dtype=torch.int32)
+        codes, latents = gpt.generate(self.cond_latents, text_tokens, return_latents=True, **self.generate_kwargs)
+        self.assertEqual(latents.shape, (1, codes.shape[-1], 128))
+        # latents computed by a second pass over the generated codes
+        target_latents = gpt(
+            text_tokens,
+            torch.tensor([text_tokens.shape[-1]]),
+            codes,
+            torch.tensor([codes.shape[-1] * gpt.code_stride_len]),
+            cond_latents=self.cond_latents,
+            return_latent=True,
+        )
+        torch.testing.assert_close(latents, target_latents, rtol=1e-4, atol=1e-4)
+        wav = self.model.hifigan_decoder(latents, g=self.speaker_embedding)
+        target_wav = self.model.hifigan_decoder(target_latents, g=self.speaker_embedding)
+        torch.testing.assert_close(wav, target_wav, rtol=1e-4, atol=1e-4)
+
+    @torch.inference_mode()
+    def test_static_kv_cache(self):
+        gpt = self.model.gpt
+        texts = [torch.randint(1, 60, (length,), dtype=torch.int32) for length in [5, 12, 8]]
+        text_lengths = torch.tensor([len(text) for text in texts])
+        text_inputs = torch.nn.utils.rnn.pad_sequence(texts, batch_first=True)
+        outputs = []
+        for static_kv_cache in [False, True]:
+            gpt.init_gpt_for_inference(kv_cache=True, static_kv_cache=static_kv_cache)
+            codes, latents = gpt.generate(
+                self.cond_latents, text_inputs, text_lengths=text_lengths, return_latents=True, **self.generate_kwargs
+            )
+            beam_codes = gpt.generate(self.cond_latents, texts[0].unsqueeze(0), do_sample=False, num_beams=2)
+            outputs.append((codes, latents, beam_codes))
+        gpt.init_gpt_for_inference(kv_cache=True)
+        self.assertTrue(torch.equal(outputs[0][0], outputs[1][0]))
+        torch.testing.assert_close(outputs[0][1], outputs[1][1], rtol=1e-4, atol=1e-4)
+        self.assertTrue(torch.equal(outputs[0][2], outputs[1][2]))
+
+    @torch.inference_mode()
+    def test_static_kv_cache_per_generation(self):
+        gpt = self.model.gpt
+        gpt.init_gpt_for_inference(kv_cache=True, static_kv_cache=True)
+        try:
+            gpt_inputs = gpt.compute_embeddings(self.cond_latents, torch.randint(1, 60, (1, 5), dtype=torch.int32))
+            # concurrent generations never write in the same cache
+            caches = [gpt.gpt_inference.prepare_inputs_for_generation(gpt_inputs)["past_key_values"] for _ in range(2)]
+        finally:
+            gpt.init_gpt_for_inference(kv_cache=True)
+        self.assertIsNot(caches[0], caches[1])
+        self.assertEqual(caches[0].length, 0)